@@ -0,0 +1,181 @@
+"""API 응답 직렬화/압축/캐시 검증 - orjson 응답 클래스, 단일 본문 응답 압축 미들웨어, ETag"""
+
+import gzip
+import hashlib
+import logging
+from typing import Any, Dict, Optional
+
+import orjson
+from pydantic import BaseModel
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.responses import JSONResponse, Response
+
+try:
+    import brotli
+except ImportError:  # brotli 미설치 시 gzip만 사용
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+# 압축 대상 Content-Type (접두사)
+COMPRESSIBLE_TYPES = ("application/json", "text/plain", "text/html")
+
+GZIP_LEVEL = 5
+BROTLI_QUALITY = 4
+
+# ETag에 반영하는 응답 형식 버전 (GET 리소스 응답 필드가 바뀌면 올림)
+ETAG_SCHEMA_VERSION = "1"
+
+
+def dumps(content: Any) -> bytes:
+    """orjson 직렬화 (Pydantic 모델은 model_dump() 후 직렬화, 한글은 UTF-8 그대로)"""
+    if isinstance(content, BaseModel):
+        content = content.model_dump()
+    return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    orjson 기반 JSON 응답
+
+    라우트가 이 응답을 직접 반환하면 FastAPI의 response_model 재검증과
+    jsonable_encoder 변환을 거치지 않는다 (response_model은 문서화 용도로만 사용).
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def make_etag(data_version: str, *parts: Any) -> str:
+    """
+    강한 ETag 생성 (데이터 빌드 버전 + 응답 형식 버전 + 리소스 식별자 해시)
+
+    같은 빌드 안에서는 리소스 본문이 바뀌지 않으므로 본문을 만들지 않고도 ETag를 계산할 수 있다.
+    """
+    key = "\0".join(str(part) for part in (ETAG_SCHEMA_VERSION, data_version, *parts))
+    return '"' + hashlib.sha256(key.encode("utf-8")).hexdigest()[:32] + '"'
+
+
+def match_etag(if_none_match: Optional[str], etag: str) -> Optional[str]:
+    """
+    If-None-Match 헤더에서 etag와 일치하는 값 반환 (약한 비교)
+
+    압축 응답은 CompressionMiddleware가 ETag에 인코딩 접미사(-br, -gzip)를 붙이므로
+    접미사가 붙은 값도 같은 리소스로 인정한다.
+
+    Returns:
+        일치한 ETag (304 응답에 그대로 사용) 또는 None
+    """
+    if not if_none_match:
+        return None
+    if if_none_match.strip() == "*":
+        return etag
+
+    opaque = etag.strip('"')
+    accepted = {opaque, *(f"{opaque}-{encoding}" for encoding in ("br", "gzip"))}
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        tag = candidate[2:] if candidate.startswith("W/") else candidate
+        if tag.strip('"') in accepted:
+            return candidate
+    return None
+
+
+def cache_headers(etag: str, max_age: int) -> Dict[str, str]:
+    """공유 캐시(CDN/리버스 프록시)까지 저장 가능한 캐시 헤더"""
+    return {"ETag": etag, "Cache-Control": f"public, max-age={max_age}"}
+
+
+def not_modified(etag: str, max_age: int) -> Response:
+    """304 Not Modified 응답 (본문 없음, 캐시 헤더만 갱신)"""
+    return Response(status_code=304, headers=cache_headers(etag, max_age))
+
+
+def _choose_encoding(accept_encoding: str) -> Optional[str]:
+    """Accept-Encoding에서 사용할 압축 방식 선택 (br 우선, q=0 제외)"""
+    accepted = set()
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        if params.strip().replace(" ", "") in ("q=0", "q=0.0"):
+            continue
+        accepted.add(name.strip().lower())
+
+    if brotli is not None and "br" in accepted:
+        return "br"
+    if "gzip" in accepted:
+        return "gzip"
+    return None
+
+
+def _compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+class CompressionMiddleware:
+    """
+    단일 본문 응답 압축 ASGI 미들웨어 (brotli → gzip)
+
+    본문이 한 번에 전송되는 JSON/텍스트 응답만 minimum_size 이상일 때 압축한다.
+    SSE/NDJSON 같은 스트리밍 응답(more_body=True)은 청크 단위 전송이 지연되지 않도록 그대로 통과시킨다.
+    """
+
+    def __init__(self, app, minimum_size: int = 1024):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or self.minimum_size <= 0:
+            await self.app(scope, receive, send)
+            return
+
+        encoding = _choose_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message = None
+        passthrough = False
+
+        async def send_wrapper(message):
+            nonlocal start_message, passthrough
+            if passthrough:
+                await send(message)
+                return
+
+            if message["type"] == "http.response.start":
+                start_message = message
+                return
+
+            if message["type"] != "http.response.body" or start_message is None:
+                await send(message)
+                return
+
+            # 스트리밍 응답이거나 압축 대상이 아니면 원본 그대로 전송
+            headers = MutableHeaders(raw=start_message["headers"])
+            body = message.get("body", b"")
+            if (
+                message.get("more_body", False)
+                or "content-encoding" in headers
+                or not headers.get("content-type", "").startswith(COMPRESSIBLE_TYPES)
+                or len(body) < self.minimum_size
+            ):
+                passthrough = True
+                await send(start_message)
+                await send(message)
+                return
+
+            compressed = _compress(body, encoding)
+            headers["content-encoding"] = encoding
+            # 인코딩별로 본문이 다르므로 강한 ETag에 접미사를 붙여 구분 (match_etag가 인식)
+            etag = headers.get("etag")
+            if etag and not etag.startswith("W/") and etag.endswith('"'):
+                headers["etag"] = f'{etag[:-1]}-{encoding}"'
+            headers["content-length"] = str(len(compressed))
+            headers.add_vary_header("Accept-Encoding")
+            passthrough = True
+            await send(start_message)
+            await send({"type": "http.response.body", "body": compressed})
+
+        await self.app(scope, receive, send_wrapper)
@@ -1,12 +1,15 @@
 """API 라우트 정의"""
 
+import asyncio
 import time
 import logging
-from typing import Optional
+from typing import AsyncIterator, List, Optional
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Header, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
 
-from app.schemas.request import SearchRequest, UserProfileSchema
+from app.api.responses import ORJSONResponse, cache_headers, dumps, make_etag, match_etag, not_modified
+from app.schemas.request import BatchSearchRequest, SearchRequest, UserProfileSchema
 from app.schemas.response import (
     SearchResponse,
     RecipeResponse,
@@ -14,12 +17,33 @@ from app.schemas.response import (
     ExerciseResponse,
     AnalyzedQueryResponse,
     ErrorResponse,
-    HealthResponse
+    HealthResponse,
+    JobResponse,
+    ReadinessResponse,
+    RecipeListResponse,
+    SimilarRecipesResponse,
+    TimingsResponse
 )
-from app.core.workflow.graph import run_workflow
+from app.core.workflow.graph import run_workflow, run_workflow_deferred, stream_workflow
+from app.core.workflow.jobs import JOB_SUCCEEDED, get_job_manager
+from app.core.agents.exercise_recommender import recommend_exercises
+from app.core.agents.response_formatter import get_response_formatter
 from app.core.workflow.state import UserProfile
-from app.core.services.vector_db_service import get_vector_db_service
+from app.core.workflow.deadline import create_deadline
+from app.core.workflow.response_cache import astore_cached_state
+from app.core.workflow.warmup import get_warmup_manager
+from app.core.services.admission import (
+    AdmissionRejected,
+    batch_item_slot,
+    check_batch_quota,
+    rejection_response
+)
+from app.core.services.health_monitor import get_health_monitor
+from app.core.services.micro_batcher import micro_batching
 from app.core.services.nutrition_db_service import get_nutrition_db_service
+from app.core.services.recipe_catalog import get_recipe_catalog
+from app.core.services.tracing import Trace, export_trace, start_trace
+from app.config import get_settings
 
 logger = logging.getLogger(__name__)
 
@@ -30,118 +54,75 @@ router = APIRouter(prefix="/api", tags=["Recipe & Fitness"])
     "/search",
     response_model=SearchResponse,
     responses={
+        202: {"model": SearchResponse, "description": "DB 결과만 반환, GPT 생성은 백그라운드 작업으로 진행 (background=true)"},
         400: {"model": ErrorResponse, "description": "잘못된 요청"},
-        500: {"model": ErrorResponse, "description": "서버 오류"}
+        429: {"model": ErrorResponse, "description": "대기열 가득 참/요청 한도 초과 (Retry-After)"},
+        500: {"model": ErrorResponse, "description": "서버 오류"},
+        503: {"model": ErrorResponse, "description": "대기 시간 초과 (Retry-After)"}
     },
     summary="레시피 검색 및 영양정보/운동 추천",
     description="사용자 쿼리를 분석하여 레시피, 영양정보, 운동 추천을 제공합니다."
 )
-async def search(request: SearchRequest) -> SearchResponse:
+async def search(
+    request: SearchRequest,
+    timings: bool = Query(default=False, description="노드/외부 호출별 처리 시간 포함 여부"),
+    x_request_timeout: Optional[float] = Header(
+        default=None,
+        description="요청 예산 (초, 기본 REQUEST_TIMEOUT_SECONDS)"
+    )
+) -> ORJSONResponse:
     """
     레시피 검색 및 영양정보/운동 추천 통합 API
 
     - 쿼리 분석 (음식명, 인분 추출)
-    - 레시피 검색 (Vector DB → LLM Fallback)
+    - 레시피 검색 (Vector DB → LLM Fallback, 영양/운동 질의는 생략)
     - 영양정보 계산
     - 운동 추천 (칼로리 소모 기준)
+    - response_mode="structured"면 GPT 포맷팅 없이 템플릿 응답
+    - X-Request-Timeout 예산이 소진되면 LLM 단계를 대체 경로로 처리 (degraded_stages)
+    - timings=true면 노드/외부 호출별 처리 시간 포함 (timings)
+    - 같은 쿼리는 응답 캐시에서 운동 추천만 재계산 (cache_status)
+    - 동시 실행 한도와 대기열이 가득 차면 429, 대기 시간을 넘기면 503 (Retry-After, AdmissionMiddleware)
+    - background=true고 DB에 결과가 없으면 GPT 생성 없이 DB 결과와 job_id를 202로 반환
+      (최종 결과는 GET /api/jobs/{job_id})
     """
     start_time = time.time()
+    deadline = create_deadline(x_request_timeout)
+    trace = _start_trace("POST /api/search", timings)
 
     try:
         logger.info(f"검색 요청: {request.query}")
 
-        # UserProfile 변환
-        user_profile: Optional[UserProfile] = None
-        if request.user_profile:
-            user_profile = UserProfile(
-                weight_kg=request.user_profile.weight,
-                height_cm=request.user_profile.height,
-                age=request.user_profile.age,
-                gender=request.user_profile.gender,
-                activity_level=request.user_profile.activity_level
+        # 워크플로우 실행 (background=true면 GPT 생성이 필요할 때 DB 단계까지만)
+        job_manager = get_job_manager() if request.background else None
+        if job_manager is not None:
+            final_state, completed = await run_workflow_deferred(
+                request.query, _to_user_profile(request), request.response_mode, deadline
+            )
+        else:
+            final_state = await run_workflow(
+                request.query, _to_user_profile(request), request.response_mode, deadline
             )
+            completed = True
 
-        # 워크플로우 실행
-        final_state = await run_workflow(request.query, user_profile)
+        if not completed:
+            job_id = await job_manager.submit(final_state)
+            processing_time_ms = (time.time() - start_time) * 1000
+            response = _build_deferred_response(final_state, request.query, processing_time_ms, job_id)
+            await _finish_trace(trace, response, timings)
+            logger.info(f"검색 DB 결과 반환, GPT 생성은 작업 {job_id}: {processing_time_ms:.0f}ms")
+            return ORJSONResponse(response, status_code=202, headers={"Location": f"/api/jobs/{job_id}"})
 
         # 처리 시간 계산
         processing_time_ms = (time.time() - start_time) * 1000
 
         # 응답 구성
-        response = SearchResponse(
-            success=True,
-            message="검색 완료",
-            processing_time_ms=processing_time_ms
-        )
-
-        # 분석된 쿼리
-        analyzed = final_state.get("analyzed_query", {})
-        if analyzed:
-            response.analyzed_query = AnalyzedQueryResponse(
-                food_name=analyzed.get("food_name", ""),
-                servings=analyzed.get("servings", 1),
-                query_type=analyzed.get("query_type", "recipe"),
-                original_query=request.query
-            )
-
-        # 레시피
-        recipe_data = final_state.get("recipe")
-        if recipe_data:
-            response.recipe = RecipeResponse(
-                recipe_id=recipe_data.get("recipe_id", ""),
-                name=recipe_data.get("name", ""),
-                category=recipe_data.get("category", ""),
-                cooking_method=recipe_data.get("cooking_method", ""),
-                ingredients=recipe_data.get("ingredients", []),
-                instructions=recipe_data.get("instructions", []),
-                tips=recipe_data.get("tips", ""),
-                image_url=recipe_data.get("image_url", ""),
-                source=recipe_data.get("source", "database")
-            )
-
-        # 영양정보
-        nutrition_data = final_state.get("nutrition")
-        if nutrition_data:
-            response.nutrition = NutritionResponse(
-                food_name=nutrition_data.get("food_name", ""),
-                servings=nutrition_data.get("servings", 1),
-                serving_size=nutrition_data.get("serving_size", 0),
-                calories=nutrition_data.get("calories", 0),
-                protein=nutrition_data.get("protein", 0),
-                fat=nutrition_data.get("fat", 0),
-                carbohydrate=nutrition_data.get("carbohydrate", 0),
-                sugar=nutrition_data.get("sugar", 0),
-                fiber=nutrition_data.get("fiber", 0),
-                sodium=nutrition_data.get("sodium", 0),
-                calcium=nutrition_data.get("calcium", 0),
-                iron=nutrition_data.get("iron", 0),
-                potassium=nutrition_data.get("potassium", 0),
-                vitamin_a=nutrition_data.get("vitamin_a", 0),
-                vitamin_c=nutrition_data.get("vitamin_c", 0),
-                cholesterol=nutrition_data.get("cholesterol", 0)
-            )
-
-        # 운동 추천
-        exercises_data = final_state.get("exercise_recommendations", [])
-        response.exercises = [
-            ExerciseResponse(
-                name=ex.get("name", ""),
-                name_kr=ex.get("name_kr", ""),
-                intensity=ex.get("intensity", "medium"),
-                duration_minutes=ex.get("duration_minutes", 0),
-                calories_burned=ex.get("calories_burned", 0),
-                met=ex.get("met", 0),
-                description=ex.get("description", ""),
-                tips=ex.get("tips", "")
-            )
-            for ex in exercises_data
-        ]
-
-        # 최종 응답 텍스트
-        response.response = final_state.get("response", "")
+        response = _build_search_response(final_state, request.query, processing_time_ms)
+        await _finish_trace(trace, response, timings)
 
         logger.info(f"검색 완료: {processing_time_ms:.0f}ms")
-        return response
+        # response_model 재검증/jsonable_encoder를 거치지 않고 orjson으로 직렬화
+        return ORJSONResponse(response)
 
     except Exception as e:
         logger.error(f"검색 실패: {e}")
@@ -155,51 +136,581 @@ async def search(request: SearchRequest) -> SearchResponse:
         )
 
 
-@router.get(
-    "/health",
-    response_model=HealthResponse,
-    summary="서비스 상태 확인",
-    description="서비스 및 의존성 상태를 확인합니다."
+@router.post(
+    "/search/stream",
+    summary="레시피 검색 (SSE 스트리밍)",
+    description=(
+        "검색 결과를 Server-Sent Events로 단계별 전송합니다. "
+        "이벤트 순서: analyzed_query → recipe → nutrition → exercises → token(반복) → done "
+        "(영양/운동 질의는 recipe 이벤트 생략)"
+    ),
+    response_class=StreamingResponse
 )
-async def health_check() -> HealthResponse:
-    """헬스체크 엔드포인트"""
-    services = {}
+async def search_stream(
+    request: SearchRequest,
+    timings: bool = Query(default=False, description="done 이벤트에 처리 시간 분해 포함 여부"),
+    x_request_timeout: Optional[float] = Header(
+        default=None,
+        description="요청 예산 (초, 기본 REQUEST_TIMEOUT_SECONDS)"
+    )
+) -> StreamingResponse:
+    """
+    레시피 검색 스트리밍 API
+
+    - 워크플로우 노드가 끝날 때마다 해당 단계 결과를 이벤트로 전송
+    - 최종 응답 텍스트는 OpenAI 스트리밍 API로 토큰 단위 전송 (event: token)
+    - 마지막에 전체 SearchResponse를 event: done으로 전송
+    """
+    logger.info(f"스트리밍 검색 요청: {request.query}")
+    return StreamingResponse(
+        _search_event_stream(request, create_deadline(x_request_timeout), timings),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+async def _search_event_stream(
+    request: SearchRequest,
+    deadline: float,
+    timings: bool = False
+) -> AsyncIterator[str]:
+    """검색 SSE 이벤트 생성"""
+    start_time = time.time()
+    trace = _start_trace("POST /api/search/stream", timings)
 
-    # Vector DB 상태
     try:
-        vector_service = get_vector_db_service()
-        total_recipes = vector_service.total_recipes if vector_service else 0
-        services["vector_db"] = {
-            "ready": vector_service.is_ready if vector_service else False,
-            "total_recipes": total_recipes
-        }
+        final_state = None
+        async for event, data in stream_workflow(
+            request.query, _to_user_profile(request), request.response_mode, deadline
+        ):
+            if event == "state":
+                final_state = data
+            elif event == "analyzed_query":
+                yield _sse(event, AnalyzedQueryResponse.model_validate(
+                    _analyzed_query_payload(data, request.query)
+                ))
+            elif event == "recipe":
+                yield _sse(event, RecipeResponse.model_validate(_recipe_payload(data)))
+            elif event == "nutrition":
+                yield _sse(event, NutritionResponse.model_validate(_nutrition_payload(data)))
+            elif event == "exercises":
+                yield _sse(event, [
+                    ExerciseResponse.model_validate(ex).model_dump() for ex in _exercises_payload(data)
+                ])
+
+        if final_state.get("cache_status") == "hit":
+            # 캐시 적중: 운동 추천까지 렌더링된 응답을 한 번에 전송
+            yield _sse("token", {"text": final_state["response"]})
+        else:
+            # 응답 텍스트 토큰 스트리밍 (AsyncOpenAI 스트림)
+            formatter = get_response_formatter()
+            chunks = []
+            async for chunk in formatter.astream(final_state):
+                chunks.append(chunk)
+                yield _sse("token", {"text": chunk})
+            final_state["response"] = "".join(chunks)
+            await astore_cached_state(final_state)
+
+        processing_time_ms = (time.time() - start_time) * 1000
+        response = _build_search_response(final_state, request.query, processing_time_ms)
+        await _finish_trace(trace, response, timings)
+        logger.info(f"스트리밍 검색 완료: {processing_time_ms:.0f}ms")
+        yield _sse("done", response.model_dump())
+
     except Exception as e:
-        services["vector_db"] = {"ready": False, "error": str(e)}
+        logger.error(f"스트리밍 검색 실패: {e}")
+        yield _sse("error", ErrorResponse(
+            success=False,
+            error="검색 처리 중 오류가 발생했습니다",
+            detail=str(e)
+        ).model_dump())
+
+
+@router.post(
+    "/search/batch",
+    summary="일괄 검색 (NDJSON 스트리밍)",
+    description=(
+        "여러 검색 요청을 제한된 동시성으로 실행하고 완료되는 순서대로 NDJSON 한 줄씩 전송합니다. "
+        "각 줄: {\"index\", \"query\", \"result\": SearchResponse} 또는 {\"index\", \"query\", \"error\": ErrorResponse}"
+    ),
+    response_class=StreamingResponse,
+    responses={
+        400: {"model": ErrorResponse, "description": "잘못된 요청"},
+        429: {"model": ErrorResponse, "description": "요청 한도 초과 (Retry-After)"}
+    }
+)
+async def search_batch(
+    request: BatchSearchRequest,
+    http_request: Request,
+    x_request_timeout: Optional[float] = Header(
+        default=None,
+        description="쿼리별 요청 예산 (초, 기본 REQUEST_TIMEOUT_SECONDS, 실행 시작 시점부터)"
+    )
+) -> StreamingResponse:
+    """
+    일괄 검색 API
+
+    - 최대 concurrency개의 워크플로우를 동시에 실행 (나머지는 대기)
+    - 동시 실행 중인 쿼리의 임베딩은 API 호출 하나로, 영양정보 정확 매칭은 IN 쿼리 하나로 묶어 조회
+    - 결과는 요청 순서가 아닌 완료 순서로 전송 (index로 요청과 매칭)
+    - 개별 쿼리 실패는 해당 줄의 error로 전달하고 나머지는 계속 처리
+    - 클라이언트 할당량은 쿼리 수만큼 차감, 각 항목은 대화형 검색과 같은 LLM 동시 실행 한도를 공유
+    """
+    settings = get_settings()
+    if len(request.requests) > settings.batch_max_queries:
+        raise HTTPException(
+            status_code=400,
+            detail=ErrorResponse(
+                success=False,
+                error="일괄 검색 요청 수가 너무 많습니다",
+                detail=f"최대 {settings.batch_max_queries}개까지 요청할 수 있습니다 (요청: {len(request.requests)}개)"
+            ).model_dump()
+        )
 
-    # Nutrition DB 상태
     try:
-        nutrition_service = get_nutrition_db_service()
-        total_nutrition = nutrition_service.get_total_count() if nutrition_service else 0
-        services["nutrition_db"] = {
-            "ready": nutrition_service.is_ready if nutrition_service else False,
-            "total_records": total_nutrition
-        }
-    except Exception as e:
-        services["nutrition_db"] = {"ready": False, "error": str(e)}
+        check_batch_quota(http_request.scope, len(request.requests))
+    except AdmissionRejected as rejected:
+        return rejection_response(rejected)
+
+    concurrency = min(request.concurrency or settings.batch_concurrency, settings.batch_max_concurrency)
+    logger.info(f"일괄 검색 요청: {len(request.requests)}개 (동시 {concurrency})")
+    return StreamingResponse(
+        _batch_result_stream(request.requests, concurrency, x_request_timeout),
+        media_type="application/x-ndjson",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+async def _batch_result_stream(
+    requests: List[SearchRequest],
+    concurrency: int,
+    request_timeout: Optional[float]
+) -> AsyncIterator[bytes]:
+    """일괄 검색 결과 NDJSON 생성 (완료 순서)"""
+    start_time = time.time()
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run_one(index: int, item: SearchRequest) -> dict:
+        async with semaphore, batch_item_slot():
+            item_start = time.time()
+            # 예산은 대기열 진입이 아닌 실행 시작 시점부터 계산
+            deadline = create_deadline(request_timeout)
+            try:
+                final_state = await run_workflow(
+                    item.query, _to_user_profile(item), item.response_mode, deadline
+                )
+                processing_time_ms = (time.time() - item_start) * 1000
+                response = _build_search_response(final_state, item.query, processing_time_ms)
+                return {"index": index, "query": item.query, "result": response.model_dump()}
+            except Exception as e:
+                logger.error(f"일괄 검색 항목 실패 ({index}): {e}")
+                error = ErrorResponse(
+                    success=False,
+                    error="검색 처리 중 오류가 발생했습니다",
+                    detail=str(e)
+                )
+                return {"index": index, "query": item.query, "error": error.model_dump()}
+
+    # 태스크가 생성 시점의 컨텍스트를 복사하므로 모든 항목이 micro-batching 사용
+    with micro_batching():
+        tasks = [asyncio.create_task(run_one(i, item)) for i, item in enumerate(requests)]
 
-    # OpenAI 상태 (API 키 존재 여부만 확인)
     try:
-        from app.config import get_settings
-        settings = get_settings()
-        services["openai"] = {
-            "ready": bool(settings.openai_api_key),
-            "model": settings.openai_model
-        }
-    except Exception as e:
-        services["openai"] = {"ready": False, "error": str(e)}
+        for next_done in asyncio.as_completed(tasks):
+            line = await next_done
+            yield dumps(line) + b"\n"
+        logger.info(f"일괄 검색 완료: {len(requests)}개, {(time.time() - start_time) * 1000:.0f}ms")
+    finally:
+        # 클라이언트 연결이 끊기면 남은 항목 취소
+        for task in tasks:
+            task.cancel()
+
+
+@router.get(
+    "/jobs/{job_id}",
+    response_model=JobResponse,
+    responses={404: {"model": ErrorResponse, "description": "작업 없음 (만료되었거나 잘못된 ID)"}},
+    summary="백그라운드 작업 조회",
+    description=(
+        "background=true 검색에서 반환된 job_id의 상태와 최종 검색 결과를 조회합니다. "
+        "wait를 지정하면 작업이 끝날 때까지 최대 wait초 기다린 뒤 응답합니다 (롱 폴링)."
+    )
+)
+async def get_job(
+    job_id: str,
+    wait: float = Query(default=0, ge=0, le=30, description="작업 종료까지 최대 대기 시간 (초)")
+) -> ORJSONResponse:
+    """백그라운드 작업 조회 API (succeeded면 result에 SearchResponse)"""
+    job_manager = get_job_manager()
+    job = await job_manager.wait(job_id, wait) if job_manager is not None else None
+    if job is None:
+        raise _resource_error(404, "작업을 찾을 수 없습니다", job_id)
+
+    result = None
+    if job["status"] == JOB_SUCCEEDED:
+        final_state = job["result"]
+        processing_time_ms = (job["updated_at"] - job["created_at"]) * 1000
+        result = _build_search_response(final_state, final_state.get("user_query", ""), processing_time_ms)
+
+    return ORJSONResponse(JobResponse(
+        job_id=job["job_id"],
+        status=job["status"],
+        result=result,
+        error=job["error"],
+        created_at=job["created_at"],
+        updated_at=job["updated_at"]
+    ))
+
+
+def _start_trace(name: str, timings: bool) -> Optional[Trace]:
+    """timings 요청 또는 TRACE_EXPORT_PATH 설정 시 요청 트레이스 시작"""
+    if timings or get_settings().trace_export_path:
+        return start_trace(name)
+    return None
 
-    # 전체 상태 판단
-    all_ready = all(s.get("ready", False) for s in services.values())
-    status = "healthy" if all_ready else "degraded"
 
-    return HealthResponse(status=status, services=services)
+async def _finish_trace(trace: Optional[Trace], response: SearchResponse, timings: bool):
+    """트레이스 종료 → timings 응답 반영 및 파일 싱크로 내보내기"""
+    if trace is None:
+        return
+
+    trace.finish()
+    if timings:
+        response.timings = TimingsResponse(**trace.summary())
+    # 파일 쓰기가 이벤트 루프를 막지 않도록 스레드에서 실행
+    await asyncio.to_thread(export_trace, trace)
+
+
+def _sse(event: str, data) -> str:
+    """SSE 메시지 직렬화"""
+    payload = dumps(data).decode("utf-8")
+    return f"event: {event}\ndata: {payload}\n\n"
+
+
+def _to_user_profile(request: SearchRequest) -> Optional[UserProfile]:
+    """요청 프로필 → 워크플로우 UserProfile 변환"""
+    if not request.user_profile:
+        return None
+    return UserProfile(
+        weight=request.user_profile.weight,
+        height=request.user_profile.height,
+        age=request.user_profile.age,
+        gender=request.user_profile.gender,
+        activity_level=request.user_profile.activity_level
+    )
+
+
+def _build_search_response(
+    final_state: dict,
+    query: str,
+    processing_time_ms: float
+) -> SearchResponse:
+    """
+    최종 State → SearchResponse 변환
+
+    중첩 모델을 하나씩 만들지 않고 dict로 구성한 뒤 한 번에 검증한다
+    (Pydantic v2에서는 model_construct보다 Rust 검증기 한 번 호출이 빠름).
+    """
+    analyzed = final_state.get("analyzed_query", {})
+    recipe_data = final_state.get("recipe")
+    nutrition_data = final_state.get("nutrition")
+
+    return SearchResponse.model_validate({
+        "success": True,
+        "message": "검색 완료",
+        # 분석된 쿼리
+        "analyzed_query": _analyzed_query_payload(analyzed, query) if analyzed else None,
+        # 레시피
+        "recipe": _recipe_payload(recipe_data) if recipe_data else None,
+        # 영양정보
+        "nutrition": _nutrition_payload(nutrition_data) if nutrition_data else None,
+        # 운동 추천
+        "exercises": _exercises_payload(final_state.get("exercise_recommendations", [])),
+        # 최종 응답 텍스트
+        "response": final_state.get("response", ""),
+        "processing_time_ms": processing_time_ms,
+        # 요청 예산 소진/LLM 실패로 대체 경로를 사용한 단계
+        "degraded_stages": list(final_state.get("degraded_stages") or []),
+        # 응답 캐시 상태
+        "cache_status": final_state.get("cache_status", "bypass"),
+    })
+
+
+def _build_deferred_response(
+    state: dict,
+    query: str,
+    processing_time_ms: float,
+    job_id: str
+) -> SearchResponse:
+    """
+    DB 단계 결과 State → SearchResponse (GPT 생성은 백그라운드 작업으로 진행 중)
+
+    레시피는 생성 전이므로 비우고, 영양DB에 결과가 있으면 그 칼로리로 운동 추천을 계산한다.
+    """
+    state = recommend_exercises(dict(state, recipe={}))
+    response = _build_search_response(state, query, processing_time_ms)
+    response.message = "DB 결과를 먼저 반환합니다 (GPT 생성 결과는 GET /api/jobs/{job_id}로 조회)"
+    response.job_id = job_id
+    return response
+
+
+def _analyzed_query_payload(analyzed: dict, query: str) -> dict:
+    """분석된 쿼리 응답 필드 (AnalyzedQueryResponse)"""
+    return dict(
+        food_name=analyzed.get("food_name", ""),
+        servings=analyzed.get("servings", 1),
+        query_type=analyzed.get("query_type", "recipe"),
+        original_query=query
+    )
+
+
+def _recipe_payload(recipe_data: dict) -> dict:
+    """레시피 응답 필드 (RecipeResponse)"""
+    return dict(
+        recipe_id=recipe_data.get("recipe_id", ""),
+        name=recipe_data.get("name", ""),
+        category=recipe_data.get("category", ""),
+        cooking_method=recipe_data.get("cooking_method", ""),
+        ingredients=recipe_data.get("ingredients", []),
+        instructions=recipe_data.get("instructions", []),
+        tips=recipe_data.get("tips", ""),
+        image_url=recipe_data.get("image_url", ""),
+        source=recipe_data.get("source", "database")
+    )
+
+
+def _nutrition_payload(nutrition_data: dict) -> dict:
+    """영양정보 응답 필드 (NutritionResponse)"""
+    return dict(
+        food_name=nutrition_data.get("food_name", ""),
+        servings=nutrition_data.get("servings", 1),
+        serving_size=nutrition_data.get("serving_size", 0),
+        calories=nutrition_data.get("calories", 0),
+        protein=nutrition_data.get("protein", 0),
+        fat=nutrition_data.get("fat", 0),
+        carbohydrate=nutrition_data.get("carbohydrate", 0),
+        sugar=nutrition_data.get("sugar", 0),
+        fiber=nutrition_data.get("fiber", 0),
+        sodium=nutrition_data.get("sodium", 0),
+        calcium=nutrition_data.get("calcium", 0),
+        iron=nutrition_data.get("iron", 0),
+        potassium=nutrition_data.get("potassium", 0),
+        vitamin_a=nutrition_data.get("vitamin_a", 0),
+        vitamin_c=nutrition_data.get("vitamin_c", 0),
+        cholesterol=nutrition_data.get("cholesterol", 0)
+    )
+
+
+def _exercises_payload(exercises_data: list) -> List[dict]:
+    """운동 추천 응답 필드 (ExerciseResponse 목록)"""
+    return [
+        dict(
+            name=ex.get("name", ""),
+            name_kr=ex.get("name_kr", ""),
+            intensity=ex.get("intensity", "medium"),
+            duration_minutes=ex.get("duration_minutes", 0),
+            calories_burned=ex.get("calories_burned", 0),
+            met=ex.get("met", 0),
+            description=ex.get("description", ""),
+            tips=ex.get("tips", "")
+        )
+        for ex in exercises_data or []
+    ]
+
+
+# ============================================================
+# GET 리소스 (브라우저/CDN/리버스 프록시 캐시 가능)
+# 레시피와 영양정보는 데이터 빌드 사이에 변하지 않으므로 ETag를 데이터 빌드 버전과
+# 요청 식별자로만 계산한다. If-None-Match가 일치하면 데이터를 조회하지 않고 304를 반환한다.
+# 파일 로드/해시/SQLite 조회가 이벤트 루프를 막지 않도록 동기 함수(스레드풀)로 정의한다.
+# ============================================================
+
+_RESOURCE_RESPONSES = {
+    304: {"description": "변경 없음 (If-None-Match 일치)"},
+    404: {"model": ErrorResponse, "description": "리소스 없음"},
+    429: {"model": ErrorResponse, "description": "대기열 가득 참/요청 한도 초과 (Retry-After)"},
+}
+
+
+def _resource_error(status_code: int, error: str, detail: Optional[str] = None) -> HTTPException:
+    """GET 리소스 에러 (캐시 헤더 없음)"""
+    return HTTPException(
+        status_code=status_code,
+        detail=ErrorResponse(success=False, error=error, detail=detail).model_dump()
+    )
+
+
+def _resource_response(content, etag: str) -> ORJSONResponse:
+    """ETag/Cache-Control을 포함한 GET 리소스 응답"""
+    return ORJSONResponse(
+        content,
+        headers=cache_headers(etag, get_settings().resource_cache_max_age_seconds)
+    )
+
+
+def _check_not_modified(if_none_match: Optional[str], etag: str) -> Optional[Response]:
+    """If-None-Match가 일치하면 304 응답 (클라이언트가 보낸 인코딩별 ETag를 그대로 사용)"""
+    matched = match_etag(if_none_match, etag)
+    if matched is None:
+        return None
+    return not_modified(matched, get_settings().resource_cache_max_age_seconds)
+
+
+@router.get(
+    "/recipes",
+    response_model=RecipeListResponse,
+    responses={**_RESOURCE_RESPONSES, 400: {"model": ErrorResponse, "description": "잘못된 커서"}},
+    tags=["Resources"],
+    summary="레시피 목록 조회",
+    description="카테고리별 레시피 목록을 커서 페이지네이션으로 조회합니다 (ETag/Cache-Control 포함)."
+)
+def list_recipes(
+    category: Optional[str] = Query(default=None, description="카테고리 (예: 반찬, 국&찌개)"),
+    cursor: Optional[str] = Query(default=None, description="이전 응답의 next_cursor"),
+    limit: int = Query(default=20, ge=1, le=100, description="페이지 크기"),
+    if_none_match: Optional[str] = Header(default=None)
+) -> Response:
+    """레시피 목록 (next_cursor가 null이면 마지막 페이지)"""
+    catalog = get_recipe_catalog()
+    etag = make_etag(catalog.data_version, "recipes", category or "", cursor or "", limit)
+    cached = _check_not_modified(if_none_match, etag)
+    if cached is not None:
+        return cached
+
+    try:
+        items, next_cursor = catalog.list_recipes(category, cursor, limit)
+    except ValueError as e:
+        raise _resource_error(400, "잘못된 커서입니다", str(e))
+
+    return _resource_response(
+        RecipeListResponse.model_validate({"items": items, "next_cursor": next_cursor}),
+        etag
+    )
+
+
+@router.get(
+    "/recipes/{recipe_id}",
+    response_model=RecipeResponse,
+    responses=_RESOURCE_RESPONSES,
+    tags=["Resources"],
+    summary="레시피 상세 조회",
+    description="recipe_id로 레시피 상세(재료, 조리 순서)를 조회합니다 (ETag/Cache-Control 포함)."
+)
+def get_recipe(recipe_id: str, if_none_match: Optional[str] = Header(default=None)) -> Response:
+    """레시피 상세"""
+    catalog = get_recipe_catalog()
+    etag = make_etag(catalog.data_version, "recipe", recipe_id)
+    cached = _check_not_modified(if_none_match, etag)
+    if cached is not None:
+        return cached
+
+    recipe = catalog.get(recipe_id)
+    if recipe is None:
+        raise _resource_error(404, "레시피를 찾을 수 없습니다", f"recipe_id: {recipe_id}")
+
+    payload = _recipe_payload({**recipe, "tips": recipe.get("tip", ""), "source": "database"})
+    return _resource_response(RecipeResponse.model_validate(payload), etag)
+
+
+@router.get(
+    "/recipes/{recipe_id}/similar",
+    response_model=SimilarRecipesResponse,
+    responses={**_RESOURCE_RESPONSES, 503: {"model": ErrorResponse, "description": "벡터 DB 미준비"}},
+    tags=["Resources"],
+    summary="유사 레시피 조회",
+    description="벡터 DB에 저장된 레시피 벡터로 유사 레시피를 조회합니다 (임베딩 API 호출 없음)."
+)
+def get_similar_recipes(
+    recipe_id: str,
+    limit: int = Query(default=5, ge=1, le=20, description="반환할 유사 레시피 수"),
+    if_none_match: Optional[str] = Header(default=None)
+) -> Response:
+    """유사 레시피 (유사도 내림차순, 기준 레시피 제외)"""
+    catalog = get_recipe_catalog()
+    etag = make_etag(catalog.data_version, "similar", recipe_id, limit)
+    cached = _check_not_modified(if_none_match, etag)
+    if cached is not None:
+        return cached
+
+    if catalog.get(recipe_id) is None:
+        raise _resource_error(404, "레시피를 찾을 수 없습니다", f"recipe_id: {recipe_id}")
+
+    items = catalog.similar(recipe_id, limit)
+    if items is None:
+        raise _resource_error(503, "벡터 DB가 준비되지 않았습니다")
+
+    return _resource_response(
+        SimilarRecipesResponse.model_validate({"recipe_id": recipe_id, "items": items}),
+        etag
+    )
+
+
+@router.get(
+    "/nutrition/{food_name}",
+    response_model=NutritionResponse,
+    responses={**_RESOURCE_RESPONSES, 503: {"model": ErrorResponse, "description": "영양정보 DB 미준비"}},
+    tags=["Resources"],
+    summary="음식 영양정보 조회",
+    description="음식명(정확한 매칭)으로 1회 제공량 기준 영양정보를 조회합니다 (ETag/Cache-Control 포함)."
+)
+def get_food_nutrition(food_name: str, if_none_match: Optional[str] = Header(default=None)) -> Response:
+    """음식 영양정보 (1인분)"""
+    service = get_nutrition_db_service()
+    etag = make_etag(service.data_version, "nutrition", food_name)
+    cached = _check_not_modified(if_none_match, etag)
+    if cached is not None:
+        return cached
+
+    if not service.is_ready:
+        raise _resource_error(503, "영양정보 DB가 준비되지 않았습니다")
+
+    row = service.get_nutrition(food_name)
+    if row is None:
+        raise _resource_error(404, "영양정보를 찾을 수 없습니다", f"food_name: {food_name}")
+
+    # NULL 컬럼은 0으로 (스키마가 음수/None을 허용하지 않음)
+    values = {key: value or 0 for key, value in row.get("nutrition", {}).items()}
+    payload = _nutrition_payload({
+        **values,
+        "food_name": row.get("food_name", food_name),
+        "servings": 1,
+        "serving_size": row.get("serving_size") or 0,
+    })
+    return _resource_response(NutritionResponse.model_validate(payload), etag)
+
+
+@router.get(
+    "/health",
+    response_model=HealthResponse,
+    summary="서비스 상태 확인",
+    description=(
+        "백그라운드 주기 점검의 마지막 결과를 반환합니다. "
+        "deep=1이면 레코드 수, OpenAI 연결, 파이프라인 캐시까지 점검합니다 (점검 주기 동안 재사용)."
+    )
+)
+async def health_check(
+    deep: bool = Query(default=False, description="레코드 수/OpenAI 연결까지 점검")
+) -> HealthResponse:
+    """헬스체크 엔드포인트 (기본은 스냅샷 반환으로 프로브마다 DB를 조회하지 않음)"""
+    monitor = get_health_monitor()
+    snapshot = await monitor.deep_check() if deep else monitor.snapshot
+    return HealthResponse(**snapshot)
+
+
+@router.get(
+    "/ready",
+    response_model=ReadinessResponse,
+    responses={503: {"model": ReadinessResponse, "description": "예열 진행 중 또는 필수 구성 요소 준비 실패"}},
+    summary="서비스 준비 상태 확인 (로드밸런서용)",
+    description=(
+        "시작 시 예열이 끝났고 필수 구성 요소(vector_db, workflow)가 준비됐으면 200, "
+        "예열 중이거나 필수 구성 요소가 실패했으면 503(failed_components에 실패 목록)을 반환합니다. "
+        "외부 의존성은 확인하지 않습니다."
+    )
+)
+async def readiness_check(response: Response) -> ReadinessResponse:
+    """레디니스 엔드포인트 (/api/health와 달리 외부 의존성이 아닌 예열 결과로 판단)"""
+    warmup = get_warmup_manager()
+    if not warmup.is_ready:
+        response.status_code = 503
+    return ReadinessResponse(**warmup.get_status())
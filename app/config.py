@@ -29,7 +29,28 @@ class Settings(BaseSettings):
 
     # OpenAI API
     openai_api_key: str = Field(default="", alias="OPENAI_API_KEY")
+    openai_base_url: str = Field(default="", alias="OPENAI_BASE_URL")
     openai_model: str = Field(default="gpt-4o-mini", alias="OPENAI_MODEL")
+    openai_max_connections: int = Field(default=100, alias="OPENAI_MAX_CONNECTIONS")
+    openai_timeout_seconds: float = Field(default=60.0, alias="OPENAI_TIMEOUT_SECONDS")
+    openai_keepalive_seconds: float = Field(default=30.0, alias="OPENAI_KEEPALIVE_SECONDS")
+    openai_max_retries: int = Field(default=2, alias="OPENAI_MAX_RETRIES")
+    openai_retry_base_delay_seconds: float = Field(default=0.25, alias="OPENAI_RETRY_BASE_DELAY_SECONDS")
+    openai_retry_max_delay_seconds: float = Field(default=4.0, alias="OPENAI_RETRY_MAX_DELAY_SECONDS")
+    openai_hedge_enabled: bool = Field(default=True, alias="OPENAI_HEDGE_ENABLED")
+    openai_hedge_percentile: float = Field(default=0.95, alias="OPENAI_HEDGE_PERCENTILE")
+    openai_hedge_min_delay_seconds: float = Field(default=0.2, alias="OPENAI_HEDGE_MIN_DELAY_SECONDS")
+    openai_hedge_min_samples: int = Field(default=20, alias="OPENAI_HEDGE_MIN_SAMPLES")
+    openai_circuit_failure_threshold: int = Field(default=5, alias="OPENAI_CIRCUIT_FAILURE_THRESHOLD")
+    openai_circuit_reset_seconds: float = Field(default=30.0, alias="OPENAI_CIRCUIT_RESET_SECONDS")
+
+    # Request Budget (X-Request-Timeout 헤더가 없으면 기본값 사용)
+    request_timeout_seconds: float = Field(default=20.0, alias="REQUEST_TIMEOUT_SECONDS")
+    max_request_timeout_seconds: float = Field(default=60.0, alias="MAX_REQUEST_TIMEOUT_SECONDS")
+    llm_min_budget_seconds: float = Field(default=0.5, alias="LLM_MIN_BUDGET_SECONDS")
+
+    # Tracing (OpenTelemetry 호환 JSON 파일 싱크, 빈 값이면 내보내지 않음)
+    trace_export_path: str = Field(default="", alias="TRACE_EXPORT_PATH")
 
     # 공공데이터포털 API
     recipe_api_key: str = Field(default="", alias="RECIPE_API_KEY")
@@ -44,6 +65,81 @@ class Settings(BaseSettings):
     similarity_threshold: float = Field(default=0.7, alias="SIMILARITY_THRESHOLD")
     top_k_results: int = Field(default=3, alias="TOP_K_RESULTS")
 
+    # Query Analyzer Config
+    query_rule_threshold: float = Field(default=0.8, alias="QUERY_RULE_THRESHOLD")
+    dish_dictionary_db_group: str = Field(default="음식", alias="DISH_DICTIONARY_DB_GROUP")
+    query_cache_size: int = Field(default=1000, alias="QUERY_CACHE_SIZE")
+    query_cache_ttl_seconds: float = Field(default=86400, alias="QUERY_CACHE_TTL_SECONDS")
+    query_cache_path: str = Field(default="", alias="QUERY_CACHE_PATH")  # 빈 값이면 메모리 전용
+
+    # Pipeline Cache (프로필과 무관한 워크플로우 결과 캐시: 메모리 → SQLite)
+    pipeline_cache_enabled: bool = Field(default=True, alias="PIPELINE_CACHE_ENABLED")
+    pipeline_cache_size: int = Field(default=500, alias="PIPELINE_CACHE_SIZE")
+    pipeline_cache_ttl_seconds: float = Field(default=86400, alias="PIPELINE_CACHE_TTL_SECONDS")
+    pipeline_cache_db_path: str = Field(default="", alias="PIPELINE_CACHE_DB_PATH")  # 빈 값이면 메모리 전용
+    pipeline_cache_db_max_entries: int = Field(default=10000, alias="PIPELINE_CACHE_DB_MAX_ENTRIES")
+
+    # Batch Search (POST /api/search/batch, 동시 실행 쿼리의 임베딩/영양정보 조회 묶음 처리)
+    batch_max_queries: int = Field(default=1000, alias="BATCH_MAX_QUERIES")
+    batch_concurrency: int = Field(default=8, alias="BATCH_CONCURRENCY")
+    batch_max_concurrency: int = Field(default=32, alias="BATCH_MAX_CONCURRENCY")
+    micro_batch_max_size: int = Field(default=64, alias="MICRO_BATCH_MAX_SIZE")
+    micro_batch_wait_ms: float = Field(default=10, alias="MICRO_BATCH_WAIT_MS")
+    micro_batch_timeout_ms: float = Field(default=1000, alias="MICRO_BATCH_TIMEOUT_MS")  # 영양정보 배치 대기 상한 (초과 시 직접 조회)
+
+    # Warm-up (시작 시 싱글톤 병렬 초기화 → /api/ready, 예열 쿼리로 캐시 사전 채우기)
+    warmup_enabled: bool = Field(default=True, alias="WARMUP_ENABLED")
+    warmup_queries_path: str = Field(default="", alias="WARMUP_QUERIES_PATH")  # 빈 값이면 예열 쿼리 생략
+    warmup_concurrency: int = Field(default=4, alias="WARMUP_CONCURRENCY")
+    warmup_timeout_seconds: float = Field(default=120, alias="WARMUP_TIMEOUT_SECONDS")
+
+    # Health Check (백그라운드 주기 점검 스냅샷, deep=1은 레코드 수/OpenAI 연결 확인)
+    health_check_interval_seconds: float = Field(default=10, alias="HEALTH_CHECK_INTERVAL_SECONDS")
+    health_deep_timeout_seconds: float = Field(default=5, alias="HEALTH_DEEP_TIMEOUT_SECONDS")
+
+    # Response Compression (단일 본문 JSON 응답을 brotli/gzip으로 압축, 0이면 비활성)
+    response_compression_min_bytes: int = Field(default=1024, alias="RESPONSE_COMPRESSION_MIN_BYTES")
+
+    # GET Resources (레시피/영양정보 조회, 데이터 빌드 버전 기반 ETag + Cache-Control)
+    resource_cache_max_age_seconds: int = Field(default=86400, alias="RESOURCE_CACHE_MAX_AGE_SECONDS")
+    data_version: str = Field(default="", alias="DATA_VERSION")  # 빈 값이면 데이터 파일 내용 해시
+
+    # Admission Control (풀별 동시 실행 제한 + 대기열, 가득 차면 429 / 대기 시간 초과 시 503)
+    admission_enabled: bool = Field(default=True, alias="ADMISSION_ENABLED")
+    admission_llm_max_concurrency: int = Field(default=16, alias="ADMISSION_LLM_MAX_CONCURRENCY")
+    admission_llm_max_queue: int = Field(default=64, alias="ADMISSION_LLM_MAX_QUEUE")
+    admission_db_max_concurrency: int = Field(default=64, alias="ADMISSION_DB_MAX_CONCURRENCY")
+    admission_db_max_queue: int = Field(default=256, alias="ADMISSION_DB_MAX_QUEUE")
+    admission_queue_timeout_seconds: float = Field(default=10, alias="ADMISSION_QUEUE_TIMEOUT_SECONDS")
+    client_quota_rate_per_second: float = Field(default=0, alias="CLIENT_QUOTA_RATE_PER_SECOND")  # 0이면 비활성
+    client_quota_burst: float = Field(default=20, alias="CLIENT_QUOTA_BURST")
+
+    # Background Jobs (background=true 검색의 LLM 단계를 워커에서 실행, 작업 상태는 SQLite 저장)
+    jobs_enabled: bool = Field(default=True, alias="JOBS_ENABLED")
+    jobs_db_path: str = Field(default="data/cache/jobs.db", alias="JOBS_DB_PATH")
+    job_workers: int = Field(default=4, alias="JOB_WORKERS")
+    job_timeout_seconds: float = Field(default=120, alias="JOB_TIMEOUT_SECONDS")
+    job_max_attempts: int = Field(default=3, alias="JOB_MAX_ATTEMPTS")
+    job_retention_seconds: float = Field(default=86400, alias="JOB_RETENTION_SECONDS")
+    job_lease_seconds: float = Field(default=30, alias="JOB_LEASE_SECONDS")  # 실행 중 작업 임대 (만료 시 다른 워커가 재실행)
+
+    # Speculative Fallback (DB 미스가 예상되면 벡터 검색과 GPT 레시피 생성을 동시에 시작, 적중 시 결과 폐기)
+    speculative_fallback_enabled: bool = Field(default=False, alias="SPECULATIVE_FALLBACK_ENABLED")
+    speculative_miss_threshold: float = Field(default=0.5, alias="SPECULATIVE_MISS_THRESHOLD")
+    speculative_min_observations: int = Field(default=3, alias="SPECULATIVE_MIN_OBSERVATIONS")
+    speculative_history_size: int = Field(default=10000, alias="SPECULATIVE_HISTORY_SIZE")
+
+    # LLM Fallback (레시피와 영양정보를 JSON 스키마 응답 한 번으로 생성)
+    llm_combined_generation_enabled: bool = Field(default=False, alias="LLM_COMBINED_GENERATION_ENABLED")
+
+    # Response Token Budget (응답 포맷터 컨텍스트 토큰 예산, 쿼리 유형별 max_tokens)
+    response_token_budget_enabled: bool = Field(default=True, alias="RESPONSE_TOKEN_BUDGET_ENABLED")
+    response_context_max_tokens: int = Field(default=500, alias="RESPONSE_CONTEXT_MAX_TOKENS")  # DB 레시피 전체 컨텍스트 p95 ≈ 487
+
+    # Answer Cards (DB 레시피별로 미리 생성한 응답, scripts/build_answer_cards.py)
+    answer_cards_enabled: bool = Field(default=True, alias="ANSWER_CARDS_ENABLED")
+    answer_cards_path: str = Field(default="data/processed/answer_cards.jsonl", alias="ANSWER_CARDS_PATH")
+
     # Default User Profile
     default_weight_kg: float = Field(default=70, alias="DEFAULT_WEIGHT_KG")
     default_height_cm: float = Field(default=170, alias="DEFAULT_HEIGHT_CM")
@@ -3,17 +3,22 @@
 from app.core.agents.query_analyzer import (
     QueryAnalyzer,
     get_query_analyzer,
-    analyze_query
+    analyze_query,
+    aanalyze_query
 )
 from app.core.agents.recipe_fetcher import (
     RecipeFetcher,
     get_recipe_fetcher,
-    fetch_recipe
+    fetch_recipe,
+    afetch_recipe
 )
 from app.core.agents.nutrition_calculator import (
     NutritionCalculator,
     get_nutrition_calculator,
-    calculate_nutrition
+    lookup_nutrition,
+    alookup_nutrition,
+    calculate_nutrition,
+    acalculate_nutrition
 )
 from app.core.agents.exercise_recommender import (
     ExerciseRecommender,
@@ -23,12 +28,15 @@ from app.core.agents.exercise_recommender import (
 from app.core.agents.response_formatter import (
     ResponseFormatter,
     get_response_formatter,
-    format_response
+    format_response,
+    aformat_response,
+    format_template_response
 )
 from app.core.agents.llm_fallback import (
     LLMFallbackAgent,
     get_llm_fallback_agent,
-    process_llm_fallback
+    process_llm_fallback,
+    aprocess_llm_fallback
 )
 
 __all__ = [
@@ -36,14 +44,19 @@ __all__ = [
     "QueryAnalyzer",
     "get_query_analyzer",
     "analyze_query",
+    "aanalyze_query",
     # Recipe Fetcher
     "RecipeFetcher",
     "get_recipe_fetcher",
     "fetch_recipe",
+    "afetch_recipe",
     # Nutrition Calculator
     "NutritionCalculator",
     "get_nutrition_calculator",
+    "lookup_nutrition",
+    "alookup_nutrition",
     "calculate_nutrition",
+    "acalculate_nutrition",
     # Exercise Recommender
     "ExerciseRecommender",
     "get_exercise_recommender",
@@ -52,8 +65,11 @@ __all__ = [
     "ResponseFormatter",
     "get_response_formatter",
     "format_response",
+    "aformat_response",
+    "format_template_response",
     # LLM Fallback
     "LLMFallbackAgent",
     "get_llm_fallback_agent",
     "process_llm_fallback",
+    "aprocess_llm_fallback",
 ]
@@ -1,10 +1,13 @@
 """LLM Fallback Agent - DB에 없는 레시피/영양정보 생성"""
 
 import logging
-from typing import Optional
+from typing import Optional, Tuple
 
+from app.config import get_settings
 from app.core.workflow.state import ChatState, RecipeInfo, NutritionInfo
-from app.core.services.llm_service import get_llm_service
+from app.core.services.llm_service import LLMService, get_llm_service
+from app.core.workflow.deadline import llm_timeout, mark_degraded
+from app.core.workflow.speculation import take_speculative
 
 logger = logging.getLogger(__name__)
 
@@ -24,81 +27,250 @@ class LLMFallbackAgent:
         """
         recipe_source가 llm_fallback인 경우 레시피/영양정보 생성
 
+        워크플로우에서는 process_recipe()와 process_nutrition()이
+        별도 노드로 병렬 실행된다.
+
         Args:
             state: ChatState
 
         Returns:
             recipe, nutrition이 업데이트된 ChatState
         """
+        state = self.process_recipe(state)
+        return self.process_nutrition(state)
+
+    async def aprocess(self, state: ChatState) -> ChatState:
+        """process()의 비동기 버전"""
+        state = await self.aprocess_recipe(state)
+        return await self.aprocess_nutrition(state)
+
+    def process_recipe(self, state: ChatState) -> ChatState:
+        """
+        recipe_source가 llm_fallback이고 레시피 내용이 없으면 GPT로 레시피 생성
+
+        Args:
+            state: ChatState
+
+        Returns:
+            recipe가 업데이트된 ChatState
+        """
+        target = self._recipe_target(state)
+        if not target:
+            return state
+
+        llm_service, food_name, servings, timeout = target
+        if self._combine_with_nutrition(state):
+            logger.info(f"LLM 레시피+영양정보 통합 생성 시작: {food_name}")
+            generated = llm_service.generate_recipe_with_nutrition(food_name, servings, timeout)
+            return self._apply_combined(state, generated, food_name, servings)
+
+        logger.info(f"LLM 레시피 생성 시작: {food_name}")
+        generated_recipe = llm_service.generate_recipe(food_name, servings, timeout)
+        return self._apply_recipe(state, generated_recipe, food_name)
+
+    async def aprocess_recipe(self, state: ChatState) -> ChatState:
+        """process_recipe()의 비동기 버전 (AsyncOpenAI, 레시피 검색 중 시작한 투기 생성이 있으면 이어받음)"""
+        target = self._recipe_target(state)
+        if not target:
+            return state
+
+        llm_service, food_name, servings, timeout = target
+        speculative = take_speculative("recipe", food_name, servings)
+        if speculative is not None:
+            logger.info(f"투기 생성 중인 레시피 사용: {food_name}")
+            generated_recipe = await speculative
+        elif self._combine_with_nutrition(state):
+            logger.info(f"LLM 레시피+영양정보 통합 생성 시작: {food_name}")
+            generated = await llm_service.agenerate_recipe_with_nutrition(food_name, servings, timeout)
+            return self._apply_combined(state, generated, food_name, servings)
+        else:
+            logger.info(f"LLM 레시피 생성 시작: {food_name}")
+            generated_recipe = await llm_service.agenerate_recipe(food_name, servings, timeout)
+        return self._apply_recipe(state, generated_recipe, food_name)
+
+    def process_nutrition(self, state: ChatState) -> ChatState:
+        """
+        영양정보가 없으면 GPT로 영양정보 추정 (DB/LLM 레시피 상관없이)
+
+        Args:
+            state: ChatState
+
+        Returns:
+            nutrition이 업데이트된 ChatState
+        """
+        target = self._nutrition_target(state)
+        if not target:
+            return state
+
+        llm_service, food_name, servings, timeout = target
+        if self._combined_enabled() and state.get("recipe_source") == "llm_fallback":
+            # 병렬로 실행 중인 레시피 생성과 같은 통합 호출을 공유 (single-flight)
+            logger.info(f"영양정보 없음, 레시피+영양정보 통합 생성 사용: {food_name}")
+            generated = llm_service.generate_recipe_with_nutrition(food_name, servings, timeout)
+            generated_nutrition = generated["nutrition"] if generated else None
+        else:
+            logger.info(f"영양정보 없음, GPT로 생성 시도: {food_name}")
+            generated_nutrition = llm_service.generate_nutrition(food_name, servings, timeout)
+        return self._apply_nutrition(state, generated_nutrition, food_name, servings)
+
+    async def aprocess_nutrition(self, state: ChatState) -> ChatState:
+        """process_nutrition()의 비동기 버전 (AsyncOpenAI, 투기 생성 중인 영양정보 추정이 있으면 이어받음)"""
+        target = self._nutrition_target(state)
+        if not target:
+            return state
+
+        llm_service, food_name, servings, timeout = target
+        speculative = take_speculative("nutrition", food_name, servings)
+        if speculative is not None:
+            logger.info(f"투기 생성 중인 영양정보 사용: {food_name}")
+            generated_nutrition = await speculative
+        elif self._combined_enabled() and state.get("recipe_source") == "llm_fallback":
+            logger.info(f"영양정보 없음, 레시피+영양정보 통합 생성 사용: {food_name}")
+            generated = await llm_service.agenerate_recipe_with_nutrition(food_name, servings, timeout)
+            generated_nutrition = generated["nutrition"] if generated else None
+        else:
+            logger.info(f"영양정보 없음, GPT로 생성 시도: {food_name}")
+            generated_nutrition = await llm_service.agenerate_nutrition(food_name, servings, timeout)
+        return self._apply_nutrition(state, generated_nutrition, food_name, servings)
+
+    def _combined_enabled(self) -> bool:
+        """레시피+영양정보 통합 생성 사용 여부 (LLM_COMBINED_GENERATION_ENABLED)"""
+        return get_settings().llm_combined_generation_enabled
+
+    def _combine_with_nutrition(self, state: ChatState) -> bool:
+        """레시피 생성 시 영양정보도 함께 생성할지 여부 (영양DB 조회 결과가 없을 때만)"""
+        return self._combined_enabled() and state.get("nutrition", {}).get("calories", 0) <= 0
+
+    def _recipe_target(self, state: ChatState) -> Optional[Tuple[LLMService, str, int, Optional[float]]]:
+        """레시피 생성이 필요하면 (LLM 서비스, 음식명, 인분, 타임아웃) 반환"""
         recipe_source = state.get("recipe_source", "database")
         logger.info(f"LLM Fallback 진입 - recipe_source: {recipe_source}")
 
-        # DB에서 찾은 경우에도 영양정보가 없으면 LLM으로 생성 시도
-        analyzed_query = state.get("analyzed_query", {})
-        food_name = analyzed_query.get("food_name", "")
-        servings = analyzed_query.get("servings", 1)
+        recipe = state.get("recipe", {})
+        if recipe_source != "llm_fallback" or recipe.get("ingredients") or recipe.get("instructions"):
+            return None
 
+        return self._get_target(state, "llm_fallback")
+
+    def _nutrition_target(self, state: ChatState) -> Optional[Tuple[LLMService, str, int, Optional[float]]]:
+        """영양정보 추정이 필요하면 (LLM 서비스, 음식명, 인분, 타임아웃) 반환"""
+        nutrition = state.get("nutrition", {})
+        if nutrition.get("calories", 0) > 0:
+            return None
+
+        return self._get_target(state, "nutrition_calculator")
+
+    def _get_target(
+        self,
+        state: ChatState,
+        stage: str
+    ) -> Optional[Tuple[LLMService, str, int, Optional[float]]]:
+        """
+        준비된 LLM 서비스와 음식명/인분, 남은 요청 예산 반환
+
+        하나라도 없으면 None, 요청 예산이 소진되었으면 stage를 성능 저하로 기록하고 None
+        """
+        llm_service = self._get_ready_service()
+        if not llm_service:
+            return None
+
+        food_name, servings = self._get_food(state)
         if not food_name:
             logger.warning("음식명이 없어 LLM fallback 불가")
-            return state
+            return None
 
-        # 매번 새로운 LLM 서비스 인스턴스 가져오기
-        llm_service = get_llm_service()
-        logger.info(f"LLM 서비스 상태: is_ready={llm_service.is_ready}")
+        timeout = llm_timeout(state, stage)
+        if timeout == 0:
+            mark_degraded(state, stage)
+            return None
 
-        if not llm_service.is_ready:
-            logger.error("LLM 서비스가 준비되지 않았습니다!")
-            return state
+        return llm_service, food_name, servings, timeout
 
-        logger.info(f"LLM Fallback 시작: {food_name}")
+    def _apply_recipe(self, state: ChatState, generated_recipe: Optional[dict], food_name: str) -> ChatState:
+        """생성된 레시피를 State에 반영 (생성 실패 시 성능 저하로 기록)"""
+        if not generated_recipe:
+            mark_degraded(state, "llm_fallback")
+            return state
 
-        # 레시피 생성 (recipe_source가 llm_fallback인 경우만)
+        # 기존 이미지 URL 보존 (recipe_fetcher에서 설정한 fallback 이미지)
         recipe = state.get("recipe", {})
-        if recipe_source == "llm_fallback" and not recipe.get("ingredients") and not recipe.get("instructions"):
-            generated_recipe = llm_service.generate_recipe(food_name, servings)
-            if generated_recipe:
-                # 기존 이미지 URL 보존 (recipe_fetcher에서 설정한 fallback 이미지)
-                existing_image_url = recipe.get("image_url", "") if recipe else ""
-                state["recipe"] = RecipeInfo(
-                    recipe_id="",
-                    name=generated_recipe.get("name", food_name),
-                    category=generated_recipe.get("category", ""),
-                    cooking_method=generated_recipe.get("cooking_method", ""),
-                    ingredients=generated_recipe.get("ingredients", []),
-                    instructions=generated_recipe.get("instructions", []),
-                    tips=generated_recipe.get("tips", ""),
-                    image_url=existing_image_url  # 기존 이미지 URL 유지
-                )
-                logger.info("레시피 생성 완료")
-
-        # 영양정보 생성 (영양정보가 없는 경우 - DB/LLM 상관없이)
-        nutrition = state.get("nutrition", {})
-        if nutrition.get("calories", 0) <= 0:
-            logger.info(f"영양정보 없음, GPT로 생성 시도: {food_name}")
-            generated_nutrition = llm_service.generate_nutrition(food_name, servings)
-            if generated_nutrition:
-                state["nutrition"] = NutritionInfo(
-                    food_name=food_name,
-                    serving_size=generated_nutrition.get("serving_size", 100),
-                    servings=servings,
-                    calories=generated_nutrition.get("calories", 0),
-                    protein=generated_nutrition.get("protein", 0),
-                    fat=generated_nutrition.get("fat", 0),
-                    carbohydrate=generated_nutrition.get("carbohydrate", 0),
-                    sugar=generated_nutrition.get("sugar", 0),
-                    fiber=generated_nutrition.get("fiber", 0),
-                    sodium=generated_nutrition.get("sodium", 0),
-                    calcium=0,
-                    iron=0,
-                    potassium=0,
-                    vitamin_a=0,
-                    vitamin_c=0,
-                    cholesterol=0
-                )
-                logger.info("영양정보 생성 완료")
+        existing_image_url = recipe.get("image_url", "") if recipe else ""
+        state["recipe"] = RecipeInfo(
+            recipe_id="",
+            name=generated_recipe.get("name", food_name),
+            category=generated_recipe.get("category", ""),
+            cooking_method=generated_recipe.get("cooking_method", ""),
+            ingredients=generated_recipe.get("ingredients", []),
+            instructions=generated_recipe.get("instructions", []),
+            tips=generated_recipe.get("tips", ""),
+            image_url=existing_image_url  # 기존 이미지 URL 유지
+        )
+        logger.info("레시피 생성 완료")
 
         return state
 
+    def _apply_combined(
+        self,
+        state: ChatState,
+        generated: Optional[dict],
+        food_name: str,
+        servings: int
+    ) -> ChatState:
+        """통합 생성 결과를 State에 반영 (워크플로우에서는 레시피만 병합되고 영양정보는 영양 노드가 공유)"""
+        state = self._apply_recipe(state, generated["recipe"] if generated else None, food_name)
+        if generated and generated["nutrition"] and state.get("nutrition", {}).get("calories", 0) <= 0:
+            state = self._apply_nutrition(state, generated["nutrition"], food_name, servings)
+        return state
+
+    def _apply_nutrition(
+        self,
+        state: ChatState,
+        generated_nutrition: Optional[dict],
+        food_name: str,
+        servings: int
+    ) -> ChatState:
+        """추정된 영양정보를 State에 반영 (추정 실패 시 성능 저하로 기록)"""
+        if not generated_nutrition:
+            mark_degraded(state, "nutrition_calculator")
+            return state
+
+        state["nutrition"] = NutritionInfo(
+            food_name=food_name,
+            serving_size=generated_nutrition.get("serving_size", 100),
+            servings=servings,
+            calories=generated_nutrition.get("calories", 0),
+            protein=generated_nutrition.get("protein", 0),
+            fat=generated_nutrition.get("fat", 0),
+            carbohydrate=generated_nutrition.get("carbohydrate", 0),
+            sugar=generated_nutrition.get("sugar", 0),
+            fiber=generated_nutrition.get("fiber", 0),
+            sodium=generated_nutrition.get("sodium", 0),
+            calcium=0,
+            iron=0,
+            potassium=0,
+            vitamin_a=0,
+            vitamin_c=0,
+            cholesterol=0
+        )
+        logger.info("영양정보 생성 완료")
+
+        return state
+
+    def _get_food(self, state: ChatState) -> Tuple[str, int]:
+        """분석된 쿼리에서 음식명/인분 추출"""
+        analyzed_query = state.get("analyzed_query", {})
+        return analyzed_query.get("food_name", ""), analyzed_query.get("servings", 1)
+
+    def _get_ready_service(self) -> Optional[LLMService]:
+        """준비된 LLM 서비스 반환 (매번 새로 가져옴, 준비 안 됐으면 None)"""
+        llm_service = get_llm_service()
+        logger.info(f"LLM 서비스 상태: is_ready={llm_service.is_ready}")
+
+        if not llm_service.is_ready:
+            logger.error("LLM 서비스가 준비되지 않았습니다!")
+            return None
+        return llm_service
+
 
 # 싱글톤 인스턴스
 _llm_fallback_agent: Optional[LLMFallbackAgent] = None
@@ -113,6 +285,12 @@ def get_llm_fallback_agent() -> LLMFallbackAgent:
 
 
 def process_llm_fallback(state: ChatState) -> ChatState:
-    """LangGraph 노드 함수"""
+    """LangGraph 노드 함수 (레시피 생성, 영양정보는 calculate_nutrition 노드에서 처리)"""
+    agent = get_llm_fallback_agent()
+    return agent.process_recipe(state)
+
+
+async def aprocess_llm_fallback(state: ChatState) -> ChatState:
+    """LangGraph 노드 함수 (비동기)"""
     agent = get_llm_fallback_agent()
-    return agent.process(state)
+    return await agent.aprocess_recipe(state)
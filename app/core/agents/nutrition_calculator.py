@@ -1,10 +1,13 @@
 """NutritionCalculator Agent - 영양 정보 계산"""
 
+import asyncio
 import logging
 from typing import Optional
 
 from app.core.workflow.state import ChatState, NutritionInfo
 from app.core.services.nutrition_db_service import get_nutrition_db_service
+from app.core.agents.llm_fallback import get_llm_fallback_agent
+from app.core.workflow.speculation import note_nutrition_miss
 
 logger = logging.getLogger(__name__)
 
@@ -19,10 +22,37 @@ class NutritionCalculator:
     def __init__(self):
         self.nutrition_db = get_nutrition_db_service()
 
+    def lookup(self, state: ChatState) -> ChatState:
+        """
+        분석된 음식명으로 영양정보 DB 조회 (레시피 검색과 병렬 실행용)
+
+        Args:
+            state: analyzed_query가 포함된 ChatState
+
+        Returns:
+            nutrition이 업데이트된 ChatState (DB에 없으면 빈 영양정보)
+        """
+        analyzed_query = state.get("analyzed_query", {})
+        food_name = analyzed_query.get("food_name", "")
+        servings = analyzed_query.get("servings", 1)
+
+        if not food_name or not self.nutrition_db.is_ready:
+            state["nutrition"] = self._create_empty_nutrition(food_name, servings)
+            return state
+
+        logger.info(f"영양DB 사전 조회: {food_name} ({servings}인분)")
+        state["nutrition"] = self._search_nutrition_db(food_name, servings)
+        return state
+
     def calculate(self, state: ChatState) -> ChatState:
         """
         레시피 또는 음식명에 대한 영양 정보 계산
 
+        우선순위:
+        1. 레시피 DB의 영양정보
+        2. lookup()으로 미리 조회한 영양DB 결과
+        3. 레시피 이름으로 영양DB 조회
+
         Args:
             state: recipe, analyzed_query가 포함된 ChatState
 
@@ -51,8 +81,14 @@ class NutritionCalculator:
             logger.info(f"레시피 영양정보 사용: {nutrition_info.get('calories', 0):.0f}kcal")
             return state
 
-        # NutritionDB에서 검색
-        if self.nutrition_db.is_ready:
+        # 미리 조회한 영양DB 결과
+        looked_up = state.get("nutrition", {})
+        if looked_up.get("calories", 0) > 0:
+            logger.info(f"영양DB 사전 조회 결과 사용: {looked_up.get('calories', 0):.0f}kcal")
+            return state
+
+        # NutritionDB에서 검색 (레시피 이름이 분석된 음식명과 다른 경우)
+        if self.nutrition_db.is_ready and food_name != analyzed_query.get("food_name", ""):
             nutrition_info = self._search_nutrition_db(food_name, servings)
             if nutrition_info.get("calories", 0) > 0:
                 state["nutrition"] = nutrition_info
@@ -176,7 +212,40 @@ def get_nutrition_calculator() -> NutritionCalculator:
     return _nutrition_calculator
 
 
+def lookup_nutrition(state: ChatState) -> ChatState:
+    """LangGraph 노드 함수 (영양DB 사전 조회)"""
+    calculator = get_nutrition_calculator()
+    return calculator.lookup(state)
+
+
+async def alookup_nutrition(state: ChatState) -> ChatState:
+    """LangGraph 노드 함수 (비동기, DB 미스면 투기 실행에 알림)"""
+    calculator = get_nutrition_calculator()
+    state = await asyncio.to_thread(calculator.lookup, state)
+
+    if state.get("nutrition", {}).get("calories", 0) <= 0:
+        note_nutrition_miss(state, state.get("analyzed_query", {}).get("food_name", ""))
+
+    return state
+
+
 def calculate_nutrition(state: ChatState) -> ChatState:
-    """LangGraph 노드 함수"""
+    """LangGraph 노드 함수 (영양정보 확정, 없으면 GPT 추정)"""
     calculator = get_nutrition_calculator()
-    return calculator.calculate(state)
+    state = calculator.calculate(state)
+
+    if state.get("nutrition", {}).get("calories", 0) <= 0:
+        state = get_llm_fallback_agent().process_nutrition(state)
+
+    return state
+
+
+async def acalculate_nutrition(state: ChatState) -> ChatState:
+    """LangGraph 노드 함수 (비동기, DB/파일 조회는 스레드에서 실행)"""
+    calculator = get_nutrition_calculator()
+    state = await asyncio.to_thread(calculator.calculate, state)
+
+    if state.get("nutrition", {}).get("calories", 0) <= 0:
+        state = await get_llm_fallback_agent().aprocess_nutrition(state)
+
+    return state
@@ -1,14 +1,28 @@
 """QueryAnalyzer Agent - 사용자 쿼리 분석"""
 
+import asyncio
 import json
 import logging
 import re
-from typing import Optional
-
-from openai import OpenAI
+from typing import Optional, Tuple
 
 from app.config import get_settings
 from app.core.workflow.state import ChatState, AnalyzedQuery
+from app.core.services.dish_matcher import (
+    get_dish_matcher,
+    NUTRITION_KEYWORDS,
+    EXERCISE_KEYWORDS,
+    RECIPE_KEYWORDS
+)
+from app.core.services.query_cache import get_query_cache, normalize_query
+from app.core.services.openai_client import (
+    get_openai_client,
+    get_async_openai_client,
+    with_timeout
+)
+from app.core.services.metrics import record_token_usage
+from app.core.services.tracing import span
+from app.core.workflow.deadline import llm_timeout, mark_degraded
 
 logger = logging.getLogger(__name__)
 
@@ -44,8 +58,9 @@ class QueryAnalyzer:
 
     def __init__(self):
         self.settings = get_settings()
-        self.client = OpenAI(api_key=self.settings.openai_api_key)
+        self.client = get_openai_client()
         self.model = self.settings.openai_model
+        self.rule_threshold = self.settings.query_rule_threshold
 
     def analyze(self, state: ChatState) -> ChatState:
         """
@@ -64,17 +79,25 @@ class QueryAnalyzer:
 
         logger.info(f"쿼리 분석 시작: {user_query}")
 
+        # 사전 기반 규칙 분석 (신뢰도가 충분하면 GPT 생략)
+        analyzed, confidence = self._analyze_with_rules(user_query)
+        if analyzed and confidence >= self.rule_threshold:
+            state["analyzed_query"] = analyzed
+            logger.info(f"규칙 분석 완료 (신뢰도 {confidence:.2f}): {analyzed}")
+            return state
+
         try:
-            # GPT로 쿼리 분석
-            analyzed = self._analyze_with_gpt(user_query)
+            # GPT로 쿼리 분석 (남은 요청 예산을 타임아웃으로 사용)
+            analyzed = self._analyze_with_gpt(user_query, llm_timeout(state, "query_analyzer"))
 
             if analyzed:
                 state["analyzed_query"] = analyzed
                 logger.info(f"쿼리 분석 완료: {analyzed}")
             else:
-                # GPT 실패 시 기본 파싱 시도
+                # GPT 실패/예산 소진 시 기본 파싱 시도
                 analyzed = self._fallback_parse(user_query)
                 state["analyzed_query"] = analyzed
+                mark_degraded(state, "query_analyzer")
                 logger.warning(f"GPT 분석 실패, 기본 파싱 사용: {analyzed}")
 
         except Exception as e:
@@ -82,41 +105,189 @@ class QueryAnalyzer:
             # 에러 발생 시 기본 파싱
             analyzed = self._fallback_parse(user_query)
             state["analyzed_query"] = analyzed
+            mark_degraded(state, "query_analyzer")
 
         return state
 
-    def _analyze_with_gpt(self, query: str) -> Optional[AnalyzedQuery]:
-        """GPT를 사용한 쿼리 분석"""
+    async def aanalyze(self, state: ChatState) -> ChatState:
+        """
+        analyze()의 비동기 버전 (AsyncOpenAI 사용, 이벤트 루프를 막지 않음)
+
+        Args:
+            state: 현재 ChatState
+
+        Returns:
+            analyzed_query가 업데이트된 ChatState
+        """
+        user_query = state.get("user_query", "")
+        if not user_query:
+            state["error"] = "사용자 쿼리가 비어있습니다."
+            return state
+
+        logger.info(f"쿼리 분석 시작: {user_query}")
+
+        # 예열 완료 전 첫 요청이면 음식명 사전(Aho-Corasick)을 생성하므로 스레드에서 실행
+        analyzed, confidence = await asyncio.to_thread(self._analyze_with_rules, user_query)
+        if analyzed and confidence >= self.rule_threshold:
+            state["analyzed_query"] = analyzed
+            logger.info(f"규칙 분석 완료 (신뢰도 {confidence:.2f}): {analyzed}")
+            return state
+
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": SYSTEM_PROMPT},
-                    {"role": "user", "content": query}
-                ],
-                temperature=0,
-                max_tokens=200
+            analyzed = await self._aanalyze_with_gpt(
+                user_query, llm_timeout(state, "query_analyzer")
             )
 
-            content = response.choices[0].message.content
-            logger.debug(f"GPT 응답: {content}")
-
-            # JSON 파싱
-            parsed = self._parse_json(content)
-            if parsed:
-                return AnalyzedQuery(
-                    food_name=parsed.get("food_name", ""),
-                    servings=parsed.get("servings", 1),
-                    query_type=parsed.get("query_type", "recipe"),
-                    original_query=query
+            if analyzed:
+                state["analyzed_query"] = analyzed
+                logger.info(f"쿼리 분석 완료: {analyzed}")
+            else:
+                analyzed = self._fallback_parse(user_query)
+                state["analyzed_query"] = analyzed
+                mark_degraded(state, "query_analyzer")
+                logger.warning(f"GPT 분석 실패, 기본 파싱 사용: {analyzed}")
+
+        except Exception as e:
+            logger.error(f"쿼리 분석 실패: {e}")
+            analyzed = self._fallback_parse(user_query)
+            state["analyzed_query"] = analyzed
+            mark_degraded(state, "query_analyzer")
+
+        return state
+
+    def _analyze_with_rules(self, query: str) -> Tuple[Optional[AnalyzedQuery], float]:
+        """음식명 사전(Aho-Corasick) 기반 결정적 분석
+
+        Returns:
+            (AnalyzedQuery 또는 None, 신뢰도 0~1)
+        """
+        try:
+            match = get_dish_matcher().match(query)
+        except Exception as e:
+            logger.warning(f"규칙 분석 실패: {e}")
+            return None, 0.0
+
+        if not match.food_name:
+            return None, 0.0
+
+        return AnalyzedQuery(
+            food_name=match.food_name,
+            servings=match.servings,
+            query_type=match.query_type,
+            original_query=query
+        ), match.confidence
+
+    def _analyze_with_gpt(self, query: str, timeout: Optional[float] = None) -> Optional[AnalyzedQuery]:
+        """
+        GPT를 사용한 쿼리 분석 (정규화 쿼리 기준 캐시)
+
+        캐시 미스이고 timeout이 0(요청 예산 소진)이면 GPT를 호출하지 않고 None 반환
+        """
+        cache = get_query_cache()
+        cache_key = normalize_query(query)
+
+        cached = cache.get(cache_key)
+        if cached:
+            logger.info(f"쿼리 분석 캐시 사용: {cache_key}")
+            return AnalyzedQuery(**cached, original_query=query)
+
+        if timeout == 0:
+            return None
+
+        analyzed = self._request_gpt_analysis(query, timeout)
+        self._cache_analysis(cache_key, analyzed)
+        return analyzed
+
+    async def _aanalyze_with_gpt(
+        self,
+        query: str,
+        timeout: Optional[float] = None
+    ) -> Optional[AnalyzedQuery]:
+        """_analyze_with_gpt()의 비동기 버전"""
+        cache = get_query_cache()
+        cache_key = normalize_query(query)
+
+        cached = cache.get(cache_key)
+        if cached:
+            logger.info(f"쿼리 분석 캐시 사용: {cache_key}")
+            return AnalyzedQuery(**cached, original_query=query)
+
+        if timeout == 0:
+            return None
+
+        analyzed = await self._arequest_gpt_analysis(query, timeout)
+        self._cache_analysis(cache_key, analyzed)
+        return analyzed
+
+    def _cache_analysis(self, cache_key: str, analyzed: Optional[AnalyzedQuery]):
+        """GPT 분석 결과 캐시 저장"""
+        if analyzed:
+            get_query_cache().set(cache_key, {
+                "food_name": analyzed.get("food_name", ""),
+                "servings": analyzed.get("servings", 1),
+                "query_type": analyzed.get("query_type", "recipe")
+            })
+
+    def _request_gpt_analysis(self, query: str, timeout: Optional[float] = None) -> Optional[AnalyzedQuery]:
+        """GPT 쿼리 분석 API 호출"""
+        try:
+            with span("openai.chat", purpose="query_analysis"):
+                response = self.client.chat.completions.create(
+                    **self._build_request(query, timeout)
                 )
+            record_token_usage("openai.chat", "query_analysis", response)
+            return self._to_analyzed_query(response.choices[0].message.content, query)
 
+        except Exception as e:
+            logger.error(f"GPT 분석 오류: {e}")
             return None
 
+    async def _arequest_gpt_analysis(
+        self,
+        query: str,
+        timeout: Optional[float] = None
+    ) -> Optional[AnalyzedQuery]:
+        """GPT 쿼리 분석 API 호출 (AsyncOpenAI)"""
+        try:
+            with span("openai.chat", purpose="query_analysis"):
+                response = await get_async_openai_client().chat.completions.create(
+                    **self._build_request(query, timeout)
+                )
+            record_token_usage("openai.chat", "query_analysis", response)
+            return self._to_analyzed_query(response.choices[0].message.content, query)
+
         except Exception as e:
             logger.error(f"GPT 분석 오류: {e}")
             return None
 
+    def _build_request(self, query: str, timeout: Optional[float] = None) -> dict:
+        """GPT 쿼리 분석 요청 파라미터"""
+        return with_timeout({
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "user", "content": query}
+            ],
+            "temperature": 0,
+            "max_tokens": 200
+        }, timeout)
+
+    def _to_analyzed_query(self, content: str, query: str) -> Optional[AnalyzedQuery]:
+        """GPT 응답 → AnalyzedQuery"""
+        logger.debug(f"GPT 응답: {content}")
+
+        # JSON 파싱
+        parsed = self._parse_json(content)
+        if parsed:
+            return AnalyzedQuery(
+                food_name=parsed.get("food_name", ""),
+                servings=parsed.get("servings", 1),
+                query_type=parsed.get("query_type", "recipe"),
+                original_query=query
+            )
+
+        return None
+
     def _parse_json(self, text: str) -> Optional[dict]:
         """텍스트에서 JSON 추출 및 파싱"""
         try:
@@ -147,11 +318,11 @@ class QueryAnalyzer:
             servings = int(servings_match.group(1))
 
         # 쿼리 유형 추출
-        if any(word in query for word in ["칼로리", "영양", "영양소", "성분"]):
+        if any(word in query for word in NUTRITION_KEYWORDS):
             query_type = "nutrition"
-        elif any(word in query for word in ["운동", "소모", "태우"]):
+        elif any(word in query for word in EXERCISE_KEYWORDS):
             query_type = "exercise"
-        elif any(word in query for word in ["레시피", "만드는", "요리법", "조리법"]):
+        elif any(word in query for word in RECIPE_KEYWORDS):
             query_type = "recipe"
 
         # 음식명 추출 (간단한 규칙: 첫 번째 명사 추출)
@@ -187,3 +358,9 @@ def analyze_query(state: ChatState) -> ChatState:
     """LangGraph 노드 함수"""
     analyzer = get_query_analyzer()
     return analyzer.analyze(state)
+
+
+async def aanalyze_query(state: ChatState) -> ChatState:
+    """LangGraph 노드 함수 (비동기)"""
+    analyzer = get_query_analyzer()
+    return await analyzer.aanalyze(state)
@@ -1,10 +1,14 @@
 """RecipeFetcher Agent - 레시피 검색"""
 
+import asyncio
 import logging
-from typing import Optional
+from typing import Optional, Tuple
 
 from app.core.workflow.state import ChatState, RecipeInfo
 from app.core.services.vector_db_service import get_vector_db_service
+from app.core.services.tracing import span
+from app.core.workflow.deadline import llm_timeout, mark_degraded
+from app.core.workflow.speculation import resolve_speculative_recipe, start_speculative_recipe
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +43,85 @@ class RecipeFetcher:
         Returns:
             recipe, recipe_source가 업데이트된 ChatState
         """
+        food_name = self._prepare(state)
+        if not food_name:
+            return state
+
+        try:
+            best_match, fallback_image_recipe = self._match_by_name(food_name)
+
+            # 3단계: 벡터 유사도 검색 (LLM fallback이 결정되지 않은 경우에만)
+            # 요청 예산이 소진되었으면 임베딩 호출 없이 LLM fallback으로 진행
+            if best_match is None and fallback_image_recipe is None:
+                timeout = llm_timeout(state, "recipe_fetcher")
+                if timeout == 0:
+                    mark_degraded(state, "recipe_fetcher")
+                else:
+                    results = self.vector_db.search(
+                        query=food_name,
+                        top_k=5,
+                        similarity_threshold=self.similarity_threshold,
+                        timeout=timeout
+                    )
+                    best_match = self._pick_vector_result(results, food_name)
+                    resolve_speculative_recipe(food_name, speculated=False, missed=best_match is None)
+
+            return self._apply_match(state, food_name, best_match, fallback_image_recipe)
+
+        except Exception as e:
+            logger.error(f"레시피 검색 실패: {e}")
+            state["recipe_source"] = "llm_fallback"
+            state["recipe"] = self._create_empty_recipe(food_name)
+
+        return state
+
+    async def afetch(self, state: ChatState) -> ChatState:
+        """
+        fetch()의 비동기 버전
+
+        벡터 검색의 쿼리 임베딩은 AsyncOpenAI로 생성하고,
+        레시피 파일 조회는 스레드에서 실행하여 이벤트 루프를 막지 않는다.
+        DB 미스가 예상되면 벡터 검색과 동시에 GPT 레시피 생성을 시작한다 (SPECULATIVE_FALLBACK_ENABLED).
+        """
+        food_name = self._prepare(state)
+        if not food_name:
+            return state
+
+        try:
+            best_match, fallback_image_recipe = self._match_by_name(food_name)
+
+            if best_match is None and fallback_image_recipe is None:
+                timeout = llm_timeout(state, "recipe_fetcher")
+                if timeout == 0:
+                    mark_degraded(state, "recipe_fetcher")
+                else:
+                    speculated = start_speculative_recipe(state, food_name)
+                    results = await self.vector_db.asearch(
+                        query=food_name,
+                        top_k=5,
+                        similarity_threshold=self.similarity_threshold,
+                        timeout=timeout
+                    )
+                    best_match = self._pick_vector_result(results, food_name)
+                    resolve_speculative_recipe(food_name, speculated, missed=best_match is None)
+
+            return await asyncio.to_thread(
+                self._apply_match, state, food_name, best_match, fallback_image_recipe
+            )
+
+        except Exception as e:
+            logger.error(f"레시피 검색 실패: {e}")
+            state["recipe_source"] = "llm_fallback"
+            state["recipe"] = self._create_empty_recipe(food_name)
+
+        return state
+
+    def _prepare(self, state: ChatState) -> str:
+        """
+        검색할 음식명 반환
+
+        음식명이 없거나 Vector DB가 준비되지 않았으면 LLM fallback으로 마킹하고 빈 문자열 반환
+        """
         analyzed_query = state.get("analyzed_query", {})
         food_name = analyzed_query.get("food_name", "")
 
@@ -46,7 +129,7 @@ class RecipeFetcher:
             logger.warning("음식명이 없습니다.")
             state["recipe_source"] = "llm_fallback"
             state["recipe"] = {}
-            return state
+            return ""
 
         logger.info(f"레시피 검색: {food_name}")
 
@@ -55,87 +138,93 @@ class RecipeFetcher:
             logger.warning("Vector DB가 준비되지 않았습니다. LLM fallback 사용")
             state["recipe_source"] = "llm_fallback"
             state["recipe"] = self._create_empty_recipe(food_name)
-            return state
+            return ""
 
-        try:
-            best_match = None
-            use_llm_fallback = False
-
-            # 1단계: 정확한 이름 매칭
-            exact_match = self.vector_db.get_recipe_by_name(food_name)
-            if exact_match:
-                logger.info(f"정확한 매칭: {exact_match.get('name')}")
-                best_match = exact_match
-
-            # 2단계: 이름에 검색어가 포함된 레시피 (짧은 이름 우선)
-            # 단, 검색어가 기본 요리명(예: 김치찌개, 불고기)이고 정확한 매칭이 없으면
-            # 변형 레시피보다 LLM fallback이 더 적합함
-            fallback_image_recipe = None  # LLM fallback 시 이미지 참조용
-            if not best_match:
-                containing_recipes = []
-                for recipe in self.vector_db.recipes:
-                    recipe_name = recipe.get("name", "")
-                    # 검색어가 레시피 이름에 포함되어 있는지 확인
-                    if food_name in recipe_name:
-                        containing_recipes.append(recipe)
-
-                if containing_recipes:
-                    # 이름 길이가 짧은 순으로 정렬
-                    containing_recipes.sort(key=lambda x: len(x.get("name", "")))
-                    candidate = containing_recipes[0]
-                    candidate_name = candidate.get("name", "")
-
-                    # 검색어와 후보 이름이 거의 같은 경우만 사용
-                    # 차이가 1글자 이내이거나, 검색어 길이의 20% 이내인 경우만 매칭
-                    # 예: "된장국"(3) vs "된장국"(3) OK, "김치찌개"(4) vs "완자김치찌개"(6) NO
-                    len_diff = len(candidate_name) - len(food_name)
-                    if len_diff <= 1 or (len(food_name) >= 4 and len_diff <= len(food_name) * 0.25):
-                        best_match = candidate
-                        logger.info(f"이름 포함 매칭: {candidate_name} (후보 {len(containing_recipes)}개)")
-                    else:
-                        # 변형 레시피만 있으면 LLM fallback 사용 (이미지는 변형 레시피에서 차용)
-                        logger.info(f"'{food_name}'의 변형 레시피만 존재 ({candidate_name} 등). LLM fallback 사용")
-                        use_llm_fallback = True
-                        fallback_image_recipe = candidate  # 이미지 참조용으로 저장
+        return food_name
 
-            # 3단계: 벡터 유사도 검색 (LLM fallback이 결정되지 않은 경우에만)
-            if not best_match and not use_llm_fallback:
-                results = self.vector_db.search(
-                    query=food_name,
-                    top_k=5,
-                    similarity_threshold=self.similarity_threshold
-                )
-
-                if results:
-                    # 검색어가 포함된 결과 우선
-                    for result in results:
-                        if food_name in result.get("name", ""):
-                            best_match = result
-                            break
-
-                    # 없으면 가장 유사한 결과 사용
-                    if not best_match:
-                        best_match = results[0]
-
-                    logger.info(f"벡터 검색 결과: {best_match.get('name')} (유사도: {best_match.get('similarity', 0):.4f})")
-
-            if best_match:
-                # 상세 레시피 정보 조회
-                recipe_info = self._get_full_recipe(best_match)
-                state["recipe"] = recipe_info
-                state["recipe_source"] = "database"
-            else:
-                # 검색 결과 없음 → LLM fallback
-                logger.info(f"'{food_name}' 검색 결과 없음. LLM fallback 사용")
-                state["recipe_source"] = "llm_fallback"
-                # fallback_image_recipe가 있으면 해당 이미지 사용
-                fallback_image_url = self._get_recipe_image(fallback_image_recipe) if fallback_image_recipe else ""
-                state["recipe"] = self._create_empty_recipe(food_name, fallback_image_url)
+    def _match_by_name(self, food_name: str) -> Tuple[Optional[dict], Optional[dict]]:
+        """
+        이름 기반 매칭 (1~2단계)
 
-        except Exception as e:
-            logger.error(f"레시피 검색 실패: {e}")
+        Returns:
+            (매칭된 레시피, LLM fallback 시 이미지 참조용 레시피)
+            매칭된 레시피가 None이고 이미지 참조용 레시피가 있으면 벡터 검색 없이 LLM fallback
+            둘 다 None이면 벡터 검색 필요
+        """
+        # 1단계: 정확한 이름 매칭
+        exact_match = self.vector_db.get_recipe_by_name(food_name)
+        if exact_match:
+            logger.info(f"정확한 매칭: {exact_match.get('name')}")
+            return exact_match, None
+
+        # 2단계: 이름에 검색어가 포함된 레시피 (짧은 이름 우선)
+        # 단, 검색어가 기본 요리명(예: 김치찌개, 불고기)이고 정확한 매칭이 없으면
+        # 변형 레시피보다 LLM fallback이 더 적합함
+        containing_recipes = []
+        for recipe in self.vector_db.recipes:
+            recipe_name = recipe.get("name", "")
+            # 검색어가 레시피 이름에 포함되어 있는지 확인
+            if food_name in recipe_name:
+                containing_recipes.append(recipe)
+
+        if not containing_recipes:
+            return None, None
+
+        # 이름 길이가 짧은 순으로 정렬
+        containing_recipes.sort(key=lambda x: len(x.get("name", "")))
+        candidate = containing_recipes[0]
+        candidate_name = candidate.get("name", "")
+
+        # 검색어와 후보 이름이 거의 같은 경우만 사용
+        # 차이가 1글자 이내이거나, 검색어 길이의 20% 이내인 경우만 매칭
+        # 예: "된장국"(3) vs "된장국"(3) OK, "김치찌개"(4) vs "완자김치찌개"(6) NO
+        len_diff = len(candidate_name) - len(food_name)
+        if len_diff <= 1 or (len(food_name) >= 4 and len_diff <= len(food_name) * 0.25):
+            logger.info(f"이름 포함 매칭: {candidate_name} (후보 {len(containing_recipes)}개)")
+            return candidate, None
+
+        # 변형 레시피만 있으면 LLM fallback 사용 (이미지는 변형 레시피에서 차용)
+        logger.info(f"'{food_name}'의 변형 레시피만 존재 ({candidate_name} 등). LLM fallback 사용")
+        return None, candidate
+
+    def _pick_vector_result(self, results: list, food_name: str) -> Optional[dict]:
+        """벡터 검색 결과 중 최적 레시피 선택 (검색어 포함 결과 우선)"""
+        if not results:
+            return None
+
+        best_match = None
+        for result in results:
+            if food_name in result.get("name", ""):
+                best_match = result
+                break
+
+        # 없으면 가장 유사한 결과 사용
+        if not best_match:
+            best_match = results[0]
+
+        logger.info(f"벡터 검색 결과: {best_match.get('name')} (유사도: {best_match.get('similarity', 0):.4f})")
+        return best_match
+
+    def _apply_match(
+        self,
+        state: ChatState,
+        food_name: str,
+        best_match: Optional[dict],
+        fallback_image_recipe: Optional[dict]
+    ) -> ChatState:
+        """검색 결과를 State에 반영"""
+        if best_match:
+            # 상세 레시피 정보 조회
+            recipe_info = self._get_full_recipe(best_match)
+            state["recipe"] = recipe_info
+            state["recipe_source"] = "database"
+        else:
+            # 검색 결과 없음 → LLM fallback
+            logger.info(f"'{food_name}' 검색 결과 없음. LLM fallback 사용")
             state["recipe_source"] = "llm_fallback"
-            state["recipe"] = self._create_empty_recipe(food_name)
+            # fallback_image_recipe가 있으면 해당 이미지 사용
+            fallback_image_url = self._get_recipe_image(fallback_image_recipe) if fallback_image_recipe else ""
+            state["recipe"] = self._create_empty_recipe(food_name, fallback_image_url)
 
         return state
 
@@ -153,8 +242,9 @@ class RecipeFetcher:
 
         try:
             if recipes_file.exists():
-                with open(recipes_file, "r", encoding="utf-8") as f:
-                    recipes = json.load(f)
+                with span("recipe_file.read", file=recipes_file.name):
+                    with open(recipes_file, "r", encoding="utf-8") as f:
+                        recipes = json.load(f)
 
                 # recipe_id 또는 name으로 매칭
                 for recipe in recipes:
@@ -196,8 +286,9 @@ class RecipeFetcher:
 
         try:
             if recipes_file.exists():
-                with open(recipes_file, "r", encoding="utf-8") as f:
-                    recipes = json.load(f)
+                with span("recipe_file.read", file=recipes_file.name):
+                    with open(recipes_file, "r", encoding="utf-8") as f:
+                        recipes = json.load(f)
 
                 for recipe in recipes:
                     if recipe.get("recipe_id") == recipe_id or recipe.get("name") == name:
@@ -237,3 +328,9 @@ def fetch_recipe(state: ChatState) -> ChatState:
     """LangGraph 노드 함수"""
     fetcher = get_recipe_fetcher()
     return fetcher.fetch(state)
+
+
+async def afetch_recipe(state: ChatState) -> ChatState:
+    """LangGraph 노드 함수 (비동기)"""
+    fetcher = get_recipe_fetcher()
+    return await fetcher.afetch(state)
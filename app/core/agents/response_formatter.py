@@ -2,12 +2,21 @@
 
 import json
 import logging
-from typing import Optional
-
-from openai import OpenAI
+import re
+from typing import AsyncIterator, Iterator, Optional
 
 from app.config import get_settings
 from app.core.workflow.state import ChatState
+from app.core.services.openai_client import (
+    get_openai_client,
+    get_async_openai_client,
+    with_timeout
+)
+from app.core.services.answer_cards import get_answer_card_store
+from app.core.services.metrics import get_metrics_registry, record_token_usage
+from app.core.services.token_budget import get_token_counter
+from app.core.services.tracing import span
+from app.core.workflow.deadline import llm_timeout, mark_degraded, remaining_seconds
 
 logger = logging.getLogger(__name__)
 
@@ -19,16 +28,68 @@ SYSTEM_PROMPT = """당신은 친근하고 전문적인 한국 음식 영양사 A
 1. 음식 소개 (1-2문장)
 2. 레시피 (재료, 조리법)
 3. 영양 정보 (칼로리, 주요 영양소)
-4. 운동 추천 (강도별 운동과 시간)
+4. 운동 추천 (컨텍스트에 운동 추천 자리표시자가 있으면 그 자리표시자만 한 줄로 그대로 출력,
+   섹션 제목은 자리표시자에 포함되어 있으므로 "### 운동 추천" 같은 제목을 따로 쓰지 말 것)
 5. 마무리 조언 (1문장)
 
 주의사항:
 - 마크다운 형식 사용 (##, *, - 등)
 - 이모지를 적절히 사용하여 친근한 분위기
 - 숫자는 쉽게 읽을 수 있도록 (예: 1,000 → 1,000)
-- 운동 시간은 분 단위로 표시
 """
 
+# 응답 골격(skeleton)의 운동 추천 섹션 자리표시자
+# 운동 추천만 사용자 프로필에 의존하므로 골격은 프로필과 무관하게 캐시하고 요청마다 채운다
+EXERCISE_PLACEHOLDER = "[[EXERCISES]]"
+
+# GPT가 자리표시자 바로 앞에 직접 쓴 운동 추천 제목 (exercise_section()이 제목을 포함하므로 제거)
+_DUPLICATE_EXERCISE_HEADING = re.compile(
+    r"(?:^|(?<=\n))#{1,6}[^\n]*운동[^\n]*\n+(?=" + re.escape(EXERCISE_PLACEHOLDER) + ")"
+)
+
+# 쿼리 유형별 최대 출력 토큰 (RESPONSE_TOKEN_BUDGET_ENABLED=false면 LEGACY_MAX_TOKENS)
+# 출력 토큰이 응답 지연을 좌우하므로 레시피 설명이 필요 없는 유형은 짧게 제한한다
+MAX_TOKENS_BY_QUERY_TYPE = {"recipe": 1200, "nutrition": 600, "exercise": 600, "general": 900}
+LEGACY_MAX_TOKENS = 2000
+
+# 쿼리 유형별 응답 길이 안내 (max_tokens에 걸려 잘리지 않도록 모델에 분량을 알림)
+LENGTH_GUIDE_BY_QUERY_TYPE = {
+    "recipe": "레시피 중심, 800자 이내",
+    "nutrition": "영양 정보 중심, 400자 이내 (조리법 생략)",
+    "exercise": "운동 추천 중심, 400자 이내 (조리법 생략)",
+    "general": "600자 이내",
+}
+
+# 컨텍스트 항목별 최대 토큰 (예산과 별개로 항목 하나가 컨텍스트를 차지하지 않도록)
+USER_QUERY_MAX_TOKENS = 100
+INSTRUCTION_STEP_MAX_TOKENS = 40
+TIP_MAX_TOKENS = 40
+
+_TRUNCATED = get_metrics_registry().counter(
+    "response_formatter_truncated_total",
+    "max_tokens에 걸려 잘린 GPT 응답 수",
+    ("query_type",)
+)
+
+INTENSITY_EMOJI = {"low": "🚶", "medium": "🚴", "high": "🏃"}
+INTENSITY_KR = {"low": "저강도", "medium": "중강도", "high": "고강도"}
+
+
+def should_use_template(state: ChatState) -> bool:
+    """
+    GPT 포맷팅 없이 템플릿 응답을 사용할지 판단
+
+    - response_mode가 "structured"인 경우 (클라이언트가 구조화 데이터만 요청)
+    - 레시피/영양정보가 모두 없어 GPT가 설명할 내용이 없는 경우
+    """
+    if state.get("response_mode") == "structured":
+        return True
+
+    recipe = state.get("recipe") or {}
+    nutrition = state.get("nutrition") or {}
+    has_recipe = bool(recipe.get("ingredients") or recipe.get("instructions"))
+    return not has_recipe and nutrition.get("calories", 0) <= 0
+
 
 class ResponseFormatter:
     """최종 응답 생성 Agent
@@ -38,7 +99,7 @@ class ResponseFormatter:
 
     def __init__(self):
         self.settings = get_settings()
-        self.client = OpenAI(api_key=self.settings.openai_api_key)
+        self.client = get_openai_client()
         self.model = self.settings.openai_model
 
     def format(self, state: ChatState) -> ChatState:
@@ -53,40 +114,222 @@ class ResponseFormatter:
         """
         logger.info("최종 응답 생성 시작")
 
+        if should_use_template(state):
+            return self.format_template(state)
+
+        card_response = self._answer_card_response(state)
+        if card_response is not None:
+            set_response(state, card_response)
+            return state
+
+        timeout = llm_timeout(state, "response_formatter")
+        if timeout == 0:
+            mark_degraded(state, "response_formatter")
+            return self.format_template(state)
+
         try:
             # GPT로 응답 생성
-            response = self._generate_with_gpt(state)
+            response = self._generate_with_gpt(state, timeout)
 
             if response:
-                state["response"] = response
+                set_response(state, response)
                 logger.info("GPT 응답 생성 완료")
             else:
                 # Fallback: 템플릿 기반 응답
-                response = self._generate_template_response(state)
-                state["response"] = response
+                set_response(state, self._generate_template_response(state))
+                mark_degraded(state, "response_formatter")
+                logger.warning("템플릿 응답 사용")
+
+        except Exception as e:
+            logger.error(f"응답 생성 실패: {e}")
+            set_response(state, self._generate_template_response(state))
+            mark_degraded(state, "response_formatter")
+
+        return state
+
+    async def aformat(self, state: ChatState) -> ChatState:
+        """format()의 비동기 버전 (AsyncOpenAI)"""
+        logger.info("최종 응답 생성 시작")
+
+        if should_use_template(state):
+            return self.format_template(state)
+
+        card_response = self._answer_card_response(state)
+        if card_response is not None:
+            set_response(state, card_response)
+            return state
+
+        timeout = llm_timeout(state, "response_formatter")
+        if timeout == 0:
+            mark_degraded(state, "response_formatter")
+            return self.format_template(state)
+
+        try:
+            response = await self._agenerate_with_gpt(state, timeout)
+
+            if response:
+                set_response(state, response)
+                logger.info("GPT 응답 생성 완료")
+            else:
+                set_response(state, self._generate_template_response(state))
+                mark_degraded(state, "response_formatter")
                 logger.warning("템플릿 응답 사용")
 
         except Exception as e:
             logger.error(f"응답 생성 실패: {e}")
-            state["response"] = self._generate_template_response(state)
+            set_response(state, self._generate_template_response(state))
+            mark_degraded(state, "response_formatter")
+
+        return state
 
+    def format_template(self, state: ChatState) -> ChatState:
+        """GPT 호출 없이 템플릿 기반 응답 생성"""
+        set_response(state, self._generate_template_response(state))
+        logger.info("템플릿 응답 생성 완료 (GPT 포맷팅 생략)")
         return state
 
-    def _generate_with_gpt(self, state: ChatState) -> Optional[str]:
+    def stream(self, state: ChatState) -> Iterator[str]:
+        """
+        최종 응답을 토큰 단위로 스트리밍 (OpenAI streaming API)
+
+        템플릿 응답 대상이거나 GPT 스트리밍이 첫 토큰 전에 실패하면
+        템플릿 응답을 한 번에 반환. 스트리밍 중 요청 예산이 소진되면 그 시점에서 종료
+        운동 추천 자리표시자는 스트리밍 중에 치환하고, 응답 골격은 state["response_skeleton"]에 기록
+
+        Args:
+            state: 모든 정보가 포함된 ChatState
+
+        Yields:
+            응답 텍스트 조각
+        """
+        if should_use_template(state):
+            yield set_response(state, self._generate_template_response(state))
+            return
+
+        card_response = self._answer_card_response(state)
+        if card_response is not None:
+            yield set_response(state, card_response)
+            return
+
+        timeout = llm_timeout(state, "response_formatter")
+        renderer = _StreamRenderer(state)
+
+        try:
+            if timeout != 0:
+                with span("openai.chat.stream_open", purpose="response"):
+                    stream = self.client.chat.completions.create(
+                        **self._build_request(state, timeout, stream=True)
+                    )
+
+                for chunk in stream:
+                    if not chunk.choices:
+                        continue
+                    self._note_finish(state, getattr(chunk.choices[0], "finish_reason", None))
+                    delta = chunk.choices[0].delta.content
+                    if delta:
+                        rendered = renderer.feed(delta)
+                        if rendered:
+                            yield rendered
+                    if self._is_expired(state):
+                        break
+
+        except Exception as e:
+            logger.error(f"GPT 스트리밍 오류: {e}")
+
+        if renderer.emitted:
+            yield renderer.finish()
+            return
+
+        logger.warning("템플릿 응답 사용 (스트리밍)")
+        mark_degraded(state, "response_formatter")
+        yield set_response(state, self._generate_template_response(state))
+
+    async def astream(self, state: ChatState) -> AsyncIterator[str]:
+        """stream()의 비동기 버전 (AsyncOpenAI 스트리밍)"""
+        if should_use_template(state):
+            yield set_response(state, self._generate_template_response(state))
+            return
+
+        card_response = self._answer_card_response(state)
+        if card_response is not None:
+            yield set_response(state, card_response)
+            return
+
+        timeout = llm_timeout(state, "response_formatter")
+        renderer = _StreamRenderer(state)
+
+        try:
+            if timeout != 0:
+                with span("openai.chat.stream_open", purpose="response"):
+                    stream = await get_async_openai_client().chat.completions.create(
+                        **self._build_request(state, timeout, stream=True)
+                    )
+
+                async for chunk in stream:
+                    if not chunk.choices:
+                        continue
+                    self._note_finish(state, getattr(chunk.choices[0], "finish_reason", None))
+                    delta = chunk.choices[0].delta.content
+                    if delta:
+                        rendered = renderer.feed(delta)
+                        if rendered:
+                            yield rendered
+                    if self._is_expired(state):
+                        break
+
+        except Exception as e:
+            logger.error(f"GPT 스트리밍 오류: {e}")
+
+        if renderer.emitted:
+            yield renderer.finish()
+            return
+
+        logger.warning("템플릿 응답 사용 (스트리밍)")
+        mark_degraded(state, "response_formatter")
+        yield set_response(state, self._generate_template_response(state))
+
+    def _answer_card_response(self, state: ChatState) -> Optional[str]:
+        """DB 레시피의 답변 카드로 만든 응답 골격 (카드가 없으면 None → GPT 응답 생성)"""
+        if state.get("recipe_source") != "database":
+            return None
+
+        store = get_answer_card_store()
+        recipe = state.get("recipe") or {}
+        if store is None or not recipe.get("recipe_id"):
+            return None
+
+        card = store.get(recipe)
+        if card is None:
+            return None
+
+        logger.info(f"답변 카드 사용 (GPT 포맷팅 생략): {recipe.get('name', '')}")
+        return store.render(card, state)
+
+    def _generate_with_gpt(self, state: ChatState, timeout: Optional[float] = None) -> Optional[str]:
         """GPT를 사용한 응답 생성"""
-        # State 정보 정리
-        context = self._build_context(state)
+        try:
+            with span("openai.chat", purpose="response"):
+                response = self.client.chat.completions.create(
+                    **self._build_request(state, timeout)
+                )
+            record_token_usage("openai.chat", "response", response)
+            self._note_finish(state, getattr(response.choices[0], "finish_reason", None))
 
+            return response.choices[0].message.content
+
+        except Exception as e:
+            logger.error(f"GPT 응답 생성 오류: {e}")
+            return None
+
+    async def _agenerate_with_gpt(self, state: ChatState, timeout: Optional[float] = None) -> Optional[str]:
+        """GPT를 사용한 응답 생성 (AsyncOpenAI)"""
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": SYSTEM_PROMPT},
-                    {"role": "user", "content": context}
-                ],
-                temperature=0.7,
-                max_tokens=2000
-            )
+            with span("openai.chat", purpose="response"):
+                response = await get_async_openai_client().chat.completions.create(
+                    **self._build_request(state, timeout)
+                )
+            record_token_usage("openai.chat", "response", response)
+            self._note_finish(state, getattr(response.choices[0], "finish_reason", None))
 
             return response.choices[0].message.content
 
@@ -94,13 +337,151 @@ class ResponseFormatter:
             logger.error(f"GPT 응답 생성 오류: {e}")
             return None
 
+    def _build_request(self, state: ChatState, timeout: Optional[float] = None, stream: bool = False) -> dict:
+        """GPT 응답 생성 요청 파라미터"""
+        request = {
+            "model": self.model,
+            "messages": self._build_messages(state),
+            "temperature": 0.7,
+            "max_tokens": self._max_tokens(state)
+        }
+        if stream:
+            request["stream"] = True
+        return with_timeout(request, timeout)
+
+    def _max_tokens(self, state: ChatState) -> int:
+        """쿼리 유형별 최대 출력 토큰"""
+        if not self.settings.response_token_budget_enabled:
+            return LEGACY_MAX_TOKENS
+        query_type = state.get("analyzed_query", {}).get("query_type", "recipe")
+        return MAX_TOKENS_BY_QUERY_TYPE.get(query_type, MAX_TOKENS_BY_QUERY_TYPE["general"])
+
+    def _note_finish(self, state: ChatState, finish_reason: Optional[str]):
+        """max_tokens에 걸려 잘린 응답 기록"""
+        if finish_reason == "length":
+            query_type = state.get("analyzed_query", {}).get("query_type", "recipe")
+            logger.warning(f"GPT 응답이 max_tokens({self._max_tokens(state)})에서 잘림: {query_type}")
+            _TRUNCATED.inc(query_type)
+
+    def _is_expired(self, state: ChatState) -> bool:
+        """스트리밍 중 요청 예산 소진 여부 (소진 시 성능 저하로 기록)"""
+        remaining = remaining_seconds(state)
+        if remaining is not None and remaining <= 0:
+            logger.warning("요청 예산 소진, 응답 스트리밍 중단")
+            mark_degraded(state, "response_formatter")
+            return True
+        return False
+
+    def _build_messages(self, state: ChatState) -> list:
+        """GPT 메시지 구성"""
+        # State 정보 정리
+        context = self._build_context(state)
+
+        return [
+            {"role": "system", "content": SYSTEM_PROMPT},
+            {"role": "user", "content": context}
+        ]
+
     def _build_context(self, state: ChatState) -> str:
-        """GPT 컨텍스트 빌드"""
+        """
+        GPT 컨텍스트 빌드 (RESPONSE_CONTEXT_MAX_TOKENS 예산 안에서)
+
+        질문/인분/영양 정보/운동 추천 자리표시자는 항상 넣고, 남은 예산으로
+        재료 → 조리법 → 팁 → 분류/조리방법 순서로 레시피 정보를 채운다.
+        영양/운동 질의는 조리법과 팁을 넣지 않는다.
+        """
+        if not self.settings.response_token_budget_enabled:
+            return self._build_full_context(state)
+
+        counter = get_token_counter()
+        user_query = counter.truncate(state.get("user_query", ""), USER_QUERY_MAX_TOKENS)
+        recipe = state.get("recipe") or {}
+        recipe_source = state.get("recipe_source", "database")
+        nutrition = state.get("nutrition") or {}
+        analyzed = state.get("analyzed_query", {})
+        query_type = analyzed.get("query_type", "recipe")
+
+        header = [
+            f"사용자 질문: {user_query}",
+            f"음식명: {analyzed.get('food_name', '')}",
+            f"인분 수: {analyzed.get('servings', 1)}인분",
+            f"응답 분량: {LENGTH_GUIDE_BY_QUERY_TYPE.get(query_type, LENGTH_GUIDE_BY_QUERY_TYPE['general'])}",
+        ]
+        if recipe_source == "llm_fallback":
+            header.append("레시피 출처: AI 생성")
+
+        footer = []
+        if nutrition:
+            footer.append(f"\n영양 정보 ({nutrition.get('servings', 1)}인분):")
+            footer.append(f"- 칼로리: {nutrition.get('calories', 0):.0f}kcal")
+            footer.append(f"- 단백질: {nutrition.get('protein', 0):.1f}g")
+            footer.append(f"- 지방: {nutrition.get('fat', 0):.1f}g")
+            footer.append(f"- 탄수화물: {nutrition.get('carbohydrate', 0):.1f}g")
+            if nutrition.get("sodium", 0) > 0:
+                footer.append(f"- 나트륨: {nutrition.get('sodium', 0):.0f}mg")
+        if nutrition.get("calories", 0) > 0:
+            footer.append(
+                f"\n운동 추천 자리표시자: 운동 추천 섹션 위치에 제목 없이 {EXERCISE_PLACEHOLDER} 한 줄만 출력"
+            )
+
+        remaining = self.settings.response_context_max_tokens - counter.count("\n".join(header + footer))
+        recipe_lines = []
+        if recipe.get("name"):
+            recipe_lines = self._budget_recipe_lines(recipe, query_type, remaining)
+
+        return "\n".join(header + recipe_lines + footer)
+
+    def _budget_recipe_lines(self, recipe: dict, query_type: str, budget: int) -> list:
+        """예산 안에서 레시피 정보 줄 구성 (가치가 높은 항목부터 채우고 표시 순서로 반환)"""
+        counter = get_token_counter()
+        lines = {"name": f"\n레시피 정보:\n- 음식명: {recipe.get('name', '')}"}
+        budget -= counter.count(lines["name"]) + 1
+
+        def fits(line: str) -> bool:
+            return counter.count(line) + 1 <= budget
+
+        # 재료: 예산에 맞는 만큼 앞에서부터
+        ingredients = recipe.get("ingredients", [])[:10]
+        for n in range(len(ingredients), 0, -1):
+            line = f"- 재료: {', '.join(ingredients[:n])}"
+            if fits(line):
+                lines["ingredients"] = line
+                budget -= counter.count(line) + 1
+                break
+
+        if query_type in ("recipe", "general"):
+            # 조리법: 단계별로 줄여 예산에 맞는 단계까지
+            steps = [
+                counter.truncate(step, INSTRUCTION_STEP_MAX_TOKENS)
+                for step in recipe.get("instructions", [])[:5]
+            ]
+            for n in range(len(steps), 0, -1):
+                line = f"- 조리법: {' '.join(steps[:n])}"
+                if fits(line):
+                    lines["instructions"] = line
+                    budget -= counter.count(line) + 1
+                    break
+
+            if recipe.get("tips") and budget > 10:
+                line = f"- 팁: {counter.truncate(recipe['tips'], min(TIP_MAX_TOKENS, budget - 5))}"
+                if fits(line):
+                    lines["tips"] = line
+                    budget -= counter.count(line) + 1
+
+        if recipe.get("category") or recipe.get("cooking_method"):
+            line = f"- 분류/조리방법: {recipe.get('category', '')} / {recipe.get('cooking_method', '')}"
+            if fits(line):
+                lines["meta"] = line
+
+        order = ("name", "meta", "ingredients", "instructions", "tips")
+        return [lines[key] for key in order if key in lines]
+
+    def _build_full_context(self, state: ChatState) -> str:
+        """예산 없이 전체 컨텍스트 빌드 (RESPONSE_TOKEN_BUDGET_ENABLED=false)"""
         user_query = state.get("user_query", "")
         recipe = state.get("recipe", {})
         recipe_source = state.get("recipe_source", "database")
         nutrition = state.get("nutrition", {})
-        exercises = state.get("exercise_recommendations", [])
         analyzed = state.get("analyzed_query", {})
 
         context_parts = [
@@ -138,25 +519,18 @@ class ResponseFormatter:
             if nutrition.get("sodium", 0) > 0:
                 context_parts.append(f"- 나트륨: {nutrition.get('sodium', 0):.0f}mg")
 
-        # 운동 추천
-        if exercises:
-            context_parts.append(f"\n운동 추천 (소모 칼로리: {nutrition.get('calories', 0):.0f}kcal):")
-            for ex in exercises:
-                intensity_kr = {"low": "저강도", "medium": "중강도", "high": "고강도"}.get(
-                    ex.get("intensity", ""), ""
-                )
-                context_parts.append(
-                    f"- {intensity_kr}: {ex.get('name_kr', '')} "
-                    f"({ex.get('duration_minutes', 0):.0f}분)"
-                )
+        # 운동 추천 (사용자 프로필에 의존하므로 자리표시자로 출력하고 요청마다 채움)
+        if nutrition.get("calories", 0) > 0:
+            context_parts.append(
+                f"\n운동 추천 자리표시자: 운동 추천 섹션 위치에 제목 없이 {EXERCISE_PLACEHOLDER} 한 줄만 출력"
+            )
 
         return "\n".join(context_parts)
 
     def _generate_template_response(self, state: ChatState) -> str:
-        """템플릿 기반 응답 생성 (Fallback)"""
+        """템플릿 기반 응답 골격 생성 (Fallback, 운동 추천은 자리표시자)"""
         recipe = state.get("recipe", {})
         nutrition = state.get("nutrition", {})
-        exercises = state.get("exercise_recommendations", [])
         analyzed = state.get("analyzed_query", {})
         recipe_source = state.get("recipe_source", "database")
 
@@ -199,21 +573,9 @@ class ResponseFormatter:
                 parts.append(f"- 🧂 나트륨: {nutrition.get('sodium', 0):.0f}mg")
             parts.append("")
 
-        # 운동 추천
-        if exercises:
-            parts.append(f"### 🏃 운동 추천")
-            parts.append(f"*{nutrition.get('calories', 0):.0f}kcal를 소모하기 위한 운동:*\n")
-
-            intensity_emoji = {"low": "🚶", "medium": "🚴", "high": "🏃"}
-            intensity_kr = {"low": "저강도", "medium": "중강도", "high": "고강도"}
-
-            for ex in exercises:
-                emoji = intensity_emoji.get(ex.get("intensity", ""), "🏃")
-                kr = intensity_kr.get(ex.get("intensity", ""), "")
-                parts.append(
-                    f"- {emoji} **{kr}** - {ex.get('name_kr', '')}: "
-                    f"약 {ex.get('duration_minutes', 0):.0f}분"
-                )
+        # 운동 추천 (칼로리가 있을 때만 추천되므로 자리표시자 여부는 프로필과 무관)
+        if nutrition.get("calories", 0) > 0:
+            parts.append(EXERCISE_PLACEHOLDER)
             parts.append("")
 
         # 마무리
@@ -223,6 +585,114 @@ class ResponseFormatter:
         return "\n".join(parts)
 
 
+def exercise_section(state: ChatState) -> str:
+    """운동 추천 섹션 (사용자 프로필별로 계산된 exercise_recommendations 기준)"""
+    exercises = state.get("exercise_recommendations", [])
+    if not exercises:
+        return ""
+
+    nutrition = state.get("nutrition", {})
+    parts = [
+        "### 🏃 운동 추천",
+        f"*{nutrition.get('calories', 0):.0f}kcal를 소모하기 위한 운동:*\n",
+    ]
+    for ex in exercises:
+        emoji = INTENSITY_EMOJI.get(ex.get("intensity", ""), "🏃")
+        kr = INTENSITY_KR.get(ex.get("intensity", ""), "")
+        parts.append(
+            f"- {emoji} **{kr}** - {ex.get('name_kr', '')}: "
+            f"약 {ex.get('duration_minutes', 0):.0f}분"
+        )
+    return "\n".join(parts)
+
+
+def render_response(skeleton: str, state: ChatState) -> str:
+    """
+    응답 골격의 운동 추천 자리표시자를 실제 운동 추천 섹션으로 치환
+
+    GPT가 자리표시자를 빠뜨린 경우 운동 추천 섹션을 끝에 덧붙이고,
+    자리표시자 앞에 운동 추천 제목을 직접 쓴 경우 제목이 두 번 나오지 않도록 지운다.
+    """
+    section = exercise_section(state)
+    skeleton = _DUPLICATE_EXERCISE_HEADING.sub("", skeleton)
+    if EXERCISE_PLACEHOLDER in skeleton:
+        return skeleton.replace(EXERCISE_PLACEHOLDER, section)
+    if section:
+        return f"{skeleton}\n\n{section}"
+    return skeleton
+
+
+def set_response(state: ChatState, skeleton: str) -> str:
+    """응답 골격과 렌더링된 최종 응답을 State에 기록하고 최종 응답 반환"""
+    state["response_skeleton"] = skeleton
+    state["response"] = render_response(skeleton, state)
+    return state["response"]
+
+
+class _StreamRenderer:
+    """스트리밍 청크의 운동 추천 자리표시자 치환
+
+    청크 경계에 걸친 자리표시자를 놓치지 않도록 자리표시자의 앞부분으로
+    끝나는 텍스트는 다음 청크까지 보류한다. 자리표시자 앞에 GPT가 쓴 운동 추천 제목을
+    지울 수 있도록 끝에 걸린 제목 줄도 다음 내용이 올 때까지 보류한다.
+    """
+
+    def __init__(self, state: ChatState):
+        self.state = state
+        self.emitted = False
+        self._parts = []
+        self._pending = ""
+
+    def feed(self, delta: str) -> str:
+        """GPT 청크 → 전송할 텍스트"""
+        self.emitted = True
+        self._parts.append(delta)
+        text = self._pending + delta
+
+        hold = max(_placeholder_prefix_length(text), _heading_hold_length(text))
+        self._pending = text[len(text) - hold:] if hold else ""
+        return self._render(text[:len(text) - hold])
+
+    def _render(self, text: str) -> str:
+        text = _DUPLICATE_EXERCISE_HEADING.sub("", text)
+        return text.replace(EXERCISE_PLACEHOLDER, exercise_section(self.state))
+
+    def finish(self) -> str:
+        """보류된 텍스트 (+ 자리표시자가 없었으면 운동 추천 섹션) 반환, 골격/최종 응답 기록"""
+        skeleton = "".join(self._parts)
+        response = render_response(skeleton, self.state)
+        self.state["response_skeleton"] = skeleton
+        self.state["response"] = response
+
+        tail = self._render(self._pending)
+        if EXERCISE_PLACEHOLDER not in skeleton and response != skeleton:
+            tail += response[len(skeleton):]
+        return tail
+
+
+def _heading_hold_length(text: str) -> int:
+    """text 끝의 제목 줄 길이 (작성 중이거나, 운동 추천 제목 뒤에 자리표시자가 올 수 있으면 보류)"""
+    start = text.rfind("\n#") + 1 or (0 if text.startswith("#") else -1)
+    if start < 0:
+        return 0
+
+    heading, newline, rest = text[start:].partition("\n")
+    if not newline:
+        return len(text) - start
+    rest = rest.lstrip("\n")
+    if "운동" in heading and "\n" not in rest and EXERCISE_PLACEHOLDER.startswith(rest):
+        return len(text) - start
+    return 0
+
+
+def _placeholder_prefix_length(text: str) -> int:
+    """text 끝이 자리표시자의 앞부분과 겹치는 길이"""
+    for length in range(min(len(EXERCISE_PLACEHOLDER) - 1, len(text)), 0, -1):
+        if text.endswith(EXERCISE_PLACEHOLDER[:length]):
+            return length
+    return 0
+
+
 # 싱글톤 인스턴스
 _response_formatter: Optional[ResponseFormatter] = None
 
@@ -239,3 +709,15 @@ def format_response(state: ChatState) -> ChatState:
     """LangGraph 노드 함수"""
     formatter = get_response_formatter()
     return formatter.format(state)
+
+
+async def aformat_response(state: ChatState) -> ChatState:
+    """LangGraph 노드 함수 (비동기)"""
+    formatter = get_response_formatter()
+    return await formatter.aformat(state)
+
+
+def format_template_response(state: ChatState) -> ChatState:
+    """LangGraph 노드 함수 (템플릿 응답)"""
+    formatter = get_response_formatter()
+    return formatter.format_template(state)
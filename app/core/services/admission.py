@@ -0,0 +1,424 @@
+"""요청 수락 제어 - 경로별 동시 실행 제한/대기열, 클라이언트별 토큰 버킷 할당량"""
+
+import asyncio
+import hashlib
+import logging
+import math
+import threading
+import time
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager, nullcontext
+from typing import Any, AsyncIterator, Deque, Dict, Optional
+
+import orjson
+from starlette.datastructures import Headers
+from starlette.responses import Response
+
+from app.config import get_settings
+from app.core.services.metrics import get_metrics_registry
+
+logger = logging.getLogger(__name__)
+
+# 수락 제어 대상 경로 → 풀 (llm: GPT 호출이 있는 워크플로우, db: 데이터 조회만 하는 GET 리소스)
+# 일괄 검색(batch)은 요청 자체가 아닌 항목별로 llm 풀 슬롯을 얻으므로 여기서는 할당량만 검사한다.
+EXACT_ROUTES = {
+    ("POST", "/api/search"): "llm",
+    ("POST", "/api/search/stream"): "llm",
+    ("POST", "/api/search/batch"): "batch",
+}
+PREFIX_ROUTES = (
+    ("GET", "/api/recipes", "db"),
+    ("GET", "/api/nutrition/", "db"),
+)
+
+# 슬롯 점유 시간 이동 평균 가중치 (Retry-After 추정용)
+HOLD_TIME_ALPHA = 0.2
+
+_registry = get_metrics_registry()
+_REJECTIONS = _registry.counter(
+    "admission_rejections_total", "수락 제어로 거절된 요청 수", ("pool", "reason")
+)
+_QUEUE_WAIT = _registry.histogram(
+    "admission_queue_wait_seconds", "수락 대기열에서 기다린 시간", ("pool",)
+)
+
+
+class AdmissionRejected(Exception):
+    """수락 거절 (대기열 가득 참/대기 시간 초과/할당량 초과)"""
+
+    def __init__(self, pool: str, reason: str, retry_after: float, status_code: int = 429):
+        self.pool = pool
+        self.reason = reason
+        self.retry_after = max(1, math.ceil(retry_after))
+        self.status_code = status_code
+        super().__init__(f"{pool}: {reason}")
+
+
+class ConcurrencyLimiter:
+    """
+    동시 실행 제한 + 제한된 대기열 (FIFO)
+
+    슬롯이 없으면 대기열에서 기다리고, 대기열이 가득 찼으면 즉시 거절한다.
+    트래픽 급증 시 요청이 서버 안에 무한정 쌓여 모두 함께 시간 초과되는 대신
+    초과분을 빨리 거절해 수락된 요청의 지연 시간을 지킨다.
+    서버 이벤트 루프 하나에서만 사용한다.
+    """
+
+    def __init__(self, name: str, max_concurrency: int, max_queue: int, queue_timeout: float):
+        """
+        Args:
+            name: 풀 이름 (메트릭 라벨)
+            max_concurrency: 동시 실행 수
+            max_queue: 대기열 크기 (0이면 대기 없이 거절)
+            queue_timeout: 대기열 최대 대기 시간 (초)
+        """
+        self.name = name
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_queue = max(0, max_queue)
+        self.queue_timeout = queue_timeout
+
+        self._active = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+        self._avg_hold_seconds = 1.0
+
+    @property
+    def active(self) -> int:
+        """실행 중인 요청 수"""
+        return self._active
+
+    @property
+    def queue_depth(self) -> int:
+        """대기 중인 요청 수"""
+        return len(self._waiters)
+
+    def retry_after(self) -> float:
+        """대기열이 빠지는 데 걸릴 예상 시간 (초)"""
+        return self._avg_hold_seconds * (self.queue_depth / self.max_concurrency + 1)
+
+    async def acquire(self, bounded: bool = True):
+        """
+        슬롯 획득
+
+        Args:
+            bounded: False면 대기열 크기/대기 시간 제한 없이 기다림 (이미 수락된 일괄 검색 항목용)
+
+        Raises:
+            AdmissionRejected: 대기열이 가득 찼거나(429) 대기 시간을 초과한 경우(503)
+        """
+        if self._active < self.max_concurrency and not self._waiters:
+            self._active += 1
+            return
+
+        if bounded and self.queue_depth >= self.max_queue:
+            _REJECTIONS.inc(self.name, "queue_full")
+            raise AdmissionRejected(self.name, "queue_full", self.retry_after())
+
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.append(future)
+        try:
+            await asyncio.wait_for(future, self.queue_timeout if bounded else None)
+        except asyncio.TimeoutError:
+            self._discard(future)
+            _REJECTIONS.inc(self.name, "queue_timeout")
+            raise AdmissionRejected(self.name, "queue_timeout", self.retry_after(), status_code=503)
+        except BaseException:
+            self._discard(future)
+            raise
+
+    def release(self):
+        """슬롯 반환 (대기 중인 요청이 있으면 슬롯을 그대로 넘겨줌)"""
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self._active -= 1
+
+    def _discard(self, future: asyncio.Future):
+        """대기 취소 (취소와 슬롯 양도가 겹쳤으면 받은 슬롯을 반환)"""
+        if future.done() and not future.cancelled():
+            self.release()
+            return
+        future.cancel()
+        try:
+            self._waiters.remove(future)
+        except ValueError:
+            pass
+
+    @asynccontextmanager
+    async def slot(self, bounded: bool = True) -> AsyncIterator[None]:
+        """슬롯을 점유하는 컨텍스트 (대기 시간/점유 시간 기록)"""
+        wait_start = time.perf_counter()
+        await self.acquire(bounded)
+        hold_start = time.perf_counter()
+        _QUEUE_WAIT.observe(hold_start - wait_start, self.name)
+        try:
+            yield
+        finally:
+            held = time.perf_counter() - hold_start
+            self._avg_hold_seconds += HOLD_TIME_ALPHA * (held - self._avg_hold_seconds)
+            self.release()
+
+
+class TokenBucketQuotas:
+    """
+    클라이언트별 토큰 버킷 할당량
+
+    초당 rate개씩 최대 burst개까지 토큰이 채워지며, 요청마다 비용만큼 차감한다.
+    클라이언트 수는 max_clients로 제한하고 가장 오래 요청이 없던 클라이언트부터 제거한다.
+    """
+
+    def __init__(self, rate: float, burst: float, max_clients: int = 10000):
+        """
+        Args:
+            rate: 초당 충전 토큰 수
+            burst: 버킷 크기 (연속 요청 허용량)
+            max_clients: 추적할 최대 클라이언트 수
+        """
+        self.rate = rate
+        self.burst = max(1.0, burst)
+        self.max_clients = max_clients
+
+        self._buckets: "OrderedDict[str, list]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def try_acquire(self, client: str, cost: float = 1.0) -> float:
+        """
+        토큰 차감
+
+        Args:
+            client: 클라이언트 키
+            cost: 요청 비용 (버킷 크기보다 크면 버킷이 가득 찼을 때 허용)
+
+        Returns:
+            0이면 허용, 아니면 다시 시도할 때까지 기다릴 시간 (초)
+        """
+        cost = min(cost, self.burst)
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(client)
+            if bucket is None:
+                bucket = [self.burst, now]
+                self._buckets[client] = bucket
+                if len(self._buckets) > self.max_clients:
+                    self._buckets.popitem(last=False)
+            else:
+                self._buckets.move_to_end(client)
+                bucket[0] = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+                bucket[1] = now
+
+            if bucket[0] >= cost:
+                bucket[0] -= cost
+                return 0.0
+            return (cost - bucket[0]) / self.rate
+
+    @property
+    def client_count(self) -> int:
+        """추적 중인 클라이언트 수"""
+        return len(self._buckets)
+
+
+def client_key(scope: Dict[str, Any]) -> str:
+    """
+    할당량 키 (API 키 → 클라이언트 IP 순)
+
+    API 키는 원문을 보관하지 않도록 해시한다. 프록시 뒤에서는 uvicorn --proxy-headers로
+    X-Forwarded-For가 반영된 클라이언트 주소를 사용한다.
+    """
+    headers = Headers(scope=scope)
+    api_key = headers.get("x-api-key")
+    if not api_key:
+        authorization = headers.get("authorization", "")
+        if authorization.lower().startswith("bearer "):
+            api_key = authorization[7:].strip()
+    if api_key:
+        return "key:" + hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:16]
+
+    client = scope.get("client")
+    return "ip:" + (client[0] if client else "unknown")
+
+
+def classify(method: str, path: str) -> Optional[str]:
+    """요청 경로의 수락 제어 풀 (대상이 아니면 None)"""
+    pool = EXACT_ROUTES.get((method, path.rstrip("/") or "/"))
+    if pool is not None:
+        return pool
+    for route_method, prefix, prefix_pool in PREFIX_ROUTES:
+        if method == route_method and path.startswith(prefix):
+            return prefix_pool
+    return None
+
+
+class AdmissionController:
+    """풀별 동시 실행 제한과 클라이언트 할당량"""
+
+    def __init__(
+        self,
+        limiters: Dict[str, ConcurrencyLimiter],
+        quotas: Optional[TokenBucketQuotas] = None
+    ):
+        self.limiters = limiters
+        self.quotas = quotas
+
+    def check_quota(self, scope: Dict[str, Any], pool: str, cost: float = 1.0):
+        """
+        클라이언트 할당량 차감
+
+        Raises:
+            AdmissionRejected: 할당량 초과 (429)
+        """
+        if self.quotas is None or cost <= 0:
+            return
+        retry_after = self.quotas.try_acquire(client_key(scope), cost)
+        if retry_after > 0:
+            _REJECTIONS.inc(pool, "quota")
+            raise AdmissionRejected(pool, "quota", retry_after)
+
+    def get_stats(self) -> Dict[str, Dict[str, int]]:
+        """풀별 실행/대기 수"""
+        return {
+            name: {"active": limiter.active, "queue_depth": limiter.queue_depth}
+            for name, limiter in self.limiters.items()
+        }
+
+
+def rejection_response(rejected: AdmissionRejected) -> Response:
+    """거절 응답 (ErrorResponse 형식 본문 + Retry-After)"""
+    messages = {
+        "queue_full": "요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해주세요",
+        "queue_timeout": "대기 시간이 초과되었습니다. 잠시 후 다시 시도해주세요",
+        "quota": "요청 한도를 초과했습니다",
+    }
+    body = orjson.dumps({
+        "detail": {
+            "success": False,
+            "error": messages.get(rejected.reason, "요청을 처리할 수 없습니다"),
+            "detail": f"pool={rejected.pool}, reason={rejected.reason}",
+        }
+    })
+    return Response(
+        content=body,
+        status_code=rejected.status_code,
+        headers={"Retry-After": str(rejected.retry_after)},
+        media_type="application/json"
+    )
+
+
+class AdmissionMiddleware:
+    """
+    수락 제어 ASGI 미들웨어
+
+    대상 경로 요청은 할당량을 차감한 뒤 해당 풀의 슬롯을 응답 전송이 끝날 때까지 점유한다
+    (SSE 스트리밍은 스트림 종료까지). 거절 시 Retry-After와 함께 429/503을 반환한다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        controller = get_admission_controller()
+        pool = classify(scope["method"], scope["path"]) if controller is not None else None
+        if pool is None:
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            controller.check_quota(scope, pool)
+            limiter = controller.limiters.get(pool)
+            if limiter is None:
+                await self.app(scope, receive, send)
+                return
+            async with limiter.slot():
+                await self.app(scope, receive, send)
+        except AdmissionRejected as rejected:
+            logger.warning(f"요청 거절 ({scope['method']} {scope['path']}): {rejected}")
+            await rejection_response(rejected)(scope, receive, send)
+
+
+def batch_item_slot():
+    """
+    일괄 검색 항목의 llm 풀 슬롯
+
+    이미 수락된 일괄 검색의 항목은 거절하지 않고 대기열 제한 없이 기다린다
+    (대화형 요청과 같은 풀을 공유해 LLM 동시 호출 수를 함께 제한).
+    수락 제어가 비활성화되어 있으면 아무것도 하지 않는다.
+    """
+    controller = get_admission_controller()
+    if controller is None or "llm" not in controller.limiters:
+        return nullcontext()
+    return controller.limiters["llm"].slot(bounded=False)
+
+
+def check_batch_quota(scope: Dict[str, Any], query_count: int):
+    """
+    일괄 검색 할당량 차감 (미들웨어가 차감한 1개를 제외한 나머지 쿼리 수)
+
+    버킷보다 큰 일괄 검색도 버킷이 가득 찼을 때는 수락되도록 총 비용을 버킷 크기로 제한한다.
+
+    Raises:
+        AdmissionRejected: 할당량 초과 (429)
+    """
+    controller = get_admission_controller()
+    if controller is not None and controller.quotas is not None:
+        controller.check_quota(scope, "batch", min(query_count, controller.quotas.burst) - 1)
+
+
+def _collect_metrics():
+    """풀별 실행 중/대기 중 요청 수 (/metrics 스크레이프 시 호출)"""
+    controller = _admission_controller
+    if controller is None:
+        return
+    stats = controller.get_stats()
+    yield (
+        "admission_in_flight", "gauge", "수락 제어 풀별 실행 중인 요청 수",
+        [({"pool": name}, values["active"]) for name, values in stats.items()]
+    )
+    yield (
+        "admission_queue_depth", "gauge", "수락 제어 풀별 대기 중인 요청 수",
+        [({"pool": name}, values["queue_depth"]) for name, values in stats.items()]
+    )
+
+
+_registry.register_collector(_collect_metrics)
+
+
+# 싱글톤 인스턴스
+_admission_controller: Optional[AdmissionController] = None
+_admission_initialized = False
+
+
+def get_admission_controller() -> Optional[AdmissionController]:
+    """AdmissionController 싱글톤 인스턴스 반환 (ADMISSION_ENABLED=false면 None)"""
+    global _admission_controller, _admission_initialized
+    if not _admission_initialized:
+        settings = get_settings()
+        if settings.admission_enabled:
+            quotas = None
+            if settings.client_quota_rate_per_second > 0:
+                quotas = TokenBucketQuotas(
+                    rate=settings.client_quota_rate_per_second,
+                    burst=settings.client_quota_burst
+                )
+            _admission_controller = AdmissionController(
+                limiters={
+                    "llm": ConcurrencyLimiter(
+                        "llm",
+                        settings.admission_llm_max_concurrency,
+                        settings.admission_llm_max_queue,
+                        settings.admission_queue_timeout_seconds
+                    ),
+                    "db": ConcurrencyLimiter(
+                        "db",
+                        settings.admission_db_max_concurrency,
+                        settings.admission_db_max_queue,
+                        settings.admission_queue_timeout_seconds
+                    ),
+                },
+                quotas=quotas
+            )
+        _admission_initialized = True
+    return _admission_controller
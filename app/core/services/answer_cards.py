@@ -0,0 +1,159 @@
+"""답변 카드 - DB 레시피별로 미리 생성한 GPT 응답 (인분/영양정보만 요청마다 채움)
+
+scripts/build_answer_cards.py가 레시피마다 1인분 기준 마크다운 응답을 GPT로 생성해 JSONL로 저장한다.
+응답의 인분 수와 영양 수치는 자리표시자([[SERVINGS]], [[CALORIES]] 등)로 남겨 두고,
+런타임에는 요청의 영양정보(인분 수 반영)로 치환하므로 DB 레시피 응답에 GPT를 호출하지 않는다.
+운동 추천 자리표시자([[EXERCISES]])는 응답 골격에 그대로 두어 사용자 프로필별로 채운다.
+
+레시피 내용(이름/재료/조리법/팁)이 바뀌면 지문(fingerprint)이 달라져 해당 카드는 사용하지 않는다.
+"""
+
+import hashlib
+import json
+import logging
+import re
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from app.config import get_settings
+from app.core.services.metrics import get_metrics_registry
+
+logger = logging.getLogger(__name__)
+
+# 프로젝트 루트
+PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
+
+# 자리표시자 → (영양정보 필드, 출력 형식), SERVINGS는 인분 수
+CARD_PLACEHOLDERS = {
+    "[[SERVINGS]]": ("servings", "{:.0f}"),
+    "[[CALORIES]]": ("calories", "{:,.0f}"),
+    "[[PROTEIN]]": ("protein", "{:.1f}"),
+    "[[FAT]]": ("fat", "{:.1f}"),
+    "[[CARBOHYDRATE]]": ("carbohydrate", "{:.1f}"),
+    "[[SODIUM]]": ("sodium", "{:,.0f}"),
+}
+_PLACEHOLDER_PATTERN = re.compile("|".join(re.escape(p) for p in CARD_PLACEHOLDERS))
+
+# 지문에 반영할 레시피 필드 (RecipeInfo 기준, 영양 수치는 자리표시자라 제외)
+FINGERPRINT_FIELDS = ("name", "category", "cooking_method", "ingredients", "instructions", "tips")
+
+_CARDS = get_metrics_registry().counter(
+    "answer_cards_total", "DB 레시피 응답의 답변 카드 사용 결과 (hit / miss / stale)", ("outcome",)
+)
+
+
+def recipe_fingerprint(recipe: Dict[str, Any]) -> str:
+    """레시피 내용 지문 (RecipeInfo 형식, 빌드 시와 런타임에 같은 방식으로 계산)"""
+    content = {field: recipe.get(field) or "" for field in FINGERPRINT_FIELDS}
+    encoded = json.dumps(content, ensure_ascii=False, sort_keys=True).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()[:16]
+
+
+class AnswerCardStore:
+    """
+    답변 카드 저장소
+
+    JSONL 파일(한 줄에 카드 하나)을 한 번 로드해 recipe_id로 조회한다.
+    빌드를 이어서 실행하면 같은 recipe_id가 여러 줄일 수 있으며 마지막 줄을 사용한다.
+    """
+
+    def __init__(self, cards_path: Path):
+        """
+        Args:
+            cards_path: 답변 카드 JSONL 파일 경로
+        """
+        self.cards_path = cards_path
+        self.cards: Dict[str, Dict[str, Any]] = {}
+        self._load()
+
+    def _load(self):
+        if not self.cards_path.exists():
+            logger.info(f"답변 카드 파일 없음: {self.cards_path} (DB 레시피도 GPT로 응답 생성)")
+            return
+
+        with open(self.cards_path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    card = json.loads(line)
+                except json.JSONDecodeError:
+                    # 빌드 중단으로 잘린 마지막 줄
+                    logger.warning("답변 카드 파싱 실패, 건너뜀")
+                    continue
+                if card.get("recipe_id") and card.get("markdown"):
+                    self.cards[card["recipe_id"]] = card
+
+        logger.info(f"답변 카드 로드 완료: {len(self.cards)}개")
+
+    @property
+    def total_cards(self) -> int:
+        return len(self.cards)
+
+    def get(self, recipe: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        레시피의 답변 카드 조회
+
+        Args:
+            recipe: RecipeInfo (recipe_id와 지문 계산용 내용 포함)
+
+        Returns:
+            카드 또는 None (카드가 없거나 레시피 내용이 바뀐 경우)
+        """
+        card = self.cards.get(recipe.get("recipe_id") or "")
+        if card is None:
+            _CARDS.inc("miss")
+            return None
+        if card.get("fingerprint") != recipe_fingerprint(recipe):
+            _CARDS.inc("stale")
+            return None
+        _CARDS.inc("hit")
+        return card
+
+    def render(self, card: Dict[str, Any], state: Dict[str, Any]) -> str:
+        """
+        카드 마크다운의 인분/영양 자리표시자를 요청 값으로 치환 (운동 추천 자리표시자는 유지)
+
+        요청의 영양정보가 없으면 카드의 1인분 영양정보에 인분 수를 곱해 사용한다.
+        """
+        servings = state.get("analyzed_query", {}).get("servings", 1) or 1
+        nutrition = state.get("nutrition") or {}
+        if nutrition.get("calories", 0) <= 0:
+            per_serving = card.get("nutrition") or {}
+            nutrition = {
+                field: (per_serving.get(field) or 0) * servings
+                for field, _ in CARD_PLACEHOLDERS.values()
+                if field != "servings"
+            }
+
+        values = {"servings": servings, **nutrition}
+
+        def substitute(match: "re.Match") -> str:
+            field, fmt = CARD_PLACEHOLDERS[match.group()]
+            return fmt.format(values.get(field) or 0)
+
+        return _PLACEHOLDER_PATTERN.sub(substitute, card["markdown"])
+
+
+# 싱글톤 인스턴스
+_answer_card_store: Optional[AnswerCardStore] = None
+_answer_card_store_initialized = False
+_init_lock = threading.Lock()
+
+
+def get_answer_card_store() -> Optional[AnswerCardStore]:
+    """AnswerCardStore 싱글톤 인스턴스 반환 (ANSWER_CARDS_ENABLED=false면 None)"""
+    global _answer_card_store, _answer_card_store_initialized
+    if not _answer_card_store_initialized:
+        with _init_lock:
+            if not _answer_card_store_initialized:
+                settings = get_settings()
+                if settings.answer_cards_enabled:
+                    cards_path = Path(settings.answer_cards_path)
+                    if not cards_path.is_absolute():
+                        cards_path = PROJECT_ROOT / cards_path
+                    _answer_card_store = AnswerCardStore(cards_path)
+                _answer_card_store_initialized = True
+    return _answer_card_store
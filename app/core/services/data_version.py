@@ -0,0 +1,44 @@
+"""데이터 빌드 버전 - 데이터 파일 내용 해시 (GET 리소스 ETag 기준)"""
+
+import hashlib
+import logging
+from pathlib import Path
+from typing import Sequence
+
+from app.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+READ_CHUNK_SIZE = 1 << 20
+
+
+def compute_data_version(paths: Sequence[Path]) -> str:
+    """
+    데이터 파일 내용으로 빌드 버전 계산 (sha256 앞 16자리)
+
+    수정 시각이 아닌 내용으로 계산하므로 같은 빌드를 배포한 레플리카는 같은 버전(ETag)을 갖는다.
+    DATA_VERSION이 설정되어 있으면 파일을 읽지 않고 그 값을 사용한다 (빌드 파이프라인에서 지정).
+
+    Args:
+        paths: 버전에 반영할 데이터 파일 (없는 파일은 없음 상태로 반영)
+
+    Returns:
+        데이터 빌드 버전 문자열
+    """
+    override = get_settings().data_version
+    if override:
+        return override
+
+    digest = hashlib.sha256()
+    for path in paths:
+        digest.update(path.name.encode("utf-8") + b"\0")
+        if not path.exists():
+            digest.update(b"missing\0")
+            continue
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(READ_CHUNK_SIZE), b""):
+                digest.update(chunk)
+
+    version = digest.hexdigest()[:16]
+    logger.info(f"데이터 빌드 버전 계산: {version} ({', '.join(p.name for p in paths)})")
+    return version
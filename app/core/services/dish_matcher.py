@@ -0,0 +1,282 @@
+"""음식명 사전 매칭 서비스 - Aho-Corasick 기반 규칙 쿼리 분석"""
+
+import logging
+import re
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from app.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+# 쿼리 유형 키워드 (QueryAnalyzer 규칙 파싱과 공유)
+NUTRITION_KEYWORDS = ["칼로리", "영양", "영양소", "성분"]
+EXERCISE_KEYWORDS = ["운동", "소모", "태우"]
+RECIPE_KEYWORDS = ["레시피", "만드는", "요리법", "조리법"]
+
+# 의미 없는 부가 표현 (남은 글자 수 계산에서 제외)
+FILLER_WORDS = [
+    "알려줘", "알려주세요", "알려줄래", "만들어줘", "만드는법", "만드는방법", "방법",
+    "정보", "얼마나", "얼마", "어떻게돼", "어떻게", "되나요", "돼요", "해야해", "해야돼",
+    "해야", "하나요", "먹고", "먹으면", "먹었어", "주세요",
+]
+
+# 매칭된 표현 바로 뒤에 붙는 조사
+PARTICLES = set("이가은는을를의도요")
+
+SERVINGS_PATTERN = re.compile(r"(\d+)\s*인분")
+_NON_WORD_PATTERN = re.compile(r"[\s\W_]+", re.UNICODE)
+
+
+class AhoCorasick:
+    """Aho-Corasick 다중 패턴 매칭 오토마톤
+
+    각 패턴에 payload를 연결하고, 텍스트 한 번 순회로 모든 매칭 위치를 찾는다.
+    """
+
+    def __init__(self):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[Tuple[int, object]]] = [[]]
+        self._built = False
+
+    def add(self, pattern: str, payload: object):
+        """패턴 추가 (build 전에만 가능)"""
+        if self._built:
+            raise RuntimeError("이미 빌드된 오토마톤에는 패턴을 추가할 수 없습니다.")
+        if not pattern:
+            return
+
+        node = 0
+        for ch in pattern:
+            next_node = self._goto[node].get(ch)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto[node][ch] = next_node
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            node = next_node
+        self._output[node].append((len(pattern), payload))
+
+    def build(self):
+        """실패 링크 계산 (BFS)"""
+        queue = deque()
+        for next_node in self._goto[0].values():
+            self._fail[next_node] = 0
+            queue.append(next_node)
+
+        while queue:
+            node = queue.popleft()
+            for ch, next_node in self._goto[node].items():
+                queue.append(next_node)
+                fail = self._fail[node]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_node] = self._goto[fail].get(ch, 0)
+                if self._fail[next_node] == next_node:
+                    self._fail[next_node] = 0
+                self._output[next_node].extend(self._output[self._fail[next_node]])
+
+        self._built = True
+
+    @property
+    def size(self) -> int:
+        """노드 수"""
+        return len(self._goto)
+
+    def iter_matches(self, text: str) -> List[Tuple[int, int, object]]:
+        """
+        텍스트에서 모든 패턴 매칭 검색
+
+        Returns:
+            (시작 위치, 끝 위치(exclusive), payload) 리스트
+        """
+        if not self._built:
+            self.build()
+
+        matches = []
+        node = 0
+        for i, ch in enumerate(text):
+            while node and ch not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(ch, 0)
+            for length, payload in self._output[node]:
+                matches.append((i + 1 - length, i + 1, payload))
+        return matches
+
+
+@dataclass
+class RuleMatch:
+    """규칙 기반 분석 결과"""
+    food_name: str = ""
+    servings: int = 1
+    query_type: str = "recipe"
+    confidence: float = 0.0
+    leftover: str = ""
+    intents: List[str] = field(default_factory=list)
+
+
+class DishMatcher:
+    """음식명 사전 + 의도 키워드 기반 결정적 쿼리 분석기
+
+    레시피 DB와 영양정보 DB의 음식명을 Aho-Corasick 오토마톤으로 구성하여
+    "김치찌개", "김치찌개 2인분 레시피", "불고기 칼로리" 같은 단순 쿼리를 GPT 없이 분석한다.
+    """
+
+    def __init__(self, food_names: Optional[List[str]] = None):
+        """
+        Args:
+            food_names: 사전에 넣을 음식명 (None이면 레시피/영양정보 DB에서 로드)
+        """
+        self.automaton = AhoCorasick()
+        self.dish_count = 0
+        self._dish_keys: set = set()
+
+        names = food_names if food_names is not None else self._load_food_names()
+        self._build(names)
+
+    def _load_food_names(self) -> List[str]:
+        """레시피 메타데이터 + 영양정보 DB 음식명 로드"""
+        names: List[str] = []
+
+        try:
+            from app.core.services.vector_db_service import get_vector_db_service
+            names.extend(r.get("name", "") for r in get_vector_db_service().recipes)
+        except Exception as e:
+            logger.warning(f"레시피 음식명 로드 실패: {e}")
+
+        try:
+            from app.core.services.nutrition_db_service import get_nutrition_db_service
+            nutrition_db = get_nutrition_db_service()
+            if nutrition_db.is_ready:
+                db_group = get_settings().dish_dictionary_db_group or None
+                names.extend(nutrition_db.get_food_names(db_group=db_group))
+        except Exception as e:
+            logger.warning(f"영양정보 음식명 로드 실패: {e}")
+
+        return names
+
+    def _build(self, food_names: List[str]):
+        """오토마톤 구성 (먼저 들어온 표기를 대표 음식명으로 사용)"""
+        seen: Dict[str, str] = {}
+        for name in food_names:
+            key = _compact(name)
+            if len(key) < 2 or key in seen:
+                continue
+            seen[key] = name.strip()
+            self.automaton.add(key, ("dish", seen[key]))
+
+        self.dish_count = len(seen)
+        self._dish_keys = set(seen)
+
+        for query_type, keywords in (
+            ("nutrition", NUTRITION_KEYWORDS),
+            ("exercise", EXERCISE_KEYWORDS),
+            ("recipe", RECIPE_KEYWORDS),
+        ):
+            for keyword in keywords:
+                self.automaton.add(keyword, ("intent", query_type))
+
+        for word in FILLER_WORDS:
+            self.automaton.add(word, ("filler", None))
+
+        self.automaton.build()
+        logger.info(f"음식명 사전 빌드 완료: {self.dish_count}개 음식, {self.automaton.size}개 노드")
+
+    def contains(self, food_name: str) -> bool:
+        """음식명이 사전(레시피/영양정보 DB 음식명)에 있는지 여부 (공백/구두점 무시)"""
+        return _compact(food_name) in self._dish_keys
+
+    def match(self, query: str) -> RuleMatch:
+        """
+        쿼리를 규칙 기반으로 분석
+
+        confidence는 (음식명 길이) / (음식명 길이 + 해석되지 않은 글자 수)이며,
+        음식명이 없으면 0이다.
+
+        Args:
+            query: 사용자 쿼리
+
+        Returns:
+            RuleMatch
+        """
+        result = RuleMatch()
+
+        servings_match = SERVINGS_PATTERN.search(query)
+        if servings_match:
+            result.servings = max(1, int(servings_match.group(1)))
+        text = _compact(SERVINGS_PATTERN.sub(" ", query))
+        if not text:
+            return result
+
+        matches = self.automaton.iter_matches(text)
+
+        # 가장 긴 음식명 (동일 길이면 앞쪽)
+        dish_span: Optional[Tuple[int, int, str]] = None
+        for start, end, (kind, value) in matches:
+            if kind != "dish":
+                continue
+            if dish_span is None or (end - start) > (dish_span[1] - dish_span[0]):
+                dish_span = (start, end, value)
+
+        covered = [False] * len(text)
+        if dish_span:
+            result.food_name = dish_span[2]
+            for i in range(dish_span[0], dish_span[1]):
+                covered[i] = True
+
+        # 음식명과 겹치지 않는 의도 키워드/부가 표현 (긴 표현 우선)
+        others = sorted(
+            (m for m in matches if m[2][0] != "dish"),
+            key=lambda m: m[1] - m[0],
+            reverse=True
+        )
+        for start, end, (kind, value) in others:
+            if any(covered[start:end]):
+                continue
+            if kind == "intent":
+                result.intents.append(value)
+            for i in range(start, end):
+                covered[i] = True
+
+        if "nutrition" in result.intents:
+            result.query_type = "nutrition"
+        elif "exercise" in result.intents:
+            result.query_type = "exercise"
+
+        for i in range(1, len(text)):
+            if not covered[i] and covered[i - 1] and text[i] in PARTICLES:
+                covered[i] = True
+
+        leftover = "".join(ch for ch, c in zip(text, covered) if not c)
+        result.leftover = leftover
+
+        if dish_span:
+            dish_len = dish_span[1] - dish_span[0]
+            result.confidence = round(dish_len / (dish_len + len(leftover)), 4)
+
+        return result
+
+
+def _compact(text: str) -> str:
+    """공백/구두점 제거"""
+    return _NON_WORD_PATTERN.sub("", text or "")
+
+
+# 싱글톤 인스턴스
+_dish_matcher: Optional[DishMatcher] = None
+_dish_matcher_lock = threading.Lock()
+
+
+def get_dish_matcher() -> DishMatcher:
+    """DishMatcher 싱글톤 인스턴스 반환 (예열 스레드와 요청 스레드가 동시에 불러도 한 번만 생성)"""
+    global _dish_matcher
+    if _dish_matcher is None:
+        with _dish_matcher_lock:
+            if _dish_matcher is None:
+                _dish_matcher = DishMatcher()
+    return _dish_matcher
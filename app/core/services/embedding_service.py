@@ -2,14 +2,25 @@
 
 import logging
 import time
-from typing import List, Optional
-
-from openai import OpenAI
+from functools import partial
+from typing import Dict, List, Optional
 
 from app.config import get_settings
+from app.core.services.micro_batcher import MicroBatcher, is_batching_enabled
+from app.core.services.single_flight import SingleFlight
+from app.core.services.openai_client import (
+    get_openai_client,
+    get_async_openai_client,
+    with_timeout
+)
+from app.core.services.metrics import record_token_usage
+from app.core.services.tracing import span
 
 logger = logging.getLogger(__name__)
 
+# 동일 텍스트에 대한 동시 임베딩 요청 병합
+_embedding_flight = SingleFlight("embedding")
+
 
 class EmbeddingService:
     """OpenAI 임베딩 서비스 클래스"""
@@ -24,41 +35,121 @@ class EmbeddingService:
                    - text-embedding-3-large: 3072 차원, 더 정확
         """
         self.settings = get_settings()
-        self.client = OpenAI(api_key=self.settings.openai_api_key)
+        self.client = get_openai_client()
         self.model = model
         self._dimension = 1536 if "small" in model else 3072
 
+        # 배치 검색 중 여러 쿼리의 임베딩을 API 호출 하나로 묶음
+        self._batcher = MicroBatcher(
+            "embedding",
+            self._create_embeddings,
+            max_batch_size=self.settings.micro_batch_max_size,
+            max_wait_seconds=self.settings.micro_batch_wait_ms / 1000
+        )
+
     @property
     def dimension(self) -> int:
         """임베딩 벡터 차원"""
         return self._dimension
 
-    def get_embedding(self, text: str) -> List[float]:
+    def get_embedding(self, text: str, timeout: Optional[float] = None) -> List[float]:
         """
         단일 텍스트 임베딩 생성
 
         Args:
             text: 임베딩할 텍스트
+            timeout: API 호출 타임아웃 (초, 기본: 클라이언트 설정)
 
         Returns:
             임베딩 벡터 (List[float])
         """
+        text = self._normalize(text)
+
+        if is_batching_enabled():
+            fn = partial(self._batched_embedding, text, timeout)
+        else:
+            fn = partial(self._create_embedding, text, timeout)
+
+        embedding = _embedding_flight.do((self.model, text), fn, timeout)
+        return list(embedding)
+
+    async def aget_embedding(self, text: str, timeout: Optional[float] = None) -> List[float]:
+        """get_embedding()의 비동기 버전 (AsyncOpenAI)"""
+        text = self._normalize(text)
+
+        if is_batching_enabled():
+            fn = partial(self._abatched_embedding, text, timeout)
+        else:
+            fn = partial(self._acreate_embedding, text, timeout)
+
+        embedding = await _embedding_flight.do_async((self.model, text), fn, timeout)
+        return list(embedding)
+
+    def _normalize(self, text: str) -> str:
+        """텍스트 검증 및 정규화"""
         if not text or not text.strip():
             raise ValueError("텍스트가 비어있습니다.")
 
-        # 텍스트 정규화
-        text = text.strip().replace("\n", " ")
+        return text.strip().replace("\n", " ")
+
+    def _batched_embedding(self, text: str, timeout: Optional[float] = None) -> List[float]:
+        """micro-batch 결과 대기 (배치 응답에 텍스트가 빠져 있으면 단건 호출로 대체)"""
+        embedding = self._batcher.submit(text, timeout)
+        if embedding is None:
+            logger.warning(f"배치 임베딩 응답에 누락된 텍스트, 단건 호출: {text[:50]}")
+            return self._create_embedding(text, timeout)
+        return embedding
+
+    async def _abatched_embedding(self, text: str, timeout: Optional[float] = None) -> List[float]:
+        """_batched_embedding()의 비동기 버전"""
+        embedding = await self._batcher.asubmit(text, timeout)
+        if embedding is None:
+            logger.warning(f"배치 임베딩 응답에 누락된 텍스트, 단건 호출: {text[:50]}")
+            return await self._acreate_embedding(text, timeout)
+        return embedding
+
+    def _create_embedding(self, text: str, timeout: Optional[float] = None) -> List[float]:
+        """임베딩 API 호출 (single-flight leader만 호출)"""
+        try:
+            with span("openai.embedding", model=self.model):
+                response = self.client.embeddings.create(
+                    **with_timeout({"input": text, "model": self.model}, timeout)
+                )
+            record_token_usage("openai.embedding", "", response)
+            return response.data[0].embedding
+        except Exception as e:
+            logger.error(f"임베딩 생성 실패: {e}")
+            raise
 
+    async def _acreate_embedding(self, text: str, timeout: Optional[float] = None) -> List[float]:
+        """임베딩 API 호출 (AsyncOpenAI, single-flight leader만 호출)"""
         try:
-            response = self.client.embeddings.create(
-                input=text,
-                model=self.model
-            )
+            with span("openai.embedding", model=self.model):
+                response = await get_async_openai_client().embeddings.create(
+                    **with_timeout({"input": text, "model": self.model}, timeout)
+                )
+            record_token_usage("openai.embedding", "", response)
             return response.data[0].embedding
         except Exception as e:
             logger.error(f"임베딩 생성 실패: {e}")
             raise
 
+    def _create_embeddings(self, texts: List[str]) -> Dict[str, List[float]]:
+        """
+        여러 텍스트 임베딩을 API 호출 하나로 생성 (micro-batcher가 호출)
+
+        쿼리별 타임아웃이 다르므로 배치 호출에는 클라이언트 기본 타임아웃을 사용하고,
+        각 쿼리는 자신의 타임아웃만큼만 결과를 기다린다.
+        """
+        try:
+            with span("openai.embedding", model=self.model, batch_size=len(texts)):
+                response = self.client.embeddings.create(input=texts, model=self.model)
+            record_token_usage("openai.embedding", "", response)
+            return {texts[item.index]: item.embedding for item in response.data}
+        except Exception as e:
+            logger.error(f"배치 임베딩 생성 실패 ({len(texts)}개): {e}")
+            raise
+
     def get_embeddings_batch(
         self,
         texts: List[str],
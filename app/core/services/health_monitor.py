@@ -0,0 +1,205 @@
+"""헬스체크 모니터 - 백그라운드 주기 점검과 스냅샷 제공"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Dict, Optional
+
+from app.config import get_settings
+from app.core.services.nutrition_db_service import get_nutrition_db_service
+from app.core.services.openai_client import get_openai_client
+from app.core.services.pipeline_cache import get_pipeline_cache
+from app.core.services.query_cache import get_query_cache
+from app.core.services.upstream_transport import PROBE_HEADER, get_circuit_breaker
+from app.core.services.vector_db_service import get_vector_db_service
+
+logger = logging.getLogger(__name__)
+
+
+def _check(name: str, fn) -> Dict[str, Any]:
+    """개별 점검 실행 (예외는 ready=false로 기록)"""
+    try:
+        return fn()
+    except Exception as e:
+        logger.warning(f"헬스체크 실패 ({name}): {e}")
+        return {"ready": False, "error": str(e)}
+
+
+def _check_vector_db(deep: bool) -> Dict[str, Any]:
+    service = get_vector_db_service()
+    result = {"ready": service.is_ready, "total_recipes": service.total_recipes}
+    if deep:
+        result["total_vectors"] = service.index.ntotal if service.index is not None else 0
+    return result
+
+
+def _check_nutrition_db(deep: bool) -> Dict[str, Any]:
+    service = get_nutrition_db_service()
+    result = {"ready": service.is_ready}
+    if deep:
+        # 테이블 스캔이 필요한 COUNT(*)는 deep 점검에서만 실행
+        result["total_records"] = service.get_total_count() if service.is_ready else 0
+    return result
+
+
+def _check_openai(deep: bool, timeout: float) -> Dict[str, Any]:
+    settings = get_settings()
+    result = {
+        "ready": bool(settings.openai_api_key),
+        "model": settings.openai_model,
+        "circuit": get_circuit_breaker().state,
+    }
+    if deep and result["ready"]:
+        start = time.perf_counter()
+        try:
+            # 전송 계층의 재시도/헤지/서킷 브레이커를 건너뛰고 한 번만 확인
+            # (프로브가 타임아웃보다 길어지지 않고, 프로브 실패가 서킷을 열지 않도록)
+            get_openai_client().with_options(timeout=timeout, max_retries=0).models.list(
+                extra_headers={PROBE_HEADER: "1"}
+            )
+            result["reachable"] = True
+        except Exception as e:
+            result["ready"] = False
+            result["reachable"] = False
+            result["error"] = str(e)
+        result["latency_ms"] = round((time.perf_counter() - start) * 1000, 1)
+    return result
+
+
+def _check_caches(deep: bool) -> Dict[str, Dict[str, Any]]:
+    results = {"query_cache": {"ready": True, **get_query_cache().get_stats()}}
+    if deep:
+        pipeline_cache = get_pipeline_cache()
+        if pipeline_cache is None:
+            results["pipeline_cache"] = {"ready": True, "enabled": False}
+        else:
+            results["pipeline_cache"] = {
+                "ready": True,
+                "enabled": True,
+                "memory": pipeline_cache.memory.get_stats(),
+                "disk": pipeline_cache.disk.get_stats() if pipeline_cache.disk is not None else None,
+            }
+    return results
+
+
+class HealthMonitor:
+    """
+    헬스체크 모니터
+
+    가벼운 점검(서비스 준비 여부, 캐시 통계)을 백그라운드에서 주기적으로 실행하고
+    /api/health는 마지막 스냅샷을 그대로 반환한다 (프로브마다 DB/서비스를 조회하지 않음).
+    레코드 수, OpenAI 연결 확인 같은 비싼 점검은 deep 점검에서만 실행하며
+    결과를 점검 주기 동안 재사용한다.
+    """
+
+    def __init__(self, interval_seconds: float = 10.0, deep_timeout_seconds: float = 5.0):
+        """
+        Args:
+            interval_seconds: 점검 주기 (초, deep 점검 결과 재사용 시간)
+            deep_timeout_seconds: deep 점검의 OpenAI 연결 확인 타임아웃 (초)
+        """
+        self.interval_seconds = interval_seconds
+        self.deep_timeout_seconds = deep_timeout_seconds
+
+        self._snapshot: Dict[str, Any] = {"status": "starting", "services": {}, "checked_at": None}
+        self._deep_snapshot: Optional[Dict[str, Any]] = None
+        self._deep_lock: Optional[asyncio.Lock] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def snapshot(self) -> Dict[str, Any]:
+        """마지막 점검 결과"""
+        return self._snapshot
+
+    def check(self, deep: bool = False) -> Dict[str, Any]:
+        """
+        점검 실행 (블로킹, 스레드에서 호출)
+
+        Args:
+            deep: 레코드 수/OpenAI 연결/파이프라인 캐시까지 점검
+
+        Returns:
+            {"status", "services", "checked_at"}
+        """
+        services = {
+            "vector_db": _check("vector_db", lambda: _check_vector_db(deep)),
+            "nutrition_db": _check("nutrition_db", lambda: _check_nutrition_db(deep)),
+            "openai": _check("openai", lambda: _check_openai(deep, self.deep_timeout_seconds)),
+        }
+        try:
+            services.update(_check_caches(deep))
+        except Exception as e:
+            logger.warning(f"헬스체크 실패 (caches): {e}")
+            services["query_cache"] = {"ready": False, "error": str(e)}
+
+        all_ready = all(s.get("ready", False) for s in services.values())
+        return {
+            "status": "healthy" if all_ready else "degraded",
+            "services": services,
+            "checked_at": time.time(),
+        }
+
+    async def refresh(self) -> Dict[str, Any]:
+        """가벼운 점검 실행 → 스냅샷 갱신"""
+        self._snapshot = await asyncio.to_thread(self.check)
+        return self._snapshot
+
+    async def deep_check(self) -> Dict[str, Any]:
+        """deep 점검 (점검 주기 안에서는 이전 결과 재사용, 동시 요청은 한 번만 실행)"""
+        if self._deep_lock is None:
+            self._deep_lock = asyncio.Lock()
+
+        async with self._deep_lock:
+            cached = self._deep_snapshot
+            if cached is not None and time.time() - cached["checked_at"] < self.interval_seconds:
+                return cached
+
+            self._deep_snapshot = await asyncio.to_thread(self.check, True)
+            return self._deep_snapshot
+
+    def start(self, after: Optional[asyncio.Task] = None) -> asyncio.Task:
+        """
+        백그라운드 주기 점검 시작
+
+        Args:
+            after: 첫 점검 전에 기다릴 태스크 (예열 중 싱글톤을 중복 생성하지 않도록)
+        """
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(after))
+        return self._task
+
+    async def stop(self):
+        """주기 점검 중지"""
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    async def _run(self, after: Optional[asyncio.Task]):
+        if after is not None:
+            await asyncio.wait([after])
+
+        while True:
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.error(f"헬스체크 갱신 실패: {e}")
+            await asyncio.sleep(self.interval_seconds)
+
+
+# 싱글톤 인스턴스
+_health_monitor: Optional[HealthMonitor] = None
+
+
+def get_health_monitor() -> HealthMonitor:
+    """HealthMonitor 싱글톤 인스턴스 반환"""
+    global _health_monitor
+    if _health_monitor is None:
+        settings = get_settings()
+        _health_monitor = HealthMonitor(
+            interval_seconds=settings.health_check_interval_seconds,
+            deep_timeout_seconds=settings.health_deep_timeout_seconds
+        )
+    return _health_monitor
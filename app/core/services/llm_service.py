@@ -1,16 +1,33 @@
 """LLM 서비스 - GPT를 사용한 레시피/영양정보 생성"""
 
+import copy
 import json
 import logging
 import re
+import time
 from typing import Optional, Dict, List
 
-from openai import OpenAI
-
 from app.config import get_settings
+from app.core.services.single_flight import SingleFlight
+from app.core.services.openai_client import (
+    get_openai_client,
+    get_async_openai_client,
+    with_timeout
+)
+from app.core.services.metrics import get_metrics_registry, record_token_usage
+from app.core.services.tracing import span
 
 logger = logging.getLogger(__name__)
 
+# 동일 음식에 대한 동시 생성 요청 병합 (LLMService 재생성과 무관하게 공유)
+_recipe_flight = SingleFlight("llm_recipe")
+_nutrition_flight = SingleFlight("llm_nutrition")
+_combined_flight = SingleFlight("llm_combined")
+
+_PARSE_FAILURES = get_metrics_registry().counter(
+    "llm_parse_failures_total", "GPT 응답 JSON 파싱 실패 수", ("operation",)
+)
+
 
 RECIPE_GENERATION_PROMPT = """당신은 한국 요리 전문가입니다.
 사용자가 요청한 음식의 레시피를 JSON 형식으로 생성해주세요.
@@ -60,6 +77,67 @@ NUTRITION_ESTIMATION_PROMPT = """당신은 영양학 전문가입니다.
 """
 
 
+COMBINED_GENERATION_PROMPT = """당신은 한국 요리와 영양학 전문가입니다.
+사용자가 요청한 음식의 레시피와 영양정보를 함께 생성해주세요.
+
+요청 음식: {food_name}
+인분 수: {servings}
+
+레시피:
+- 정확한 한국 요리 레시피를 제공하되, 양은 요청된 인분 수에 맞게 조절해주세요.
+- instructions는 "1. 첫번째 단계" 형식, estimated_time은 분 단위입니다.
+
+영양정보:
+- 1인분 기준 영양정보를 추정하고, 인분 수를 곱하여 계산해주세요.
+- serving_size는 1회 제공량(g), calories는 kcal, sodium은 mg, 나머지는 g 단위 숫자입니다.
+"""
+
+
+# 통합 생성 응답 스키마 (Structured Outputs strict 모드: 모든 필드 필수, 추가 필드 금지)
+COMBINED_GENERATION_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "recipe": {
+            "type": "object",
+            "properties": {
+                "name": {"type": "string"},
+                "category": {"type": "string"},
+                "cooking_method": {"type": "string"},
+                "ingredients": {"type": "array", "items": {"type": "string"}},
+                "instructions": {"type": "array", "items": {"type": "string"}},
+                "tips": {"type": "string"},
+                "estimated_time": {"type": "integer"}
+            },
+            "required": [
+                "name", "category", "cooking_method", "ingredients",
+                "instructions", "tips", "estimated_time"
+            ],
+            "additionalProperties": False
+        },
+        "nutrition": {
+            "type": "object",
+            "properties": {
+                "serving_size": {"type": "number"},
+                "calories": {"type": "number"},
+                "protein": {"type": "number"},
+                "fat": {"type": "number"},
+                "carbohydrate": {"type": "number"},
+                "sodium": {"type": "number"},
+                "sugar": {"type": "number"},
+                "fiber": {"type": "number"}
+            },
+            "required": [
+                "serving_size", "calories", "protein", "fat",
+                "carbohydrate", "sodium", "sugar", "fiber"
+            ],
+            "additionalProperties": False
+        }
+    },
+    "required": ["recipe", "nutrition"],
+    "additionalProperties": False
+}
+
+
 class LLMService:
     """GPT를 사용한 레시피/영양정보 생성 서비스"""
 
@@ -67,6 +145,7 @@ class LLMService:
         self.settings = get_settings()
         self.model = self.settings.openai_model
         self.client = None
+        self.api_key = ""
         self._is_ready = False
 
         # API 키 확인
@@ -82,7 +161,8 @@ class LLMService:
                 logger.warning(f"Streamlit secrets 로드 실패: {e}")
 
         if api_key:
-            self.client = OpenAI(api_key=api_key)
+            self.api_key = api_key
+            self.client = get_openai_client(api_key)
             self._is_ready = True
             logger.info("LLM 서비스 초기화 완료")
         else:
@@ -96,7 +176,8 @@ class LLMService:
     def generate_recipe(
         self,
         food_name: str,
-        servings: int = 1
+        servings: int = 1,
+        timeout: Optional[float] = None
     ) -> Optional[Dict]:
         """
         GPT로 레시피 생성
@@ -104,6 +185,7 @@ class LLMService:
         Args:
             food_name: 음식 이름
             servings: 인분 수
+            timeout: API 호출 타임아웃 (초, 요청 예산의 남은 시간)
 
         Returns:
             레시피 정보 딕셔너리 또는 None
@@ -112,50 +194,127 @@ class LLMService:
             logger.warning("LLM 서비스가 준비되지 않았습니다. 레시피 생성 불가")
             return None
 
-        logger.info(f"GPT 레시피 생성: {food_name} ({servings}인분)")
+        key = (self.model, food_name, servings)
+        try:
+            recipe = _recipe_flight.do(
+                key, lambda: self._generate_recipe(food_name, servings, timeout), timeout
+            )
+        except TimeoutError:
+            logger.warning(f"레시피 생성 대기 시간 초과: {food_name}")
+            return None
+        return copy.deepcopy(recipe)
 
-        prompt = RECIPE_GENERATION_PROMPT.format(
-            food_name=food_name,
-            servings=servings
-        )
+    async def agenerate_recipe(
+        self,
+        food_name: str,
+        servings: int = 1,
+        timeout: Optional[float] = None
+    ) -> Optional[Dict]:
+        """generate_recipe()의 비동기 버전 (AsyncOpenAI)"""
+        if not self.is_ready:
+            logger.warning("LLM 서비스가 준비되지 않았습니다. 레시피 생성 불가")
+            return None
 
+        key = (self.model, food_name, servings)
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are a Korean cuisine expert. Always respond in valid JSON format only."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.7,
-                max_tokens=1500
+            recipe = await _recipe_flight.do_async(
+                key, lambda: self._agenerate_recipe(food_name, servings, timeout), timeout
             )
+        except TimeoutError:
+            logger.warning(f"레시피 생성 대기 시간 초과: {food_name}")
+            return None
+        return copy.deepcopy(recipe)
 
-            content = response.choices[0].message.content
-            recipe = self._parse_json(content)
+    def _generate_recipe(
+        self,
+        food_name: str,
+        servings: int,
+        timeout: Optional[float] = None
+    ) -> Optional[Dict]:
+        """GPT 레시피 생성 (single-flight leader만 호출)"""
+        logger.info(f"GPT 레시피 생성: {food_name} ({servings}인분)")
 
-            if recipe:
-                # 기본 필드 보장
-                recipe.setdefault("name", food_name)
-                recipe.setdefault("category", "기타")
-                recipe.setdefault("cooking_method", "")
-                recipe.setdefault("ingredients", [])
-                recipe.setdefault("instructions", [])
-                recipe.setdefault("tips", "")
-                recipe.setdefault("image_url", "")
-                recipe["recipe_id"] = ""  # LLM 생성 레시피는 ID 없음
+        try:
+            with span("openai.chat", purpose="recipe"):
+                response = self.client.chat.completions.create(
+                    **self._recipe_request(food_name, servings, timeout)
+                )
+            record_token_usage("openai.chat", "recipe", response)
+            return self._to_recipe(response.choices[0].message.content, food_name)
 
-                logger.info(f"레시피 생성 완료: {recipe.get('name')}")
-                return recipe
+        except Exception as e:
+            logger.error(f"레시피 생성 실패: {e}")
+
+        return None
+
+    async def _agenerate_recipe(
+        self,
+        food_name: str,
+        servings: int,
+        timeout: Optional[float] = None
+    ) -> Optional[Dict]:
+        """GPT 레시피 생성 (AsyncOpenAI, single-flight leader만 호출)"""
+        logger.info(f"GPT 레시피 생성: {food_name} ({servings}인분)")
+
+        try:
+            with span("openai.chat", purpose="recipe"):
+                response = await get_async_openai_client(self.api_key).chat.completions.create(
+                    **self._recipe_request(food_name, servings, timeout)
+                )
+            record_token_usage("openai.chat", "recipe", response)
+            return self._to_recipe(response.choices[0].message.content, food_name)
 
         except Exception as e:
             logger.error(f"레시피 생성 실패: {e}")
 
         return None
 
+    def _recipe_request(self, food_name: str, servings: int, timeout: Optional[float] = None) -> Dict:
+        """레시피 생성 요청 파라미터"""
+        prompt = RECIPE_GENERATION_PROMPT.format(
+            food_name=food_name,
+            servings=servings
+        )
+        return with_timeout({
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": "You are a Korean cuisine expert. Always respond in valid JSON format only."},
+                {"role": "user", "content": prompt}
+            ],
+            "temperature": 0.7,
+            "max_tokens": 1500
+        }, timeout)
+
+    def _to_recipe(self, content: str, food_name: str) -> Optional[Dict]:
+        """GPT 응답 → 레시피 딕셔너리"""
+        recipe = self._parse_json(content)
+        if not recipe:
+            _PARSE_FAILURES.inc("recipe")
+        return self._normalize_recipe(recipe, food_name)
+
+    def _normalize_recipe(self, recipe: Optional[Dict], food_name: str) -> Optional[Dict]:
+        """레시피 기본 필드 보장"""
+        if recipe:
+            # 기본 필드 보장
+            recipe.setdefault("name", food_name)
+            recipe.setdefault("category", "기타")
+            recipe.setdefault("cooking_method", "")
+            recipe.setdefault("ingredients", [])
+            recipe.setdefault("instructions", [])
+            recipe.setdefault("tips", "")
+            recipe.setdefault("image_url", "")
+            recipe["recipe_id"] = ""  # LLM 생성 레시피는 ID 없음
+
+            logger.info(f"레시피 생성 완료: {recipe.get('name')}")
+            return recipe
+
+        return None
+
     def generate_nutrition(
         self,
         food_name: str,
-        servings: int = 1
+        servings: int = 1,
+        timeout: Optional[float] = None
     ) -> Optional[Dict]:
         """
         GPT로 영양정보 추정
@@ -163,6 +322,7 @@ class LLMService:
         Args:
             food_name: 음식 이름
             servings: 인분 수
+            timeout: API 호출 타임아웃 (초, 요청 예산의 남은 시간)
 
         Returns:
             영양정보 딕셔너리 또는 None
@@ -171,52 +331,269 @@ class LLMService:
             logger.warning("LLM 서비스가 준비되지 않았습니다. 영양정보 추정 불가")
             return None
 
+        key = (self.model, food_name, servings)
+        try:
+            nutrition = _nutrition_flight.do(
+                key, lambda: self._generate_nutrition(food_name, servings, timeout), timeout
+            )
+        except TimeoutError:
+            logger.warning(f"영양정보 추정 대기 시간 초과: {food_name}")
+            return None
+        return copy.deepcopy(nutrition)
+
+    async def agenerate_nutrition(
+        self,
+        food_name: str,
+        servings: int = 1,
+        timeout: Optional[float] = None
+    ) -> Optional[Dict]:
+        """generate_nutrition()의 비동기 버전 (AsyncOpenAI)"""
+        if not self.is_ready:
+            logger.warning("LLM 서비스가 준비되지 않았습니다. 영양정보 추정 불가")
+            return None
+
+        key = (self.model, food_name, servings)
+        try:
+            nutrition = await _nutrition_flight.do_async(
+                key, lambda: self._agenerate_nutrition(food_name, servings, timeout), timeout
+            )
+        except TimeoutError:
+            logger.warning(f"영양정보 추정 대기 시간 초과: {food_name}")
+            return None
+        return copy.deepcopy(nutrition)
+
+    def _generate_nutrition(
+        self,
+        food_name: str,
+        servings: int,
+        timeout: Optional[float] = None
+    ) -> Optional[Dict]:
+        """GPT 영양정보 추정 (single-flight leader만 호출)"""
+        logger.info(f"GPT 영양정보 추정: {food_name} ({servings}인분)")
+
+        try:
+            with span("openai.chat", purpose="nutrition"):
+                response = self.client.chat.completions.create(
+                    **self._nutrition_request(food_name, servings, timeout)
+                )
+            record_token_usage("openai.chat", "nutrition", response)
+            return self._to_nutrition(response.choices[0].message.content, food_name, servings)
+
+        except Exception as e:
+            logger.error(f"영양정보 추정 실패: {e}")
+
+        return None
+
+    async def _agenerate_nutrition(
+        self,
+        food_name: str,
+        servings: int,
+        timeout: Optional[float] = None
+    ) -> Optional[Dict]:
+        """GPT 영양정보 추정 (AsyncOpenAI, single-flight leader만 호출)"""
         logger.info(f"GPT 영양정보 추정: {food_name} ({servings}인분)")
 
+        try:
+            with span("openai.chat", purpose="nutrition"):
+                response = await get_async_openai_client(self.api_key).chat.completions.create(
+                    **self._nutrition_request(food_name, servings, timeout)
+                )
+            record_token_usage("openai.chat", "nutrition", response)
+            return self._to_nutrition(response.choices[0].message.content, food_name, servings)
+
+        except Exception as e:
+            logger.error(f"영양정보 추정 실패: {e}")
+
+        return None
+
+    def _nutrition_request(self, food_name: str, servings: int, timeout: Optional[float] = None) -> Dict:
+        """영양정보 추정 요청 파라미터"""
         prompt = NUTRITION_ESTIMATION_PROMPT.format(
             food_name=food_name,
             servings=servings
         )
+        return with_timeout({
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": "You are a nutrition expert. Always respond in valid JSON format only with numeric values."},
+                {"role": "user", "content": prompt}
+            ],
+            "temperature": 0.5,
+            "max_tokens": 500
+        }, timeout)
+
+    def _to_nutrition(self, content: str, food_name: str, servings: int) -> Optional[Dict]:
+        """GPT 응답 → 영양정보 딕셔너리"""
+        nutrition = self._parse_json(content)
+        if not nutrition:
+            _PARSE_FAILURES.inc("nutrition")
+        return self._normalize_nutrition(nutrition, food_name, servings)
+
+    def _normalize_nutrition(self, nutrition: Optional[Dict], food_name: str, servings: int) -> Optional[Dict]:
+        """영양정보 숫자 필드 변환 및 기본값 설정"""
+        if nutrition:
+            # 숫자 필드 변환 및 기본값 설정
+            numeric_fields = [
+                "serving_size", "servings", "calories", "protein",
+                "fat", "carbohydrate", "sodium", "sugar", "fiber"
+            ]
+
+            for field in numeric_fields:
+                if field in nutrition:
+                    try:
+                        nutrition[field] = float(nutrition[field])
+                    except (ValueError, TypeError):
+                        nutrition[field] = 0
+
+            nutrition.setdefault("food_name", food_name)
+            nutrition.setdefault("servings", servings)
+
+            logger.info(f"영양정보 추정 완료: {nutrition.get('calories', 0):.0f}kcal")
+            return nutrition
+
+        return None
+
+    def generate_recipe_with_nutrition(
+        self,
+        food_name: str,
+        servings: int = 1,
+        timeout: Optional[float] = None
+    ) -> Optional[Dict]:
+        """
+        GPT 한 번의 호출로 레시피와 영양정보를 함께 생성 (Structured Outputs)
+
+        Args:
+            food_name: 음식 이름
+            servings: 인분 수
+            timeout: API 호출 타임아웃 (초, 요청 예산의 남은 시간)
+
+        Returns:
+            {"recipe": 레시피 또는 None, "nutrition": 영양정보 또는 None} 또는 None
+        """
+        if not self.is_ready:
+            logger.warning("LLM 서비스가 준비되지 않았습니다. 레시피/영양정보 생성 불가")
+            return None
 
+        key = (self.model, food_name, servings)
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are a nutrition expert. Always respond in valid JSON format only with numeric values."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.5,
-                max_tokens=500
+            generated = _combined_flight.do(
+                key, lambda: self._generate_combined(food_name, servings, timeout), timeout
             )
+        except TimeoutError:
+            logger.warning(f"레시피/영양정보 생성 대기 시간 초과: {food_name}")
+            return None
+        return copy.deepcopy(generated)
 
-            content = response.choices[0].message.content
-            nutrition = self._parse_json(content)
+    async def agenerate_recipe_with_nutrition(
+        self,
+        food_name: str,
+        servings: int = 1,
+        timeout: Optional[float] = None
+    ) -> Optional[Dict]:
+        """generate_recipe_with_nutrition()의 비동기 버전 (AsyncOpenAI)"""
+        if not self.is_ready:
+            logger.warning("LLM 서비스가 준비되지 않았습니다. 레시피/영양정보 생성 불가")
+            return None
 
-            if nutrition:
-                # 숫자 필드 변환 및 기본값 설정
-                numeric_fields = [
-                    "serving_size", "servings", "calories", "protein",
-                    "fat", "carbohydrate", "sodium", "sugar", "fiber"
-                ]
+        key = (self.model, food_name, servings)
+        try:
+            generated = await _combined_flight.do_async(
+                key, lambda: self._agenerate_combined(food_name, servings, timeout), timeout
+            )
+        except TimeoutError:
+            logger.warning(f"레시피/영양정보 생성 대기 시간 초과: {food_name}")
+            return None
+        return copy.deepcopy(generated)
+
+    def _generate_combined(
+        self,
+        food_name: str,
+        servings: int,
+        timeout: Optional[float] = None
+    ) -> Optional[Dict]:
+        """GPT 레시피+영양정보 통합 생성 (single-flight leader만 호출)"""
+        logger.info(f"GPT 레시피+영양정보 생성: {food_name} ({servings}인분)")
+
+        try:
+            with span("openai.chat", purpose="combined"):
+                response = self.client.chat.completions.create(
+                    **self._combined_request(food_name, servings, timeout)
+                )
+            record_token_usage("openai.chat", "combined", response)
+            return self._to_combined(response.choices[0].message.content, food_name, servings)
+
+        except Exception as e:
+            logger.error(f"레시피/영양정보 생성 실패: {e}")
 
-                for field in numeric_fields:
-                    if field in nutrition:
-                        try:
-                            nutrition[field] = float(nutrition[field])
-                        except (ValueError, TypeError):
-                            nutrition[field] = 0
+        return None
 
-                nutrition.setdefault("food_name", food_name)
-                nutrition.setdefault("servings", servings)
+    async def _agenerate_combined(
+        self,
+        food_name: str,
+        servings: int,
+        timeout: Optional[float] = None
+    ) -> Optional[Dict]:
+        """GPT 레시피+영양정보 통합 생성 (AsyncOpenAI, single-flight leader만 호출)"""
+        logger.info(f"GPT 레시피+영양정보 생성: {food_name} ({servings}인분)")
 
-                logger.info(f"영양정보 추정 완료: {nutrition.get('calories', 0):.0f}kcal")
-                return nutrition
+        try:
+            with span("openai.chat", purpose="combined"):
+                response = await get_async_openai_client(self.api_key).chat.completions.create(
+                    **self._combined_request(food_name, servings, timeout)
+                )
+            record_token_usage("openai.chat", "combined", response)
+            return self._to_combined(response.choices[0].message.content, food_name, servings)
 
         except Exception as e:
-            logger.error(f"영양정보 추정 실패: {e}")
+            logger.error(f"레시피/영양정보 생성 실패: {e}")
 
         return None
 
+    def _combined_request(self, food_name: str, servings: int, timeout: Optional[float] = None) -> Dict:
+        """레시피+영양정보 통합 생성 요청 파라미터 (JSON 스키마로 응답 형식 강제)"""
+        prompt = COMBINED_GENERATION_PROMPT.format(
+            food_name=food_name,
+            servings=servings
+        )
+        return with_timeout({
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": "You are a Korean cuisine and nutrition expert. Respond with JSON matching the given schema."},
+                {"role": "user", "content": prompt}
+            ],
+            "response_format": {
+                "type": "json_schema",
+                "json_schema": {
+                    "name": "recipe_with_nutrition",
+                    "strict": True,
+                    "schema": COMBINED_GENERATION_SCHEMA
+                }
+            },
+            "temperature": 0.5,
+            "max_tokens": 2000
+        }, timeout)
+
+    def _to_combined(self, content: Optional[str], food_name: str, servings: int) -> Optional[Dict]:
+        """GPT 응답 → {"recipe", "nutrition"} (스키마를 따르므로 정규식 추출 없이 바로 파싱)"""
+        try:
+            generated = json.loads(content) if content else None
+        except json.JSONDecodeError:
+            generated = None
+
+        if not isinstance(generated, dict):
+            # 모델 거절(refusal) 또는 잘린 응답
+            _PARSE_FAILURES.inc("combined")
+            return None
+
+        recipe = generated.get("recipe")
+        nutrition = generated.get("nutrition")
+        return {
+            "recipe": self._normalize_recipe(recipe if isinstance(recipe, dict) else None, food_name),
+            "nutrition": self._normalize_nutrition(
+                nutrition if isinstance(nutrition, dict) else None, food_name, servings
+            )
+        }
+
     def _parse_json(self, text: str) -> Optional[Dict]:
         """텍스트에서 JSON 추출 및 파싱"""
         # 직접 파싱 시도
@@ -246,12 +623,19 @@ class LLMService:
 
 # 싱글톤 인스턴스
 _llm_service: Optional[LLMService] = None
+_llm_service_retry_at = 0.0
+
+# 준비되지 않은 LLMService를 다시 생성하는 최소 간격 (초)
+_LLM_SERVICE_RETRY_SECONDS = 30.0
 
 
 def get_llm_service() -> LLMService:
     """LLMService 싱글톤 인스턴스 반환"""
-    global _llm_service
-    # 서비스가 없거나 준비되지 않았으면 다시 생성 시도
-    if _llm_service is None or not _llm_service.is_ready:
+    global _llm_service, _llm_service_retry_at
+    # 준비되지 않았으면 (API 키/Streamlit secrets 로드 전) 일정 간격으로만 다시 생성 시도
+    if _llm_service is None or (
+        not _llm_service.is_ready and time.monotonic() >= _llm_service_retry_at
+    ):
         _llm_service = LLMService()
+        _llm_service_retry_at = time.monotonic() + _LLM_SERVICE_RETRY_SECONDS
     return _llm_service
@@ -0,0 +1,312 @@
+"""Prometheus 메트릭 - 스레드별 집계 카운터/히스토그램과 텍스트 포맷 노출"""
+
+import bisect
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 기본 지연 시간 버킷 (초)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# 수집기 반환 형식: (이름, 타입, 설명, [(라벨, 값)])
+CollectedFamily = Tuple[str, str, str, List[Tuple[Dict[str, str], float]]]
+
+
+class _Shard:
+    """스레드 하나가 단독으로 쓰는 메트릭 값 (쓰기 시 잠금 없음)"""
+
+    def __init__(self):
+        # 메트릭 이름 → 라벨 값 튜플 → 카운터 값 / [버킷별 개수..., +Inf 개수, 합계]
+        self.values: Dict[str, Dict[Tuple[str, ...], Any]] = {}
+
+
+class MetricsRegistry:
+    """메트릭 레지스트리
+
+    핫패스의 inc()/observe()는 현재 스레드의 샤드만 수정하므로 잠금이 필요 없다.
+    스크레이프 시 모든 샤드를 합산하며, 샤드 목록 등록(스레드별 최초 1회)에만 잠금을 사용한다.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._shards: List[_Shard] = []
+        self._metrics: Dict[str, "_Metric"] = {}
+        self._collectors: List[Callable[[], Iterable[CollectedFamily]]] = []
+
+    def _shard(self) -> _Shard:
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = _Shard()
+            self._local.shard = shard
+            with self._lock:
+                self._shards.append(shard)
+        return shard
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> "Counter":
+        """카운터 등록 (같은 이름이면 기존 메트릭 반환)"""
+        return self._register(Counter(self, name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ) -> "Histogram":
+        """히스토그램 등록 (같은 이름이면 기존 메트릭 반환)"""
+        return self._register(Histogram(self, name, documentation, labelnames, buckets))
+
+    def _register(self, metric: "_Metric") -> Any:
+        with self._lock:
+            return self._metrics.setdefault(metric.name, metric)
+
+    def register_collector(self, collector: Callable[[], Iterable[CollectedFamily]]):
+        """
+        스크레이프 시 호출되는 수집기 등록
+
+        자체 통계를 이미 관리하는 컴포넌트(캐시, single-flight)가
+        핫패스 비용 없이 값을 노출할 때 사용한다.
+        """
+        with self._lock:
+            self._collectors.append(collector)
+
+    def render(self) -> str:
+        """Prometheus 텍스트 포맷 (0.0.4) 생성"""
+        with self._lock:
+            shards = list(self._shards)
+            metrics = list(self._metrics.values())
+            collectors = list(self._collectors)
+
+        lines: List[str] = []
+        for metric in metrics:
+            # dict 복사는 GIL 아래에서 원자적이므로 쓰는 스레드와 경합하지 않음
+            merged = metric.merge(dict(shard.values.get(metric.name, {})) for shard in shards)
+            lines.extend(metric.render(merged))
+
+        for collector in collectors:
+            try:
+                for name, metric_type, documentation, samples in collector():
+                    lines.append(f"# HELP {name} {documentation}")
+                    lines.append(f"# TYPE {name} {metric_type}")
+                    for labels, value in samples:
+                        lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+            except Exception as e:
+                logger.warning(f"메트릭 수집기 실패: {e}")
+
+        return "\n".join(lines) + "\n"
+
+
+class _Metric:
+    metric_type = ""
+
+    def __init__(self, registry: MetricsRegistry, name: str, documentation: str, labelnames: Sequence[str]):
+        self._registry = registry
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+
+    def _values(self) -> Dict[Tuple[str, ...], Any]:
+        shard = self._registry._shard()
+        values = shard.values.get(self.name)
+        if values is None:
+            values = shard.values[self.name] = {}
+        return values
+
+    def _labels(self, labelvalues: Tuple[str, ...]) -> Dict[str, str]:
+        return dict(zip(self.labelnames, labelvalues))
+
+    def _header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.metric_type}"]
+
+
+class Counter(_Metric):
+    """단조 증가 카운터"""
+    metric_type = "counter"
+
+    def inc(self, *labelvalues: str, amount: float = 1.0):
+        values = self._values()
+        values[labelvalues] = values.get(labelvalues, 0) + amount
+
+    def merge(self, shard_values: Iterable[Dict]) -> Dict[Tuple[str, ...], float]:
+        merged: Dict[Tuple[str, ...], float] = {}
+        for values in shard_values:
+            for key, value in values.items():
+                merged[key] = merged.get(key, 0) + value
+        return merged
+
+    def render(self, merged: Dict[Tuple[str, ...], float]) -> List[str]:
+        lines = self._header()
+        for key, value in sorted(merged.items()):
+            lines.append(f"{self.name}{_format_labels(self._labels(key))} {_format_value(value)}")
+        return lines
+
+
+class Histogram(_Metric):
+    """누적 버킷 히스토그램"""
+    metric_type = "histogram"
+
+    def __init__(
+        self,
+        registry: MetricsRegistry,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str],
+        buckets: Sequence[float]
+    ):
+        super().__init__(registry, name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, *labelvalues: str):
+        values = self._values()
+        counts = values.get(labelvalues)
+        if counts is None:
+            # 버킷별 개수 + (+Inf) + 합계
+            counts = values[labelvalues] = [0] * (len(self.buckets) + 1) + [0.0]
+        counts[bisect.bisect_left(self.buckets, value)] += 1
+        counts[-1] += value
+
+    def merge(self, shard_values: Iterable[Dict]) -> Dict[Tuple[str, ...], List[float]]:
+        merged: Dict[Tuple[str, ...], List[float]] = {}
+        for values in shard_values:
+            for key, counts in values.items():
+                counts = list(counts)
+                total = merged.get(key)
+                if total is None:
+                    merged[key] = counts
+                else:
+                    for i, count in enumerate(counts):
+                        total[i] += count
+        return merged
+
+    def render(self, merged: Dict[Tuple[str, ...], List[float]]) -> List[str]:
+        lines = self._header()
+        for key, counts in sorted(merged.items()):
+            labels = self._labels(key)
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                bucket_labels = {**labels, "le": _format_value(bound)}
+                lines.append(f"{self.name}_bucket{_format_labels(bucket_labels)} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(labels)} {_format_value(counts[-1])}")
+            lines.append(f"{self.name}_count{_format_labels(labels)} {cumulative}")
+        return lines
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    pairs = ",".join(f'{key}="{_escape(str(value))}"' for key, value in labels.items())
+    return "{" + pairs + "}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+# 전역 레지스트리
+_registry = MetricsRegistry()
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """전역 MetricsRegistry 반환"""
+    return _registry
+
+
+# 서비스 공통 메트릭
+HTTP_REQUESTS = _registry.counter(
+    "http_requests_total", "HTTP 요청 수", ("method", "route", "status")
+)
+HTTP_REQUEST_DURATION = _registry.histogram(
+    "http_request_duration_seconds", "HTTP 요청 처리 시간 (스트리밍은 전송 완료까지)", ("method", "route")
+)
+WORKFLOW_NODE_DURATION = _registry.histogram(
+    "workflow_node_duration_seconds", "워크플로우 노드 실행 시간", ("node",)
+)
+EXTERNAL_CALLS = _registry.counter(
+    "external_calls_total",
+    "외부 호출 수 (openai.chat, openai.embedding, faiss.search, sqlite.query, recipe_file.read)",
+    ("call", "operation", "outcome")
+)
+EXTERNAL_CALL_DURATION = _registry.histogram(
+    "external_call_duration_seconds", "외부 호출 시간", ("call", "operation")
+)
+OPENAI_TOKENS = _registry.counter(
+    "openai_tokens_total", "OpenAI 토큰 사용량", ("call", "operation", "type")
+)
+
+
+def observe_span(name: str, kind: str, seconds: float, attributes: Dict[str, Any], error: bool):
+    """트레이싱 구간 종료 시 호출 (노드/외부 호출 지연 시간 기록)"""
+    if kind == "node":
+        WORKFLOW_NODE_DURATION.observe(seconds, name)
+        return
+
+    operation = str(attributes.get("purpose") or attributes.get("operation") or "")
+    EXTERNAL_CALLS.inc(name, operation, "error" if error else "success")
+    EXTERNAL_CALL_DURATION.observe(seconds, name, operation)
+
+
+def record_token_usage(call: str, operation: str, response: Any):
+    """OpenAI 응답의 usage를 토큰 카운터에 반영 (usage가 없으면 무시)"""
+    usage = getattr(response, "usage", None)
+    if usage is None:
+        return
+
+    prompt_tokens = getattr(usage, "prompt_tokens", 0) or 0
+    completion_tokens = getattr(usage, "completion_tokens", 0) or 0
+    if prompt_tokens:
+        OPENAI_TOKENS.inc(call, operation, "prompt", amount=prompt_tokens)
+    if completion_tokens:
+        OPENAI_TOKENS.inc(call, operation, "completion", amount=completion_tokens)
+
+
+class MetricsMiddleware:
+    """
+    HTTP 요청 수/처리 시간 기록 ASGI 미들웨어
+
+    route 라벨은 매칭된 경로 템플릿을 사용해 카디널리티를 제한한다 (미매칭은 "unmatched").
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status = {"code": 500}
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = scope.get("route")
+            route_path = getattr(route, "path", None) or "unmatched"
+            method = scope.get("method", "")
+            HTTP_REQUESTS.inc(method, route_path, str(status["code"]))
+            HTTP_REQUEST_DURATION.observe(time.perf_counter() - start, method, route_path)
+
+
+def render_metrics() -> str:
+    """전역 레지스트리의 Prometheus 텍스트"""
+    return _registry.render()
@@ -0,0 +1,145 @@
+"""Micro-batching 서비스 - 짧은 시간 창 안의 개별 요청을 하나의 upstream 호출로 묶음"""
+
+import asyncio
+import contextvars
+import logging
+import threading
+from concurrent.futures import Future
+from contextlib import contextmanager
+from typing import Callable, Dict, Generic, Hashable, Iterator, List, Optional, Tuple, TypeVar
+
+from app.core.services.metrics import get_metrics_registry
+
+logger = logging.getLogger(__name__)
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+# 배치 검색 요청 처리 중인지 여부 (asyncio 태스크/LangGraph 스레드풀로 전파)
+_batching_enabled: contextvars.ContextVar[bool] = contextvars.ContextVar("micro_batching", default=False)
+
+_BATCH_SIZE = get_metrics_registry().histogram(
+    "micro_batch_size",
+    "micro-batch 한 번에 묶인 키 수",
+    ("batcher",),
+    buckets=(1, 2, 4, 8, 16, 32, 64, 128, 256)
+)
+
+
+@contextmanager
+def micro_batching() -> Iterator[None]:
+    """이 컨텍스트(및 여기서 생성된 태스크)의 조회를 micro-batch로 처리"""
+    token = _batching_enabled.set(True)
+    try:
+        yield
+    finally:
+        _batching_enabled.reset(token)
+
+
+def is_batching_enabled() -> bool:
+    """현재 컨텍스트에서 micro-batching 사용 여부"""
+    return _batching_enabled.get()
+
+
+class MicroBatcher(Generic[K, V]):
+    """요청 묶음 처리 (micro-batching)
+
+    첫 요청이 들어오면 max_wait_seconds 뒤에 대기 중인 키를 모아 batch_fn을 한 번 호출하고,
+    그 전에 max_batch_size개가 모이면 즉시 호출한다. 같은 키는 한 번만 조회한다.
+
+    결과는 concurrent.futures.Future로 전달하므로 스레드풀 동기 경로(submit)와
+    이벤트 루프 비동기 경로(asubmit)가 같은 배치를 공유한다.
+    batch_fn은 항상 별도 스레드(타이머 스레드 또는 배치가 가득 찼을 때 시작한 스레드)에서 실행되므로
+    submit_future()는 이벤트 루프에서 호출해도 블로킹 호출을 하지 않는다.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        batch_fn: Callable[[List[K]], Dict[K, V]],
+        max_batch_size: int = 64,
+        max_wait_seconds: float = 0.01
+    ):
+        """
+        Args:
+            name: 로그/통계 구분용 이름
+            batch_fn: 키 목록 → {키: 값} (결과에 없는 키는 None)
+            max_batch_size: 최대 배치 크기
+            max_wait_seconds: 첫 요청 이후 배치를 모으는 최대 시간 (초)
+        """
+        self.name = name
+        self.batch_fn = batch_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait_seconds = max_wait_seconds
+
+        self._lock = threading.Lock()
+        self._pending: Dict[K, Future] = {}
+        self._timer: Optional[threading.Timer] = None
+
+    def submit_future(self, key: K) -> Future:
+        """키를 현재 배치에 추가하고 결과 Future 반환 (대기열에 넣기만 하고 batch_fn은 호출하지 않음)"""
+        batch = None
+        with self._lock:
+            future = self._pending.get(key)
+            if future is not None:
+                return future
+
+            future = Future()
+            self._pending[key] = future
+            if len(self._pending) >= self.max_batch_size:
+                batch = self._take_locked()
+            elif self._timer is None:
+                self._timer = threading.Timer(self.max_wait_seconds, self._flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+        if batch:
+            # 배치가 가득 차면 타이머를 기다리지 않고 별도 스레드에서 실행 (호출자가 이벤트 루프일 수 있음)
+            threading.Thread(target=self._run, args=(batch,), name=f"{self.name}-batch", daemon=True).start()
+        return future
+
+    def submit(self, key: K, timeout: Optional[float] = None) -> Optional[V]:
+        """
+        동기 조회 (배치 결과 대기)
+
+        Args:
+            key: 조회 키
+            timeout: 최대 대기 시간 (초, 초과 시 TimeoutError)
+        """
+        return self.submit_future(key).result(timeout)
+
+    async def asubmit(self, key: K, timeout: Optional[float] = None) -> Optional[V]:
+        """비동기 조회 (이벤트 루프를 막지 않고 배치 결과 대기)"""
+        future = asyncio.wrap_future(self.submit_future(key))
+        return await asyncio.wait_for(asyncio.shield(future), timeout)
+
+    def _take_locked(self) -> List[Tuple[K, Future]]:
+        """대기 중인 배치 꺼내기 (self._lock 보유 상태에서 호출)"""
+        batch = list(self._pending.items())
+        self._pending = {}
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        return batch
+
+    def _flush(self):
+        """타이머 만료 시 대기 중인 배치 실행"""
+        with self._lock:
+            batch = self._take_locked()
+        if batch:
+            self._run(batch)
+
+    def _run(self, batch: List[Tuple[K, Future]]):
+        keys = [key for key, _ in batch]
+        _BATCH_SIZE.observe(len(keys), self.name)
+        logger.debug(f"[{self.name}] 배치 실행: {len(keys)}개")
+
+        try:
+            results = self.batch_fn(keys)
+        except BaseException as e:
+            for _, future in batch:
+                future.set_exception(e)
+            return
+
+        for key, future in batch:
+            future.set_result(results.get(key))
@@ -2,8 +2,16 @@
 
 import logging
 import sqlite3
+import threading
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Dict, Iterator, List, Optional
+
+from app.config import get_settings
+from app.core.services.data_version import compute_data_version
+from app.core.services.micro_batcher import MicroBatcher, is_batching_enabled
+from app.core.services.tracing import span
 
 logger = logging.getLogger(__name__)
 
@@ -24,67 +32,182 @@ class NutritionDBService:
         """
         self.db_path = db_path or DB_PATH
         self._conn: Optional[sqlite3.Connection] = None
+        self._conn_lock = threading.Lock()
+        # 공유 연결은 스레드 간 동시 사용이 안전하지 않으므로 쿼리 실행~결과 읽기를 직렬화
+        self._query_lock = threading.Lock()
+        self._data_version: Optional[str] = None
+
+        # 배치 검색 중 여러 쿼리의 정확 매칭 조회를 IN 쿼리 하나로 묶음
+        settings = get_settings()
+        self._batch_timeout = settings.micro_batch_timeout_ms / 1000
+        self._batcher = MicroBatcher(
+            "nutrition",
+            self.get_nutrition_many,
+            max_batch_size=settings.micro_batch_max_size,
+            max_wait_seconds=settings.micro_batch_wait_ms / 1000
+        )
 
     def _get_connection(self) -> sqlite3.Connection:
-        """DB 연결 획득"""
+        """DB 연결 획득 (FastAPI 스레드풀에서 공유하므로 스레드 검사 비활성화)"""
         if self._conn is None:
-            if not self.db_path.exists():
-                raise FileNotFoundError(f"영양정보 DB 파일이 없습니다: {self.db_path}")
-            self._conn = sqlite3.connect(str(self.db_path))
-            self._conn.row_factory = sqlite3.Row
+            with self._conn_lock:
+                if self._conn is None:
+                    if not self.db_path.exists():
+                        raise FileNotFoundError(f"영양정보 DB 파일이 없습니다: {self.db_path}")
+                    conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+                    conn.row_factory = sqlite3.Row
+                    self._conn = conn
         return self._conn
 
+    @contextmanager
+    def _cursor(self) -> Iterator[sqlite3.Cursor]:
+        """쿼리용 커서 (블록이 끝날 때까지 다른 스레드의 쿼리는 대기)"""
+        conn = self._get_connection()
+        with self._query_lock:
+            yield conn.cursor()
+
     def close(self):
         """DB 연결 종료"""
-        if self._conn:
-            self._conn.close()
-            self._conn = None
+        with self._query_lock:
+            if self._conn:
+                self._conn.close()
+                self._conn = None
 
     @property
     def is_ready(self) -> bool:
         """서비스 준비 상태"""
         return self.db_path.exists()
 
+    @property
+    def data_version(self) -> str:
+        """영양정보 데이터 빌드 버전 (DB 파일 내용 해시, 최초 접근 시 한 번 계산)"""
+        if self._data_version is None:
+            with self._conn_lock:
+                if self._data_version is None:
+                    self._data_version = compute_data_version([self.db_path])
+        return self._data_version
+
     def get_total_count(self) -> int:
         """총 레코드 수 조회"""
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-            cursor.execute("SELECT COUNT(*) FROM nutrition")
-            return cursor.fetchone()[0]
+            with self._cursor() as cursor:
+                cursor.execute("SELECT COUNT(*) FROM nutrition")
+                return cursor.fetchone()[0]
         except Exception as e:
             logger.error(f"총 레코드 수 조회 실패: {e}")
             return 0
 
-    def get_nutrition(self, food_name: str) -> Optional[Dict]:
+    def warm_up(self) -> int:
+        """
+        연결 생성 및 테이블 전체 스캔으로 페이지 캐시 예열
+
+        Returns:
+            총 레코드 수 (DB가 없으면 0)
+        """
+        if not self.is_ready:
+            return 0
+
+        with self._cursor() as cursor:
+            # 인덱스만 읽는 COUNT(*)와 달리 모든 행 페이지를 읽도록 컬럼 값을 집계
+            cursor.execute("SELECT COUNT(*), SUM(calories) FROM nutrition")
+            return cursor.fetchone()[0]
+
+    def get_food_names(self, db_group: Optional[str] = None) -> List[str]:
+        """
+        전체 음식명 조회 (중복 제거)
+
+        Args:
+            db_group: DB 그룹 필터 (예: "음식", None이면 전체)
+
+        Returns:
+            음식명 리스트
+        """
+        try:
+            with self._cursor() as cursor:
+                if db_group:
+                    cursor.execute(
+                        "SELECT DISTINCT food_name FROM nutrition WHERE db_group = ?",
+                        (db_group,)
+                    )
+                else:
+                    cursor.execute("SELECT DISTINCT food_name FROM nutrition")
+
+                return [row[0] for row in cursor.fetchall() if row[0]]
+
+        except Exception as e:
+            logger.error(f"음식명 목록 조회 실패: {e}")
+            return []
+
+    def get_nutrition(self, food_name: str, timeout: Optional[float] = None) -> Optional[Dict]:
         """
         음식명으로 영양정보 조회 (정확한 매칭)
 
         Args:
             food_name: 음식 이름
+            timeout: 배치 결과 최대 대기 시간 (초, 기본: MICRO_BATCH_TIMEOUT_MS),
+                     초과하면 배치를 기다리지 않고 직접 조회
 
         Returns:
             영양정보 딕셔너리 또는 None
         """
+        if is_batching_enabled():
+            try:
+                return self._batcher.submit(food_name, timeout if timeout is not None else self._batch_timeout)
+            except FutureTimeoutError:
+                logger.warning(f"영양정보 배치 조회 대기 시간 초과, 직접 조회: {food_name}")
+
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-
-            cursor.execute("""
-                SELECT * FROM nutrition
-                WHERE food_name = ?
-                LIMIT 1
-            """, (food_name,))
-
-            row = cursor.fetchone()
-            if row:
-                return self._row_to_dict(row)
-            return None
+            with self._cursor() as cursor:
+                with span("sqlite.query", operation="get_nutrition"):
+                    cursor.execute("""
+                        SELECT * FROM nutrition
+                        WHERE food_name = ?
+                        LIMIT 1
+                    """, (food_name,))
+                    row = cursor.fetchone()
+
+                if row:
+                    return self._row_to_dict(row)
+                return None
 
         except Exception as e:
             logger.error(f"영양정보 조회 실패: {e}")
             return None
 
+    def get_nutrition_many(self, food_names: List[str]) -> Dict[str, Dict]:
+        """
+        여러 음식명의 영양정보를 IN 쿼리 하나로 조회 (정확한 매칭)
+
+        Args:
+            food_names: 음식 이름 리스트
+
+        Returns:
+            {음식명: 영양정보} (없는 음식은 제외, 중복 음식명은 첫 행 사용)
+        """
+        names = list(dict.fromkeys(food_names))
+        if not names:
+            return {}
+
+        try:
+            with self._cursor() as cursor:
+                with span("sqlite.query", operation="get_nutrition_many", batch_size=len(names)):
+                    placeholders = ",".join("?" * len(names))
+                    cursor.execute(
+                        f"SELECT * FROM nutrition WHERE food_name IN ({placeholders}) ORDER BY rowid",
+                        names
+                    )
+                    rows = cursor.fetchall()
+
+                results: Dict[str, Dict] = {}
+                for row in rows:
+                    if row["food_name"] not in results:
+                        results[row["food_name"]] = self._row_to_dict(row)
+                return results
+
+        except Exception as e:
+            logger.error(f"영양정보 일괄 조회 실패: {e}")
+            return {}
+
     def search_similar(
         self,
         food_name: str,
@@ -101,23 +224,23 @@ class NutritionDBService:
             영양정보 리스트
         """
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-
-            cursor.execute("""
-                SELECT * FROM nutrition
-                WHERE food_name LIKE ?
-                ORDER BY
-                    CASE
-                        WHEN food_name = ? THEN 0
-                        WHEN food_name LIKE ? THEN 1
-                        ELSE 2
-                    END,
-                    food_name
-                LIMIT ?
-            """, (f"%{food_name}%", food_name, f"{food_name}%", limit))
-
-            return [self._row_to_dict(row) for row in cursor.fetchall()]
+            with self._cursor() as cursor:
+                with span("sqlite.query", operation="search_similar"):
+                    cursor.execute("""
+                        SELECT * FROM nutrition
+                        WHERE food_name LIKE ?
+                        ORDER BY
+                            CASE
+                                WHEN food_name = ? THEN 0
+                                WHEN food_name LIKE ? THEN 1
+                                ELSE 2
+                            END,
+                            food_name
+                        LIMIT ?
+                    """, (f"%{food_name}%", food_name, f"{food_name}%", limit))
+                    rows = cursor.fetchall()
+
+                return [self._row_to_dict(row) for row in rows]
 
         except Exception as e:
             logger.error(f"유사 음식 검색 실패: {e}")
@@ -139,16 +262,14 @@ class NutritionDBService:
             영양정보 리스트
         """
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-
-            cursor.execute("""
-                SELECT * FROM nutrition
-                WHERE category1 LIKE ? OR category2 LIKE ?
-                LIMIT ?
-            """, (f"%{category}%", f"%{category}%", limit))
+            with self._cursor() as cursor:
+                cursor.execute("""
+                    SELECT * FROM nutrition
+                    WHERE category1 LIKE ? OR category2 LIKE ?
+                    LIMIT ?
+                """, (f"%{category}%", f"%{category}%", limit))
 
-            return [self._row_to_dict(row) for row in cursor.fetchall()]
+                return [self._row_to_dict(row) for row in cursor.fetchall()]
 
         except Exception as e:
             logger.error(f"카테고리 검색 실패: {e}")
@@ -172,17 +293,15 @@ class NutritionDBService:
             영양정보 리스트
         """
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
+            with self._cursor() as cursor:
+                cursor.execute("""
+                    SELECT * FROM nutrition
+                    WHERE calories BETWEEN ? AND ?
+                    ORDER BY calories
+                    LIMIT ?
+                """, (min_cal, max_cal, limit))
 
-            cursor.execute("""
-                SELECT * FROM nutrition
-                WHERE calories BETWEEN ? AND ?
-                ORDER BY calories
-                LIMIT ?
-            """, (min_cal, max_cal, limit))
-
-            return [self._row_to_dict(row) for row in cursor.fetchall()]
+                return [self._row_to_dict(row) for row in cursor.fetchall()]
 
         except Exception as e:
             logger.error(f"칼로리 범위 검색 실패: {e}")
@@ -203,17 +322,15 @@ class NutritionDBService:
     ) -> List[Dict]:
         """고단백 음식 조회"""
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-
-            cursor.execute("""
-                SELECT * FROM nutrition
-                WHERE protein >= ?
-                ORDER BY protein DESC
-                LIMIT ?
-            """, (min_protein, limit))
+            with self._cursor() as cursor:
+                cursor.execute("""
+                    SELECT * FROM nutrition
+                    WHERE protein >= ?
+                    ORDER BY protein DESC
+                    LIMIT ?
+                """, (min_protein, limit))
 
-            return [self._row_to_dict(row) for row in cursor.fetchall()]
+                return [self._row_to_dict(row) for row in cursor.fetchall()]
 
         except Exception as e:
             logger.error(f"고단백 음식 조회 실패: {e}")
@@ -222,49 +339,47 @@ class NutritionDBService:
     def get_statistics(self) -> Dict:
         """영양정보 통계 조회"""
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-
-            stats = {}
-
-            # 총 레코드 수
-            cursor.execute("SELECT COUNT(*) FROM nutrition")
-            stats["total_count"] = cursor.fetchone()[0]
-
-            # DB 그룹별 분포
-            cursor.execute("""
-                SELECT db_group, COUNT(*) as cnt
-                FROM nutrition
-                GROUP BY db_group
-                ORDER BY cnt DESC
-            """)
-            stats["db_groups"] = {row[0]: row[1] for row in cursor.fetchall()}
-
-            # 카테고리별 분포 (상위 10개)
-            cursor.execute("""
-                SELECT category1, COUNT(*) as cnt
-                FROM nutrition
-                WHERE category1 IS NOT NULL AND category1 != ''
-                GROUP BY category1
-                ORDER BY cnt DESC
-                LIMIT 10
-            """)
-            stats["top_categories"] = {row[0]: row[1] for row in cursor.fetchall()}
-
-            # 칼로리 통계
-            cursor.execute("""
-                SELECT AVG(calories), MIN(calories), MAX(calories)
-                FROM nutrition
-                WHERE calories > 0
-            """)
-            row = cursor.fetchone()
-            stats["calories"] = {
-                "avg": round(row[0], 1) if row[0] else 0,
-                "min": round(row[1], 1) if row[1] else 0,
-                "max": round(row[2], 1) if row[2] else 0
-            }
-
-            return stats
+            with self._cursor() as cursor:
+                stats = {}
+
+                # 총 레코드 수
+                cursor.execute("SELECT COUNT(*) FROM nutrition")
+                stats["total_count"] = cursor.fetchone()[0]
+
+                # DB 그룹별 분포
+                cursor.execute("""
+                    SELECT db_group, COUNT(*) as cnt
+                    FROM nutrition
+                    GROUP BY db_group
+                    ORDER BY cnt DESC
+                """)
+                stats["db_groups"] = {row[0]: row[1] for row in cursor.fetchall()}
+
+                # 카테고리별 분포 (상위 10개)
+                cursor.execute("""
+                    SELECT category1, COUNT(*) as cnt
+                    FROM nutrition
+                    WHERE category1 IS NOT NULL AND category1 != ''
+                    GROUP BY category1
+                    ORDER BY cnt DESC
+                    LIMIT 10
+                """)
+                stats["top_categories"] = {row[0]: row[1] for row in cursor.fetchall()}
+
+                # 칼로리 통계
+                cursor.execute("""
+                    SELECT AVG(calories), MIN(calories), MAX(calories)
+                    FROM nutrition
+                    WHERE calories > 0
+                """)
+                row = cursor.fetchone()
+                stats["calories"] = {
+                    "avg": round(row[0], 1) if row[0] else 0,
+                    "min": round(row[1], 1) if row[1] else 0,
+                    "max": round(row[2], 1) if row[2] else 0
+                }
+
+                return stats
 
         except Exception as e:
             logger.error(f"통계 조회 실패: {e}")
@@ -0,0 +1,129 @@
+"""OpenAI 클라이언트 팩토리 - 커넥션 풀을 공유하는 동기/비동기 클라이언트
+
+모든 클라이언트는 헤지/재시도/서킷 브레이커 전송 계층(upstream_transport)을 거친다.
+재시도는 전송 계층에서만 하므로 SDK 자체 재시도는 끈다(max_retries=0).
+"""
+
+import asyncio
+import logging
+import threading
+import weakref
+from typing import Any, Dict, Optional
+
+import httpx
+from openai import AsyncOpenAI, OpenAI
+
+from app.config import get_settings
+from app.core.services.upstream_transport import create_async_transport, create_sync_transport
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+_sync_clients: Dict[str, OpenAI] = {}
+# httpx.AsyncClient의 커넥션 풀은 생성된 이벤트 루프에 묶이므로 루프별로 보관
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, AsyncOpenAI]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _limits() -> httpx.Limits:
+    settings = get_settings()
+    return httpx.Limits(
+        max_connections=settings.openai_max_connections,
+        max_keepalive_connections=settings.openai_max_connections,
+        keepalive_expiry=settings.openai_keepalive_seconds
+    )
+
+
+def _timeout() -> httpx.Timeout:
+    return httpx.Timeout(get_settings().openai_timeout_seconds, connect=10.0)
+
+
+def _base_url() -> Optional[str]:
+    """OPENAI_BASE_URL (비우면 SDK 기본값)"""
+    return get_settings().openai_base_url or None
+
+
+def _create_sync_client(api_key: str) -> OpenAI:
+    """풀링된 httpx.Client를 사용하는 동기 클라이언트 생성"""
+    transport = create_sync_transport(httpx.HTTPTransport(limits=_limits()))
+    http_client = httpx.Client(transport=transport, timeout=_timeout())
+    return OpenAI(api_key=api_key, base_url=_base_url(), http_client=http_client, max_retries=0)
+
+
+def _create_async_client(api_key: str) -> AsyncOpenAI:
+    """풀링된 httpx.AsyncClient를 사용하는 비동기 클라이언트 생성"""
+    transport = create_async_transport(httpx.AsyncHTTPTransport(limits=_limits()))
+    http_client = httpx.AsyncClient(transport=transport, timeout=_timeout())
+    return AsyncOpenAI(api_key=api_key, base_url=_base_url(), http_client=http_client, max_retries=0)
+
+
+def get_openai_client(api_key: Optional[str] = None) -> OpenAI:
+    """
+    동기 OpenAI 클라이언트 반환 (API 키별 싱글톤)
+
+    Streamlit/스레드풀 동기 경로에서 사용하며, 모든 Agent/서비스가
+    같은 커넥션 풀을 공유한다.
+
+    Args:
+        api_key: OpenAI API 키 (기본: 설정값)
+
+    Returns:
+        OpenAI 클라이언트
+    """
+    api_key = api_key or get_settings().openai_api_key
+    with _lock:
+        client = _sync_clients.get(api_key)
+        if client is None:
+            client = _create_sync_client(api_key)
+            _sync_clients[api_key] = client
+        return client
+
+
+def get_async_openai_client(api_key: Optional[str] = None) -> AsyncOpenAI:
+    """
+    비동기 OpenAI 클라이언트 반환 (이벤트 루프/API 키별 싱글톤)
+
+    반드시 실행 중인 이벤트 루프 안에서 호출해야 한다.
+
+    Args:
+        api_key: OpenAI API 키 (기본: 설정값)
+
+    Returns:
+        AsyncOpenAI 클라이언트
+    """
+    api_key = api_key or get_settings().openai_api_key
+    loop = asyncio.get_running_loop()
+    with _lock:
+        clients = _async_clients.setdefault(loop, {})
+        client = clients.get(api_key)
+        if client is None:
+            client = _create_async_client(api_key)
+            clients[api_key] = client
+            logger.info("AsyncOpenAI 클라이언트 생성 (커넥션 풀 공유)")
+        return client
+
+
+def with_timeout(request: Dict[str, Any], timeout: Optional[float]) -> Dict[str, Any]:
+    """
+    요청 파라미터에 요청별 타임아웃 추가
+
+    OpenAI SDK는 timeout=None을 "타임아웃 없음"으로 해석하므로
+    값이 있을 때만 추가하고, 없으면 클라이언트 기본 타임아웃을 사용한다.
+    """
+    if timeout is not None:
+        request["timeout"] = timeout
+    return request
+
+
+async def aclose_openai_clients():
+    """현재 이벤트 루프의 비동기 클라이언트 종료 (애플리케이션 종료 시)"""
+    loop = asyncio.get_running_loop()
+    with _lock:
+        clients = _async_clients.pop(loop, {})
+
+    for client in clients.values():
+        try:
+            await client.close()
+        except Exception as e:
+            logger.warning(f"AsyncOpenAI 클라이언트 종료 실패: {e}")
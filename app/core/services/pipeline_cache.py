@@ -0,0 +1,225 @@
+"""파이프라인 응답 캐시 - 메모리(LRU + TTL) → SQLite 2단 캐시"""
+
+import asyncio
+import copy
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from app.config import get_settings
+from app.core.services.query_cache import QueryCache, track_cache_metrics
+
+logger = logging.getLogger(__name__)
+
+# 프로젝트 루트
+PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
+
+
+class SQLiteCache:
+    """SQLite 기반 영구 캐시 (TTL + 최대 항목 수)
+
+    값은 JSON으로 저장하며, 최대 항목 수를 넘으면 가장 오래 조회되지 않은 항목부터 제거한다.
+    FastAPI 스레드풀/이벤트 루프에서 함께 사용하므로 연결 하나를 Lock으로 보호한다.
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        max_entries: int = 10000,
+        ttl_seconds: float = 86400,
+        name: str = "sqlite_cache"
+    ):
+        """
+        Args:
+            db_path: SQLite DB 파일 경로
+            max_entries: 최대 항목 수
+            ttl_seconds: 항목 유효 시간 (초)
+            name: 로그/통계 구분용 이름
+        """
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.name = name
+
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "sets": 0, "evictions": 0, "expirations": 0}
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS cache (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                expires_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_cache_accessed_at ON cache(accessed_at)")
+        self._conn.commit()
+        self._size = self._conn.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+        track_cache_metrics(self)
+        logger.info(f"[{self.name}] SQLite 캐시 로드: {self._size}개 ({self.db_path})")
+
+    def get(self, key: str) -> Optional[Tuple[Any, float]]:
+        """캐시 조회 → (값, 만료 시각), 없거나 만료되면 None"""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self._stats["misses"] += 1
+                return None
+
+            value, expires_at = row
+            if expires_at <= now:
+                self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+                self._conn.commit()
+                self._size -= 1
+                self._stats["expirations"] += 1
+                self._stats["misses"] += 1
+                return None
+
+            self._conn.execute("UPDATE cache SET accessed_at = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            self._stats["hits"] += 1
+
+        return json.loads(value), expires_at
+
+    def set(self, key: str, value: Any):
+        """캐시 저장 (최대 항목 수 초과 시 오래 조회되지 않은 항목 제거)"""
+        now = time.time()
+        payload = json.dumps(value, ensure_ascii=False)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, expires_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, payload, now + self.ttl_seconds, now)
+            )
+            self._size = self._conn.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+            self._stats["sets"] += 1
+
+            overflow = self._size - self.max_entries
+            if overflow > 0:
+                self._conn.execute("""
+                    DELETE FROM cache WHERE key IN (
+                        SELECT key FROM cache ORDER BY accessed_at LIMIT ?
+                    )
+                """, (overflow,))
+                self._size -= overflow
+                self._stats["evictions"] += overflow
+            self._conn.commit()
+
+    def clear(self):
+        """전체 삭제"""
+        with self._lock:
+            self._conn.execute("DELETE FROM cache")
+            self._conn.commit()
+            self._size = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 통계"""
+        with self._lock:
+            return {**self._stats, "size": self._size, "max_size": self.max_entries}
+
+
+class TieredCache:
+    """메모리 → SQLite 2단 캐시
+
+    조회는 메모리 먼저, 없으면 SQLite에서 찾아 남은 TTL로 메모리에 올린다.
+    저장은 두 단계에 모두 기록한다. 반환값은 사본이므로 호출자가 수정해도 캐시에 영향이 없다.
+    """
+
+    def __init__(self, memory: QueryCache, disk: Optional[SQLiteCache] = None):
+        self.memory = memory
+        self.disk = disk
+
+    def get(self, key: str) -> Optional[Any]:
+        """캐시 조회"""
+        value = self.memory.get(key)
+        if value is None and self.disk is not None:
+            value = self._get_from_disk(key)
+        return copy.deepcopy(value) if value is not None else None
+
+    async def aget(self, key: str) -> Optional[Any]:
+        """get()의 비동기 버전 (SQLite 조회는 스레드에서 실행)"""
+        value = self.memory.get(key)
+        if value is None and self.disk is not None:
+            value = await asyncio.to_thread(self._get_from_disk, key)
+        return copy.deepcopy(value) if value is not None else None
+
+    def _get_from_disk(self, key: str) -> Optional[Any]:
+        entry = self.disk.get(key)
+        if entry is None:
+            return None
+
+        value, expires_at = entry
+        self.memory.set(key, value, ttl_seconds=expires_at - time.time())
+        return value
+
+    def set(self, key: str, value: Any):
+        """캐시 저장"""
+        value = copy.deepcopy(value)
+        self.memory.set(key, value)
+        if self.disk is not None:
+            try:
+                self.disk.set(key, value)
+            except Exception as e:
+                logger.warning(f"SQLite 캐시 저장 실패: {e}")
+
+    async def aset(self, key: str, value: Any):
+        """set()의 비동기 버전 (SQLite 저장은 스레드에서 실행)"""
+        value = copy.deepcopy(value)
+        self.memory.set(key, value)
+        if self.disk is not None:
+            try:
+                await asyncio.to_thread(self.disk.set, key, value)
+            except Exception as e:
+                logger.warning(f"SQLite 캐시 저장 실패: {e}")
+
+    def clear(self):
+        """전체 삭제"""
+        self.memory.clear()
+        if self.disk is not None:
+            self.disk.clear()
+
+
+# 싱글톤 인스턴스
+_pipeline_cache: Optional[TieredCache] = None
+_pipeline_cache_lock = threading.Lock()
+
+
+def get_pipeline_cache() -> Optional[TieredCache]:
+    """파이프라인 응답 캐시 싱글톤 인스턴스 반환 (PIPELINE_CACHE_ENABLED=false면 None)"""
+    global _pipeline_cache
+    settings = get_settings()
+    if not settings.pipeline_cache_enabled:
+        return None
+
+    with _pipeline_cache_lock:
+        if _pipeline_cache is None:
+            memory = QueryCache(
+                max_size=settings.pipeline_cache_size,
+                ttl_seconds=settings.pipeline_cache_ttl_seconds,
+                name="pipeline_memory"
+            )
+            disk = None
+            if settings.pipeline_cache_db_path:
+                db_path = Path(settings.pipeline_cache_db_path)
+                if not db_path.is_absolute():
+                    db_path = PROJECT_ROOT / db_path
+                try:
+                    disk = SQLiteCache(
+                        db_path,
+                        max_entries=settings.pipeline_cache_db_max_entries,
+                        ttl_seconds=settings.pipeline_cache_ttl_seconds,
+                        name="pipeline_sqlite"
+                    )
+                except Exception as e:
+                    logger.warning(f"SQLite 캐시 초기화 실패, 메모리 캐시만 사용: {e}")
+            _pipeline_cache = TieredCache(memory, disk)
+    return _pipeline_cache
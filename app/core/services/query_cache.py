@@ -0,0 +1,276 @@
+"""쿼리 분석 결과 캐시 - 정규화된 쿼리 기준 LRU + TTL"""
+
+import atexit
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from app.config import get_settings
+from app.core.services.metrics import get_metrics_registry
+
+logger = logging.getLogger(__name__)
+
+# 프로젝트 루트
+PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
+
+# 쿼리 끝에 붙는 요청/존댓말 표현 (정규화 시 제거)
+POLITE_ENDINGS = [
+    "알려주시겠어요", "알려주실래요", "알려주세요", "알려줄래", "알려줘",
+    "가르쳐주세요", "가르쳐줘", "부탁드립니다", "부탁해요", "부탁해",
+    "해주세요", "해줘", "주세요", "줘요", "줘", "좀",
+]
+
+_PUNCTUATION_PATTERN = re.compile(r"[^\w\s]", re.UNICODE)
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+_ENDING_PATTERN = re.compile(
+    r"(?:\s*(?:" + "|".join(sorted(POLITE_ENDINGS, key=len, reverse=True)) + r"))+$"
+)
+
+# /metrics 수집 대상 캐시 인스턴스 (get_stats()에 hits/misses/evictions/expirations/size 제공)
+_caches: "weakref.WeakSet" = weakref.WeakSet()
+
+
+def track_cache_metrics(cache):
+    """캐시 인스턴스를 /metrics 수집 대상으로 등록"""
+    _caches.add(cache)
+
+
+def normalize_query(query: str) -> str:
+    """
+    캐시 키용 쿼리 정규화
+
+    구두점 제거, 공백 정리, 끝에 붙는 요청/존댓말 표현 제거
+    예: "김치찌개 레시피 알려줘!" → "김치찌개 레시피"
+
+    Args:
+        query: 원본 쿼리
+
+    Returns:
+        정규화된 쿼리
+    """
+    text = _PUNCTUATION_PATTERN.sub(" ", (query or "").lower())
+    text = _WHITESPACE_PATTERN.sub(" ", text).strip()
+    text = _ENDING_PATTERN.sub("", text).strip()
+    return text
+
+
+class QueryCache:
+    """LRU + TTL 캐시 (스레드 안전, 선택적 디스크 저장)
+
+    FastAPI 스레드풀에서 동시에 접근하므로 모든 연산은 단일 Lock으로 보호한다.
+    디스크 저장은 요청 경로(이벤트 루프 포함)를 막지 않도록 백그라운드 스레드에서 실행한다.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1000,
+        ttl_seconds: float = 86400,
+        persist_path: Optional[Path] = None,
+        persist_every: int = 20,
+        name: str = "query_cache"
+    ):
+        """
+        Args:
+            max_size: 최대 항목 수 (초과 시 가장 오래 사용되지 않은 항목 제거)
+            ttl_seconds: 항목 유효 시간 (초)
+            persist_path: 디스크 저장 경로 (None이면 메모리 전용)
+            persist_every: N회 저장마다 디스크에 기록 (백그라운드 스레드)
+            name: 로그/통계 구분용 이름
+        """
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.persist_path = persist_path
+        self.persist_every = persist_every
+        self.name = name
+
+        self._lock = threading.Lock()
+        self._data: "OrderedDict[str, tuple]" = OrderedDict()  # key → (expires_at, value)
+        self._dirty = 0
+        self._flushing = False  # 백그라운드 저장 진행 중 (동시에 하나만)
+        self._flush_lock = threading.Lock()  # 파일 쓰기 직렬화 (백그라운드 저장 / 종료 시 저장)
+        self._stats = {"hits": 0, "misses": 0, "sets": 0, "evictions": 0, "expirations": 0}
+        track_cache_metrics(self)
+
+        if self.persist_path:
+            self._load()
+            atexit.register(self.flush)
+
+    def get(self, key: str) -> Optional[Any]:
+        """캐시 조회 (만료 항목은 제거 후 miss 처리)"""
+        now = time.time()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self._stats["misses"] += 1
+                return None
+
+            expires_at, value = entry
+            if expires_at <= now:
+                del self._data[key]
+                self._stats["expirations"] += 1
+                self._stats["misses"] += 1
+                return None
+
+            self._data.move_to_end(key)
+            self._stats["hits"] += 1
+            return value
+
+    def set(self, key: str, value: Any, ttl_seconds: Optional[float] = None):
+        """캐시 저장 (ttl_seconds: 항목별 유효 시간, 기본: 캐시 TTL)"""
+        ttl_seconds = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        with self._lock:
+            self._data[key] = (time.time() + ttl_seconds, value)
+            self._data.move_to_end(key)
+            self._stats["sets"] += 1
+
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+                self._stats["evictions"] += 1
+
+            self._dirty += 1
+            should_flush = (
+                self.persist_path is not None and self._dirty >= self.persist_every and not self._flushing
+            )
+            if should_flush:
+                self._flushing = True
+
+        if should_flush:
+            threading.Thread(target=self._flush_in_background, name=f"{self.name}-flush", daemon=True).start()
+
+    def clear(self):
+        """전체 항목 삭제"""
+        with self._lock:
+            self._data.clear()
+            self._dirty += 1
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 통계"""
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["misses"]
+            return {
+                **self._stats,
+                "size": len(self._data),
+                "max_size": self.max_size,
+                "hit_rate": round(self._stats["hits"] / lookups, 4) if lookups else 0.0
+            }
+
+    def flush(self):
+        """디스크에 저장 (만료되지 않은 항목만, 호출 스레드에서 실행)"""
+        if not self.persist_path:
+            return
+
+        with self._flush_lock:
+            now = time.time()
+            with self._lock:
+                if not self._dirty:
+                    return
+                entries = [
+                    [key, expires_at, value]
+                    for key, (expires_at, value) in self._data.items()
+                    if expires_at > now
+                ]
+                self._dirty = 0
+
+            tmp_name = None
+            try:
+                self.persist_path.parent.mkdir(parents=True, exist_ok=True)
+                # 저장마다 고유한 임시 파일에 쓴 뒤 교체 (다른 프로세스의 저장과 섞이지 않도록)
+                with tempfile.NamedTemporaryFile(
+                    "w", encoding="utf-8", dir=self.persist_path.parent,
+                    prefix=self.persist_path.name + ".", suffix=".tmp", delete=False
+                ) as f:
+                    tmp_name = f.name
+                    json.dump(entries, f, ensure_ascii=False)
+                os.replace(tmp_name, self.persist_path)
+            except Exception as e:
+                logger.error(f"[{self.name}] 캐시 저장 실패: {e}")
+                if tmp_name is not None and os.path.exists(tmp_name):
+                    os.unlink(tmp_name)
+
+    def _flush_in_background(self):
+        """set()이 persist_every회마다 시작하는 백그라운드 저장"""
+        try:
+            self.flush()
+        finally:
+            with self._lock:
+                self._flushing = False
+
+    def _load(self):
+        """디스크에서 로드"""
+        if not self.persist_path.exists():
+            return
+
+        try:
+            with open(self.persist_path, "r", encoding="utf-8") as f:
+                entries = json.load(f)
+        except Exception as e:
+            logger.warning(f"[{self.name}] 캐시 로드 실패: {e}")
+            return
+
+        now = time.time()
+        for key, expires_at, value in entries[-self.max_size:]:
+            if expires_at > now:
+                self._data[key] = (expires_at, value)
+        logger.info(f"[{self.name}] 캐시 로드 완료: {len(self._data)}개")
+
+
+def _collect_metrics():
+    """캐시별 hit/miss/eviction 카운터와 항목 수 (/metrics 스크레이프 시 호출)"""
+    stats = [(cache.name, cache.get_stats()) for cache in list(_caches)]
+    yield (
+        "cache_requests_total", "counter", "캐시 조회 수",
+        [
+            ({"cache": name, "result": result}, values[key])
+            for name, values in stats
+            for result, key in (("hit", "hits"), ("miss", "misses"))
+        ]
+    )
+    yield (
+        "cache_evictions_total", "counter", "캐시 항목 제거 수 (LRU 초과/TTL 만료)",
+        [
+            ({"cache": name, "reason": reason}, values[key])
+            for name, values in stats
+            for reason, key in (("size", "evictions"), ("expired", "expirations"))
+        ]
+    )
+    yield (
+        "cache_entries", "gauge", "캐시 항목 수",
+        [({"cache": name}, values["size"]) for name, values in stats]
+    )
+
+
+get_metrics_registry().register_collector(_collect_metrics)
+
+
+# 싱글톤 인스턴스
+_query_cache: Optional[QueryCache] = None
+
+
+def get_query_cache() -> QueryCache:
+    """QueryAnalyzer 결과 캐시 싱글톤 인스턴스 반환"""
+    global _query_cache
+    if _query_cache is None:
+        settings = get_settings()
+        persist_path = None
+        if settings.query_cache_path:
+            persist_path = Path(settings.query_cache_path)
+            if not persist_path.is_absolute():
+                persist_path = PROJECT_ROOT / persist_path
+        _query_cache = QueryCache(
+            max_size=settings.query_cache_size,
+            ttl_seconds=settings.query_cache_ttl_seconds,
+            persist_path=persist_path
+        )
+    return _query_cache
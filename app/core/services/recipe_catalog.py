@@ -0,0 +1,180 @@
+"""레시피 카탈로그 - GET 리소스용 레시피 상세/목록/유사 레시피 조회"""
+
+import json
+import logging
+import threading
+from bisect import bisect_right
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from app.core.services.data_version import compute_data_version
+from app.core.services.vector_db_service import VECTOR_DB_DIR, get_vector_db_service
+
+logger = logging.getLogger(__name__)
+
+# 프로젝트 루트
+PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
+RECIPES_PATH = PROJECT_ROOT / "data" / "processed" / "recipes.json"
+
+SUMMARY_FIELDS = ("recipe_id", "name", "category", "cooking_method", "image_url")
+
+
+def to_summary(recipe: Dict) -> Dict:
+    """레시피 목록 항목 (상세 재료/조리 순서 제외)"""
+    return {field: recipe.get(field, "") for field in SUMMARY_FIELDS}
+
+
+class RecipeCatalog:
+    """
+    레시피 카탈로그
+
+    recipes.json을 한 번 로드해 recipe_id/카테고리로 조회한다 (데이터 빌드 사이에는 변하지 않음).
+    목록은 파일 순서를 따르며, 커서는 마지막 항목의 recipe_id라 데이터가 다시 빌드되어도
+    페이지가 중복/누락되지 않는다.
+    """
+
+    def __init__(self, recipes_path: Optional[Path] = None):
+        """
+        Args:
+            recipes_path: 레시피 JSON 파일 경로
+        """
+        self.recipes_path = recipes_path or RECIPES_PATH
+
+        self.recipes: List[Dict] = []
+        self._positions: Dict[str, int] = {}
+        self._category_positions: Dict[str, List[int]] = {}
+        self._vector_positions: Optional[Dict[str, int]] = None
+        self._data_version: Optional[str] = None
+        self._version_lock = threading.Lock()
+
+        self._load()
+
+    def _load(self):
+        """레시피 파일 로드 및 recipe_id/카테고리 인덱스 구성"""
+        if not self.recipes_path.exists():
+            logger.warning(f"레시피 파일 없음: {self.recipes_path}")
+            return
+
+        with open(self.recipes_path, "r", encoding="utf-8") as f:
+            self.recipes = json.load(f)
+
+        for position, recipe in enumerate(self.recipes):
+            recipe_id = recipe.get("recipe_id", "")
+            if recipe_id and recipe_id not in self._positions:
+                self._positions[recipe_id] = position
+            self._category_positions.setdefault(recipe.get("category", ""), []).append(position)
+
+        logger.info(f"레시피 카탈로그 로드 완료: {len(self.recipes)}개 레시피")
+
+    @property
+    def total_recipes(self) -> int:
+        """총 레시피 수"""
+        return len(self.recipes)
+
+    @property
+    def data_version(self) -> str:
+        """레시피 데이터 빌드 버전 (레시피 파일 + 벡터 DB 내용 해시, 최초 접근 시 한 번 계산)"""
+        if self._data_version is None:
+            with self._version_lock:
+                if self._data_version is None:
+                    self._data_version = compute_data_version([
+                        self.recipes_path,
+                        VECTOR_DB_DIR / "metadata.json",
+                        VECTOR_DB_DIR / "faiss.index",
+                    ])
+        return self._data_version
+
+    def get(self, recipe_id: str) -> Optional[Dict]:
+        """
+        recipe_id로 레시피 조회
+
+        Returns:
+            레시피 정보 또는 None
+        """
+        position = self._positions.get(recipe_id)
+        if position is None:
+            return None
+        return self.recipes[position].copy()
+
+    def list_recipes(
+        self,
+        category: Optional[str] = None,
+        cursor: Optional[str] = None,
+        limit: int = 20
+    ) -> Tuple[List[Dict], Optional[str]]:
+        """
+        레시피 목록 조회 (커서 페이지네이션)
+
+        Args:
+            category: 카테고리 (정확한 매칭, None이면 전체)
+            cursor: 이전 페이지 마지막 레시피의 recipe_id (None이면 첫 페이지)
+            limit: 페이지 크기
+
+        Returns:
+            (레시피 요약 리스트, 다음 페이지 커서 또는 None)
+
+        Raises:
+            ValueError: 커서가 존재하지 않는 recipe_id인 경우
+        """
+        positions: Sequence[int] = (
+            self._category_positions.get(category, []) if category else range(len(self.recipes))
+        )
+
+        start = 0
+        if cursor:
+            cursor_position = self._positions.get(cursor)
+            if cursor_position is None:
+                raise ValueError(f"잘못된 커서: {cursor}")
+            start = bisect_right(positions, cursor_position)
+
+        page = positions[start:start + limit]
+        items = [to_summary(self.recipes[position]) for position in page]
+        next_cursor = items[-1]["recipe_id"] if items and start + limit < len(positions) else None
+        return items, next_cursor
+
+    def similar(self, recipe_id: str, top_k: int = 5) -> Optional[List[Dict]]:
+        """
+        벡터 DB에 저장된 레시피 벡터로 유사 레시피 조회 (쿼리 임베딩 호출 없음)
+
+        Args:
+            recipe_id: 기준 레시피 ID
+            top_k: 반환할 결과 수
+
+        Returns:
+            유사도를 포함한 레시피 요약 리스트 (벡터 DB가 준비되지 않았으면 None)
+        """
+        vector_db = get_vector_db_service()
+        if not vector_db.is_ready:
+            return None
+
+        if self._vector_positions is None:
+            self._vector_positions = {
+                recipe.get("id", ""): position for position, recipe in enumerate(vector_db.recipes)
+            }
+
+        vector_position = self._vector_positions.get(recipe_id)
+        if vector_position is None:
+            return []
+
+        results = []
+        for match in vector_db.get_similar_recipes(vector_position, top_k):
+            recipe = self.get(match.get("id", "")) or {
+                "recipe_id": match.get("id", ""),
+                "name": match.get("name", ""),
+                "category": match.get("category", ""),
+                "cooking_method": match.get("cooking_method", ""),
+            }
+            results.append({**to_summary(recipe), "similarity": match["similarity"]})
+        return results
+
+
+# 싱글톤 인스턴스
+_recipe_catalog: Optional[RecipeCatalog] = None
+
+
+def get_recipe_catalog() -> RecipeCatalog:
+    """RecipeCatalog 싱글톤 인스턴스 반환"""
+    global _recipe_catalog
+    if _recipe_catalog is None:
+        _recipe_catalog = RecipeCatalog()
+    return _recipe_catalog
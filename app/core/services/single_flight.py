@@ -0,0 +1,172 @@
+"""Single-flight 서비스 - 동일 키의 동시 호출을 하나의 upstream 호출로 병합"""
+
+import asyncio
+import logging
+import threading
+import weakref
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+from app.core.services.metrics import get_metrics_registry
+
+logger = logging.getLogger(__name__)
+
+# /metrics 수집 대상 인스턴스
+_flights: "weakref.WeakSet[SingleFlight]" = weakref.WeakSet()
+
+
+class SingleFlight:
+    """동일 키 요청 병합 (request coalescing)
+
+    같은 키로 동시에 들어온 호출 중 첫 번째(leader)만 실제 함수를 실행하고,
+    나머지(follower)는 진행 중인 Future를 기다려 같은 결과를 공유한다.
+
+    in-flight 테이블은 concurrent.futures.Future를 사용하므로
+    스레드풀 동기 경로(run_workflow_sync)와 이벤트 루프 비동기 경로(run_workflow)가
+    같은 키를 공유할 수 있다.
+    """
+
+    def __init__(self, name: str = "default"):
+        """
+        Args:
+            name: 로그/통계 구분용 이름
+        """
+        self.name = name
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, Future] = {}
+        self._executions = 0
+        self._shared = 0
+        _flights.add(self)
+
+    def _acquire(self, key: Hashable) -> Tuple[Future, bool]:
+        """키에 대한 Future 획득 (leader 여부 반환)"""
+        with self._lock:
+            future = self._calls.get(key)
+            if future is not None:
+                self._shared += 1
+                return future, False
+
+            future = Future()
+            self._calls[key] = future
+            self._executions += 1
+            return future, True
+
+    def _release(self, key: Hashable, future: Future):
+        """완료된 Future를 in-flight 테이블에서 제거"""
+        with self._lock:
+            if self._calls.get(key) is future:
+                del self._calls[key]
+
+    def do(self, key: Hashable, fn: Callable[[], Any], timeout: Optional[float] = None) -> Any:
+        """
+        동기 호출 병합
+
+        Args:
+            key: 병합 기준 키
+            fn: 실제 실행할 함수 (인자 없음)
+            timeout: follower의 최대 대기 시간 (초, 초과 시 TimeoutError)
+
+        Returns:
+            fn의 결과 (follower는 leader의 결과를 공유)
+        """
+        future, is_leader = self._acquire(key)
+        if not is_leader:
+            logger.debug(f"[{self.name}] 진행 중인 호출 대기: {key}")
+            return future.result(timeout)
+
+        try:
+            result = fn()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            self._release(key, future)
+
+    async def do_async(
+        self,
+        key: Hashable,
+        fn: Callable[[], Awaitable[Any]],
+        timeout: Optional[float] = None
+    ) -> Any:
+        """
+        비동기 호출 병합
+
+        Args:
+            key: 병합 기준 키
+            fn: 실제 실행할 코루틴 함수 (인자 없음)
+            timeout: follower의 최대 대기 시간 (초, 초과 시 TimeoutError)
+
+        Returns:
+            fn의 결과 (follower는 leader의 결과를 공유, leader가 취소되어도 fn은 끝까지 실행)
+        """
+        future, is_leader = self._acquire(key)
+        if not is_leader:
+            logger.debug(f"[{self.name}] 진행 중인 호출 대기: {key}")
+            # shield: follower의 타임아웃이 leader의 공유 Future를 취소하지 않도록
+            shared = asyncio.wrap_future(future)
+            # follower가 먼저 취소/시간 초과되어도 leader 예외가 "never retrieved"로 기록되지 않도록
+            shared.add_done_callback(_consume_exception)
+            return await asyncio.wait_for(asyncio.shield(shared), timeout)
+
+        # 공유 작업은 호출자와 분리된 태스크에서 실행
+        # (SSE 연결 끊김/배치 스트림 정리로 leader가 취소되어도 follower는 결과를 받음)
+        task = asyncio.ensure_future(self._lead_async(key, future, fn))
+        task.add_done_callback(_consume_exception)
+        return await asyncio.shield(task)
+
+    async def _lead_async(self, key: Hashable, future: Future, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """leader의 공유 작업 실행 → 결과를 Future로 공유"""
+        try:
+            result = await fn()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            self._release(key, future)
+
+    @property
+    def in_flight(self) -> int:
+        """현재 진행 중인 키 수"""
+        with self._lock:
+            return len(self._calls)
+
+    def get_stats(self) -> Dict[str, int]:
+        """실행/공유 횟수 통계"""
+        with self._lock:
+            return {
+                "executions": self._executions,
+                "shared": self._shared,
+                "in_flight": len(self._calls)
+            }
+
+
+def _consume_exception(future: asyncio.Future):
+    """완료된 Future/태스크의 예외를 조회 처리 (기다리던 쪽이 이미 떠난 경우)"""
+    if not future.cancelled():
+        future.exception()
+
+
+def _collect_metrics():
+    """single-flight 실행/병합 횟수와 진행 중인 키 수 (/metrics 스크레이프 시 호출)"""
+    stats = [(flight.name, flight.get_stats()) for flight in list(_flights)]
+    yield (
+        "single_flight_calls_total", "counter", "single-flight 호출 수 (leader: 실제 실행, shared: 결과 공유)",
+        [
+            ({"flight": name, "role": role}, values[key])
+            for name, values in stats
+            for role, key in (("leader", "executions"), ("shared", "shared"))
+        ]
+    )
+    yield (
+        "single_flight_in_flight", "gauge", "진행 중인 single-flight 키 수",
+        [({"flight": name}, values["in_flight"]) for name, values in stats]
+    )
+
+
+get_metrics_registry().register_collector(_collect_metrics)
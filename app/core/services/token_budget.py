@@ -0,0 +1,119 @@
+"""토큰 예산 - GPT 프롬프트 토큰 수를 로컬에서 계산하고 예산에 맞춰 줄임
+
+tiktoken이 설치되어 있으면 모델의 인코딩으로 정확히 세고,
+없으면 문자 수 기반 추정치(한글은 글자당 약 1토큰)를 사용한다.
+"""
+
+import logging
+import threading
+from typing import List, Optional
+
+from app.config import get_settings
+
+try:
+    import tiktoken
+except ImportError:  # tiktoken 미설치 시 문자 수로 추정
+    tiktoken = None
+
+logger = logging.getLogger(__name__)
+
+# tiktoken이 모델을 모를 때 사용할 인코딩 (gpt-4o 계열)
+DEFAULT_ENCODING = "o200k_base"
+
+# 줄임 표시
+ELLIPSIS = "…"
+
+
+class TokenCounter:
+    """모델 인코딩 기준 토큰 수 계산"""
+
+    def __init__(self, model: str):
+        """
+        Args:
+            model: 인코딩을 고를 OpenAI 모델명
+        """
+        self.model = model
+        self._encoding = None
+        if tiktoken is None:
+            logger.info("tiktoken 미설치, 토큰 수를 문자 수로 추정")
+            return
+
+        try:
+            self._encoding = tiktoken.encoding_for_model(model)
+        except KeyError:
+            self._encoding = tiktoken.get_encoding(DEFAULT_ENCODING)
+        except Exception as e:
+            # 인코딩 파일 다운로드 실패 등
+            logger.warning(f"tiktoken 인코딩 로드 실패, 문자 수로 추정: {e}")
+
+    @property
+    def is_exact(self) -> bool:
+        return self._encoding is not None
+
+    def count(self, text: str) -> int:
+        """텍스트 토큰 수"""
+        if not text:
+            return 0
+        if self._encoding is not None:
+            return len(self._encoding.encode(text))
+        return _estimate_tokens(text)
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        """
+        텍스트를 max_tokens 이하로 줄임 (넘으면 끝에 "…")
+
+        Args:
+            text: 원문
+            max_tokens: 최대 토큰 수 (줄임 표시 포함)
+        """
+        if max_tokens <= 0:
+            return ""
+        if self.count(text) <= max_tokens:
+            return text
+
+        if self._encoding is not None:
+            tokens = self._encoding.encode(text)[:max(max_tokens - 1, 0)]
+            # 멀티바이트 문자가 토큰 경계에서 잘리면 깨진 문자가 남으므로 제거
+            return self._encoding.decode(tokens).rstrip("�").rstrip() + ELLIPSIS
+
+        # 추정 모드: 토큰 수가 맞을 때까지 문자 단위로 줄임
+        low, high = 0, len(text)
+        while low < high:
+            mid = (low + high + 1) // 2
+            if _estimate_tokens(text[:mid]) < max_tokens:
+                low = mid
+            else:
+                high = mid - 1
+        return text[:low].rstrip() + ELLIPSIS
+
+    def fit_lines(self, lines: List[str], max_tokens: int) -> List[str]:
+        """앞에서부터 예산 안에 들어가는 줄만 남김 (줄바꿈 1토큰 포함)"""
+        kept, used = [], 0
+        for line in lines:
+            cost = self.count(line) + 1
+            if used + cost > max_tokens:
+                break
+            kept.append(line)
+            used += cost
+        return kept
+
+
+def _estimate_tokens(text: str) -> int:
+    """문자 수 기반 토큰 추정 (한글 등 비ASCII 1자 ≈ 1토큰, ASCII 4자 ≈ 1토큰)"""
+    non_ascii = sum(1 for ch in text if ord(ch) > 127)
+    return non_ascii + (len(text) - non_ascii + 3) // 4
+
+
+# 싱글톤 인스턴스
+_token_counter: Optional[TokenCounter] = None
+_init_lock = threading.Lock()
+
+
+def get_token_counter() -> TokenCounter:
+    """TokenCounter 싱글톤 인스턴스 반환 (OPENAI_MODEL 인코딩)"""
+    global _token_counter
+    if _token_counter is None:
+        with _init_lock:
+            if _token_counter is None:
+                _token_counter = TokenCounter(get_settings().openai_model)
+    return _token_counter
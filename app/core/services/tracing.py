@@ -0,0 +1,235 @@
+"""경량 트레이싱 - 워크플로우 노드/외부 호출 구간 측정 및 OpenTelemetry 호환 JSON 내보내기"""
+
+import contextvars
+import json
+import logging
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from app.config import get_settings
+from app.core.services.metrics import observe_span
+
+logger = logging.getLogger(__name__)
+
+# 구간 종류 (timings 집계 그룹)
+SPAN_KIND_REQUEST = "request"
+SPAN_KIND_NODE = "node"
+SPAN_KIND_EXTERNAL = "external"
+
+# OTLP SpanKind (INTERNAL=1, SERVER=2, CLIENT=3)
+_OTLP_SPAN_KINDS = {
+    SPAN_KIND_REQUEST: 2,
+    SPAN_KIND_NODE: 1,
+    SPAN_KIND_EXTERNAL: 3,
+}
+
+_current_trace: contextvars.ContextVar[Optional["Trace"]] = contextvars.ContextVar(
+    "current_trace", default=None
+)
+_current_span: contextvars.ContextVar[Optional["Span"]] = contextvars.ContextVar(
+    "current_span", default=None
+)
+
+_export_lock = threading.Lock()
+
+
+@dataclass
+class Span:
+    """측정 구간"""
+    name: str
+    kind: str
+    span_id: str
+    parent_id: Optional[str]
+    start_ns: int
+    end_ns: int = 0
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
+
+    @property
+    def duration_ms(self) -> float:
+        return (self.end_ns - self.start_ns) / 1_000_000
+
+
+class Trace:
+    """
+    요청 하나의 구간 모음
+
+    병렬 노드(스레드풀/태스크)가 동시에 구간을 추가하므로 잠금으로 보호한다.
+    """
+
+    def __init__(self, name: str):
+        self.trace_id = uuid.uuid4().hex
+        self.spans: List[Span] = []
+        self._lock = threading.Lock()
+        self.root = self._new_span(name, SPAN_KIND_REQUEST, None)
+
+    def _new_span(self, name: str, kind: str, parent: Optional[Span], **attributes) -> Span:
+        return Span(
+            name=name,
+            kind=kind,
+            span_id=uuid.uuid4().hex[:16],
+            parent_id=parent.span_id if parent else None,
+            start_ns=time.time_ns(),
+            attributes=attributes
+        )
+
+    def add(self, span: Span):
+        with self._lock:
+            self.spans.append(span)
+
+    def finish(self):
+        """루트 구간 종료"""
+        if not self.root.end_ns:
+            self.root.end_ns = time.time_ns()
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        구간을 이름별로 집계한 timings 반환
+
+        Returns:
+            {"total_ms", "nodes": {이름: {count, total_ms}}, "external": {이름: {count, total_ms}}}
+        """
+        with self._lock:
+            spans = list(self.spans)
+
+        groups: Dict[str, Dict[str, Dict[str, float]]] = {"nodes": {}, "external": {}}
+        for span in spans:
+            group = "nodes" if span.kind == SPAN_KIND_NODE else "external"
+            entry = groups[group].setdefault(span.name, {"count": 0, "total_ms": 0.0})
+            entry["count"] += 1
+            entry["total_ms"] += span.duration_ms
+
+        for entries in groups.values():
+            for entry in entries.values():
+                entry["total_ms"] = round(entry["total_ms"], 2)
+
+        end_ns = self.root.end_ns or time.time_ns()
+        return {
+            "total_ms": round((end_ns - self.root.start_ns) / 1_000_000, 2),
+            **groups
+        }
+
+    def to_otlp(self) -> Dict[str, Any]:
+        """OpenTelemetry OTLP/JSON (ExportTraceServiceRequest) 형식으로 변환"""
+        with self._lock:
+            spans = [self.root] + list(self.spans)
+
+        return {
+            "resourceSpans": [{
+                "resource": {
+                    "attributes": [_otlp_attribute("service.name", "korean-recipe-fitness-api")]
+                },
+                "scopeSpans": [{
+                    "scope": {"name": __name__},
+                    "spans": [self._otlp_span(span) for span in spans]
+                }]
+            }]
+        }
+
+    def _otlp_span(self, span: Span) -> Dict[str, Any]:
+        otlp = {
+            "traceId": self.trace_id,
+            "spanId": span.span_id,
+            "name": span.name,
+            "kind": _OTLP_SPAN_KINDS.get(span.kind, 1),
+            "startTimeUnixNano": str(span.start_ns),
+            "endTimeUnixNano": str(span.end_ns or span.start_ns),
+            "attributes": [
+                _otlp_attribute(key, value)
+                for key, value in {"span.kind": span.kind, **span.attributes}.items()
+            ],
+            "status": {"code": 2, "message": span.error} if span.error else {"code": 1},
+        }
+        if span.parent_id:
+            otlp["parentSpanId"] = span.parent_id
+        return otlp
+
+
+def _otlp_attribute(key: str, value: Any) -> Dict[str, Any]:
+    """OTLP AnyValue 속성 변환"""
+    if isinstance(value, bool):
+        return {"key": key, "value": {"boolValue": value}}
+    if isinstance(value, int):
+        return {"key": key, "value": {"intValue": str(value)}}
+    if isinstance(value, float):
+        return {"key": key, "value": {"doubleValue": value}}
+    return {"key": key, "value": {"stringValue": str(value)}}
+
+
+def start_trace(name: str) -> Trace:
+    """
+    현재 컨텍스트에 새 트레이스 시작
+
+    asyncio 태스크/LangGraph 스레드풀은 컨텍스트를 복사하므로
+    워크플로우 노드와 외부 호출 구간이 같은 트레이스에 기록된다.
+    """
+    trace = Trace(name)
+    _current_trace.set(trace)
+    _current_span.set(trace.root)
+    return trace
+
+
+def get_current_trace() -> Optional[Trace]:
+    """현재 컨텍스트의 트레이스 (없으면 None)"""
+    return _current_trace.get()
+
+
+@contextmanager
+def span(name: str, kind: str = SPAN_KIND_EXTERNAL, **attributes) -> Iterator[Optional[Span]]:
+    """
+    구간 측정 컨텍스트 매니저
+
+    소요 시간은 항상 Prometheus 메트릭(노드/외부 호출 히스토그램)에 기록되고,
+    트레이스가 있을 때만 구간 객체를 만들어 트레이스에 추가한다.
+
+    Args:
+        name: 구간 이름 (예: "openai.chat", "sqlite.query")
+        kind: SPAN_KIND_NODE / SPAN_KIND_EXTERNAL
+        **attributes: 구간 속성
+    """
+    trace = _current_trace.get()
+    current = None
+    token = None
+    if trace is not None:
+        current = trace._new_span(name, kind, _current_span.get(), **attributes)
+        token = _current_span.set(current)
+
+    start = time.perf_counter()
+    error = False
+    try:
+        yield current
+    except BaseException as e:
+        error = True
+        if current is not None:
+            current.error = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        observe_span(name, kind, time.perf_counter() - start, attributes, error)
+        if current is not None:
+            current.end_ns = time.time_ns()
+            _current_span.reset(token)
+            trace.add(current)
+
+
+def export_trace(trace: Trace):
+    """
+    트레이스를 로컬 파일 싱크에 OTLP/JSON 한 줄로 추가 (TRACE_EXPORT_PATH가 비어 있으면 생략)
+    """
+    export_path = get_settings().trace_export_path
+    if not export_path:
+        return
+
+    try:
+        path = Path(export_path)
+        line = json.dumps(trace.to_otlp(), ensure_ascii=False)
+        with _export_lock:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+    except Exception as e:
+        logger.warning(f"트레이스 내보내기 실패: {e}")
@@ -0,0 +1,568 @@
+"""OpenAI 업스트림 전송 계층 - 헤지 요청, 지터 재시도, 서킷 브레이커
+
+httpx 전송(transport)을 감싸므로 OpenAI SDK를 사용하는 모든 호출(쿼리 분석, 임베딩,
+레시피/영양정보 생성, 응답 포맷팅)에 같은 정책이 적용된다.
+SDK 자체 재시도는 끄고(max_retries=0) 이 계층에서만 재시도한다.
+
+- 헤지: 같은 종류 요청의 최근 지연 분위수(OPENAI_HEDGE_PERCENTILE)가 지나도 응답이 없으면
+  같은 요청을 한 번 더 보내 먼저 도착한 응답을 사용 (비동기 클라이언트만)
+- 재시도: 연결 오류/408/409/429/5xx는 지수 백오프 + full jitter로 재시도 (요청 타임아웃 안에서만)
+- 서킷 브레이커: 연속 실패가 임계값에 도달하면 OPENAI_CIRCUIT_RESET_SECONDS 동안 요청을 보내지 않고
+  즉시 실패시킨다. 그동안 llm_timeout()이 0을 반환해 각 단계가 규칙/템플릿 경로를 사용한다.
+  업스트림 장애만 실패로 센다: 연결 실패와 5xx. 429(요청 한도)는 재시도하지만 세지 않고,
+  요청 예산(읽기 타임아웃, 예산으로 줄어든 연결 타임아웃)이 끝나서 난 타임아웃도 세지 않는다.
+- 프로브: PROBE_HEADER가 붙은 요청은 헤더를 떼고 한 번만 보낸다 (재시도/헤지 없음, 서킷 상태 무관)
+"""
+
+import asyncio
+import logging
+import random
+import re
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional
+
+import httpx
+
+from app.config import get_settings
+from app.core.services.metrics import get_metrics_registry
+
+logger = logging.getLogger(__name__)
+
+CIRCUIT_CLOSED = "closed"
+CIRCUIT_OPEN = "open"
+CIRCUIT_HALF_OPEN = "half_open"
+
+_CIRCUIT_STATE_VALUES = {CIRCUIT_CLOSED: 0, CIRCUIT_HALF_OPEN: 1, CIRCUIT_OPEN: 2}
+
+_MAX_TOKENS_PATTERN = re.compile(rb'"max_tokens":\s*(\d+)')
+
+# 헬스체크 등 재시도/서킷 브레이커 없이 한 번만 보낼 요청 표시 (업스트림으로는 보내지 않음)
+PROBE_HEADER = "x-upstream-probe"
+
+# 요청 예산 때문에 연결 타임아웃이 설정값보다 짧아진 재시도 요청 표시 (request.extensions 키)
+_BUDGET_BOUND = "budget_bound"
+
+_registry = get_metrics_registry()
+_RETRIES = _registry.counter(
+    "openai_retries_total", "OpenAI 요청 재시도 수 (reason: 상태 코드 또는 error)", ("reason",)
+)
+_HEDGES = _registry.counter(
+    "openai_hedged_requests_total", "OpenAI 헤지 요청 수 (won: 헤지 응답 사용, lost: 원 요청 응답 사용)", ("outcome",)
+)
+_CIRCUIT_TRANSITIONS = _registry.counter(
+    "openai_circuit_transitions_total", "OpenAI 서킷 브레이커 상태 전이 수", ("state",)
+)
+_CIRCUIT_REJECTED = _registry.counter(
+    "openai_circuit_rejected_total", "서킷이 열려 보내지 않은 OpenAI 요청 수"
+)
+
+
+class CircuitOpenError(httpx.TransportError):
+    """서킷이 열려 업스트림 요청을 보내지 않음"""
+
+
+def is_retryable_status(status_code: int) -> bool:
+    """재시도할 응답 상태 코드 (OpenAI SDK 기본 재시도 대상과 동일)"""
+    return status_code in (408, 409, 429) or status_code >= 500
+
+
+def is_breaker_failure_status(status_code: int) -> bool:
+    """서킷 브레이커 실패로 셀 응답 상태 코드 (업스트림 오류 5xx만)"""
+    return status_code >= 500
+
+
+def is_breaker_failure_error(error: httpx.TransportError, request: httpx.Request) -> bool:
+    """서킷 브레이커 실패로 셀 전송 오류 (연결 실패만, 요청 예산으로 줄어든 연결 타임아웃은 제외)"""
+    if isinstance(error, httpx.ConnectError):
+        return True
+    return isinstance(error, httpx.ConnectTimeout) and not request.extensions.get(_BUDGET_BOUND)
+
+
+class CircuitBreaker:
+    """
+    연속 실패 기반 서킷 브레이커 (동기/비동기 클라이언트 공유)
+
+    closed → (연속 실패 failure_threshold회) → open → (reset_seconds 경과) → half_open
+    half_open에서는 요청 하나만 프로브로 보내고, 성공하면 closed, 실패하면 다시 open.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_seconds: float = 30.0):
+        """
+        Args:
+            failure_threshold: 서킷을 열 연속 실패 수
+            reset_seconds: 서킷을 연 뒤 프로브 요청을 허용하기까지의 시간 (초)
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+
+        self._state = CIRCUIT_CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """현재 상태 (open이어도 reset_seconds가 지났으면 half_open)"""
+        with self._lock:
+            if self._state == CIRCUIT_OPEN and time.monotonic() - self._opened_at >= self.reset_seconds:
+                return CIRCUIT_HALF_OPEN
+            return self._state
+
+    @property
+    def is_open(self) -> bool:
+        """요청을 보내지 않아야 하면 True (프로브를 기다리는 half_open은 False)"""
+        return self.state == CIRCUIT_OPEN
+
+    def before_request(self):
+        """요청 전 호출 (서킷이 열렸거나 프로브가 진행 중이면 CircuitOpenError)"""
+        with self._lock:
+            if self._state == CIRCUIT_OPEN:
+                if time.monotonic() - self._opened_at < self.reset_seconds:
+                    _CIRCUIT_REJECTED.inc()
+                    raise CircuitOpenError("OpenAI 서킷 열림 (업스트림 장애)")
+                self._transition(CIRCUIT_HALF_OPEN)
+
+            if self._state == CIRCUIT_HALF_OPEN:
+                if self._probing:
+                    _CIRCUIT_REJECTED.inc()
+                    raise CircuitOpenError("OpenAI 서킷 프로브 진행 중")
+                self._probing = True
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._probing = False
+            if self._state != CIRCUIT_CLOSED:
+                self._transition(CIRCUIT_CLOSED)
+                logger.info("OpenAI 서킷 닫힘 (업스트림 복구)")
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            self._probing = False
+            if self._state == CIRCUIT_HALF_OPEN or (
+                self._state == CIRCUIT_CLOSED and self._failures >= self.failure_threshold
+            ):
+                self._opened_at = time.monotonic()
+                self._transition(CIRCUIT_OPEN)
+                logger.warning(
+                    f"OpenAI 서킷 열림 (연속 실패 {self._failures}회), {self.reset_seconds:.0f}초 동안 대체 경로 사용"
+                )
+
+    def record_abort(self):
+        """결과 없이 중단된 요청 (취소된 헤지/프로브)"""
+        with self._lock:
+            self._probing = False
+
+    def _transition(self, state: str):
+        self._state = state
+        _CIRCUIT_TRANSITIONS.inc(state)
+
+
+class LatencyTracker:
+    """요청 종류별 최근 지연 시간 (헤지 지연 계산용)"""
+
+    def __init__(self, window: int = 200, min_samples: int = 20):
+        """
+        Args:
+            window: 종류별로 보관할 최근 지연 시간 수
+            min_samples: 분위수를 계산할 최소 표본 수
+        """
+        self.window = window
+        self.min_samples = min_samples
+
+        self._samples: Dict[str, Deque[float]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, key: str, seconds: float):
+        with self._lock:
+            samples = self._samples.get(key)
+            if samples is None:
+                samples = self._samples[key] = deque(maxlen=self.window)
+            samples.append(seconds)
+
+    def percentile(self, key: str, q: float) -> Optional[float]:
+        """최근 지연 시간의 q 분위수 (표본이 부족하면 None)"""
+        with self._lock:
+            samples = self._samples.get(key)
+            if samples is None or len(samples) < self.min_samples:
+                return None
+            ordered = sorted(samples)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * q))]
+
+
+class RetryPolicy:
+    """지수 백오프 + full jitter 재시도 정책"""
+
+    def __init__(self, max_retries: int = 2, base_delay: float = 0.25, max_delay: float = 4.0):
+        """
+        Args:
+            max_retries: 최대 재시도 수
+            base_delay: 첫 재시도 최대 대기 시간 (초, 재시도마다 2배)
+            max_delay: 재시도 대기 시간 상한 (초)
+        """
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def backoff(self, attempt: int, response: Optional[httpx.Response] = None) -> float:
+        """attempt번째 재시도 전 대기 시간 (응답의 Retry-After가 있으면 우선)"""
+        retry_after = _retry_after(response) if response is not None else None
+        if retry_after is not None:
+            return min(retry_after, self.max_delay)
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+
+class _Budget:
+    """요청 타임아웃 안에서만 재시도하도록 남은 시간 관리"""
+
+    def __init__(self, request: httpx.Request):
+        timeout = request.extensions.get("timeout") or {}
+        read_timeout = timeout.get("read")
+        self.deadline = time.monotonic() + read_timeout if read_timeout else None
+
+    def allows(self, attempt: int, max_retries: int, delay: float) -> bool:
+        if attempt >= max_retries:
+            return False
+        return self.deadline is None or time.monotonic() + delay < self.deadline
+
+    def apply(self, request: httpx.Request):
+        """재시도 요청의 타임아웃을 남은 시간으로 줄임"""
+        if self.deadline is None:
+            return
+        remaining = max(self.deadline - time.monotonic(), 0.001)
+        timeout = request.extensions.get("timeout") or {}
+        connect = timeout.get("connect")
+        request.extensions = {
+            **request.extensions,
+            "timeout": {
+                name: min(value, remaining) if value is not None else remaining
+                for name, value in timeout.items()
+            },
+            _BUDGET_BOUND: connect is None or remaining < connect,
+        }
+
+
+class ResilientTransport(httpx.BaseTransport):
+    """동기 클라이언트 전송 (재시도 + 서킷 브레이커, 헤지는 비동기 클라이언트만)"""
+
+    def __init__(self, transport: httpx.BaseTransport, breaker: CircuitBreaker, retry: RetryPolicy):
+        self._transport = transport
+        self.breaker = breaker
+        self.retry = retry
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        if _take_probe_header(request):
+            return self._transport.handle_request(request)
+
+        budget = _Budget(request)
+        attempt = 0
+        while True:
+            try:
+                response = self._attempt(request)
+            except CircuitOpenError:
+                raise
+            except httpx.TransportError as e:
+                delay = self.retry.backoff(attempt)
+                if not budget.allows(attempt, self.retry.max_retries, delay):
+                    raise
+                logger.warning(f"OpenAI 요청 실패, {delay:.2f}s 후 재시도: {e}")
+                _RETRIES.inc("error")
+            else:
+                if not is_retryable_status(response.status_code):
+                    return response
+                delay = self.retry.backoff(attempt, response)
+                if not budget.allows(attempt, self.retry.max_retries, delay):
+                    return response
+                response.close()
+                logger.warning(f"OpenAI 응답 {response.status_code}, {delay:.2f}s 후 재시도")
+                _RETRIES.inc(str(response.status_code))
+
+            time.sleep(delay)
+            budget.apply(request)
+            attempt += 1
+
+    def _attempt(self, request: httpx.Request) -> httpx.Response:
+        self.breaker.before_request()
+        try:
+            response = self._transport.handle_request(request)
+        except httpx.TransportError as e:
+            _record_error(self.breaker, e, request)
+            raise
+        except BaseException:
+            self.breaker.record_abort()
+            raise
+
+        _record_response(self.breaker, response)
+        return response
+
+    def close(self):
+        self._transport.close()
+
+
+class AsyncResilientTransport(httpx.AsyncBaseTransport):
+    """비동기 클라이언트 전송 (헤지 + 재시도 + 서킷 브레이커)"""
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        breaker: CircuitBreaker,
+        retry: RetryPolicy,
+        latency: Optional[LatencyTracker] = None,
+        hedge_percentile: float = 0.95,
+        hedge_min_delay: float = 0.2
+    ):
+        """
+        Args:
+            transport: 실제 요청을 보내는 전송 (커넥션 풀)
+            breaker: 서킷 브레이커
+            retry: 재시도 정책
+            latency: 요청 종류별 지연 시간 (None이면 헤지하지 않음)
+            hedge_percentile: 헤지 요청을 보낼 지연 분위수
+            hedge_min_delay: 헤지 지연 하한 (초)
+        """
+        self._transport = transport
+        self.breaker = breaker
+        self.retry = retry
+        self.latency = latency
+        self.hedge_percentile = hedge_percentile
+        self.hedge_min_delay = hedge_min_delay
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if _take_probe_header(request):
+            return await self._transport.handle_async_request(request)
+
+        budget = _Budget(request)
+        attempt = 0
+        while True:
+            try:
+                response = await self._send(request)
+            except CircuitOpenError:
+                raise
+            except httpx.TransportError as e:
+                delay = self.retry.backoff(attempt)
+                if not budget.allows(attempt, self.retry.max_retries, delay):
+                    raise
+                logger.warning(f"OpenAI 요청 실패, {delay:.2f}s 후 재시도: {e}")
+                _RETRIES.inc("error")
+            else:
+                if not is_retryable_status(response.status_code):
+                    return response
+                delay = self.retry.backoff(attempt, response)
+                if not budget.allows(attempt, self.retry.max_retries, delay):
+                    return response
+                await response.aclose()
+                logger.warning(f"OpenAI 응답 {response.status_code}, {delay:.2f}s 후 재시도")
+                _RETRIES.inc(str(response.status_code))
+
+            await asyncio.sleep(delay)
+            budget.apply(request)
+            attempt += 1
+
+    async def _send(self, request: httpx.Request) -> httpx.Response:
+        """요청 한 번 (지연이 분위수를 넘으면 헤지 요청 추가)"""
+        key = _latency_key(request)
+        delay = self._hedge_delay(key)
+        start = time.perf_counter()
+        if delay is None:
+            response = await self._attempt(request)
+        else:
+            response = await self._hedged(request, delay)
+
+        # 헤지로 취소된 느린 요청도 반영되도록 첫 요청부터 응답까지의 시간을 기록
+        if self.latency is not None and not is_retryable_status(response.status_code):
+            self.latency.observe(key, time.perf_counter() - start)
+        return response
+
+    async def _hedged(self, request: httpx.Request, delay: float) -> httpx.Response:
+        attempts: List[asyncio.Task] = [asyncio.create_task(self._attempt(request))]
+        winner: Optional[asyncio.Task] = None
+        try:
+            done, _ = await asyncio.wait(attempts, timeout=delay)
+            # 프로브 중(half_open)에는 헤지하지 않음
+            if not done and self.breaker.state == CIRCUIT_CLOSED:
+                attempts.append(asyncio.create_task(self._attempt(request)))
+
+            pending = set(attempts)
+            while pending and winner is None:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                winner = next((task for task in attempts if task in done and _succeeded(task)), None)
+
+            if winner is None:
+                # 모두 실패: 응답이 있으면 응답(재시도 판단은 호출자), 없으면 첫 요청의 예외
+                winner = next((task for task in attempts if task.exception() is None), attempts[0])
+            if len(attempts) > 1:
+                _HEDGES.inc("won" if winner is attempts[1] else "lost")
+            return winner.result()
+        finally:
+            for task in attempts:
+                if task is not winner:
+                    await _discard_attempt(task)
+
+    async def _attempt(self, request: httpx.Request) -> httpx.Response:
+        self.breaker.before_request()
+        try:
+            response = await self._transport.handle_async_request(request)
+        except httpx.TransportError as e:
+            _record_error(self.breaker, e, request)
+            raise
+        except BaseException:
+            self.breaker.record_abort()
+            raise
+
+        _record_response(self.breaker, response)
+        return response
+
+    def _hedge_delay(self, key: str) -> Optional[float]:
+        if self.latency is None:
+            return None
+        observed = self.latency.percentile(key, self.hedge_percentile)
+        if observed is None:
+            return None
+        return max(observed, self.hedge_min_delay)
+
+    async def aclose(self):
+        await self._transport.aclose()
+
+
+def _record_response(breaker: CircuitBreaker, response: httpx.Response):
+    """응답 결과를 서킷 브레이커에 반영 (5xx만 실패, 429 등 다른 재시도 대상은 세지 않음)"""
+    if is_breaker_failure_status(response.status_code):
+        breaker.record_failure()
+    elif is_retryable_status(response.status_code):
+        breaker.record_abort()
+    else:
+        breaker.record_success()
+
+
+def _record_error(breaker: CircuitBreaker, error: httpx.TransportError, request: httpx.Request):
+    """전송 오류를 서킷 브레이커에 반영 (연결 실패만 실패, 예산 타임아웃 등은 세지 않음)"""
+    if is_breaker_failure_error(error, request):
+        breaker.record_failure()
+    else:
+        breaker.record_abort()
+
+
+def _take_probe_header(request: httpx.Request) -> bool:
+    """프로브 요청이면 표시 헤더를 떼고 True"""
+    if PROBE_HEADER not in request.headers:
+        return False
+    del request.headers[PROBE_HEADER]
+    return True
+
+
+def _succeeded(task: asyncio.Task) -> bool:
+    return task.exception() is None and not is_retryable_status(task.result().status_code)
+
+
+async def _discard_attempt(task: asyncio.Task):
+    """사용하지 않는 헤지 요청 정리 (진행 중이면 취소, 응답이 있으면 닫음)"""
+    if not task.done():
+        task.cancel()
+        return
+    if task.cancelled() or task.exception() is not None:
+        return
+    try:
+        await task.result().aclose()
+    except Exception as e:
+        logger.debug(f"헤지 응답 정리 실패: {e}")
+
+
+def _latency_key(request: httpx.Request) -> str:
+    """지연 시간 집계 단위 (경로 + 스트리밍 여부/최대 토큰 수)"""
+    path = request.url.path
+    try:
+        content = request.content
+    except httpx.RequestNotRead:
+        return path
+    if b'"stream":true' in content:
+        return f"{path}:stream"
+    match = _MAX_TOKENS_PATTERN.search(content)
+    return f"{path}:{match.group(1).decode()}" if match else path
+
+
+def _retry_after(response: httpx.Response) -> Optional[float]:
+    """Retry-After(-ms) 헤더 (초)"""
+    try:
+        if "retry-after-ms" in response.headers:
+            return float(response.headers["retry-after-ms"]) / 1000
+        if "retry-after" in response.headers:
+            return float(response.headers["retry-after"])
+    except ValueError:
+        pass
+    return None
+
+
+def _collect_metrics():
+    """서킷 브레이커 상태 (/metrics 스크레이프 시 호출)"""
+    breaker = _circuit_breaker
+    if breaker is None:
+        return
+    yield (
+        "openai_circuit_state", "gauge", "OpenAI 서킷 브레이커 상태 (0: closed, 1: half_open, 2: open)",
+        [({}, _CIRCUIT_STATE_VALUES[breaker.state])]
+    )
+
+
+_registry.register_collector(_collect_metrics)
+
+
+# 싱글톤 인스턴스
+_circuit_breaker: Optional[CircuitBreaker] = None
+_latency_tracker: Optional[LatencyTracker] = None
+_singleton_lock = threading.Lock()
+
+
+def get_circuit_breaker() -> CircuitBreaker:
+    """CircuitBreaker 싱글톤 인스턴스 반환"""
+    global _circuit_breaker
+    if _circuit_breaker is None:
+        with _singleton_lock:
+            if _circuit_breaker is None:
+                settings = get_settings()
+                _circuit_breaker = CircuitBreaker(
+                    failure_threshold=settings.openai_circuit_failure_threshold,
+                    reset_seconds=settings.openai_circuit_reset_seconds
+                )
+    return _circuit_breaker
+
+
+def get_latency_tracker() -> LatencyTracker:
+    """LatencyTracker 싱글톤 인스턴스 반환"""
+    global _latency_tracker
+    if _latency_tracker is None:
+        with _singleton_lock:
+            if _latency_tracker is None:
+                _latency_tracker = LatencyTracker(min_samples=get_settings().openai_hedge_min_samples)
+    return _latency_tracker
+
+
+def create_retry_policy() -> RetryPolicy:
+    """설정값으로 재시도 정책 생성"""
+    settings = get_settings()
+    return RetryPolicy(
+        max_retries=settings.openai_max_retries,
+        base_delay=settings.openai_retry_base_delay_seconds,
+        max_delay=settings.openai_retry_max_delay_seconds
+    )
+
+
+def create_sync_transport(transport: httpx.BaseTransport) -> ResilientTransport:
+    """동기 클라이언트용 전송 생성"""
+    return ResilientTransport(transport, get_circuit_breaker(), create_retry_policy())
+
+
+def create_async_transport(transport: httpx.AsyncBaseTransport) -> AsyncResilientTransport:
+    """비동기 클라이언트용 전송 생성 (OPENAI_HEDGE_ENABLED=false면 헤지 없음)"""
+    settings = get_settings()
+    return AsyncResilientTransport(
+        transport,
+        get_circuit_breaker(),
+        create_retry_policy(),
+        latency=get_latency_tracker() if settings.openai_hedge_enabled else None,
+        hedge_percentile=settings.openai_hedge_percentile,
+        hedge_min_delay=settings.openai_hedge_min_delay_seconds
+    )
@@ -9,6 +9,7 @@ import faiss
 import numpy as np
 
 from app.core.services.embedding_service import get_embedding_service
+from app.core.services.tracing import span
 
 logger = logging.getLogger(__name__)
 
@@ -69,11 +70,28 @@ class VectorDBService:
         """총 레시피 수"""
         return len(self.recipes)
 
+    def warm_up(self) -> int:
+        """
+        검색 경로 예열 (더미 벡터로 FAISS 검색 1회)
+
+        인덱스 페이지와 FAISS/BLAS 내부 스레드 풀을 첫 요청 전에 준비한다.
+
+        Returns:
+            인덱스 벡터 수 (준비되지 않았으면 0)
+        """
+        if not self.is_ready:
+            return 0
+
+        query_vector = np.zeros((1, self.index.d), dtype=np.float32)
+        self.index.search(query_vector, 1)
+        return self.index.ntotal
+
     def search(
         self,
         query: str,
         top_k: int = 3,
-        similarity_threshold: float = 0.5
+        similarity_threshold: float = 0.5,
+        timeout: Optional[float] = None
     ) -> List[Dict]:
         """
         쿼리로 레시피 검색
@@ -82,6 +100,7 @@ class VectorDBService:
             query: 검색 쿼리
             top_k: 반환할 최대 결과 수
             similarity_threshold: 최소 유사도 임계값 (0 ~ 1)
+            timeout: 쿼리 임베딩 API 타임아웃 (초)
 
         Returns:
             검색 결과 리스트 (유사도 포함)
@@ -93,35 +112,65 @@ class VectorDBService:
         try:
             # 쿼리 임베딩
             embedding_service = get_embedding_service()
-            query_embedding = embedding_service.get_embedding(query)
-            query_vector = np.array([query_embedding], dtype=np.float32)
-
-            # FAISS 검색 (L2 거리)
-            distances, indices = self.index.search(query_vector, top_k)
+            query_embedding = embedding_service.get_embedding(query, timeout)
+            return self._search_by_embedding(query_embedding, top_k, similarity_threshold)
 
-            results = []
-            for dist, idx in zip(distances[0], indices[0]):
-                if idx < 0 or idx >= len(self.recipes):
-                    continue
-
-                # L2 거리를 유사도로 변환
-                # 거리가 작을수록 유사함 → 1 / (1 + dist)
-                similarity = 1 / (1 + float(dist))
-
-                if similarity < similarity_threshold:
-                    continue
+        except Exception as e:
+            logger.error(f"검색 실패: {e}")
+            return []
 
-                recipe = self.recipes[idx].copy()
-                recipe["similarity"] = round(similarity, 4)
-                recipe["distance"] = round(float(dist), 4)
-                results.append(recipe)
+    async def asearch(
+        self,
+        query: str,
+        top_k: int = 3,
+        similarity_threshold: float = 0.5,
+        timeout: Optional[float] = None
+    ) -> List[Dict]:
+        """search()의 비동기 버전 (쿼리 임베딩을 AsyncOpenAI로 생성)"""
+        if not self.is_ready:
+            logger.warning("벡터 DB가 준비되지 않았습니다.")
+            return []
 
-            return results
+        try:
+            query_embedding = await get_embedding_service().aget_embedding(query, timeout)
+            return self._search_by_embedding(query_embedding, top_k, similarity_threshold)
 
         except Exception as e:
             logger.error(f"검색 실패: {e}")
             return []
 
+    def _search_by_embedding(
+        self,
+        query_embedding: List[float],
+        top_k: int,
+        similarity_threshold: float
+    ) -> List[Dict]:
+        """쿼리 임베딩으로 FAISS 검색"""
+        query_vector = np.array([query_embedding], dtype=np.float32)
+
+        # FAISS 검색 (L2 거리)
+        with span("faiss.search", top_k=top_k):
+            distances, indices = self.index.search(query_vector, top_k)
+
+        results = []
+        for dist, idx in zip(distances[0], indices[0]):
+            if idx < 0 or idx >= len(self.recipes):
+                continue
+
+            # L2 거리를 유사도로 변환
+            # 거리가 작을수록 유사함 → 1 / (1 + dist)
+            similarity = 1 / (1 + float(dist))
+
+            if similarity < similarity_threshold:
+                continue
+
+            recipe = self.recipes[idx].copy()
+            recipe["similarity"] = round(similarity, 4)
+            recipe["distance"] = round(float(dist), 4)
+            results.append(recipe)
+
+        return results
+
     def get_recipe_by_index(self, idx: int) -> Optional[Dict]:
         """
         인덱스로 레시피 조회
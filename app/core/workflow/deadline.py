@@ -0,0 +1,73 @@
+"""요청 마감 시간(deadline) 헬퍼 - 노드별 남은 예산 계산 및 성능 저하 단계 기록"""
+
+import logging
+import time
+from typing import Optional
+
+from app.config import get_settings
+from app.core.services.upstream_transport import get_circuit_breaker
+from app.core.workflow.state import ChatState
+
+logger = logging.getLogger(__name__)
+
+
+def create_deadline(timeout_seconds: Optional[float] = None) -> float:
+    """
+    요청 마감 시간 생성 (epoch 초)
+
+    Args:
+        timeout_seconds: 요청 예산 (초, 기본: REQUEST_TIMEOUT_SECONDS, 최대 MAX_REQUEST_TIMEOUT_SECONDS)
+
+    Returns:
+        마감 시각 (time.time() 기준)
+    """
+    settings = get_settings()
+    if timeout_seconds is None or timeout_seconds <= 0:
+        timeout_seconds = settings.request_timeout_seconds
+    timeout_seconds = min(timeout_seconds, settings.max_request_timeout_seconds)
+    return time.time() + timeout_seconds
+
+
+def remaining_seconds(state: ChatState) -> Optional[float]:
+    """남은 예산 (초), 마감 시간이 없으면 None"""
+    deadline = state.get("deadline")
+    if not deadline:
+        return None
+    return deadline - time.time()
+
+
+def llm_timeout(state: ChatState, stage: str) -> Optional[float]:
+    """
+    LLM 호출에 사용할 타임아웃 (남은 예산)
+
+    남은 예산이 최소 예산(LLM_MIN_BUDGET_SECONDS)보다 작거나 OpenAI 서킷이 열려 있으면
+    호출하지 않도록 0을 반환한다. 마감 시간이 없으면 None (클라이언트 기본 타임아웃 사용).
+
+    Args:
+        state: ChatState
+        stage: 로그용 단계 이름
+
+    Returns:
+        타임아웃(초), 0(예산 소진) 또는 None
+    """
+    if get_circuit_breaker().is_open:
+        logger.warning(f"[{stage}] OpenAI 서킷 열림, LLM 호출 생략")
+        return 0
+
+    remaining = remaining_seconds(state)
+    if remaining is None:
+        return None
+
+    if remaining < get_settings().llm_min_budget_seconds:
+        logger.warning(f"[{stage}] 요청 예산 소진 (남은 {remaining:.2f}s), LLM 호출 생략")
+        return 0
+    return remaining
+
+
+def mark_degraded(state: ChatState, stage: str):
+    """LLM 대신 대체 경로를 사용한 단계 기록"""
+    # 병렬 노드가 State 사본의 같은 리스트를 공유하므로 새 리스트로 교체
+    stages = state.get("degraded_stages") or []
+    if stage not in stages:
+        state["degraded_stages"] = stages + [stage]
+    logger.info(f"성능 저하 단계 기록: {stage}")
@@ -2,64 +2,269 @@
 
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple, Union
 
+from langchain_core.runnables import RunnableLambda
 from langgraph.graph import StateGraph, END
 
 from app.core.workflow.state import ChatState, create_initial_state, UserProfile
-from app.core.agents.query_analyzer import analyze_query
-from app.core.agents.recipe_fetcher import fetch_recipe
-from app.core.agents.nutrition_calculator import calculate_nutrition
+from app.core.services.tracing import SPAN_KIND_NODE, span
+from app.core.workflow.speculation import speculative_fallback
+from app.core.workflow.response_cache import (
+    aload_cached_state,
+    astore_cached_state,
+    load_cached_state,
+    store_cached_state
+)
+from app.core.agents.query_analyzer import analyze_query, aanalyze_query
+from app.core.agents.recipe_fetcher import fetch_recipe, afetch_recipe
+from app.core.agents.nutrition_calculator import (
+    lookup_nutrition,
+    alookup_nutrition,
+    calculate_nutrition,
+    acalculate_nutrition
+)
 from app.core.agents.exercise_recommender import recommend_exercises
-from app.core.agents.response_formatter import format_response
-from app.core.agents.llm_fallback import process_llm_fallback
+from app.core.agents.response_formatter import (
+    format_response,
+    aformat_response,
+    format_template_response,
+    should_use_template
+)
+from app.core.agents.llm_fallback import process_llm_fallback, aprocess_llm_fallback
 
 logger = logging.getLogger(__name__)
 
 
-def create_workflow() -> StateGraph:
+# 스트리밍 시 노드 완료 → 전송할 이벤트 (이벤트명, State 키)
+STREAM_NODE_EVENTS = {
+    "query_analyzer": [("analyzed_query", "analyzed_query")],
+    "llm_fallback": [("recipe", "recipe")],
+    "nutrition_calculator": [("nutrition", "nutrition")],
+    "exercise_recommender": [("exercises", "exercise_recommendations")],
+}
+
+# 레시피 분기를 생략하는 쿼리 유형 (영양/운동 질의는 레시피가 필요 없음)
+RECIPE_SKIP_QUERY_TYPES = ("nutrition", "exercise")
+
+# LLM 호출 없이 DB만 조회하는 앞 단계 노드 (백그라운드 작업 경로에서 먼저 실행)
+PROBE_NODES = ("query_analyzer", "recipe_fetcher", "nutrition_lookup")
+
+
+def _partial_node(
+    name: str,
+    node_fn: Callable[[ChatState], ChatState],
+    *keys: str,
+    anode_fn: Optional[Callable[[ChatState], Awaitable[ChatState]]] = None
+) -> Union[Callable[[ChatState], dict], RunnableLambda]:
+    """
+    State 전체를 반환하는 노드 함수를 담당 키만 반환하는 노드로 변환
+
+    병렬 실행되는 노드가 서로의 결과를 이전 값으로 덮어쓰지 않도록
+    State 사본으로 실행한 뒤 지정된 키(+ error, degraded_stages)만 업데이트로 반환한다.
+    실행 시간은 노드 이름(name)의 트레이싱 구간으로 기록된다.
+
+    anode_fn이 있으면 invoke()는 node_fn, ainvoke()는 anode_fn을 사용하는
+    RunnableLambda를 반환한다 (LLM 호출 노드가 이벤트 루프/스레드풀을 점유하지 않도록).
+    anode_fn이 없는 노드(로컬 DB 조회/계산)는 ainvoke() 시 LangGraph가 스레드풀에서 실행한다.
+    """
+    output_keys = keys + ("error", "degraded_stages")
+
+    def pick(result: ChatState) -> dict:
+        return {key: result[key] for key in output_keys if key in result}
+
+    def node(state: ChatState) -> dict:
+        with span(name, SPAN_KIND_NODE):
+            return pick(node_fn(dict(state)))
+
+    node.__name__ = node_fn.__name__
+    if anode_fn is None:
+        return node
+
+    async def anode(state: ChatState) -> dict:
+        with span(name, SPAN_KIND_NODE):
+            return pick(await anode_fn(dict(state)))
+
+    return RunnableLambda(node, afunc=anode, name=node_fn.__name__)
+
+
+def get_workflow_nodes(include_formatter: bool = True) -> Dict[str, Union[Callable, RunnableLambda]]:
+    """노드 이름 → 노드 (동기 invoke / 비동기 ainvoke 모두 지원)"""
+    nodes = {
+        "query_analyzer": _partial_node(
+            "query_analyzer", analyze_query, "analyzed_query", anode_fn=aanalyze_query
+        ),
+        "recipe_fetcher": _partial_node(
+            "recipe_fetcher", fetch_recipe, "recipe", "recipe_source", anode_fn=afetch_recipe
+        ),
+        "nutrition_lookup": _partial_node(
+            "nutrition_lookup", lookup_nutrition, "nutrition", anode_fn=alookup_nutrition
+        ),
+        "llm_fallback": _partial_node(
+            "llm_fallback", process_llm_fallback, "recipe", anode_fn=aprocess_llm_fallback
+        ),
+        "nutrition_calculator": _partial_node(
+            "nutrition_calculator", calculate_nutrition, "nutrition", anode_fn=acalculate_nutrition
+        ),
+        "exercise_recommender": _partial_node(
+            "exercise_recommender", recommend_exercises, "exercise_recommendations"
+        ),
+    }
+    if include_formatter:
+        nodes["response_formatter"] = _partial_node(
+            "response_formatter", format_response, "response", "response_skeleton",
+            anode_fn=aformat_response
+        )
+        nodes["template_formatter"] = _partial_node(
+            "template_formatter", format_template_response, "response", "response_skeleton"
+        )
+    return nodes
+
+
+def route_after_analysis(state: ChatState) -> List[str]:
+    """
+    쿼리 유형별 다음 노드 결정
+
+    영양/운동 질의는 레시피 검색/생성 분기를 생략하고 영양 분기만 실행
+    """
+    query_type = state.get("analyzed_query", {}).get("query_type", "recipe")
+    if query_type in RECIPE_SKIP_QUERY_TYPES:
+        logger.info(f"레시피 단계 생략 (query_type={query_type})")
+        return ["nutrition_lookup"]
+    return ["recipe_fetcher", "nutrition_lookup"]
+
+
+def route_response(state: ChatState) -> str:
+    """응답 생성 노드 결정 (GPT 포맷팅 / 템플릿)"""
+    if should_use_template(state):
+        return "template_formatter"
+    return "response_formatter"
+
+
+def create_workflow(include_formatter: bool = True) -> StateGraph:
     """
     레시피 & 피트니스 워크플로우 생성
 
-    Flow:
-        query_analyzer → recipe_fetcher → llm_fallback → nutrition_calculator
-        → exercise_recommender → response_formatter → END
+    Flow (fan-out / fan-in):
+        query_analyzer ─┬─ recipe_fetcher ──── llm_fallback ─────────┬─ exercise_recommender
+                        └─ nutrition_lookup ── nutrition_calculator ─┘   → response_formatter
+                                                                           | template_formatter → END
+
+        - 레시피 검색과 영양DB 조회는 음식명만 필요하므로 동시에 실행
+        - GPT 레시피 생성과 GPT 영양정보 추정(nutrition_calculator 내부)도 동시에 실행
+        - 영양/운동 질의(query_type)는 레시피 분기를 생략
+        - response_mode="structured"거나 응답할 데이터가 없으면 GPT 포맷팅 대신 템플릿 응답
+
+    Args:
+        include_formatter: False면 response_formatter 없이 exercise_recommender에서 종료
+            (스트리밍 경로에서 응답 텍스트를 토큰 단위로 별도 생성할 때 사용)
 
     Returns:
-        컴파일된 StateGraph
+        StateGraph
     """
     # StateGraph 생성
     workflow = StateGraph(ChatState)
 
     # 노드 추가
-    workflow.add_node("query_analyzer", analyze_query)
-    workflow.add_node("recipe_fetcher", fetch_recipe)
-    workflow.add_node("llm_fallback", process_llm_fallback)
-    workflow.add_node("nutrition_calculator", calculate_nutrition)
-    workflow.add_node("exercise_recommender", recommend_exercises)
-    workflow.add_node("response_formatter", format_response)
-
-    # 엣지 연결 (순차적 실행)
+    for name, node in get_workflow_nodes(include_formatter).items():
+        workflow.add_node(name, node)
+
     workflow.set_entry_point("query_analyzer")
 
-    workflow.add_edge("query_analyzer", "recipe_fetcher")
+    # fan-out: 레시피 검색 / 영양DB 조회 (영양/운동 질의는 영양 분기만)
+    workflow.add_conditional_edges(
+        "query_analyzer",
+        route_after_analysis,
+        ["recipe_fetcher", "nutrition_lookup"]
+    )
+
+    # 병렬 단계: GPT 레시피 생성 / 영양정보 확정 (+ GPT 추정)
     workflow.add_edge("recipe_fetcher", "llm_fallback")
-    workflow.add_edge("llm_fallback", "nutrition_calculator")
+    workflow.add_edge("nutrition_lookup", "nutrition_calculator")
+
+    _add_completion_edges(workflow, include_formatter)
+    return workflow
+
+
+def _add_completion_edges(workflow: StateGraph, include_formatter: bool):
+    """LLM 단계 이후 엣지 (운동 추천 합류 → 응답 생성)"""
+    # fan-in: 실행된 분기가 모두 끝난 뒤 운동 추천
+    # (두 분기의 길이가 같아 같은 superstep에서 합류하므로 운동 추천은 한 번만 실행)
+    workflow.add_edge("llm_fallback", "exercise_recommender")
     workflow.add_edge("nutrition_calculator", "exercise_recommender")
-    workflow.add_edge("exercise_recommender", "response_formatter")
-    workflow.add_edge("response_formatter", END)
 
+    if include_formatter:
+        workflow.add_conditional_edges(
+            "exercise_recommender",
+            route_response,
+            ["response_formatter", "template_formatter"]
+        )
+        workflow.add_edge("response_formatter", END)
+        workflow.add_edge("template_formatter", END)
+    else:
+        workflow.add_edge("exercise_recommender", END)
+
+
+def route_completion(state: ChatState) -> List[str]:
+    """DB 단계 이후 실행할 노드 (레시피 분기를 생략한 질의는 영양 분기만)"""
+    query_type = state.get("analyzed_query", {}).get("query_type", "recipe")
+    if query_type in RECIPE_SKIP_QUERY_TYPES:
+        return ["nutrition_calculator"]
+    return ["llm_fallback", "nutrition_calculator"]
+
+
+def create_probe_workflow() -> StateGraph:
+    """
+    DB 단계 워크플로우 (쿼리 분석 → 레시피 검색 / 영양DB 조회 → END)
+
+    create_completion_workflow()와 이어 실행하면 create_workflow()와 같은 결과가 된다.
+    """
+    workflow = StateGraph(ChatState)
+    nodes = get_workflow_nodes(include_formatter=False)
+    for name in PROBE_NODES:
+        workflow.add_node(name, nodes[name])
+
+    workflow.set_entry_point("query_analyzer")
+    workflow.add_conditional_edges(
+        "query_analyzer",
+        route_after_analysis,
+        ["recipe_fetcher", "nutrition_lookup"]
+    )
+    workflow.add_edge("recipe_fetcher", END)
+    workflow.add_edge("nutrition_lookup", END)
+    return workflow
+
+
+def create_completion_workflow(include_formatter: bool = True) -> StateGraph:
+    """
+    LLM 단계 워크플로우 (GPT 레시피 생성 / 영양정보 확정 → 운동 추천 → 응답 생성)
+
+    create_probe_workflow()의 결과 State에서 시작한다 (백그라운드 작업 경로).
+    """
+    workflow = StateGraph(ChatState)
+    for name, node in get_workflow_nodes(include_formatter).items():
+        if name not in PROBE_NODES:
+            workflow.add_node(name, node)
+
+    workflow.set_conditional_entry_point(
+        route_completion,
+        ["llm_fallback", "nutrition_calculator"]
+    )
+    _add_completion_edges(workflow, include_formatter)
     return workflow
 
 
-def compile_workflow():
+def compile_workflow(include_formatter: bool = True):
     """워크플로우 컴파일"""
-    workflow = create_workflow()
+    workflow = create_workflow(include_formatter=include_formatter)
     return workflow.compile()
 
 
 # 싱글톤 컴파일된 워크플로우
 _compiled_workflow = None
+_compiled_stream_workflow = None
+_compiled_probe_workflow = None
+_compiled_completion_workflow = None
 
 
 def get_compiled_workflow():
@@ -70,16 +275,66 @@ def get_compiled_workflow():
     return _compiled_workflow
 
 
+def get_compiled_stream_workflow():
+    """스트리밍용 컴파일된 워크플로우 (response_formatter 제외) 싱글톤 반환"""
+    global _compiled_stream_workflow
+    if _compiled_stream_workflow is None:
+        _compiled_stream_workflow = compile_workflow(include_formatter=False)
+    return _compiled_stream_workflow
+
+
+def get_compiled_probe_workflow():
+    """DB 단계 컴파일된 워크플로우 싱글톤 반환"""
+    global _compiled_probe_workflow
+    if _compiled_probe_workflow is None:
+        _compiled_probe_workflow = create_probe_workflow().compile()
+    return _compiled_probe_workflow
+
+
+def get_compiled_completion_workflow():
+    """LLM 단계 컴파일된 워크플로우 싱글톤 반환"""
+    global _compiled_completion_workflow
+    if _compiled_completion_workflow is None:
+        _compiled_completion_workflow = create_completion_workflow().compile()
+    return _compiled_completion_workflow
+
+
+def needs_llm_generation(state: ChatState) -> bool:
+    """
+    DB 단계 결과에 GPT 생성이 필요한지 여부
+
+    - 레시피 검색이 LLM fallback으로 마킹된 경우 (GPT 레시피 + 영양정보 생성)
+    - 레시피 분기를 생략한 질의에서 영양DB에 결과가 없는 경우 (GPT 영양정보 추정)
+    """
+    analyzed_query = state.get("analyzed_query", {})
+    if not analyzed_query.get("food_name"):
+        return False
+    if state.get("recipe_source") == "llm_fallback":
+        return True
+    return (
+        analyzed_query.get("query_type", "recipe") in RECIPE_SKIP_QUERY_TYPES
+        and state.get("nutrition", {}).get("calories", 0) <= 0
+    )
+
+
 async def run_workflow(
     user_query: str,
-    user_profile: Optional[UserProfile] = None
+    user_profile: Optional[UserProfile] = None,
+    response_mode: str = "natural",
+    deadline: Optional[float] = None
 ) -> ChatState:
     """
-    워크플로우 실행 (비동기)
+    워크플로우 실행 (비동기, FastAPI 경로)
+
+    LLM 호출 노드는 AsyncOpenAI로 실행되어 이벤트 루프를 막지 않는다.
+    같은 쿼리가 응답 캐시에 있으면 그래프를 실행하지 않고 운동 추천만 다시 계산한다.
+    SPECULATIVE_FALLBACK_ENABLED면 DB 미스가 예상될 때 벡터 검색과 GPT 레시피 생성을 동시에 시작한다.
 
     Args:
         user_query: 사용자 쿼리
         user_profile: 사용자 프로필 (선택)
+        response_mode: 응답 생성 방식 ("natural": GPT 자연어, "structured": 템플릿)
+        deadline: 요청 마감 시각 (epoch 초, 각 LLM 호출의 타임아웃으로 사용)
 
     Returns:
         최종 ChatState
@@ -87,26 +342,141 @@ async def run_workflow(
     logger.info(f"워크플로우 시작: {user_query}")
 
     # 초기 State 생성
-    initial_state = create_initial_state(user_query, user_profile)
+    initial_state = create_initial_state(user_query, user_profile, response_mode, deadline)
+
+    # 응답 캐시 적중 시 운동 추천만 재계산
+    cached_state = await aload_cached_state(initial_state)
+    if cached_state is not None:
+        return cached_state
 
     # 워크플로우 실행
     workflow = get_compiled_workflow()
-    final_state = await workflow.ainvoke(initial_state)
+    with speculative_fallback():
+        final_state = await workflow.ainvoke(initial_state)
+    await astore_cached_state(final_state)
+
+    logger.info("워크플로우 완료")
+    return final_state
+
+
+async def run_workflow_deferred(
+    user_query: str,
+    user_profile: Optional[UserProfile] = None,
+    response_mode: str = "natural",
+    deadline: Optional[float] = None
+) -> Tuple[ChatState, bool]:
+    """
+    DB 단계를 먼저 실행하고, GPT 생성이 필요하면 나머지 단계를 실행하지 않고 반환
+
+    DB에 결과가 있으면 run_workflow()와 같은 최종 State를 반환한다.
+    완료 여부가 False면 State는 DB 단계 결과이며, complete_workflow()로 나머지 단계를 실행한다.
+
+    Args:
+        user_query: 사용자 쿼리
+        user_profile: 사용자 프로필 (선택)
+        response_mode: 응답 생성 방식 ("natural": GPT 자연어, "structured": 템플릿)
+        deadline: 요청 마감 시각 (epoch 초, 각 LLM 호출의 타임아웃으로 사용)
+
+    Returns:
+        (State, 완료 여부)
+    """
+    logger.info(f"워크플로우 시작 (LLM 단계 지연 가능): {user_query}")
+
+    state = create_initial_state(user_query, user_profile, response_mode, deadline)
+
+    cached_state = await aload_cached_state(state)
+    if cached_state is not None:
+        return cached_state, True
+
+    state = await get_compiled_probe_workflow().ainvoke(state)
+    if needs_llm_generation(state):
+        logger.info(f"DB 결과 없음, LLM 단계 지연: {user_query}")
+        return state, False
+
+    return await complete_workflow(state), True
+
+
+async def complete_workflow(state: ChatState) -> ChatState:
+    """
+    DB 단계 결과 State에서 나머지 단계 실행 (GPT 생성 → 운동 추천 → 응답 생성)
+
+    Args:
+        state: run_workflow_deferred()가 반환한 미완료 State
+
+    Returns:
+        최종 ChatState (응답 캐시에 저장)
+    """
+    final_state = await get_compiled_completion_workflow().ainvoke(state)
+    await astore_cached_state(final_state)
 
     logger.info("워크플로우 완료")
     return final_state
 
 
+async def stream_workflow(
+    user_query: str,
+    user_profile: Optional[UserProfile] = None,
+    response_mode: str = "natural",
+    deadline: Optional[float] = None
+) -> AsyncIterator[Tuple[str, object]]:
+    """
+    워크플로우 실행 (노드 완료 단위 스트리밍)
+
+    노드가 끝날 때마다 (이벤트명, 데이터)를 전달하고,
+    마지막에 ("state", 최종 ChatState)를 전달한다.
+    최종 응답 텍스트는 포함하지 않으며 ResponseFormatter.astream()으로 별도 생성한다.
+
+    Args:
+        user_query: 사용자 쿼리
+        user_profile: 사용자 프로필 (선택)
+        response_mode: 응답 생성 방식 ("natural": GPT 자연어, "structured": 템플릿)
+        deadline: 요청 마감 시각 (epoch 초, 각 LLM 호출의 타임아웃으로 사용)
+
+    Yields:
+        (이벤트명, 데이터) 튜플
+    """
+    logger.info(f"스트리밍 워크플로우 시작: {user_query}")
+
+    state = create_initial_state(user_query, user_profile, response_mode, deadline)
+
+    # 응답 캐시 적중 시 캐시된 결과를 노드 이벤트 순서대로 전달 (response 포함)
+    cached_state = await aload_cached_state(state)
+    if cached_state is not None:
+        for node_name in ("query_analyzer", "llm_fallback", "nutrition_calculator", "exercise_recommender"):
+            for event, key in STREAM_NODE_EVENTS[node_name]:
+                if event != "recipe" or cached_state.get("recipe"):
+                    yield event, cached_state.get(key)
+        yield "state", cached_state
+        return
+
+    workflow = get_compiled_stream_workflow()
+
+    async for update in workflow.astream(state, stream_mode="updates"):
+        for node_name, node_output in update.items():
+            if not node_output:
+                continue
+            state.update(node_output)
+            for event, key in STREAM_NODE_EVENTS.get(node_name, []):
+                yield event, state.get(key)
+
+    logger.info("스트리밍 워크플로우 완료")
+    yield "state", state
+
+
 def run_workflow_sync(
     user_query: str,
-    user_profile: Optional[UserProfile] = None
+    user_profile: Optional[UserProfile] = None,
+    response_mode: str = "natural",
+    deadline: Optional[float] = None
 ) -> ChatState:
     """
-    워크플로우 실행 (동기)
+    워크플로우 실행 (동기, Streamlit 경로, 응답 캐시는 run_workflow()와 공유)
 
     Args:
         user_query: 사용자 쿼리
         user_profile: 사용자 프로필 (선택)
+        response_mode: 응답 생성 방식 ("natural": GPT 자연어, "structured": 템플릿)
+        deadline: 요청 마감 시각 (epoch 초, 각 LLM 호출의 타임아웃으로 사용)
 
     Returns:
         최종 ChatState
@@ -114,11 +484,17 @@ def run_workflow_sync(
     logger.info(f"워크플로우 시작: {user_query}")
 
     # 초기 State 생성
-    initial_state = create_initial_state(user_query, user_profile)
+    initial_state = create_initial_state(user_query, user_profile, response_mode, deadline)
+
+    # 응답 캐시 적중 시 운동 추천만 재계산
+    cached_state = load_cached_state(initial_state)
+    if cached_state is not None:
+        return cached_state
 
     # 워크플로우 실행
     workflow = get_compiled_workflow()
     final_state = workflow.invoke(initial_state)
+    store_cached_state(final_state)
 
     logger.info("워크플로우 완료")
     return final_state
@@ -134,12 +510,16 @@ def get_workflow_diagram() -> str:
     return """
     graph TD
         A[Start] --> B[QueryAnalyzer]
-        B --> C[RecipeFetcher]
+        B -.->|recipe/general| C[RecipeFetcher]
+        B -.-> N[NutritionLookup]
         C --> D[LLM Fallback]
-        D --> E[NutritionCalculator]
-        E --> F[ExerciseRecommender]
-        F --> G[ResponseFormatter]
+        N --> E[NutritionCalculator]
+        D --> F[ExerciseRecommender]
+        E --> F
+        F -.->|natural| G[ResponseFormatter]
+        F -.->|structured| T[TemplateFormatter]
         G --> H[End]
+        T --> H
 
         subgraph "쿼리 분석"
             B[QueryAnalyzer<br/>음식명, 인분 추출]
@@ -151,7 +531,8 @@ def get_workflow_diagram() -> str:
         end
 
         subgraph "영양 분석"
-            E[NutritionCalculator<br/>영양정보 조회/계산]
+            N[NutritionLookup<br/>영양DB 사전 조회]
+            E[NutritionCalculator<br/>영양정보 확정/GPT 추정]
         end
 
         subgraph "운동 추천"
@@ -160,6 +541,7 @@ def get_workflow_diagram() -> str:
 
         subgraph "응답 생성"
             G[ResponseFormatter<br/>자연어 응답 생성]
+            T[TemplateFormatter<br/>템플릿 응답 생성]
         end
     """
 
@@ -261,29 +643,38 @@ def _save_workflow_png_manual(output_path: Path) -> str:
         ("__start__", "START", "#e8f5e9", "ellipse"),
         ("query_analyzer", "QueryAnalyzer\n(음식명/인분 추출)", "#e3f2fd", "box"),
         ("recipe_fetcher", "RecipeFetcher\n(Vector DB 검색)", "#fff3e0", "box"),
+        ("nutrition_lookup", "NutritionLookup\n(영양DB 사전 조회)", "#f3e5f5", "box"),
         ("llm_fallback", "LLM Fallback\n(GPT 레시피 생성)", "#fce4ec", "box"),
-        ("nutrition_calculator", "NutritionCalculator\n(영양정보 계산)", "#f3e5f5", "box"),
+        ("nutrition_calculator", "NutritionCalculator\n(영양정보 확정/GPT 추정)", "#f3e5f5", "box"),
         ("exercise_recommender", "ExerciseRecommender\n(운동 추천)", "#e8eaf6", "box"),
         ("response_formatter", "ResponseFormatter\n(응답 생성)", "#e0f7fa", "box"),
+        ("template_formatter", "TemplateFormatter\n(템플릿 응답)", "#e0f7fa", "box"),
         ("__end__", "END", "#ffebee", "ellipse"),
     ]
 
     for node_id, label, color, shape in nodes:
         dot.node(node_id, label, fillcolor=color, shape=shape)
 
-    # 엣지 정의
+    # 엣지 정의 (src, dst, 조건 라벨)
     edges = [
-        ("__start__", "query_analyzer"),
-        ("query_analyzer", "recipe_fetcher"),
-        ("recipe_fetcher", "llm_fallback"),
-        ("llm_fallback", "nutrition_calculator"),
-        ("nutrition_calculator", "exercise_recommender"),
-        ("exercise_recommender", "response_formatter"),
-        ("response_formatter", "__end__"),
+        ("__start__", "query_analyzer", None),
+        ("query_analyzer", "recipe_fetcher", "recipe/general"),
+        ("query_analyzer", "nutrition_lookup", None),
+        ("recipe_fetcher", "llm_fallback", None),
+        ("nutrition_lookup", "nutrition_calculator", None),
+        ("llm_fallback", "exercise_recommender", None),
+        ("nutrition_calculator", "exercise_recommender", None),
+        ("exercise_recommender", "response_formatter", "natural"),
+        ("exercise_recommender", "template_formatter", "structured"),
+        ("response_formatter", "__end__", None),
+        ("template_formatter", "__end__", None),
     ]
 
-    for src, dst in edges:
-        dot.edge(src, dst)
+    for src, dst, label in edges:
+        if label:
+            dot.edge(src, dst, label=label, style="dashed")
+        else:
+            dot.edge(src, dst)
 
     # PNG 저장
     output_stem = str(output_path.with_suffix(""))
@@ -0,0 +1,474 @@
+"""백그라운드 작업 - DB에 없는 쿼리의 LLM 단계를 로컬 워커 풀에서 실행
+
+POST /api/search (background=true)는 DB 단계(쿼리 분석, 레시피 검색, 영양DB 조회)만 실행하고,
+GPT 생성이 필요하면 DB 단계 결과 State를 작업으로 저장한 뒤 바로 응답한다.
+워커는 저장된 State에서 나머지 단계를 실행하고 최종 State를 저장하며,
+클라이언트는 GET /api/jobs/{job_id}로 결과를 조회한다.
+
+작업 상태는 SQLite에 저장하므로 서버가 재시작되어도 대기/실행 중이던 작업을 다시 실행한다.
+실행 중인 작업에는 실행 프로세스(owner)와 임대 만료 시각(lease_until)을 기록하고 주기적으로 연장하므로,
+같은 저장소를 쓰는 다른 워커 프로세스는 임대가 만료된(중단된) 작업만 넘겨받는다.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from app.config import get_settings
+from app.core.services.metrics import get_metrics_registry
+from app.core.workflow.graph import complete_workflow
+from app.core.workflow.state import ChatState
+
+logger = logging.getLogger(__name__)
+
+# 프로젝트 루트
+PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
+
+# 작업 상태 (pending → running → succeeded | failed)
+JOB_PENDING = "pending"
+JOB_RUNNING = "running"
+JOB_SUCCEEDED = "succeeded"
+JOB_FAILED = "failed"
+FINISHED_STATUSES = (JOB_SUCCEEDED, JOB_FAILED)
+
+_registry = get_metrics_registry()
+_JOBS = _registry.counter("jobs_total", "종료된 백그라운드 작업 수", ("status",))
+_JOB_DURATION = _registry.histogram(
+    "job_duration_seconds", "백그라운드 작업 생성부터 종료까지 걸린 시간",
+    buckets=(0.5, 1, 2.5, 5, 10, 20, 30, 60, 120, 300)
+)
+
+
+class JobStore:
+    """SQLite 기반 작업 저장소
+
+    입력 State(DB 단계 결과)와 최종 State를 JSON으로 저장한다.
+    워커(이벤트 루프)와 조회 API(스레드풀)에서 함께 사용하므로 연결 하나를 Lock으로 보호한다.
+    running 작업은 owner의 임대(lease_until)가 만료되기 전에는 다른 실행자가 가져갈 수 없다.
+    """
+
+    def __init__(self, db_path: Path, lease_seconds: float = 30.0):
+        """
+        Args:
+            db_path: SQLite DB 파일 경로
+            lease_seconds: running 작업 임대 시간 (초, 실행자가 그 안에 연장하지 않으면 중단된 것으로 봄)
+        """
+        self.db_path = db_path
+        self.lease_seconds = lease_seconds
+        self._lock = threading.Lock()
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS jobs (
+                job_id TEXT PRIMARY KEY,
+                status TEXT NOT NULL,
+                state TEXT NOT NULL,
+                result TEXT,
+                error TEXT,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                owner TEXT,
+                lease_until REAL,
+                created_at REAL NOT NULL,
+                updated_at REAL NOT NULL
+            )
+        """)
+        # 임대 컬럼이 없던 기존 저장소
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(jobs)")}
+        for column, column_type in (("owner", "TEXT"), ("lease_until", "REAL")):
+            if column not in columns:
+                self._conn.execute(f"ALTER TABLE jobs ADD COLUMN {column} {column_type}")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs(status, created_at)")
+        self._conn.commit()
+
+    def create(self, state: ChatState) -> str:
+        """작업 생성 → 작업 ID"""
+        job_id = uuid.uuid4().hex
+        now = time.time()
+        payload = json.dumps(state, ensure_ascii=False)
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO jobs (job_id, status, state, created_at, updated_at) VALUES (?, ?, ?, ?, ?)",
+                (job_id, JOB_PENDING, payload, now, now)
+            )
+            self._conn.commit()
+        return job_id
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """작업 조회 (없으면 None)"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT job_id, status, state, result, error, attempts, created_at, updated_at "
+                "FROM jobs WHERE job_id = ?",
+                (job_id,)
+            ).fetchone()
+        if row is None:
+            return None
+
+        job_id, status, state, result, error, attempts, created_at, updated_at = row
+        return {
+            "job_id": job_id,
+            "status": status,
+            "state": json.loads(state),
+            "result": json.loads(result) if result else None,
+            "error": error,
+            "attempts": attempts,
+            "created_at": created_at,
+            "updated_at": updated_at,
+        }
+
+    def mark_running(self, job_id: str, owner: str) -> Optional[Dict[str, Any]]:
+        """
+        pending 작업을 owner의 running으로 변경하고 시도 횟수 증가 → 작업
+
+        이미 실행 중(임대 유효)이거나 종료된 작업이면 None
+        """
+        now = time.time()
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE jobs SET status = ?, owner = ?, lease_until = ?, attempts = attempts + 1, updated_at = ? "
+                "WHERE job_id = ? AND status = ?",
+                (JOB_RUNNING, owner, now + self.lease_seconds, now, job_id, JOB_PENDING)
+            )
+            self._conn.commit()
+            if cursor.rowcount == 0:
+                return None
+        return self.get(job_id)
+
+    def renew(self, job_ids: List[str], owner: str) -> int:
+        """owner가 실행 중인 작업의 임대 연장 → 연장한 작업 수"""
+        if not job_ids:
+            return 0
+        now = time.time()
+        placeholders = ",".join("?" * len(job_ids))
+        with self._lock:
+            cursor = self._conn.execute(
+                f"UPDATE jobs SET lease_until = ? WHERE status = ? AND owner = ? AND job_id IN ({placeholders})",
+                (now + self.lease_seconds, JOB_RUNNING, owner, *job_ids)
+            )
+            self._conn.commit()
+        return cursor.rowcount
+
+    def finish(
+        self,
+        job_id: str,
+        owner: str,
+        status: str,
+        result: Optional[ChatState] = None,
+        error: Optional[str] = None
+    ) -> bool:
+        """
+        작업 종료 (succeeded: 최종 State, failed: 에러 메시지)
+
+        Returns:
+            기록 여부 (임대가 만료되어 다른 실행자가 가져간 작업이면 False)
+        """
+        payload = json.dumps(result, ensure_ascii=False) if result is not None else None
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE jobs SET status = ?, result = ?, error = ?, lease_until = NULL, updated_at = ? "
+                "WHERE job_id = ? AND status = ? AND owner = ?",
+                (status, payload, error, time.time(), job_id, JOB_RUNNING, owner)
+            )
+            self._conn.commit()
+        return cursor.rowcount > 0
+
+    def release(self, owner: str) -> int:
+        """owner가 실행 중이던 작업을 pending으로 되돌림 (정상 종료 시) → 작업 수"""
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE jobs SET status = ?, owner = NULL, lease_until = NULL, updated_at = ? "
+                "WHERE status = ? AND owner = ?",
+                (JOB_PENDING, time.time(), JOB_RUNNING, owner)
+            )
+            self._conn.commit()
+        return cursor.rowcount
+
+    def expire(self) -> List[str]:
+        """
+        임대가 만료된 running 작업(중단된 프로세스가 실행하던 작업)을 pending으로 되돌림 → 작업 ID 목록
+
+        임대가 유효한 작업은 이 프로세스나 다른 워커 프로세스가 실행 중이므로 건드리지 않는다.
+        """
+        now = time.time()
+        condition = "status = ? AND (lease_until IS NULL OR lease_until < ?)"
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT job_id FROM jobs WHERE {condition} ORDER BY created_at", (JOB_RUNNING, now)
+            ).fetchall()
+            self._conn.execute(
+                f"UPDATE jobs SET status = ?, owner = NULL, lease_until = NULL, updated_at = ? WHERE {condition}",
+                (JOB_PENDING, now, JOB_RUNNING, now)
+            )
+            self._conn.commit()
+        return [row[0] for row in rows]
+
+    def recover(self) -> List[str]:
+        """
+        재시작 시 이어서 실행할 작업 ID 목록 (생성 순)
+
+        임대가 만료된 running 작업만 pending으로 되돌린 뒤 pending 작업을 모두 돌려준다.
+        """
+        self.expire()
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT job_id FROM jobs WHERE status = ? ORDER BY created_at", (JOB_PENDING,)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def prune(self, older_than: float) -> int:
+        """종료 시각이 older_than(epoch 초)보다 오래된 종료 작업 삭제 → 삭제 수"""
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM jobs WHERE status IN (?, ?) AND updated_at < ?",
+                (*FINISHED_STATUSES, older_than)
+            )
+            self._conn.commit()
+        return cursor.rowcount
+
+
+class JobManager:
+    """백그라운드 작업 관리자 (SQLite 저장소 + asyncio 워커 풀)
+
+    LLM 단계는 AsyncOpenAI로 실행되므로 워커는 이벤트 루프의 태스크로 충분하다.
+    워커 수(JOB_WORKERS)가 동시에 실행되는 LLM 단계 수의 상한이 된다.
+    실행 중인 작업의 임대는 임대 시간의 1/3마다 연장하고, 같은 주기로 만료된 작업을 넘겨받는다.
+    """
+
+    def __init__(
+        self,
+        store: JobStore,
+        workers: int = 4,
+        timeout_seconds: float = 120.0,
+        max_attempts: int = 3,
+        retention_seconds: float = 86400.0
+    ):
+        """
+        Args:
+            store: 작업 저장소
+            workers: 워커 수
+            timeout_seconds: 작업 하나의 예산 (초, 각 LLM 호출의 타임아웃으로 사용)
+            max_attempts: 재시작으로 중단된 작업의 최대 실행 횟수 (넘으면 failed)
+            retention_seconds: 종료된 작업 보관 시간 (초)
+        """
+        self.store = store
+        self.workers = workers
+        self.timeout_seconds = timeout_seconds
+        self.max_attempts = max_attempts
+        self.retention_seconds = retention_seconds
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+        self._waiters: Dict[str, asyncio.Event] = {}
+        self._running = 0
+        # 이 프로세스의 실행자 ID (같은 저장소를 쓰는 워커 프로세스 구분)
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._owned: set = set()
+
+    def start(self, after: Optional[asyncio.Task] = None):
+        """
+        워커 시작 (이미 시작했으면 무시)
+
+        Args:
+            after: 중단된 작업을 다시 실행하기 전에 기다릴 태스크 (예열 중 싱글톤을 중복 생성하지 않도록)
+        """
+        if self._tasks:
+            return
+        self._queue = asyncio.Queue()
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+        self._tasks.append(asyncio.create_task(self._recover(after)))
+        self._tasks.append(asyncio.create_task(self._keep_leases()))
+        logger.info(f"백그라운드 작업 워커 시작: {self.workers}개 ({self.store.db_path})")
+
+    async def stop(self):
+        """
+        워커 중지
+
+        실행 중이던 작업은 pending으로 되돌려 다음 시작 시(또는 다른 워커 프로세스가) 다시 실행한다.
+        """
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if tasks:
+            released = await asyncio.to_thread(self.store.release, self.owner)
+            if released:
+                logger.info(f"실행 중이던 백그라운드 작업 반환: {released}개")
+
+    async def submit(self, state: ChatState) -> str:
+        """
+        DB 단계 결과 State로 작업 생성 → 작업 ID
+
+        요청 마감 시간은 저장하지 않는다 (작업 실행 시 JOB_TIMEOUT_SECONDS로 새로 계산).
+        """
+        self.start()
+        payload = {key: value for key, value in state.items() if key != "deadline"}
+        job_id = await asyncio.to_thread(self.store.create, payload)
+        self._queue.put_nowait(job_id)
+        logger.info(f"백그라운드 작업 생성: {job_id}")
+        return job_id
+
+    async def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """작업 조회 (없으면 None)"""
+        return await asyncio.to_thread(self.store.get, job_id)
+
+    async def wait(self, job_id: str, timeout: float) -> Optional[Dict[str, Any]]:
+        """
+        작업이 종료될 때까지 최대 timeout초 대기 후 조회 (롱 폴링)
+
+        Returns:
+            작업 (없으면 None)
+        """
+        if timeout <= 0:
+            return await self.get(job_id)
+
+        # 조회와 대기 사이에 작업이 끝나도 알림을 놓치지 않도록 이벤트를 먼저 등록
+        event = self._waiters.setdefault(job_id, asyncio.Event())
+        job = await self.get(job_id)
+        if job is None or job["status"] in FINISHED_STATUSES:
+            if self._waiters.get(job_id) is event and not event.is_set():
+                self._waiters.pop(job_id, None)
+            return job
+
+        try:
+            await asyncio.wait_for(event.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        return await self.get(job_id)
+
+    def get_stats(self) -> Dict[str, int]:
+        """대기 중/실행 중 작업 수"""
+        return {
+            "queue_depth": self._queue.qsize() if self._queue is not None else 0,
+            "running": self._running,
+        }
+
+    async def _recover(self, after: Optional[asyncio.Task]):
+        """이전 프로세스에서 끝나지 않은 작업 다시 실행 + 오래된 작업 정리"""
+        if after is not None:
+            await asyncio.wait([after])
+
+        pruned = await asyncio.to_thread(self.store.prune, time.time() - self.retention_seconds)
+        job_ids = await asyncio.to_thread(self.store.recover)
+        for job_id in job_ids:
+            self._queue.put_nowait(job_id)
+        if job_ids or pruned:
+            logger.info(f"백그라운드 작업 복구: {len(job_ids)}개 재실행, {pruned}개 정리")
+
+    async def _keep_leases(self):
+        """실행 중인 작업의 임대 연장 + 다른 프로세스에서 중단된(임대 만료) 작업 넘겨받기"""
+        interval = self.store.lease_seconds / 3
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await asyncio.to_thread(self.store.renew, list(self._owned), self.owner)
+                job_ids = await asyncio.to_thread(self.store.expire)
+            except Exception as e:
+                logger.error(f"백그라운드 작업 임대 연장 실패: {e}")
+                continue
+            for job_id in job_ids:
+                self._queue.put_nowait(job_id)
+            if job_ids:
+                logger.info(f"임대가 만료된 백그라운드 작업 재실행: {len(job_ids)}개")
+
+    async def _worker(self):
+        while True:
+            job_id = await self._queue.get()
+            self._running += 1
+            try:
+                await self._run(job_id)
+            except Exception as e:
+                logger.error(f"백그라운드 작업 처리 실패 ({job_id}): {e}")
+            finally:
+                self._running -= 1
+                self._owned.discard(job_id)
+
+    async def _run(self, job_id: str):
+        """작업 하나 실행 (복구와 새 작업이 같은 ID를 넣어도 한 번만 실행)"""
+        job = await asyncio.to_thread(self.store.mark_running, job_id, self.owner)
+        if job is None:
+            return
+        self._owned.add(job_id)
+
+        if job["attempts"] > self.max_attempts:
+            logger.warning(f"백그라운드 작업 최대 실행 횟수 초과: {job_id}")
+            await self._finish(job, JOB_FAILED, error="최대 실행 횟수를 초과했습니다")
+            return
+
+        state = job["state"]
+        state["deadline"] = time.time() + self.timeout_seconds
+        try:
+            final_state = await complete_workflow(state)
+        except Exception as e:
+            logger.error(f"백그라운드 작업 실패 ({job_id}): {e}")
+            await self._finish(job, JOB_FAILED, error=str(e))
+            return
+
+        final_state = {key: value for key, value in final_state.items() if key != "deadline"}
+        await self._finish(job, JOB_SUCCEEDED, result=final_state)
+        logger.info(f"백그라운드 작업 완료: {job_id}")
+
+    async def _finish(self, job: Dict[str, Any], status: str, result: Optional[ChatState] = None, error: Optional[str] = None):
+        job_id = job["job_id"]
+        recorded = await asyncio.to_thread(self.store.finish, job_id, self.owner, status, result, error)
+        if not recorded:
+            logger.warning(f"백그라운드 작업 임대 만료로 결과 폐기: {job_id}")
+            return
+        _JOBS.inc(status)
+        _JOB_DURATION.observe(time.time() - job["created_at"])
+
+        # 종료 상태가 기록된 작업만 롱 폴링 대기자에게 알림
+        event = self._waiters.pop(job_id, None)
+        if event is not None:
+            event.set()
+
+
+def _collect_metrics():
+    """대기 중/실행 중 작업 수 (/metrics 스크레이프 시 호출)"""
+    manager = _job_manager
+    if manager is None:
+        return
+    stats = manager.get_stats()
+    yield "jobs_queue_depth", "gauge", "대기 중인 백그라운드 작업 수", [({}, stats["queue_depth"])]
+    yield "jobs_running", "gauge", "실행 중인 백그라운드 작업 수", [({}, stats["running"])]
+
+
+_registry.register_collector(_collect_metrics)
+
+
+# 싱글톤 인스턴스
+_job_manager: Optional[JobManager] = None
+_job_manager_initialized = False
+
+
+def get_job_manager() -> Optional[JobManager]:
+    """JobManager 싱글톤 인스턴스 반환 (JOBS_ENABLED=false거나 저장소를 열 수 없으면 None)"""
+    global _job_manager, _job_manager_initialized
+    if not _job_manager_initialized:
+        settings = get_settings()
+        if settings.jobs_enabled:
+            db_path = Path(settings.jobs_db_path)
+            if not db_path.is_absolute():
+                db_path = PROJECT_ROOT / db_path
+            try:
+                _job_manager = JobManager(
+                    JobStore(db_path, lease_seconds=settings.job_lease_seconds),
+                    workers=settings.job_workers,
+                    timeout_seconds=settings.job_timeout_seconds,
+                    max_attempts=settings.job_max_attempts,
+                    retention_seconds=settings.job_retention_seconds
+                )
+            except Exception as e:
+                logger.warning(f"백그라운드 작업 저장소 초기화 실패, 작업 모드 비활성: {e}")
+        _job_manager_initialized = True
+    return _job_manager
@@ -0,0 +1,101 @@
+"""워크플로우 응답 캐시 - 프로필과 무관한 결과 저장/복원"""
+
+import logging
+from typing import Optional
+
+from app.core.agents.exercise_recommender import recommend_exercises
+from app.core.agents.response_formatter import render_response
+from app.core.services.pipeline_cache import get_pipeline_cache
+from app.core.services.query_cache import normalize_query
+from app.core.workflow.state import ChatState
+
+logger = logging.getLogger(__name__)
+
+# 캐시하는 State 키 (user_profile에 의존하지 않는 결과)
+CACHED_KEYS = ("analyzed_query", "recipe", "recipe_source", "nutrition", "response_skeleton")
+
+
+def cache_key(state: ChatState) -> Optional[str]:
+    """정규화된 쿼리 + 응답 방식 (정규화 결과가 비면 None)"""
+    normalized = normalize_query(state.get("user_query", ""))
+    if not normalized:
+        return None
+    return f"{state.get('response_mode', 'natural')}:{normalized}"
+
+
+def is_cacheable(state: ChatState) -> bool:
+    """
+    캐시 저장 가능 여부
+
+    예산 소진/LLM 실패로 대체 경로를 사용한 결과나 에러가 있는 결과는
+    다음 요청에서 정상 결과를 받을 수 있도록 저장하지 않는다.
+    """
+    return (
+        not state.get("error")
+        and not state.get("degraded_stages")
+        and bool(state.get("response_skeleton"))
+    )
+
+
+def _restore(state: ChatState, cached: dict) -> ChatState:
+    """캐시된 결과로 State 복원 → 운동 추천 재계산 → 응답 렌더링"""
+    state.update({key: cached[key] for key in CACHED_KEYS if key in cached})
+    state = recommend_exercises(state)
+    state["response"] = render_response(state["response_skeleton"], state)
+    state["cache_status"] = "hit"
+    return state
+
+
+def load_cached_state(state: ChatState) -> Optional[ChatState]:
+    """캐시 적중 시 완성된 State, 아니면 None (state의 cache_status 갱신)"""
+    cache = get_pipeline_cache()
+    key = cache_key(state) if cache else None
+    if key is None:
+        state["cache_status"] = "bypass"
+        return None
+
+    cached = cache.get(key)
+    if cached is None:
+        state["cache_status"] = "miss"
+        return None
+
+    logger.info(f"응답 캐시 적중: {key}")
+    return _restore(state, cached)
+
+
+async def aload_cached_state(state: ChatState) -> Optional[ChatState]:
+    """load_cached_state()의 비동기 버전"""
+    cache = get_pipeline_cache()
+    key = cache_key(state) if cache else None
+    if key is None:
+        state["cache_status"] = "bypass"
+        return None
+
+    cached = await cache.aget(key)
+    if cached is None:
+        state["cache_status"] = "miss"
+        return None
+
+    logger.info(f"응답 캐시 적중: {key}")
+    return _restore(state, cached)
+
+
+def _snapshot(state: ChatState) -> Optional[dict]:
+    """저장할 결과 (캐시 미스가 아니거나 저장 불가면 None)"""
+    if state.get("cache_status") != "miss" or not is_cacheable(state):
+        return None
+    return {key: state[key] for key in CACHED_KEYS if key in state}
+
+
+def store_cached_state(state: ChatState):
+    """캐시 미스로 실행된 워크플로우 결과 저장"""
+    snapshot = _snapshot(state)
+    if snapshot is not None:
+        get_pipeline_cache().set(cache_key(state), snapshot)
+
+
+async def astore_cached_state(state: ChatState):
+    """store_cached_state()의 비동기 버전"""
+    snapshot = _snapshot(state)
+    if snapshot is not None:
+        await get_pipeline_cache().aset(cache_key(state), snapshot)
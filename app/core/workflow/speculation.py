@@ -0,0 +1,288 @@
+"""LLM fallback 투기 실행 - DB 미스가 예상되면 벡터 검색과 GPT 생성을 동시에 시작
+
+RecipeFetcher가 이름 매칭에 실패해 벡터 검색(임베딩 호출)을 해야 할 때,
+미스 예측기가 DB에 없을 것으로 판단하면 GPT 레시피 생성을 먼저 시작한다.
+영양DB 사전 조회에도 결과가 없으면 GPT 영양정보 추정도 함께 시작한다
+(레시피 미스 시 두 생성이 병렬로 실행되므로 하나만 앞당기면 지연이 줄지 않음).
+벡터 검색이 결과를 찾으면 생성 결과는 버리고, 못 찾으면 LLMFallback이
+이미 진행 중인 생성 결과를 이어받아 벡터 검색 시간만큼 지연을 줄인다.
+
+미스 예측:
+    - 음식명별 벡터 검색 결과(적중/미스)를 학습해 미스 비율이 임계값 이상이면 예측
+    - 관측이 부족하면 음식명 사전(레시피/영양정보 DB 음식명)에 없는 이름을 미스로 예측
+
+버려진 생성 호출은 취소하지 않고 끝까지 실행한다.
+같은 음식의 생성을 single-flight로 공유하는 다른 요청이 있을 수 있어,
+leader를 취소하면 그 요청까지 실패하기 때문이다.
+"""
+
+import asyncio
+import contextvars
+import logging
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, Optional, Set, Tuple
+
+from app.config import get_settings
+from app.core.services.dish_matcher import get_dish_matcher
+from app.core.services.llm_service import get_llm_service
+from app.core.services.metrics import get_metrics_registry
+from app.core.workflow.deadline import llm_timeout
+from app.core.workflow.state import ChatState
+
+logger = logging.getLogger(__name__)
+
+# 현재 워크플로우 실행의 투기 실행 상태
+# run_workflow()가 설정하며 LangGraph 노드 태스크로 전파된다
+_speculations: contextvars.ContextVar[Optional["_Speculations"]] = (
+    contextvars.ContextVar("speculations", default=None)
+)
+
+# 버려진 생성 태스크 (완료 전에 GC되지 않도록 참조 유지)
+_discarded: Set[asyncio.Task] = set()
+
+_registry = get_metrics_registry()
+_OUTCOMES = _registry.counter(
+    "speculative_fallback_total",
+    "GPT 투기 생성 결과 (used: 사용, wasted: DB 적중으로 버림, missed: 미스 예측 실패)",
+    ("kind", "outcome")
+)
+_SAVED = _registry.histogram(
+    "speculative_fallback_saved_seconds",
+    "투기 생성으로 줄인 GPT 생성 대기 시간",
+    ("kind",),
+    buckets=(0.05, 0.1, 0.25, 0.5, 1, 2, 5, 10)
+)
+
+
+@dataclass
+class SpeculativeCall:
+    """진행 중인 투기 생성"""
+    task: asyncio.Task
+    started_at: float
+    finished_at: Optional[float] = None
+
+    def __post_init__(self):
+        self.task.add_done_callback(self._on_done)
+
+    def _on_done(self, task: asyncio.Task):
+        self.finished_at = time.perf_counter()
+
+
+@dataclass
+class _Speculations:
+    """워크플로우 실행 하나의 투기 생성 상태 (이벤트 루프 안에서만 접근)"""
+    # (종류, 음식명, 인분) → 진행 중인 생성
+    calls: Dict[Tuple[str, str, int], SpeculativeCall] = field(default_factory=dict)
+    # 레시피 미스로 예측한 음식명
+    predicted_misses: Set[str] = field(default_factory=set)
+    # 영양DB 사전 조회에 결과가 없던 음식명 → State (영양정보 추정 시작용)
+    nutrition_misses: Dict[str, ChatState] = field(default_factory=dict)
+
+
+class MissPredictor:
+    """음식명별 벡터 검색 미스 비율 학습 (LRU)"""
+
+    def __init__(self, threshold: float = 0.5, min_observations: int = 3, max_size: int = 10000):
+        """
+        Args:
+            threshold: 미스로 예측할 최소 미스 비율
+            min_observations: 학습된 비율을 사용할 최소 관측 수 (미만이면 음식명 사전으로 판단)
+            max_size: 기억할 최대 음식명 수
+        """
+        self.threshold = threshold
+        self.min_observations = min_observations
+        self.max_size = max_size
+
+        self._history: "OrderedDict[str, Tuple[int, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def predict_miss(self, food_name: str) -> bool:
+        """벡터 검색이 결과를 찾지 못할 것으로 예상되면 True"""
+        with self._lock:
+            misses, total = self._history.get(food_name, (0, 0))
+
+        if total >= self.min_observations:
+            return misses / total >= self.threshold
+
+        try:
+            return not get_dish_matcher().contains(food_name)
+        except Exception as e:
+            logger.warning(f"음식명 사전 조회 실패: {e}")
+            return False
+
+    def record(self, food_name: str, missed: bool):
+        """벡터 검색 결과 기록"""
+        with self._lock:
+            misses, total = self._history.pop(food_name, (0, 0))
+            self._history[food_name] = (misses + int(missed), total + 1)
+            while len(self._history) > self.max_size:
+                self._history.popitem(last=False)
+
+
+@contextmanager
+def speculative_fallback() -> Iterator[None]:
+    """이 컨텍스트(및 여기서 생성된 태스크)의 워크플로우에서 투기 생성 사용 (SPECULATIVE_FALLBACK_ENABLED)"""
+    if not get_settings().speculative_fallback_enabled:
+        yield
+        return
+
+    token = _speculations.set(_Speculations())
+    try:
+        yield
+    finally:
+        for call in _speculations.get().calls.values():
+            _discard(call)
+        _speculations.reset(token)
+
+
+def start_speculative_recipe(state: ChatState, food_name: str) -> bool:
+    """
+    DB 미스가 예상되면 GPT 레시피 생성 시작 (벡터 검색 직전에 호출)
+
+    영양DB 사전 조회에도 결과가 없었으면 GPT 영양정보 추정도 함께 시작한다.
+
+    Returns:
+        생성을 시작했으면 True
+    """
+    speculations = _speculations.get()
+    if speculations is None or not get_miss_predictor().predict_miss(food_name):
+        return False
+
+    if not _start(speculations, "recipe", state, food_name):
+        return False
+
+    speculations.predicted_misses.add(food_name)
+    nutrition_state = speculations.nutrition_misses.get(food_name)
+    if nutrition_state is not None:
+        _start(speculations, "nutrition", nutrition_state, food_name)
+    return True
+
+
+def note_nutrition_miss(state: ChatState, food_name: str):
+    """
+    영양DB 사전 조회에 결과가 없음을 기록 (레시피 미스로 예측했으면 GPT 영양정보 추정 시작)
+
+    레시피 검색과 영양DB 조회는 병렬로 실행되므로 나중에 끝난 쪽이 영양정보 추정을 시작한다.
+    """
+    speculations = _speculations.get()
+    if speculations is None or not food_name:
+        return
+
+    speculations.nutrition_misses[food_name] = state
+    if food_name in speculations.predicted_misses:
+        _start(speculations, "nutrition", state, food_name)
+
+
+def resolve_speculative_recipe(food_name: str, speculated: bool, missed: bool):
+    """
+    벡터 검색 결과 반영 (미스 비율 학습 + 적중 시 투기 생성 폐기)
+
+    Args:
+        food_name: 검색한 음식명
+        speculated: start_speculative_recipe()로 생성을 시작했는지 여부
+        missed: 벡터 검색이 결과를 찾지 못했는지 여부
+    """
+    get_miss_predictor().record(food_name, missed)
+    speculations = _speculations.get()
+    if speculations is None:
+        return
+
+    if speculated and not missed:
+        logger.info(f"DB 적중, GPT 투기 생성 폐기: {food_name}")
+        speculations.predicted_misses.discard(food_name)
+        for key in [key for key in speculations.calls if key[1] == food_name]:
+            _discard(speculations.calls.pop(key))
+            _OUTCOMES.inc(key[0], "wasted")
+    elif missed and not speculated:
+        _OUTCOMES.inc("recipe", "missed")
+
+
+def take_speculative(kind: str, food_name: str, servings: int) -> Optional[asyncio.Task]:
+    """
+    진행 중인 투기 생성 인계 (LLMFallback에서 호출)
+
+    Args:
+        kind: "recipe" (레시피 생성) 또는 "nutrition" (영양정보 추정)
+        food_name: 음식명
+        servings: 인분 수
+
+    Returns:
+        생성 태스크 (투기 생성이 없으면 None)
+    """
+    speculations = _speculations.get()
+    call = speculations.calls.pop((kind, food_name, servings), None) if speculations else None
+    if call is None:
+        return None
+
+    # 인계 시점까지(끝났으면 생성 완료까지) 진행된 시간만큼 대기 시간이 줄어든다
+    _OUTCOMES.inc(kind, "used")
+    _SAVED.observe((call.finished_at or time.perf_counter()) - call.started_at, kind)
+    return call.task
+
+
+def _start(speculations: _Speculations, kind: str, state: ChatState, food_name: str) -> bool:
+    """GPT 생성 태스크 시작 (LLM 서비스가 준비되지 않았거나 요청 예산이 부족하면 False)"""
+    llm_service = get_llm_service()
+    stage = "llm_fallback" if kind == "recipe" else "nutrition_calculator"
+    timeout = llm_timeout(state, stage)
+    if not llm_service.is_ready or timeout == 0:
+        return False
+
+    servings = state.get("analyzed_query", {}).get("servings", 1)
+    key = (kind, food_name, servings)
+    if key in speculations.calls:
+        return True
+
+    logger.info(f"DB 미스 예상, GPT 생성 먼저 시작 ({kind}): {food_name}")
+    if get_settings().llm_combined_generation_enabled:
+        # 레시피/영양정보 투기 생성이 같은 통합 호출을 공유 (single-flight)
+        coroutine = _generate_part(kind, food_name, servings, timeout)
+    elif kind == "recipe":
+        coroutine = llm_service.agenerate_recipe(food_name, servings, timeout)
+    else:
+        coroutine = llm_service.agenerate_nutrition(food_name, servings, timeout)
+    task = asyncio.create_task(coroutine)
+    speculations.calls[key] = SpeculativeCall(task, time.perf_counter())
+    return True
+
+
+async def _generate_part(kind: str, food_name: str, servings: int, timeout: Optional[float]) -> Optional[Dict]:
+    """레시피+영양정보 통합 생성 결과 중 kind 부분"""
+    generated = await get_llm_service().agenerate_recipe_with_nutrition(food_name, servings, timeout)
+    return generated[kind] if generated else None
+
+
+def _discard(call: SpeculativeCall):
+    """생성 결과를 버림 (single-flight를 공유하는 요청이 있을 수 있어 취소하지 않음)"""
+    if call.task.done():
+        _consume(call.task)
+        return
+    _discarded.add(call.task)
+    call.task.add_done_callback(_consume)
+
+
+def _consume(task: asyncio.Task):
+    _discarded.discard(task)
+    if not task.cancelled():
+        task.exception()
+
+
+# 싱글톤 인스턴스
+_miss_predictor: Optional[MissPredictor] = None
+
+
+def get_miss_predictor() -> MissPredictor:
+    """MissPredictor 싱글톤 인스턴스 반환"""
+    global _miss_predictor
+    if _miss_predictor is None:
+        settings = get_settings()
+        _miss_predictor = MissPredictor(
+            threshold=settings.speculative_miss_threshold,
+            min_observations=settings.speculative_min_observations,
+            max_size=settings.speculative_history_size
+        )
+    return _miss_predictor
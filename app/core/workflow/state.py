@@ -1,6 +1,20 @@
 """LangGraph 워크플로우 State 정의"""
 
-from typing import TypedDict, Optional, List, Literal
+from typing import Annotated, TypedDict, Optional, List, Literal
+
+
+def merge_error(current: Optional[str], new: Optional[str]) -> Optional[str]:
+    """병렬 노드의 에러 병합 (먼저 기록된 에러 유지)"""
+    return current or new
+
+
+def merge_stages(current: Optional[List[str]], new: Optional[List[str]]) -> List[str]:
+    """병렬 노드의 성능 저하 단계 병합 (순서 유지, 중복 제거)"""
+    merged = list(current or [])
+    for stage in new or []:
+        if stage not in merged:
+            merged.append(stage)
+    return merged
 
 
 class UserProfile(TypedDict, total=False):
@@ -73,13 +87,32 @@ class ChatState(TypedDict, total=False):
     Flow:
         1. user_query → QueryAnalyzer → analyzed_query
         2. analyzed_query → RecipeFetcher → recipe, recipe_source
-        3. recipe → NutritionCalculator → nutrition
+           analyzed_query → NutritionCalculator.lookup → nutrition (병렬)
+        3. recipe_source → LLMFallback → recipe
+           recipe + nutrition → NutritionCalculator (+ GPT 추정) → nutrition (병렬)
         4. nutrition + user_profile → ExerciseRecommender → exercise_recommendations
-        5. all data → ResponseFormatter → response
+        5. all data → ResponseFormatter → response (+ response_skeleton)
+
+    응답 캐시:
+        프로필과 무관한 결과(analyzed_query, recipe, nutrition, response_skeleton)를
+        정규화된 쿼리 기준으로 캐시하고, 적중 시 운동 추천만 다시 계산해 응답을 완성
+
+    조건부 라우팅:
+        - query_type이 nutrition/exercise면 2~3단계의 레시피 분기를 생략
+        - response_mode가 structured거나 응답할 데이터가 없으면 GPT 대신 템플릿 응답
+
+    요청 예산:
+        deadline까지 남은 시간을 각 LLM 호출의 타임아웃으로 사용하고,
+        예산이 소진되면 LLM 없는 경로로 대체한 뒤 degraded_stages에 기록
+
+    병렬 노드는 자신이 담당하는 키만 반환하며,
+    여러 노드가 쓸 수 있는 키는 Annotated reducer로 병합한다.
     """
     # 입력
     user_query: str                                     # 사용자 쿼리
     user_profile: Optional[UserProfile]                 # 사용자 프로필 (선택)
+    response_mode: Literal["natural", "structured"]     # 응답 생성 방식 (structured: GPT 포맷팅 생략)
+    deadline: Optional[float]                           # 요청 마감 시각 (epoch 초, None이면 무제한)
 
     # QueryAnalyzer 출력
     analyzed_query: AnalyzedQuery                       # 파싱된 쿼리
@@ -96,20 +129,29 @@ class ChatState(TypedDict, total=False):
 
     # ResponseFormatter 출력
     response: str                                       # 최종 응답
+    response_skeleton: str                              # 운동 추천 자리표시자가 남은 응답 골격 (캐시용)
+
+    # 파이프라인 캐시
+    cache_status: Literal["hit", "miss", "bypass"]      # 응답 캐시 상태 (bypass: 캐시 비활성/저장 불가)
 
     # 에러 처리
-    error: Optional[str]                                # 에러 메시지
+    error: Annotated[Optional[str], merge_error]        # 에러 메시지
+    degraded_stages: Annotated[List[str], merge_stages]  # 예산 소진/LLM 실패로 대체 경로를 사용한 단계
 
 
 def create_initial_state(
     user_query: str,
-    user_profile: Optional[UserProfile] = None
+    user_profile: Optional[UserProfile] = None,
+    response_mode: str = "natural",
+    deadline: Optional[float] = None
 ) -> ChatState:
     """초기 State 생성
 
     Args:
         user_query: 사용자 쿼리
         user_profile: 사용자 프로필 (선택)
+        response_mode: 응답 생성 방식 ("natural": GPT 자연어, "structured": 템플릿)
+        deadline: 요청 마감 시각 (epoch 초, 선택)
 
     Returns:
         초기화된 ChatState
@@ -117,13 +159,18 @@ def create_initial_state(
     return ChatState(
         user_query=user_query,
         user_profile=user_profile,
+        response_mode=response_mode,
+        deadline=deadline,
         analyzed_query={},
         recipe={},
         recipe_source="database",
         nutrition={},
         exercise_recommendations=[],
         response="",
-        error=None
+        response_skeleton="",
+        cache_status="miss",
+        error=None,
+        degraded_stages=[]
     )
 
 
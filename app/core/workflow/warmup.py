@@ -0,0 +1,290 @@
+"""서비스 예열 - 싱글톤 병렬 초기화, 워크플로우 컴파일, 캐시 사전 채우기"""
+
+import asyncio
+import logging
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from app.config import get_settings
+from app.core.agents.exercise_recommender import get_exercise_recommender
+from app.core.agents.llm_fallback import get_llm_fallback_agent
+from app.core.agents.nutrition_calculator import get_nutrition_calculator
+from app.core.agents.query_analyzer import get_query_analyzer
+from app.core.agents.recipe_fetcher import get_recipe_fetcher
+from app.core.agents.response_formatter import get_response_formatter
+from app.core.services.answer_cards import get_answer_card_store
+from app.core.services.calorie_calculator import get_calorie_calculator
+from app.core.services.dish_matcher import get_dish_matcher
+from app.core.services.embedding_service import get_embedding_service
+from app.core.services.llm_service import get_llm_service
+from app.core.services.nutrition_db_service import get_nutrition_db_service
+from app.core.services.openai_client import get_async_openai_client, get_openai_client
+from app.core.services.pipeline_cache import get_pipeline_cache
+from app.core.services.query_cache import get_query_cache
+from app.core.services.recipe_catalog import get_recipe_catalog
+from app.core.services.token_budget import get_token_counter
+from app.core.services.vector_db_service import get_vector_db_service
+from app.core.workflow.deadline import create_deadline
+from app.core.workflow.graph import get_compiled_stream_workflow, get_compiled_workflow, run_workflow
+
+logger = logging.getLogger(__name__)
+
+# 프로젝트 루트
+PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
+
+
+def _warm_vector_db() -> Dict[str, Any]:
+    service = get_vector_db_service()
+    return {"ready": service.is_ready, "total_vectors": service.warm_up()}
+
+
+def _warm_nutrition_db() -> Dict[str, Any]:
+    service = get_nutrition_db_service()
+    return {
+        "ready": service.is_ready,
+        "total_records": service.warm_up(),
+        "data_version": service.data_version,
+    }
+
+
+def _warm_caches() -> Dict[str, Any]:
+    pipeline_cache = get_pipeline_cache()
+    return {
+        "query_cache_size": get_query_cache().get_stats()["size"],
+        "pipeline_cache_enabled": pipeline_cache is not None,
+    }
+
+
+def _warm_model_services() -> Dict[str, Any]:
+    get_openai_client()
+    get_embedding_service()
+    get_llm_service()
+    get_calorie_calculator()
+    # 토큰 인코딩 파일은 첫 사용 시 내려받으므로 요청 전에 로드
+    return {"exact_token_count": get_token_counter().is_exact}
+
+
+def _warm_recipe_catalog() -> Dict[str, Any]:
+    catalog = get_recipe_catalog()
+    return {"total_recipes": catalog.total_recipes, "data_version": catalog.data_version}
+
+
+def _warm_dish_matcher() -> Dict[str, Any]:
+    return {"dish_count": get_dish_matcher().dish_count}
+
+
+def _warm_answer_cards() -> Dict[str, Any]:
+    store = get_answer_card_store()
+    if store is None:
+        return {"enabled": False}
+    return {"enabled": True, "total_cards": store.total_cards}
+
+
+def _warm_agents() -> Dict[str, Any]:
+    for getter in (
+        get_query_analyzer, get_recipe_fetcher, get_llm_fallback_agent,
+        get_nutrition_calculator, get_exercise_recommender, get_response_formatter
+    ):
+        getter()
+    return {}
+
+
+def _warm_workflow() -> Dict[str, Any]:
+    get_compiled_workflow()
+    get_compiled_stream_workflow()
+    return {}
+
+
+# 단계별 예열 작업 (같은 단계는 병렬 실행, 다음 단계는 이전 단계 싱글톤에 의존)
+# 싱글톤 getter는 잠금이 없으므로 같은 싱글톤을 두 작업이 동시에 만들지 않도록 나눈다.
+WARMUP_PHASES: List[Dict[str, Callable[[], Dict[str, Any]]]] = [
+    {
+        "vector_db": _warm_vector_db,
+        "nutrition_db": _warm_nutrition_db,
+        "caches": _warm_caches,
+        "model_services": _warm_model_services,
+    },
+    {
+        "dish_matcher": _warm_dish_matcher,
+        "recipe_catalog": _warm_recipe_catalog,
+        "answer_cards": _warm_answer_cards,
+        "agents": _warm_agents,
+        "workflow": _warm_workflow,
+    },
+]
+
+
+# 예열에 실패하면 준비 완료로 보지 않는 구성 요소 (나머지는 대체 경로가 있어 기록만 함)
+CRITICAL_COMPONENTS = ("vector_db", "workflow")
+
+
+def load_warm_queries(path: str) -> List[str]:
+    """예열 쿼리 파일 로드 (한 줄에 쿼리 하나, 빈 줄/# 주석 무시)"""
+    if not path:
+        return []
+
+    file_path = Path(path)
+    if not file_path.is_absolute():
+        file_path = PROJECT_ROOT / file_path
+    if not file_path.exists():
+        logger.warning(f"예열 쿼리 파일 없음: {file_path}")
+        return []
+
+    with open(file_path, "r", encoding="utf-8") as f:
+        lines = (line.strip() for line in f)
+        return [line for line in lines if line and not line.startswith("#")]
+
+
+class WarmupManager:
+    """
+    시작 시 예열 관리
+
+    서버는 예열과 동시에 요청을 받을 수 있고(/api/health),
+    로드밸런서는 예열이 끝날 때까지 /api/ready의 503 응답으로 트래픽을 보내지 않는다.
+    CRITICAL_COMPONENTS 중 하나라도 준비되지 않으면 예열이 끝나도 503을 유지한다.
+    나머지 구성 요소의 예열 실패는 기록만 하며 해당 싱글톤은 첫 요청에서 다시 초기화된다.
+    """
+
+    def __init__(self):
+        self.status = "pending"  # pending → running → ready
+        self.duration_ms: Optional[float] = None
+        self.components: Dict[str, Dict[str, Any]] = {}
+        self.warm_queries: Dict[str, Any] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def is_ready(self) -> bool:
+        """예열 완료 + 필수 구성 요소 준비 여부"""
+        return self.status == "ready" and not self.failed_components
+
+    @property
+    def failed_components(self) -> List[str]:
+        """준비되지 않은 필수 구성 요소 (예열을 건너뛴 경우 빈 리스트)"""
+        if not self.components:
+            return []
+        return [
+            name for name in CRITICAL_COMPONENTS
+            if not self.components.get(name, {}).get("ready", False)
+        ]
+
+    def start(self) -> Optional[asyncio.Task]:
+        """백그라운드 예열 시작 (WARMUP_ENABLED=false면 즉시 준비 완료)"""
+        if not get_settings().warmup_enabled:
+            self.status = "ready"
+            self.duration_ms = 0.0
+            logger.info("예열 비활성화: 첫 요청 시 서비스 초기화")
+            return None
+
+        if self._task is None:
+            self._task = asyncio.create_task(self.run())
+        return self._task
+
+    async def stop(self):
+        """진행 중인 예열 취소 (종료 시)"""
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    async def run(self):
+        """예열 실행: 단계별 병렬 초기화 → AsyncOpenAI 클라이언트 → 예열 쿼리"""
+        settings = get_settings()
+        self.status = "running"
+        start = time.perf_counter()
+        logger.info("🔥 예열 시작")
+
+        for phase in WARMUP_PHASES:
+            await asyncio.gather(*(
+                self._run_component(name, fn) for name, fn in phase.items()
+            ))
+
+        # 비동기 클라이언트는 이벤트 루프별 싱글톤이므로 서버 루프에서 생성
+        await self._run_component("async_openai", self._warm_async_client)
+
+        queries = load_warm_queries(settings.warmup_queries_path)
+        if queries:
+            try:
+                await asyncio.wait_for(
+                    self._run_warm_queries(queries, settings.warmup_concurrency),
+                    settings.warmup_timeout_seconds
+                )
+            except asyncio.TimeoutError:
+                logger.warning(f"예열 쿼리 시간 초과 ({settings.warmup_timeout_seconds}s), 남은 쿼리 생략")
+
+        self.duration_ms = (time.perf_counter() - start) * 1000
+        self.status = "ready"
+        if self.failed_components:
+            logger.error(
+                f"예열 완료 ({self.duration_ms:.0f}ms), 필수 구성 요소 준비 실패: {', '.join(self.failed_components)}"
+            )
+        else:
+            logger.info(f"✅ 예열 완료: {self.duration_ms:.0f}ms")
+
+    async def _run_component(self, name: str, fn: Callable):
+        start = time.perf_counter()
+        try:
+            if asyncio.iscoroutinefunction(fn):
+                detail = await fn()
+            else:
+                detail = await asyncio.to_thread(fn)
+            self.components[name] = {"ready": True, **(detail or {})}
+        except Exception as e:
+            logger.error(f"예열 실패 ({name}): {e}")
+            self.components[name] = {"ready": False, "error": str(e)}
+        self.components[name]["duration_ms"] = round((time.perf_counter() - start) * 1000, 1)
+        logger.info(f"예열 완료 ({name}): {self.components[name]['duration_ms']}ms")
+
+    @staticmethod
+    async def _warm_async_client() -> Dict[str, Any]:
+        get_async_openai_client()
+        return {}
+
+    async def _run_warm_queries(self, queries: List[str], concurrency: int):
+        """예열 쿼리 실행 → 쿼리 분석/응답 캐시 채우기"""
+        semaphore = asyncio.Semaphore(concurrency)
+        self.warm_queries = {"total": len(queries), "succeeded": 0, "failed": 0}
+        start = time.perf_counter()
+
+        async def run_one(query: str):
+            async with semaphore:
+                try:
+                    await run_workflow(query, deadline=create_deadline())
+                    self.warm_queries["succeeded"] += 1
+                except Exception as e:
+                    logger.warning(f"예열 쿼리 실패 ({query}): {e}")
+                    self.warm_queries["failed"] += 1
+
+        try:
+            await asyncio.gather(*(run_one(query) for query in queries))
+        finally:
+            self.warm_queries["duration_ms"] = round((time.perf_counter() - start) * 1000, 1)
+            logger.info(
+                f"예열 쿼리 {self.warm_queries['succeeded']}/{len(queries)}개 완료: "
+                f"{self.warm_queries['duration_ms']}ms"
+            )
+
+    def get_status(self) -> Dict[str, Any]:
+        """예열 상태 (/api/ready 응답)"""
+        return {
+            "ready": self.is_ready,
+            "status": self.status,
+            "failed_components": self.failed_components,
+            "duration_ms": round(self.duration_ms, 1) if self.duration_ms is not None else None,
+            "components": dict(self.components),
+            "warm_queries": dict(self.warm_queries),
+        }
+
+
+# 싱글톤 인스턴스
+_warmup_manager: Optional[WarmupManager] = None
+
+
+def get_warmup_manager() -> WarmupManager:
+    """WarmupManager 싱글톤 인스턴스 반환"""
+    global _warmup_manager
+    if _warmup_manager is None:
+        _warmup_manager = WarmupManager()
+    return _warmup_manager
@@ -3,11 +3,17 @@
 import logging
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.config import get_settings
+from app.api.responses import CompressionMiddleware, ORJSONResponse
 from app.api.routes import router
+from app.core.services.admission import AdmissionMiddleware
+from app.core.services.health_monitor import get_health_monitor
+from app.core.services.metrics import CONTENT_TYPE, MetricsMiddleware, render_metrics
+from app.core.workflow.jobs import get_job_manager
+from app.core.workflow.warmup import get_warmup_manager
 
 # 로깅 설정
 logging.basicConfig(
@@ -23,29 +29,28 @@ async def lifespan(app: FastAPI):
     # 시작 시 초기화
     logger.info("🚀 Korean Recipe & Fitness API 시작")
 
-    # 서비스 초기화
-    try:
-        from app.core.services.vector_db_service import get_vector_db_service
-        from app.core.services.nutrition_service import get_nutrition_service
+    # 서비스 예열 (백그라운드, 완료 전까지 /api/ready는 503)
+    warmup = get_warmup_manager()
+    warmup_task = warmup.start()
 
-        vector_service = get_vector_db_service()
-        if vector_service:
-            logger.info(f"✅ Vector DB 로드 완료: {vector_service.get_total_count()}개 레시피")
-        else:
-            logger.warning("⚠️ Vector DB 로드 실패")
+    # 헬스체크 주기 점검 (예열 완료 후 시작)
+    health_monitor = get_health_monitor()
+    health_monitor.start(after=warmup_task)
 
-        nutrition_service = get_nutrition_service()
-        if nutrition_service:
-            logger.info(f"✅ Nutrition DB 로드 완료: {nutrition_service.get_total_count()}개 영양정보")
-        else:
-            logger.warning("⚠️ Nutrition DB 로드 실패")
-
-    except Exception as e:
-        logger.error(f"서비스 초기화 실패: {e}")
+    # 백그라운드 작업 워커 (중단된 작업은 예열 완료 후 재실행)
+    job_manager = get_job_manager()
+    if job_manager is not None:
+        job_manager.start(after=warmup_task)
 
     yield
 
     # 종료 시 정리
+    if job_manager is not None:
+        await job_manager.stop()
+    await health_monitor.stop()
+    await warmup.stop()
+    from app.core.services.openai_client import aclose_openai_clients
+    await aclose_openai_clients()
     logger.info("👋 Korean Recipe & Fitness API 종료")
 
 
@@ -70,12 +75,18 @@ app = FastAPI(
     """,
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url="/docs",
     redoc_url="/redoc"
 )
 
-# CORS 설정
 settings = get_settings()
+
+# 수락 제어 (풀별 동시 실행 제한/대기열, 클라이언트 할당량)
+# CORS보다 안쪽에 두어 429/503 응답에도 CORS 헤더가 붙도록 한다
+app.add_middleware(AdmissionMiddleware)
+
+# CORS 설정
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],  # Streamlit 등 로컬 개발용
@@ -84,6 +95,12 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 큰 JSON 응답 압축 (brotli → gzip, 스트리밍 응답 제외)
+app.add_middleware(CompressionMiddleware, minimum_size=settings.response_compression_min_bytes)
+
+# 요청 수/처리 시간 메트릭 (/metrics)
+app.add_middleware(MetricsMiddleware)
+
 # 라우터 등록
 app.include_router(router)
 
@@ -94,10 +111,18 @@ async def root():
     return {
         "message": "Korean Recipe & Fitness API",
         "docs": "/docs",
-        "health": "/api/health"
+        "health": "/api/health",
+        "ready": "/api/ready",
+        "metrics": "/metrics"
     }
 
 
+@app.get("/metrics", tags=["Root"], include_in_schema=False)
+async def metrics() -> Response:
+    """Prometheus 메트릭 엔드포인트 (외부 서비스 의존 없음)"""
+    return Response(content=render_metrics(), media_type=CONTENT_TYPE)
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(
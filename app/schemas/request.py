@@ -1,6 +1,6 @@
 """API 요청 스키마 정의"""
 
-from typing import Optional, Literal
+from typing import List, Optional, Literal
 from pydantic import BaseModel, Field
 
 
@@ -34,11 +34,20 @@ class SearchRequest(BaseModel):
         default=None,
         description="사용자 프로필 (선택)"
     )
+    response_mode: Literal["natural", "structured"] = Field(
+        default="natural",
+        description="응답 생성 방식 (natural: GPT 자연어 응답, structured: 템플릿 응답으로 GPT 포맷팅 생략)"
+    )
+    background: bool = Field(
+        default=False,
+        description="DB에 없는 쿼리면 DB 결과와 job_id를 바로 반환하고 GPT 생성은 백그라운드 작업으로 실행 (/api/search 전용)"
+    )
 
     class Config:
         json_schema_extra = {
             "example": {
                 "query": "김치찌개 2인분 레시피 알려줘",
+                "response_mode": "natural",
                 "user_profile": {
                     "weight": 70.0,
                     "height": 175.0,
@@ -48,3 +57,24 @@ class SearchRequest(BaseModel):
                 }
             }
         }
+
+
+class BatchSearchRequest(BaseModel):
+    """일괄 검색 요청 스키마"""
+    requests: List[SearchRequest] = Field(..., min_length=1, description="검색 요청 목록")
+    concurrency: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="동시 실행 수 (기본 BATCH_CONCURRENCY, 최대 BATCH_MAX_CONCURRENCY)"
+    )
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "requests": [
+                    {"query": "김치찌개 2인분 레시피 알려줘"},
+                    {"query": "불고기 칼로리", "response_mode": "structured"}
+                ],
+                "concurrency": 8
+            }
+        }
@@ -1,6 +1,6 @@
 """API 응답 스키마 정의"""
 
-from typing import List, Optional, Literal
+from typing import Dict, List, Optional, Literal
 from pydantic import BaseModel, Field
 
 
@@ -35,6 +35,42 @@ class RecipeResponse(BaseModel):
         }
 
 
+class RecipeSummaryResponse(BaseModel):
+    """레시피 목록 항목 스키마 (재료/조리 순서 제외)"""
+    recipe_id: str = Field(..., description="레시피 ID")
+    name: str = Field(..., description="음식명")
+    category: str = Field(default="", description="카테고리")
+    cooking_method: str = Field(default="", description="조리 방법")
+    image_url: str = Field(default="", description="이미지 URL")
+
+
+class SimilarRecipeResponse(RecipeSummaryResponse):
+    """유사 레시피 항목 스키마"""
+    similarity: float = Field(..., ge=0, le=1, description="기준 레시피와의 유사도 (1 / (1 + L2 거리))")
+
+
+class RecipeListResponse(BaseModel):
+    """레시피 목록 응답 스키마 (커서 페이지네이션)"""
+    items: List[RecipeSummaryResponse] = Field(default_factory=list, description="레시피 목록")
+    next_cursor: Optional[str] = Field(default=None, description="다음 페이지 커서 (마지막 페이지면 null)")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "items": [
+                    {"recipe_id": "28", "name": "새우 두부 계란찜", "category": "반찬", "cooking_method": "찌기"}
+                ],
+                "next_cursor": "28"
+            }
+        }
+
+
+class SimilarRecipesResponse(BaseModel):
+    """유사 레시피 응답 스키마"""
+    recipe_id: str = Field(..., description="기준 레시피 ID")
+    items: List[SimilarRecipeResponse] = Field(default_factory=list, description="유사 레시피 (유사도 내림차순)")
+
+
 class NutritionResponse(BaseModel):
     """영양정보 응답 스키마"""
     food_name: str = Field(..., description="음식명")
@@ -111,6 +147,42 @@ class AnalyzedQueryResponse(BaseModel):
     original_query: str = Field(..., description="원본 쿼리")
 
 
+class SpanTimingResponse(BaseModel):
+    """구간별 소요 시간 집계"""
+    count: int = Field(default=0, ge=0, description="호출 횟수")
+    total_ms: float = Field(default=0, ge=0, description="누적 소요 시간 (ms)")
+
+
+class TimingsResponse(BaseModel):
+    """요청 처리 시간 분해 (timings=true 요청 시)"""
+    total_ms: float = Field(default=0, ge=0, description="전체 처리 시간 (ms)")
+    nodes: Dict[str, SpanTimingResponse] = Field(
+        default_factory=dict,
+        description="워크플로우 노드별 소요 시간 (병렬 노드는 시간이 겹침)"
+    )
+    external: Dict[str, SpanTimingResponse] = Field(
+        default_factory=dict,
+        description="외부 호출별 소요 시간 (openai.chat, openai.embedding, faiss.search, sqlite.query, recipe_file.read)"
+    )
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "total_ms": 1250.5,
+                "nodes": {
+                    "query_analyzer": {"count": 1, "total_ms": 2.1},
+                    "recipe_fetcher": {"count": 1, "total_ms": 310.4},
+                    "response_formatter": {"count": 1, "total_ms": 880.2}
+                },
+                "external": {
+                    "openai.embedding": {"count": 1, "total_ms": 250.3},
+                    "faiss.search": {"count": 1, "total_ms": 1.2},
+                    "openai.chat": {"count": 1, "total_ms": 875.0}
+                }
+            }
+        }
+
+
 class SearchResponse(BaseModel):
     """통합 검색 응답 스키마"""
     success: bool = Field(default=True, description="성공 여부")
@@ -146,6 +218,30 @@ class SearchResponse(BaseModel):
     # 처리 시간
     processing_time_ms: float = Field(default=0, ge=0, description="처리 시간 (ms)")
 
+    # 성능 저하 단계
+    degraded_stages: List[str] = Field(
+        default_factory=list,
+        description="요청 예산 소진/LLM 실패로 대체 경로(기본 파싱, 템플릿 응답 등)를 사용한 단계"
+    )
+
+    # 응답 캐시 상태
+    cache_status: Literal["hit", "miss", "bypass"] = Field(
+        default="bypass",
+        description="응답 캐시 상태 (hit: 캐시된 레시피/영양정보/응답 사용, 운동 추천만 재계산)"
+    )
+
+    # 처리 시간 분해
+    timings: Optional[TimingsResponse] = Field(
+        default=None,
+        description="노드/외부 호출별 처리 시간 (timings=true 쿼리 파라미터로 요청)"
+    )
+
+    # 백그라운드 작업
+    job_id: Optional[str] = Field(
+        default=None,
+        description="GPT 생성 단계를 실행 중인 백그라운드 작업 ID (GET /api/jobs/{job_id}로 최종 결과 조회)"
+    )
+
     class Config:
         json_schema_extra = {
             "example": {
@@ -178,7 +274,34 @@ class SearchResponse(BaseModel):
                     {"name_kr": "조깅", "intensity": "high", "duration_minutes": 35}
                 ],
                 "response": "김치찌개 2인분 레시피입니다...",
-                "processing_time_ms": 1250.5
+                "processing_time_ms": 1250.5,
+                "degraded_stages": [],
+                "cache_status": "miss"
+            }
+        }
+
+
+class JobResponse(BaseModel):
+    """백그라운드 작업 조회 응답 스키마"""
+    job_id: str = Field(..., description="작업 ID")
+    status: Literal["pending", "running", "succeeded", "failed"] = Field(..., description="작업 상태")
+    result: Optional[SearchResponse] = Field(
+        default=None,
+        description="최종 검색 결과 (succeeded일 때, processing_time_ms는 작업 생성부터 종료까지)"
+    )
+    error: Optional[str] = Field(default=None, description="실패 사유 (failed일 때)")
+    created_at: float = Field(..., description="생성 시각 (epoch 초)")
+    updated_at: float = Field(..., description="마지막 상태 변경 시각 (epoch 초)")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "job_id": "3f2b8c1e9a7d4e6f8b0c2d4e6f8a0b1c",
+                "status": "pending",
+                "result": None,
+                "error": None,
+                "created_at": 1760000000.0,
+                "updated_at": 1760000000.0
             }
         }
 
@@ -201,8 +324,9 @@ class ErrorResponse(BaseModel):
 
 class HealthResponse(BaseModel):
     """헬스체크 응답 스키마"""
-    status: str = Field(default="healthy", description="서비스 상태")
+    status: str = Field(default="healthy", description="서비스 상태 (starting/healthy/degraded)")
     services: dict = Field(default_factory=dict, description="서비스별 상태")
+    checked_at: Optional[float] = Field(default=None, description="점검 시각 (epoch 초)")
 
     class Config:
         json_schema_extra = {
@@ -210,8 +334,36 @@ class HealthResponse(BaseModel):
                 "status": "healthy",
                 "services": {
                     "vector_db": {"ready": True, "total_recipes": 1139},
-                    "nutrition_db": {"ready": True, "total_records": 167337},
-                    "openai": {"ready": True}
-                }
+                    "nutrition_db": {"ready": True},
+                    "openai": {"ready": True, "model": "gpt-4o-mini"}
+                },
+                "checked_at": 1760000000.0
+            }
+        }
+
+
+class ReadinessResponse(BaseModel):
+    """준비 상태 응답 스키마 (로드밸런서용)"""
+    ready: bool = Field(..., description="예열 완료 + 필수 구성 요소 준비 여부 (false면 503)")
+    status: str = Field(..., description="예열 상태 (pending/running/ready)")
+    failed_components: List[str] = Field(
+        default_factory=list, description="준비되지 않은 필수 구성 요소 (vector_db, workflow)"
+    )
+    duration_ms: Optional[float] = Field(default=None, description="예열 소요 시간 (ms)")
+    components: Dict[str, dict] = Field(default_factory=dict, description="구성 요소별 예열 결과")
+    warm_queries: dict = Field(default_factory=dict, description="예열 쿼리 실행 결과")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "ready": True,
+                "status": "ready",
+                "failed_components": [],
+                "duration_ms": 842.3,
+                "components": {
+                    "vector_db": {"ready": True, "total_vectors": 1139, "duration_ms": 310.2},
+                    "workflow": {"ready": True, "duration_ms": 95.4}
+                },
+                "warm_queries": {"total": 10, "succeeded": 10, "failed": 0, "duration_ms": 5120.0}
             }
         }
@@ -0,0 +1,170 @@
+"""
+수락 제어(admission control) 벤치마크 스크립트
+처리 용량이 제한된 upstream(동시 chat 호출 수 제한) 앞에서 /api/search 트래픽 급증 시
+수락 제어 비활성/활성의 성공 요청 지연 시간, 시간 초과, 거절(429/503) 수 비교
+
+사용법:
+    python scripts/benchmark_admission.py --requests 200 --upstream-capacity 16
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import statistics
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List
+
+# 프로젝트 루트 경로
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(PROJECT_ROOT / "scripts"))
+
+os.environ.setdefault("OPENAI_API_KEY", "sk-benchmark")
+os.environ.setdefault("WARMUP_ENABLED", "false")
+
+import httpx  # noqa: E402
+
+from stub_llm import StubOpenAI  # noqa: E402
+from benchmark_single_flight import install_stub  # noqa: E402
+from benchmark_pipeline_cache import DISHES, TEMPLATES  # noqa: E402
+
+from app.config import get_settings  # noqa: E402
+from app.core.services import admission  # noqa: E402
+from app.main import app  # noqa: E402
+
+logging.basicConfig(level=logging.ERROR)
+
+
+def limit_upstream(stub: StubOpenAI, capacity: int):
+    """스텁 chat 호출의 동시 처리 수 제한 (초과 호출은 upstream에서 대기)"""
+    async_create = stub.async_client.chat.completions.create
+    sync_create = stub.chat.completions.create
+    async_slots = asyncio.Semaphore(capacity)
+    sync_slots = threading.Semaphore(capacity)
+
+    async def limited_async_create(*args, **kwargs):
+        async with async_slots:
+            return await async_create(*args, **kwargs)
+
+    def limited_sync_create(*args, **kwargs):
+        with sync_slots:
+            return sync_create(*args, **kwargs)
+
+    stub.async_client.chat.completions.create = limited_async_create
+    stub.chat.completions.create = limited_sync_create
+
+
+def configure(enabled: bool, args):
+    """수락 제어 설정 적용 (싱글톤 재생성)"""
+    settings = get_settings()
+    settings.admission_enabled = enabled
+    settings.admission_llm_max_concurrency = args.max_concurrency
+    settings.admission_llm_max_queue = args.max_queue
+    settings.admission_queue_timeout_seconds = args.queue_timeout
+    admission._admission_controller = None
+    admission._admission_initialized = False
+
+
+async def spike(client: httpx.AsyncClient, queries: List[str], client_timeout: float) -> Dict[str, list]:
+    """모든 요청을 동시에 전송 (client_timeout 초과 시 연결 종료)"""
+    results: Dict[str, list] = {"ok": [], "rejected": [], "timeout": [], "error": []}
+
+    async def one(query: str):
+        start = time.perf_counter()
+        try:
+            response = await asyncio.wait_for(
+                client.post("/api/search", json={"query": query, "response_mode": "structured"}),
+                client_timeout
+            )
+        except asyncio.TimeoutError:
+            results["timeout"].append(time.perf_counter() - start)
+            return
+        elapsed = time.perf_counter() - start
+        if response.status_code == 200:
+            results["ok"].append(elapsed)
+        elif response.status_code in (429, 503):
+            assert "retry-after" in response.headers
+            results["rejected"].append(elapsed)
+        else:
+            results["error"].append(elapsed)
+
+    await asyncio.gather(*(one(query) for query in queries))
+    return results
+
+
+def percentile(values: List[float], q: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * q))]
+
+
+async def main_async(args):
+    stub = StubOpenAI(chat_delay=args.chat_delay, embedding_delay=args.embedding_delay, token_delay=0)
+    install_stub(stub)
+    limit_upstream(stub, args.upstream_capacity)
+
+    queries = [
+        template.format(dish=dish, n=n) + f" #{i}"
+        for i in range(args.requests // (len(DISHES) * len(TEMPLATES)) + 1)
+        for n in (2,)
+        for template in TEMPLATES
+        for dish in DISHES
+    ][:args.requests]
+
+    print(
+        f"동시 요청 {len(queries)}개, upstream 동시 처리 {args.upstream_capacity}개 "
+        f"(chat {args.chat_delay}s), 클라이언트 타임아웃 {args.client_timeout}s"
+    )
+    print("-" * 100)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://benchmark", timeout=None) as client:
+        for enabled in (False, True):
+            configure(enabled, args)
+            start = time.perf_counter()
+            results = await spike(client, queries, args.client_timeout)
+            elapsed = time.perf_counter() - start
+
+            label = (
+                f"수락 제어 on (동시 {args.max_concurrency}, 대기열 {args.max_queue})" if enabled
+                else "수락 제어 off"
+            )
+            ok = results["ok"]
+            print(
+                f"[{label}] 성공 {len(ok):4d}  거절 {len(results['rejected']):4d}  "
+                f"시간 초과 {len(results['timeout']):4d}  오류 {len(results['error']):3d}  "
+                f"({elapsed:5.1f}s)"
+            )
+            print(
+                f"    성공 지연 p50 {percentile(ok, 0.5):5.2f}s  p95 {percentile(ok, 0.95):5.2f}s  "
+                f"거절 응답 평균 {statistics.mean(results['rejected']) if results['rejected'] else 0:5.3f}s"
+            )
+            # 다음 시나리오 전에 취소된 요청의 upstream 호출이 끝나도록 대기
+            await asyncio.sleep(args.chat_delay * 2)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="수락 제어 벤치마크")
+    parser.add_argument("--requests", type=int, default=200, help="동시 요청 수")
+    parser.add_argument("--upstream-capacity", type=int, default=16, help="upstream chat 동시 처리 수")
+    parser.add_argument("--chat-delay", type=float, default=0.5, help="chat completion 지연 (초)")
+    parser.add_argument("--embedding-delay", type=float, default=0.05, help="embedding 지연 (초)")
+    parser.add_argument("--client-timeout", type=float, default=5.0, help="클라이언트 타임아웃 (초)")
+    parser.add_argument("--max-concurrency", type=int, default=16, help="ADMISSION_LLM_MAX_CONCURRENCY")
+    parser.add_argument("--max-queue", type=int, default=32, help="ADMISSION_LLM_MAX_QUEUE")
+    parser.add_argument("--queue-timeout", type=float, default=3.0, help="ADMISSION_QUEUE_TIMEOUT_SECONDS")
+    args = parser.parse_args()
+
+    # 캐시 효과를 배제하고 수락 제어만 비교
+    settings = get_settings()
+    settings.pipeline_cache_enabled = False
+
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+"""
+일괄 검색 벤치마크 스크립트
+POST /api/search 순차 호출과 POST /api/search/batch(NDJSON) 한 번 호출을 비교하고,
+micro-batching 적용 전후의 임베딩 API 호출 수 / 영양정보 SQLite 쿼리 수를 측정
+
+사용법:
+    python scripts/benchmark_batch.py --queries 40 --concurrency 8
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+
+# 프로젝트 루트 경로
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(PROJECT_ROOT / "scripts"))
+
+os.environ.setdefault("OPENAI_API_KEY", "sk-benchmark")
+
+import httpx  # noqa: E402
+
+from stub_llm import StubOpenAI  # noqa: E402
+from benchmark_single_flight import install_stub  # noqa: E402
+from benchmark_pipeline_cache import DISHES, TEMPLATES  # noqa: E402
+
+from app.config import get_settings  # noqa: E402
+from app.core.services.embedding_service import get_embedding_service  # noqa: E402
+from app.core.services.micro_batcher import micro_batching  # noqa: E402
+from app.core.services.nutrition_db_service import NutritionDBService  # noqa: E402
+from app.main import app  # noqa: E402
+
+logging.basicConfig(level=logging.ERROR)
+
+
+def build_queries(count: int) -> List[str]:
+    """서로 다른 쿼리 count개"""
+    queries = [template.format(dish=dish, n=n) for n in (1, 2, 3) for template in TEMPLATES for dish in DISHES]
+    return queries[:count]
+
+
+async def run_serial(client: httpx.AsyncClient, queries: List[str]) -> float:
+    """POST /api/search를 하나씩 호출"""
+    start = time.perf_counter()
+    for query in queries:
+        response = await client.post("/api/search", json={"query": query})
+        response.raise_for_status()
+    return time.perf_counter() - start
+
+
+async def run_batch(client: httpx.AsyncClient, queries: List[str], concurrency: int) -> dict:
+    """POST /api/search/batch 한 번 호출"""
+    body = {"requests": [{"query": q} for q in queries], "concurrency": concurrency}
+    start = time.perf_counter()
+    response = await client.post("/api/search/batch", json=body)
+    response.raise_for_status()
+    lines = [json.loads(line) for line in response.text.splitlines() if line]
+    return {
+        "elapsed": time.perf_counter() - start,
+        "count": len(lines),
+        "errors": sum(1 for line in lines if "error" in line),
+        "in_order": [line["index"] for line in lines] == list(range(len(lines))),
+    }
+
+
+async def embedding_burst(texts: List[str], batched: bool) -> float:
+    """서로 다른 텍스트 임베딩 동시 요청"""
+    service = get_embedding_service()
+    start = time.perf_counter()
+    if batched:
+        with micro_batching():
+            tasks = [asyncio.create_task(service.aget_embedding(t)) for t in texts]
+    else:
+        tasks = [asyncio.create_task(service.aget_embedding(t)) for t in texts]
+    await asyncio.gather(*tasks)
+    return time.perf_counter() - start
+
+
+def create_nutrition_db(path: Path, food_names: List[str]):
+    """벤치마크용 최소 영양정보 DB"""
+    conn = sqlite3.connect(str(path))
+    conn.execute("CREATE TABLE nutrition (food_name TEXT, db_group TEXT, calories REAL, protein REAL)")
+    conn.executemany(
+        "INSERT INTO nutrition VALUES (?, '음식', ?, ?)",
+        [(name, 100 + i, 10 + i) for i, name in enumerate(food_names)]
+    )
+    conn.commit()
+    conn.close()
+
+
+async def nutrition_burst(service: NutritionDBService, food_names: List[str], batched: bool) -> int:
+    """음식명 동시 조회 → SQLite 쿼리 수"""
+    statements = []
+    service._get_connection().set_trace_callback(statements.append)
+
+    async def lookup(name: str):
+        return await asyncio.to_thread(service.get_nutrition, name)
+
+    if batched:
+        with micro_batching():
+            tasks = [asyncio.create_task(lookup(name)) for name in food_names]
+    else:
+        tasks = [asyncio.create_task(lookup(name)) for name in food_names]
+    results = await asyncio.gather(*tasks)
+    assert all(result is not None for result in results)
+
+    service._get_connection().set_trace_callback(None)
+    return len(statements)
+
+
+async def main_async(args):
+    stub = StubOpenAI(chat_delay=args.chat_delay, embedding_delay=args.embedding_delay)
+    install_stub(stub)
+
+    queries = build_queries(args.queries)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://benchmark", timeout=None) as client:
+        elapsed = await run_serial(client, queries)
+        print(f"[순차 /search ] 총 {elapsed:6.2f}s  upstream: {stub.calls}")
+
+        stub.reset()
+        stats = await run_batch(client, queries, args.concurrency)
+        print(
+            f"[일괄 /batch  ] 총 {stats['elapsed']:6.2f}s  "
+            f"결과 {stats['count']}개 (에러 {stats['errors']})  요청 순서 유지: {stats['in_order']}  "
+            f"upstream: {stub.calls}"
+        )
+
+    print("-" * 100)
+    texts = [f"{dish} 레시피 {i}" for i in range(args.embeddings // len(DISHES) + 1) for dish in DISHES]
+    texts = texts[:args.embeddings]
+    for batched in (False, True):
+        stub.reset()
+        elapsed = await embedding_burst(texts, batched)
+        label = "batch" if batched else "단건 "
+        print(f"[임베딩 {label}] {len(texts)}개  {elapsed:6.2f}s  API 호출 {stub.calls['embedding']}회")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "nutrition.db"
+        create_nutrition_db(db_path, DISHES)
+        service = NutritionDBService(db_path)
+        for batched in (False, True):
+            count = await nutrition_burst(service, DISHES, batched)
+            label = "batch" if batched else "단건 "
+            print(f"[영양정보 {label}] {len(DISHES)}개  SQLite 쿼리 {count}회")
+        service.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="일괄 검색 / micro-batching 벤치마크")
+    parser.add_argument("--queries", type=int, default=40, help="일괄 검색 쿼리 수")
+    parser.add_argument("--concurrency", type=int, default=8, help="일괄 검색 동시 실행 수")
+    parser.add_argument("--embeddings", type=int, default=64, help="임베딩 버스트 텍스트 수")
+    parser.add_argument("--chat-delay", type=float, default=0.3, help="chat completion 지연 (초)")
+    parser.add_argument("--embedding-delay", type=float, default=0.1, help="embedding 지연 (초)")
+    args = parser.parse_args()
+
+    # 캐시 효과를 배제하고 실행 방식만 비교
+    settings = get_settings()
+    settings.pipeline_cache_enabled = False
+
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+비동기 워크플로우 동시성 벤치마크 스크립트
+N개의 동시 run_workflow 요청이 LLM 지연의 약 1배로 끝나는지 확인
+
+비교 대상:
+    - sync-nodes:  LLM 노드도 동기 함수 (ainvoke 시 기본 스레드풀에서 실행, 스레드 수만큼만 동시 실행)
+    - async-nodes: 현재 워크플로우 (LLM 노드는 AsyncOpenAI로 이벤트 루프에서 실행)
+
+사용법:
+    python scripts/benchmark_concurrency.py --concurrency 1 10 50 --chat-delay 0.5
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+
+from langchain_core.runnables import RunnableLambda
+
+# 프로젝트 루트 경로
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+os.environ.setdefault("OPENAI_API_KEY", "sk-benchmark")
+
+from stub_llm import StubOpenAI  # noqa: E402
+from benchmark_single_flight import install_stub  # noqa: E402
+
+from app.core.workflow import graph as graph_module  # noqa: E402
+from app.core.workflow.state import create_initial_state  # noqa: E402
+
+logging.basicConfig(level=logging.ERROR)
+
+
+def compile_sync_node_workflow():
+    """비교용: 모든 노드를 동기 함수로만 등록한 워크플로우"""
+    original = graph_module.get_workflow_nodes
+
+    def sync_nodes(include_formatter: bool = True):
+        nodes = original(include_formatter)
+        return {
+            name: node.func if isinstance(node, RunnableLambda) else node
+            for name, node in nodes.items()
+        }
+
+    graph_module.get_workflow_nodes = sync_nodes
+    try:
+        return graph_module.compile_workflow()
+    finally:
+        graph_module.get_workflow_nodes = original
+
+
+async def run_burst(workflow, query: str, concurrency: int) -> float:
+    """서로 다른 쿼리 N개를 동시에 실행 (single-flight 병합 배제), 경과 시간(초)"""
+    run_id = time.time_ns()
+    states = [
+        create_initial_state(f"{query} #{run_id}-{i}")
+        for i in range(concurrency)
+    ]
+    start = time.perf_counter()
+    await asyncio.gather(*(workflow.ainvoke(state) for state in states))
+    return time.perf_counter() - start
+
+
+async def main_async(args):
+    stub = StubOpenAI(
+        chat_delay=args.chat_delay,
+        embedding_delay=args.embedding_delay,
+        token_delay=0
+    )
+    install_stub(stub)
+
+    variants = [
+        ("sync-nodes", compile_sync_node_workflow()),
+        ("async-nodes", graph_module.get_compiled_workflow()),
+    ]
+
+    # 워밍업 (DB/사전 로드)
+    for _, workflow in variants:
+        await run_burst(workflow, args.query, 1)
+
+    print("=" * 60)
+    print(f"chat {args.chat_delay}s / embedding {args.embedding_delay}s, 쿼리: {args.query}")
+    print("-" * 60)
+    single = {}
+    for concurrency in args.concurrency:
+        for name, workflow in variants:
+            elapsed = await run_burst(workflow, args.query, concurrency)
+            single.setdefault(name, elapsed)
+            print(
+                f"N={concurrency:<4d} {name:12s}: {elapsed * 1000:8.0f}ms "
+                f"({elapsed / single[name]:5.2f}x 단일 요청 대비)"
+            )
+    print("=" * 60)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="비동기 워크플로우 동시성 벤치마크")
+    parser.add_argument("--concurrency", type=int, nargs="*", default=[1, 10, 50], help="동시 요청 수")
+    parser.add_argument("--query", default="스텁국 레시피", help="검색 쿼리 (요청마다 번호가 붙음)")
+    parser.add_argument("--chat-delay", type=float, default=0.5, help="chat completion 1회 지연 (초)")
+    parser.add_argument("--embedding-delay", type=float, default=0.1, help="embedding 1회 지연 (초)")
+    args = parser.parse_args()
+
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+요청 예산(deadline) 테스트 스크립트
+upstream(OpenAI)이 느리거나 멈췄을 때 응답이 예산 안에 끝나고
+성능 저하 단계가 보고되는지 확인
+
+사용법:
+    python scripts/benchmark_deadline.py --chat-delay 30 --budget 3
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트 경로
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(PROJECT_ROOT / "scripts"))
+
+os.environ.setdefault("OPENAI_API_KEY", "sk-benchmark")
+
+from stub_llm import StubOpenAI  # noqa: E402
+from benchmark_single_flight import install_stub  # noqa: E402
+
+from app.core.workflow.deadline import create_deadline  # noqa: E402
+from app.core.workflow.graph import run_workflow, run_workflow_sync  # noqa: E402
+
+logging.basicConfig(level=logging.ERROR)
+
+
+def report(label: str, elapsed: float, result: dict):
+    """소요 시간과 성능 저하 단계 출력"""
+    degraded = ", ".join(result.get("degraded_stages") or []) or "-"
+    print(f"[{label}] {elapsed:6.2f}s  degraded: {degraded}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="요청 예산 테스트")
+    parser.add_argument("--query", default="마라탕 레시피", help="테스트 쿼리")
+    parser.add_argument("--chat-delay", type=float, default=30.0, help="chat completion 지연 (초)")
+    parser.add_argument("--budget", type=float, default=3.0, help="요청 예산 (초)")
+    args = parser.parse_args()
+
+    install_stub(StubOpenAI(chat_delay=args.chat_delay))
+
+    print(f"chat 지연 {args.chat_delay}s, 요청 예산 {args.budget}s, 쿼리: {args.query}")
+    print("-" * 60)
+
+    start = time.perf_counter()
+    result = run_workflow_sync(args.query, deadline=create_deadline(args.budget))
+    report("sync ", time.perf_counter() - start, result)
+
+    start = time.perf_counter()
+    result = asyncio.run(run_workflow(args.query, deadline=create_deadline(args.budget)))
+    report("async", time.perf_counter() - start, result)
+
+
+if __name__ == "__main__":
+    main()
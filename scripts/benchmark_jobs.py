@@ -0,0 +1,156 @@
+"""
+백그라운드 작업 벤치마크 스크립트
+DB에 있는 쿼리(DB 적중)와 DB에 없는 쿼리(LLM fallback)의 /api/search 응답 시간을
+background=false(GPT 생성까지 대기)와 background=true(DB 결과 + job_id 즉시 반환)로 비교하고,
+백그라운드 작업이 최종 결과를 저장하기까지 걸린 시간을 함께 측정
+
+임시 FAISS 인덱스(랜덤 벡터)와 영양정보 DB, 작업 DB를 만들어 실제 데이터 파일 없이 실행한다.
+
+사용법:
+    python scripts/benchmark_jobs.py --requests 40 --chat-delay 1.0
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+# 프로젝트 루트 경로
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(PROJECT_ROOT / "scripts"))
+
+os.environ.setdefault("OPENAI_API_KEY", "sk-benchmark")
+os.environ.setdefault("WARMUP_ENABLED", "false")
+
+import httpx  # noqa: E402
+
+from stub_llm import StubOpenAI  # noqa: E402
+from benchmark_single_flight import install_stub  # noqa: E402
+from benchmark_resources import install_data  # noqa: E402
+
+from app.config import get_settings  # noqa: E402
+from app.core.services.query_cache import get_query_cache  # noqa: E402
+from app.core.services.vector_db_service import get_vector_db_service  # noqa: E402
+from app.core.workflow import jobs  # noqa: E402
+from app.main import app  # noqa: E402
+
+logging.basicConfig(level=logging.ERROR)
+
+# 레시피/영양정보 DB에 없는 음식 (LLM fallback 경로)
+MISSING_DISHES = ["용과샐러드", "두리안찜", "퀴노아전", "아보카도국", "망고김치", "타코비빔", "라자냐찜", "후무스전"]
+
+
+def percentile(values: List[float], q: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * q))]
+
+
+async def run_scenario(
+    client: httpx.AsyncClient,
+    queries: List[str],
+    background: bool,
+    concurrency: int
+) -> Dict[str, List[float]]:
+    """쿼리별 응답 시간과 (202면) 작업 종료까지 걸린 시간 측정"""
+    results: Dict[str, List[float]] = {"response": [], "completion": [], "deferred": []}
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(query: str):
+        async with semaphore:
+            start = time.perf_counter()
+            response = await client.post(
+                "/api/search",
+                json={"query": query, "response_mode": "structured", "background": background}
+            )
+            results["response"].append(time.perf_counter() - start)
+
+        if response.status_code == 202:
+            results["deferred"].append(1)
+            location = response.headers["location"]
+            while True:
+                job = (await client.get(location, params={"wait": 30})).json()
+                if job["status"] in ("succeeded", "failed"):
+                    break
+            assert job["status"] == "succeeded", job
+            assert job["result"]["recipe"]["ingredients"], job
+            results["completion"].append(time.perf_counter() - start)
+        else:
+            response.raise_for_status()
+            results["completion"].append(time.perf_counter() - start)
+
+    await asyncio.gather(*(one(query) for query in queries))
+    return results
+
+
+async def main_async(args):
+    stub = StubOpenAI(chat_delay=args.chat_delay, embedding_delay=args.embedding_delay, token_delay=0)
+    install_stub(stub)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        install_data(Path(tmp), args.dimension)
+
+        settings = get_settings()
+        settings.jobs_db_path = str(Path(tmp) / "jobs.db")
+        settings.job_workers = args.workers
+        jobs._job_manager = None
+        jobs._job_manager_initialized = False
+
+        # 이름이 정확히 일치하는 레시피가 있는 음식 (DB 적중 경로)
+        dishes = [
+            recipe["name"] for recipe in get_vector_db_service().recipes if " " not in recipe["name"]
+        ][:len(MISSING_DISHES)]
+        workloads = {"DB 적중": dishes, "DB 없음": MISSING_DISHES}
+
+        print(
+            f"쿼리 {args.requests}개씩 (동시 {args.concurrency}), chat {args.chat_delay}s, "
+            f"작업 워커 {args.workers}개"
+        )
+        print("-" * 100)
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://benchmark", timeout=None) as client:
+            for label, names in workloads.items():
+                for background in (False, True):
+                    # 쿼리 분석 캐시가 다음 시나리오에 영향을 주지 않도록 초기화
+                    get_query_cache().clear()
+                    queries = [f"{names[i % len(names)]} 레시피" for i in range(args.requests)]
+                    results = await run_scenario(client, queries, background, args.concurrency)
+                    response, completion = results["response"], results["completion"]
+                    print(
+                        f"[{label:5s} background={str(background).lower():5s}] "
+                        f"응답 p50 {statistics.median(response) * 1000:7.1f}ms  "
+                        f"p95 {percentile(response, 0.95) * 1000:7.1f}ms  "
+                        f"| 최종 결과 p50 {statistics.median(completion) * 1000:7.1f}ms  "
+                        f"(작업 {len(results['deferred'])}개)"
+                    )
+
+        await jobs.get_job_manager().stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="백그라운드 작업 벤치마크")
+    parser.add_argument("--requests", type=int, default=40, help="시나리오별 쿼리 수")
+    parser.add_argument("--concurrency", type=int, default=8, help="동시 요청 수")
+    parser.add_argument("--workers", type=int, default=4, help="JOB_WORKERS")
+    parser.add_argument("--chat-delay", type=float, default=1.0, help="chat completion 지연 (초)")
+    parser.add_argument("--embedding-delay", type=float, default=0.05, help="embedding 지연 (초)")
+    parser.add_argument("--dimension", type=int, default=1536, help="임시 FAISS 인덱스 차원")
+    args = parser.parse_args()
+
+    # 캐시 효과를 배제하고 LLM 단계 지연 효과만 비교
+    settings = get_settings()
+    settings.pipeline_cache_enabled = False
+
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""
+파이프라인 응답 캐시 벤치마크 스크립트
+Zipf 분포 쿼리 로그를 재생하여 캐시 비활성/활성 시 지연 시간과 upstream 호출 수 비교
+
+사용법:
+    python scripts/benchmark_pipeline_cache.py --requests 500 --distinct 100 --zipf 1.1
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+# 프로젝트 루트 경로
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(PROJECT_ROOT / "scripts"))
+
+os.environ.setdefault("OPENAI_API_KEY", "sk-benchmark")
+
+from stub_llm import StubOpenAI  # noqa: E402
+from benchmark_single_flight import install_stub  # noqa: E402
+
+from app.config import get_settings  # noqa: E402
+from app.core.services.pipeline_cache import get_pipeline_cache  # noqa: E402
+from app.core.workflow.graph import run_workflow  # noqa: E402
+from app.core.workflow.state import UserProfile  # noqa: E402
+
+logging.basicConfig(level=logging.ERROR)
+
+DISHES = [
+    "김치찌개", "된장찌개", "순두부찌개", "부대찌개", "불고기", "제육볶음", "닭갈비", "잡채",
+    "비빔밥", "김밥", "떡볶이", "갈비찜", "삼계탕", "미역국", "콩나물국", "오징어볶음",
+    "감자조림", "계란말이", "해물파전", "마라탕",
+]
+TEMPLATES = ["{dish} 레시피", "{dish} {n}인분 만드는 법", "{dish} 칼로리", "{dish} {n}인분 레시피 알려줘"]
+
+
+def build_query_log(requests: int, distinct: int, zipf_s: float, seed: int) -> List[str]:
+    """순위 r의 쿼리가 1/r^s 비율로 등장하는 쿼리 로그 생성"""
+    rng = random.Random(seed)
+    queries = [
+        template.format(dish=dish, n=n)
+        for n in (1, 2, 3, 4)
+        for template in TEMPLATES
+        for dish in DISHES
+    ]
+    rng.shuffle(queries)
+    queries = queries[:distinct]
+    weights = [1 / (rank ** zipf_s) for rank in range(1, len(queries) + 1)]
+    return rng.choices(queries, weights=weights, k=requests)
+
+
+def random_profile(rng: random.Random) -> UserProfile:
+    """요청마다 다른 사용자 프로필 (운동 추천만 달라짐)"""
+    return UserProfile(
+        weight=rng.uniform(45, 100),
+        height=rng.uniform(150, 190),
+        age=rng.randint(20, 60),
+        gender=rng.choice(["male", "female"]),
+        activity_level=rng.choice(["sedentary", "light", "moderate", "active"])
+    )
+
+
+async def replay(query_log: List[str], concurrency: int, seed: int) -> dict:
+    """쿼리 로그 재생 → 지연 시간/캐시 적중 통계"""
+    rng = random.Random(seed)
+    profiles = [random_profile(rng) for _ in query_log]
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+    statuses: List[str] = []
+
+    async def run_one(query: str, profile: UserProfile):
+        async with semaphore:
+            start = time.perf_counter()
+            state = await run_workflow(query, profile)
+            latencies.append((time.perf_counter() - start) * 1000)
+            statuses.append(state.get("cache_status", "bypass"))
+
+    start = time.perf_counter()
+    await asyncio.gather(*(run_one(q, p) for q, p in zip(query_log, profiles)))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        "elapsed": elapsed,
+        "mean": statistics.mean(latencies),
+        "p50": latencies[len(latencies) // 2],
+        "p95": latencies[int(len(latencies) * 0.95) - 1],
+        "hit_rate": statuses.count("hit") / len(statuses),
+    }
+
+
+def report(label: str, stats: dict, calls: dict):
+    print(
+        f"[{label}] 총 {stats['elapsed']:6.2f}s  평균 {stats['mean']:7.1f}ms  "
+        f"p50 {stats['p50']:7.1f}ms  p95 {stats['p95']:7.1f}ms  "
+        f"적중률 {stats['hit_rate']:5.1%}  upstream: {calls}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="파이프라인 응답 캐시 벤치마크")
+    parser.add_argument("--requests", type=int, default=500, help="재생할 요청 수")
+    parser.add_argument("--distinct", type=int, default=100, help="서로 다른 쿼리 수")
+    parser.add_argument("--zipf", type=float, default=1.1, help="Zipf 지수 s")
+    parser.add_argument("--concurrency", type=int, default=10, help="동시 요청 수")
+    parser.add_argument("--chat-delay", type=float, default=0.3, help="chat completion 지연 (초)")
+    parser.add_argument("--seed", type=int, default=42, help="난수 시드")
+    args = parser.parse_args()
+
+    stub = StubOpenAI(chat_delay=args.chat_delay)
+    install_stub(stub)
+
+    query_log = build_query_log(args.requests, args.distinct, args.zipf, args.seed)
+    print(
+        f"요청 {args.requests}개 (서로 다른 쿼리 {len(set(query_log))}개, Zipf s={args.zipf}), "
+        f"동시 {args.concurrency}"
+    )
+    print("-" * 100)
+
+    # 벤치마크 중에는 메모리 캐시만 사용 (기존 SQLite 캐시 영향 제거)
+    settings = get_settings()
+    settings.pipeline_cache_db_path = ""
+
+    settings.pipeline_cache_enabled = False
+    stats = asyncio.run(replay(query_log, args.concurrency, args.seed))
+    report("캐시 off", stats, stub.calls)
+
+    settings.pipeline_cache_enabled = True
+    get_pipeline_cache().clear()
+    stub.reset()
+    stats = asyncio.run(replay(query_log, args.concurrency, args.seed))
+    report("캐시 on ", stats, stub.calls)
+
+
+if __name__ == "__main__":
+    main()
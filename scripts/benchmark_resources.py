@@ -0,0 +1,130 @@
+"""
+GET 리소스 조건부 요청 벤치마크 스크립트
+레시피 상세/목록/유사 레시피/영양정보 GET 엔드포인트의 첫 조회(200)와
+ETag 재검증(If-None-Match → 304)의 처리 시간과 전송 크기 비교
+
+임시 FAISS 인덱스(랜덤 벡터)와 영양정보 DB를 만들어 실제 데이터 파일 없이 실행한다.
+
+사용법:
+    python scripts/benchmark_resources.py --iterations 500
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+# 프로젝트 루트 경로
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(PROJECT_ROOT / "scripts"))
+
+os.environ.setdefault("OPENAI_API_KEY", "sk-benchmark")
+os.environ.setdefault("WARMUP_ENABLED", "false")
+
+import faiss  # noqa: E402
+import httpx  # noqa: E402
+import numpy as np  # noqa: E402
+
+from benchmark_pipeline_cache import DISHES  # noqa: E402
+
+from app.core.services import nutrition_db_service, vector_db_service  # noqa: E402
+from app.core.services.nutrition_db_service import NutritionDBService  # noqa: E402
+from app.core.services.vector_db_service import VECTOR_DB_DIR, VectorDBService  # noqa: E402
+from app.main import app  # noqa: E402
+
+logging.basicConfig(level=logging.ERROR)
+
+
+def install_data(tmp: Path, dimension: int):
+    """랜덤 벡터 FAISS 인덱스와 최소 영양정보 DB를 싱글톤으로 설치"""
+    metadata_path = VECTOR_DB_DIR / "metadata.json"
+    service = VectorDBService(index_path=tmp / "faiss.index", metadata_path=metadata_path)
+    index = faiss.IndexFlatL2(dimension)
+    rng = np.random.default_rng(0)
+    index.add(rng.random((service.total_recipes, dimension), dtype=np.float32))
+    service.index = index
+    vector_db_service._vector_db_service = service
+
+    db_path = tmp / "nutrition.db"
+    conn = sqlite3.connect(str(db_path))
+    conn.execute("CREATE TABLE nutrition (food_name TEXT, serving_size REAL, calories REAL, protein REAL, fat REAL)")
+    conn.executemany(
+        "INSERT INTO nutrition VALUES (?, 400, ?, ?, ?)",
+        [(name, 300 + i, 10 + i, 5 + i) for i, name in enumerate(DISHES)]
+    )
+    conn.commit()
+    conn.close()
+    nutrition_db_service._nutrition_db_service = NutritionDBService(db_path)
+
+
+async def measure(client: httpx.AsyncClient, url: str, iterations: int) -> Dict[str, float]:
+    """200 응답과 If-None-Match 304 응답의 평균 처리 시간/전송 크기"""
+    headers = {"Accept-Encoding": "gzip"}
+    first = await client.get(url, headers=headers)
+    first.raise_for_status()
+    etag = first.headers["etag"]
+
+    full: List[float] = []
+    conditional: List[float] = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        response = await client.get(url, headers=headers)
+        full.append(time.perf_counter() - start)
+        full_bytes = len(response.content)
+
+        start = time.perf_counter()
+        response = await client.get(url, headers={**headers, "If-None-Match": etag})
+        conditional.append(time.perf_counter() - start)
+        assert response.status_code == 304, response.status_code
+
+    return {
+        "full_ms": statistics.mean(full) * 1000,
+        "conditional_ms": statistics.mean(conditional) * 1000,
+        "full_bytes": full_bytes,
+        "encoded_bytes": int(first.headers.get("content-length", full_bytes)),
+    }
+
+
+async def main_async(args):
+    with tempfile.TemporaryDirectory() as tmp:
+        install_data(Path(tmp), args.dimension)
+
+        urls = [
+            "/api/recipes/28",
+            "/api/recipes?limit=50",
+            "/api/recipes?category=반찬&limit=20&cursor=28",
+            f"/api/recipes/28/similar?limit={args.similar}",
+            f"/api/nutrition/{DISHES[0]}",
+        ]
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+            print(f"엔드포인트별 {args.iterations}회 (200 전체 응답 vs If-None-Match 304)")
+            print("-" * 100)
+            for url in urls:
+                stats = await measure(client, url, args.iterations)
+                print(
+                    f"{url:48s} 200 {stats['full_ms']:6.2f}ms ({stats['encoded_bytes']:,}B 전송)  "
+                    f"304 {stats['conditional_ms']:6.2f}ms (0B)  "
+                    f"{stats['full_ms'] / stats['conditional_ms']:.1f}x"
+                )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="GET 리소스 조건부 요청 벤치마크")
+    parser.add_argument("--iterations", type=int, default=500, help="엔드포인트별 반복 횟수")
+    parser.add_argument("--dimension", type=int, default=1536, help="임시 FAISS 인덱스 차원")
+    parser.add_argument("--similar", type=int, default=10, help="유사 레시피 수")
+    args = parser.parse_args()
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""
+응답 직렬화 마이크로벤치마크
+일반적인 검색 응답(레시피 + 영양정보 + 운동 9개 + 자연어 응답)을 기준으로
+기존 경로(필드별 모델 생성 → FastAPI 재검증/jsonable_encoder → json.dumps)와
+최적화 경로(dict 구성 후 한 번 검증 → orjson), 압축(gzip/brotli) 비용 비교
+
+사용법:
+    python scripts/benchmark_serialization.py --iterations 5000
+"""
+
+import argparse
+import asyncio
+import gzip
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Callable
+
+# 프로젝트 루트 경로
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+os.environ.setdefault("OPENAI_API_KEY", "sk-benchmark")
+
+from fastapi.routing import serialize_response  # noqa: E402
+
+from app.api import routes  # noqa: E402
+from app.api.responses import BROTLI_QUALITY, GZIP_LEVEL, brotli, dumps  # noqa: E402
+from app.schemas.response import (  # noqa: E402
+    AnalyzedQueryResponse,
+    ExerciseResponse,
+    NutritionResponse,
+    RecipeResponse,
+    SearchResponse,
+)
+
+# 일반적인 레시피 질의의 최종 State
+FINAL_STATE = {
+    "analyzed_query": {"food_name": "김치찌개", "servings": 2, "query_type": "recipe"},
+    "recipe": {
+        "recipe_id": "RCP_0001",
+        "name": "김치찌개",
+        "category": "국&찌개",
+        "cooking_method": "끓이기",
+        "ingredients": [f"재료{i} {50 + i * 10}g" for i in range(12)],
+        "instructions": [f"{i}. 재료를 손질해 냄비에 넣고 중불에서 충분히 끓인다." for i in range(1, 9)],
+        "tips": "묵은지를 사용하면 더 깊은 맛이 납니다.",
+        "image_url": "http://www.foodsafetykorea.go.kr/uploadimg/cook/10_00001_1.png",
+        "source": "database",
+    },
+    "nutrition": {
+        "food_name": "김치찌개", "servings": 2, "serving_size": 600, "calories": 450.4,
+        "protein": 24.2, "fat": 18.6, "carbohydrate": 40.2, "sugar": 6.1, "fiber": 4.3,
+        "sodium": 1840.0, "calcium": 120.5, "iron": 3.1, "potassium": 820.0,
+        "vitamin_a": 95.0, "vitamin_c": 22.4, "cholesterol": 48.0,
+    },
+    "exercise_recommendations": [
+        {
+            "name": f"exercise_{i}", "name_kr": f"운동 {i}", "intensity": ("low", "medium", "high")[i % 3],
+            "duration_minutes": 30.0 + i * 5, "calories_burned": 450.4, "met": 3.5 + i,
+            "description": "일정한 속도로 꾸준히 움직이세요.", "tips": "운동 전후로 스트레칭을 하세요.",
+        }
+        for i in range(9)
+    ],
+    "response": "## 🍳 김치찌개 (2인분)\n\n" + "김치와 돼지고기를 넣고 끓인 한국의 대표 찌개입니다. " * 40,
+    "degraded_stages": [],
+    "cache_status": "miss",
+}
+
+
+def legacy_build(final_state: dict, query: str, processing_time_ms: float) -> SearchResponse:
+    """기존 응답 구성 (중첩 모델을 필드별로 생성 후 속성 대입)"""
+    response = SearchResponse(success=True, message="검색 완료", processing_time_ms=processing_time_ms)
+    response.analyzed_query = AnalyzedQueryResponse(
+        **routes._analyzed_query_payload(final_state["analyzed_query"], query)
+    )
+    response.recipe = RecipeResponse(**routes._recipe_payload(final_state["recipe"]))
+    response.nutrition = NutritionResponse(**routes._nutrition_payload(final_state["nutrition"]))
+    response.exercises = [
+        ExerciseResponse(**ex) for ex in routes._exercises_payload(final_state["exercise_recommendations"])
+    ]
+    response.response = final_state["response"]
+    response.degraded_stages = list(final_state["degraded_stages"])
+    response.cache_status = final_state["cache_status"]
+    return response
+
+
+def bench(fn: Callable, iterations: int) -> float:
+    """1회 평균 시간 (µs)"""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+async def main_async(iterations: int):
+    route = next(r for r in routes.router.routes if getattr(r, "path", "") == "/api/search")
+    field = route.response_field
+
+    async def legacy_path() -> bytes:
+        # 필드별 모델 생성 → response_model 재검증/변환 → 표준 json 직렬화
+        response = legacy_build(FINAL_STATE, "김치찌개 2인분 레시피", 12.3)
+        content = await serialize_response(field=field, response_content=response, is_coroutine=True)
+        return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    def fast_path() -> bytes:
+        return dumps(routes._build_search_response(FINAL_STATE, "김치찌개 2인분 레시피", 12.3))
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        await legacy_path()
+    legacy_us = (time.perf_counter() - start) / iterations * 1e6
+    fast_us = bench(fast_path, iterations)
+
+    body = fast_path()
+    print(f"응답 크기: {len(body):,} bytes")
+    print("-" * 80)
+    print(f"[기존 경로   ] {legacy_us:8.1f}µs")
+    print(f"[orjson 경로 ] {fast_us:8.1f}µs  ({legacy_us / fast_us:.1f}x)")
+
+    gzip_us = bench(lambda: gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0), iterations)
+    gzip_size = len(gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0))
+    print(f"[gzip {GZIP_LEVEL}      ] {gzip_us:8.1f}µs  {gzip_size:,} bytes ({gzip_size / len(body):.0%})")
+    if brotli is not None:
+        br_us = bench(lambda: brotli.compress(body, quality=BROTLI_QUALITY), iterations)
+        br_size = len(brotli.compress(body, quality=BROTLI_QUALITY))
+        print(f"[brotli {BROTLI_QUALITY}    ] {br_us:8.1f}µs  {br_size:,} bytes ({br_size / len(body):.0%})")
+    else:
+        print("[brotli      ] 미설치 (gzip만 사용)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="응답 직렬화 마이크로벤치마크")
+    parser.add_argument("--iterations", type=int, default=5000, help="반복 횟수")
+    args = parser.parse_args()
+    asyncio.run(main_async(args.iterations))
+
+
+if __name__ == "__main__":
+    main()
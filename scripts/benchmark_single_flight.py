@@ -0,0 +1,101 @@
+"""
+Single-flight 부하 테스트 스크립트
+동일 음식에 대한 버스트 트래픽에서 upstream(OpenAI) 호출 수가 병합되는지 확인
+
+사용법:
+    python scripts/benchmark_single_flight.py --concurrency 50
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# 프로젝트 루트 경로
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+os.environ.setdefault("OPENAI_API_KEY", "sk-benchmark")
+
+from stub_llm import StubOpenAI  # noqa: E402
+
+from app.core.agents.query_analyzer import get_query_analyzer  # noqa: E402
+from app.core.agents.response_formatter import get_response_formatter  # noqa: E402
+from app.core.services import openai_client  # noqa: E402
+from app.core.services.embedding_service import get_embedding_service  # noqa: E402
+from app.core.services.llm_service import get_llm_service  # noqa: E402
+from app.core.workflow.graph import run_workflow, run_workflow_sync  # noqa: E402
+
+logging.basicConfig(level=logging.ERROR)
+logger = logging.getLogger(__name__)
+
+
+def install_stub(stub: StubOpenAI):
+    """서비스 싱글톤의 OpenAI 클라이언트(동기/비동기)를 스텁으로 교체"""
+    get_query_analyzer().client = stub
+    get_response_formatter().client = stub
+    get_llm_service().client = stub
+    get_embedding_service().client = stub
+
+    openai_client._async_clients.clear()
+    openai_client._create_async_client = lambda api_key: stub.async_client
+
+
+def run_sync_burst(query: str, concurrency: int) -> float:
+    """스레드풀 동기 경로 버스트"""
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(lambda _: run_workflow_sync(query), range(concurrency)))
+    return time.perf_counter() - start
+
+
+async def run_async_burst(query: str, concurrency: int) -> float:
+    """비동기 경로 버스트"""
+    start = time.perf_counter()
+    await asyncio.gather(*(run_workflow(query) for _ in range(concurrency)))
+    return time.perf_counter() - start
+
+
+def run_embedding_burst(text: str, concurrency: int) -> float:
+    """임베딩 버스트"""
+    service = get_embedding_service()
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(lambda _: service.get_embedding(text), range(concurrency)))
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Single-flight 부하 테스트")
+    parser.add_argument("--concurrency", type=int, default=50, help="동시 요청 수")
+    parser.add_argument("--query", default="마라탕 레시피", help="버스트 쿼리")
+    parser.add_argument("--chat-delay", type=float, default=0.5, help="chat completion 지연 (초)")
+    args = parser.parse_args()
+
+    stub = StubOpenAI(chat_delay=args.chat_delay)
+    install_stub(stub)
+
+    print(f"동시 요청 {args.concurrency}개, 쿼리: {args.query}")
+    print("-" * 60)
+
+    elapsed = run_sync_burst(args.query, args.concurrency)
+    print(f"[sync ] {elapsed:6.2f}s  upstream 호출: {stub.calls}")
+
+    stub.reset()
+    elapsed = asyncio.run(run_async_burst(args.query, args.concurrency))
+    print(f"[async] {elapsed:6.2f}s  upstream 호출: {stub.calls}")
+
+    stub.reset()
+    elapsed = run_embedding_burst(args.query, args.concurrency)
+    print(f"[embed] {elapsed:6.2f}s  upstream 호출: {stub.calls}")
+
+    print("-" * 60)
+    print(f"병합 없이 예상되는 워크플로우당 LLM 호출: 4회 × {args.concurrency}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+"""
+LLM fallback 투기 실행 벤치마크 스크립트
+이름 매칭에 실패해 벡터 검색을 하는 쿼리에서 투기 실행 비활성/활성의
+DB 미스(LLM fallback) / 벡터 검색 적중 쿼리 지연 시간과 버려진 GPT 호출 수 비교
+(영양정보 DB가 없으므로 미스 쿼리는 레시피 생성과 영양정보 추정을 모두 투기 실행한다)
+
+임시 FAISS 인덱스를 만들어 실제 데이터 파일 없이 실행한다.
+SIMILAR_DISHES는 인덱스에 임베딩을 넣어 벡터 검색이 적중하고, MISSING_DISHES는 적중하지 않는다.
+두 목록 모두 음식명 사전에 없는 이름이므로 처음에는 미스로 예측되며,
+적중 쿼리는 SPECULATIVE_MIN_OBSERVATIONS회 관측 후 학습된 비율로 투기 실행을 멈춘다.
+
+사용법:
+    python scripts/benchmark_speculative_fallback.py --rounds 6 --chat-delay 0.5 --embedding-delay 0.3
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+# 프로젝트 루트 경로
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(PROJECT_ROOT / "scripts"))
+
+os.environ.setdefault("OPENAI_API_KEY", "sk-benchmark")
+os.environ.setdefault("WARMUP_ENABLED", "false")
+
+import faiss  # noqa: E402
+import httpx  # noqa: E402
+import numpy as np  # noqa: E402
+
+from stub_llm import StubOpenAI, deterministic_embedding  # noqa: E402
+from benchmark_single_flight import install_stub  # noqa: E402
+
+from app.config import get_settings  # noqa: E402
+from app.core.services import vector_db_service  # noqa: E402
+from app.core.services.metrics import render_metrics  # noqa: E402
+from app.core.services.query_cache import get_query_cache  # noqa: E402
+from app.core.services.vector_db_service import VECTOR_DB_DIR, VectorDBService  # noqa: E402
+from app.core.workflow import speculation  # noqa: E402
+from app.main import app  # noqa: E402
+
+logging.basicConfig(level=logging.ERROR)
+
+# 레시피 DB에 없는 음식 (벡터 검색 미스 → LLM fallback)
+MISSING_DISHES = ["용과샐러드", "두리안찜", "퀴노아전", "아보카도국", "망고김치", "타코비빔", "라자냐찜", "후무스전"]
+# 이름은 다르지만 벡터 검색으로 찾는 음식 (DB 적중)
+SIMILAR_DISHES = ["얼큰김치짜글이", "매콤닭볶음", "고소두부부침", "시원콩나물해장", "달큰간장불고기", "담백황태해장", "바삭감자채전", "새콤오이무침"]
+
+
+def install_vector_db(dimension: int):
+    """SIMILAR_DISHES 임베딩을 앞쪽 레시피 벡터로 넣은 FAISS 인덱스 설치 (나머지는 먼 랜덤 벡터)"""
+    service = VectorDBService(index_path=VECTOR_DB_DIR / "missing.index", metadata_path=VECTOR_DB_DIR / "metadata.json")
+    rng = np.random.default_rng(0)
+    vectors = rng.random((service.total_recipes, dimension), dtype=np.float32) + 10
+    for i, name in enumerate(SIMILAR_DISHES):
+        vectors[i] = np.array(deterministic_embedding(name, dimension), dtype=np.float32)
+    index = faiss.IndexFlatL2(dimension)
+    index.add(vectors)
+    service.index = index
+    vector_db_service._vector_db_service = service
+
+
+def read_metric(prefix: str) -> Dict[str, float]:
+    """/metrics 텍스트에서 prefix로 시작하는 샘플 값"""
+    values = {}
+    for line in render_metrics().splitlines():
+        if line.startswith(prefix):
+            name, value = line.rsplit(" ", 1)
+            values[name] = float(value)
+    return values
+
+
+def percentile(values: List[float], q: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * q))]
+
+
+async def run_rounds(client: httpx.AsyncClient, rounds: int) -> Dict[str, List[float]]:
+    """라운드마다 미스/적중 쿼리를 동시에 전송하고 유형별 지연 시간 기록"""
+    latencies: Dict[str, List[float]] = {"miss": [], "hit": []}
+
+    async def one(kind: str, query: str):
+        start = time.perf_counter()
+        response = await client.post("/api/search", json={"query": query, "response_mode": "structured"})
+        response.raise_for_status()
+        # GPT 생성 레시피는 recipe_id가 없다
+        recipe = response.json()["recipe"]
+        assert bool(recipe["recipe_id"]) == (kind == "hit"), (query, recipe["name"])
+        latencies[kind].append(time.perf_counter() - start)
+
+    for round_index in range(rounds):
+        # 인분 수를 라운드마다 바꿔 single-flight로 이전 라운드 생성을 공유하지 않도록 함
+        await asyncio.gather(
+            *(one("miss", f"{dish} {round_index + 1}인분 레시피") for dish in MISSING_DISHES),
+            *(one("hit", f"{dish} {round_index + 1}인분 레시피") for dish in SIMILAR_DISHES),
+        )
+    return latencies
+
+
+async def main_async(args):
+    stub = StubOpenAI(chat_delay=args.chat_delay, embedding_delay=args.embedding_delay, token_delay=0)
+    install_stub(stub)
+    install_vector_db(1536)
+
+    settings = get_settings()
+    print(
+        f"라운드 {args.rounds}회 × (미스 {len(MISSING_DISHES)} + 적중 {len(SIMILAR_DISHES)}), "
+        f"chat {args.chat_delay}s, embedding {args.embedding_delay}s, "
+        f"학습 최소 관측 {settings.speculative_min_observations}회"
+    )
+    print("-" * 100)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://benchmark", timeout=None) as client:
+        for enabled in (False, True):
+            settings.speculative_fallback_enabled = enabled
+            speculation._miss_predictor = None
+            get_query_cache().clear()
+            before = read_metric("speculative_fallback")
+            stub.reset()
+
+            latencies = await run_rounds(client, args.rounds)
+            after = read_metric("speculative_fallback")
+            delta = {name: after.get(name, 0) - before.get(name, 0) for name in after}
+
+            def total(outcome: str) -> float:
+                return sum(
+                    value for name, value in delta.items()
+                    if name.startswith("speculative_fallback_total") and f'outcome="{outcome}"' in name
+                )
+
+            used, wasted, missed = total("used"), total("wasted"), total("missed")
+            saved = sum(
+                value for name, value in delta.items() if name.startswith("speculative_fallback_saved_seconds_sum")
+            )
+
+            label = "투기 실행 on " if enabled else "투기 실행 off"
+            print(
+                f"[{label}] 미스 p50 {statistics.median(latencies['miss']) * 1000:7.1f}ms  "
+                f"p95 {percentile(latencies['miss'], 0.95) * 1000:7.1f}ms  | "
+                f"적중 p50 {statistics.median(latencies['hit']) * 1000:7.1f}ms  "
+                f"p95 {percentile(latencies['hit'], 0.95) * 1000:7.1f}ms  | chat 호출 {stub.calls['chat']}"
+            )
+            if enabled:
+                print(
+                    f"    사용 {used:.0f}  버림 {wasted:.0f}  예측 실패 {missed:.0f}  "
+                    f"절약한 대기 시간 합계 {saved:.2f}s (사용당 {saved / used if used else 0:.3f}s)"
+                )
+            # 버려진 생성이 끝나도록 대기
+            await asyncio.sleep(args.chat_delay * 2)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="LLM fallback 투기 실행 벤치마크")
+    parser.add_argument("--rounds", type=int, default=6, help="라운드 수")
+    parser.add_argument("--chat-delay", type=float, default=1.0, help="chat completion 지연 (초)")
+    parser.add_argument("--embedding-delay", type=float, default=0.3, help="embedding 지연 (초, 벡터 검색 시간)")
+    args = parser.parse_args()
+
+    # 캐시 효과를 배제하고 투기 실행 효과만 비교
+    settings = get_settings()
+    settings.pipeline_cache_enabled = False
+
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
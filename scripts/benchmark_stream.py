@@ -0,0 +1,116 @@
+"""
+스트리밍 검색 TTFB 측정 스크립트
+스텁 LLM으로 /api/search 와 /api/search/stream 의 첫 유효 바이트 시간을 비교
+
+사용법:
+    python scripts/benchmark_stream.py --runs 5 --chat-delay 0.3
+"""
+
+import argparse
+import logging
+import os
+import socket
+import statistics
+import sys
+import threading
+import time
+from pathlib import Path
+
+import httpx
+import uvicorn
+
+# 프로젝트 루트 경로
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+os.environ.setdefault("OPENAI_API_KEY", "sk-benchmark")
+
+from stub_llm import StubOpenAI  # noqa: E402
+from benchmark_single_flight import install_stub  # noqa: E402
+
+from app.main import app  # noqa: E402
+
+logging.getLogger().setLevel(logging.ERROR)
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(port: int) -> uvicorn.Server:
+    """백그라운드 스레드에서 API 서버 실행"""
+    config = uvicorn.Config(app, host="127.0.0.1", port=port, log_level="error")
+    server = uvicorn.Server(config)
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.05)
+    return server
+
+
+def measure_blocking(client: httpx.Client, base_url: str, query: str) -> float:
+    """/api/search 전체 응답 시간 (ms)"""
+    start = time.perf_counter()
+    response = client.post(f"{base_url}/api/search", json={"query": query})
+    response.raise_for_status()
+    return (time.perf_counter() - start) * 1000
+
+
+def measure_stream(client: httpx.Client, base_url: str, query: str) -> dict:
+    """/api/search/stream 이벤트별 도착 시간 (ms)"""
+    timings = {}
+    start = time.perf_counter()
+    with client.stream("POST", f"{base_url}/api/search/stream", json={"query": query}) as response:
+        response.raise_for_status()
+        for line in response.iter_lines():
+            if not line.startswith("event:"):
+                continue
+            event = line[len("event:"):].strip()
+            timings.setdefault(event, (time.perf_counter() - start) * 1000)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="스트리밍 검색 TTFB 측정")
+    parser.add_argument("--runs", type=int, default=5, help="반복 횟수")
+    parser.add_argument("--query", default="스텁국 레시피", help="검색 쿼리")
+    parser.add_argument("--chat-delay", type=float, default=0.3, help="chat completion 첫 토큰 지연 (초)")
+    parser.add_argument("--token-delay", type=float, default=0.02, help="토큰 간 지연 (초)")
+    args = parser.parse_args()
+
+    stub = StubOpenAI(chat_delay=args.chat_delay, token_delay=args.token_delay)
+    install_stub(stub)
+
+    port = _free_port()
+    server = start_server(port)
+    base_url = f"http://127.0.0.1:{port}"
+
+    blocking = []
+    streams = []
+    with httpx.Client(timeout=120.0) as client:
+        for i in range(args.runs):
+            # 매 회 다른 쿼리로 single-flight/캐시 효과 배제
+            query = f"{args.query} {i}"
+            blocking.append(measure_blocking(client, base_url, query))
+            streams.append(measure_stream(client, base_url, f"{query} stream"))
+
+    server.should_exit = True
+
+    def median_of(event: str) -> float:
+        values = [s[event] for s in streams if event in s]
+        return statistics.median(values) if values else float("nan")
+
+    print("=" * 60)
+    print(f"반복 {args.runs}회 (chat {args.chat_delay}s, token {args.token_delay}s)")
+    print("-" * 60)
+    print(f"/api/search        전체 응답      : {statistics.median(blocking):8.0f}ms")
+    for event in ["analyzed_query", "recipe", "nutrition", "exercises", "token", "done"]:
+        label = "첫 토큰" if event == "token" else event
+        print(f"/api/search/stream {label:15s}: {median_of(event):8.0f}ms")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
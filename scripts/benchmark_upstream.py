@@ -0,0 +1,156 @@
+"""
+OpenAI 업스트림 전송 계층 벤치마크 스크립트
+기본 AsyncOpenAI 클라이언트(SDK 재시도)와 헤지/재시도/서킷 브레이커 전송 계층의
+꼬리 지연, 일시 오류 성공률, 장애 시 실패 시간 비교
+
+httpx.MockTransport로 업스트림을 흉내 내므로 네트워크/API 키 없이 실행한다.
+    - 꼬리 지연: 일부 요청(--slow-ratio)만 --slow-delay초 걸리는 업스트림
+    - 일시 오류: 일부 요청(--error-ratio)이 503을 반환하는 업스트림
+    - 장애: 모든 요청이 503을 반환하는 업스트림
+
+사용법:
+    python scripts/benchmark_upstream.py --requests 400 --concurrency 20
+"""
+
+import argparse
+import asyncio
+import logging
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+# 프로젝트 루트 경로
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+import httpx  # noqa: E402
+from openai import AsyncOpenAI  # noqa: E402
+
+from app.core.services.upstream_transport import (  # noqa: E402
+    AsyncResilientTransport,
+    CircuitBreaker,
+    LatencyTracker,
+    RetryPolicy,
+)
+
+logging.basicConfig(level=logging.ERROR)
+
+EMBEDDING_RESPONSE = {
+    "object": "list",
+    "data": [{"object": "embedding", "index": 0, "embedding": [0.0] * 8}],
+    "model": "text-embedding-3-small",
+    "usage": {"prompt_tokens": 1, "total_tokens": 1},
+}
+
+
+def make_upstream(latency: Callable[[], float], error_ratio: float, calls: Dict[str, int]) -> httpx.MockTransport:
+    """지연/오류 비율을 흉내 내는 업스트림"""
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls["total"] += 1
+        await asyncio.sleep(latency())
+        if random.random() < error_ratio:
+            return httpx.Response(503, json={"error": {"message": "overloaded"}})
+        return httpx.Response(200, json=EMBEDDING_RESPONSE)
+
+    return httpx.MockTransport(handler)
+
+
+def make_client(upstream: httpx.MockTransport, resilient: bool, args) -> AsyncOpenAI:
+    if not resilient:
+        # SDK 기본 재시도 (max_retries=2, 지수 백오프)
+        return AsyncOpenAI(api_key="sk-benchmark", http_client=httpx.AsyncClient(transport=upstream))
+
+    transport = AsyncResilientTransport(
+        upstream,
+        CircuitBreaker(failure_threshold=5, reset_seconds=args.reset_seconds),
+        RetryPolicy(max_retries=2, base_delay=0.05, max_delay=1.0),
+        latency=LatencyTracker(min_samples=20),
+        hedge_percentile=0.95,
+        hedge_min_delay=0.05
+    )
+    return AsyncOpenAI(api_key="sk-benchmark", http_client=httpx.AsyncClient(transport=transport), max_retries=0)
+
+
+def percentile(values: List[float], q: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * q))]
+
+
+async def run(client: AsyncOpenAI, requests: int, concurrency: int, timeout: float) -> Dict[str, List[float]]:
+    """요청별 지연 시간 (성공/실패 분리)"""
+    results: Dict[str, List[float]] = {"ok": [], "failed": []}
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one():
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                await client.embeddings.create(model="text-embedding-3-small", input="김치찌개", timeout=timeout)
+                results["ok"].append(time.perf_counter() - start)
+            except Exception:
+                results["failed"].append(time.perf_counter() - start)
+
+    await asyncio.gather(*(one() for _ in range(requests)))
+    return results
+
+
+async def main_async(args):
+    def tail_latency() -> float:
+        return args.slow_delay if random.random() < args.slow_ratio else args.base_delay
+
+    scenarios = {
+        "꼬리 지연": (tail_latency, 0.0),
+        "일시 오류": (lambda: args.base_delay, args.error_ratio),
+        "장애": (lambda: args.base_delay, 1.0),
+    }
+
+    print(
+        f"요청 {args.requests}개 (동시 {args.concurrency}), 기본 지연 {args.base_delay}s, "
+        f"느린 요청 {args.slow_ratio:.0%} × {args.slow_delay}s, 오류 {args.error_ratio:.0%}"
+    )
+    print("-" * 100)
+    for label, (latency, error_ratio) in scenarios.items():
+        for resilient in (False, True):
+            random.seed(0)
+            calls = {"total": 0}
+            client = make_client(make_upstream(latency, error_ratio, calls), resilient, args)
+            start = time.perf_counter()
+            results = await run(client, args.requests, args.concurrency, args.timeout)
+            elapsed = time.perf_counter() - start
+            await client.close()
+
+            name = "전송 계층" if resilient else "SDK 기본"
+            ok, failed = results["ok"], results["failed"]
+            line = f"[{label:5s} {name:6s}] 성공 {len(ok):4d}  실패 {len(failed):4d}  업스트림 호출 {calls['total']:4d}  "
+            if ok:
+                line += (
+                    f"| p50 {statistics.median(ok) * 1000:7.1f}ms  p95 {percentile(ok, 0.95) * 1000:7.1f}ms  "
+                    f"p99 {percentile(ok, 0.99) * 1000:7.1f}ms  "
+                )
+            if failed:
+                line += f"| 실패까지 p50 {statistics.median(failed) * 1000:7.1f}ms  "
+            print(line + f"| 전체 {elapsed:.1f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="OpenAI 업스트림 전송 계층 벤치마크")
+    parser.add_argument("--requests", type=int, default=400, help="시나리오별 요청 수")
+    parser.add_argument("--concurrency", type=int, default=20, help="동시 요청 수")
+    parser.add_argument("--base-delay", type=float, default=0.1, help="일반 응답 지연 (초)")
+    parser.add_argument("--slow-delay", type=float, default=1.5, help="느린 응답 지연 (초)")
+    parser.add_argument("--slow-ratio", type=float, default=0.05, help="느린 응답 비율")
+    parser.add_argument("--error-ratio", type=float, default=0.1, help="일시 오류(503) 비율")
+    parser.add_argument("--timeout", type=float, default=10.0, help="요청 타임아웃 (초)")
+    parser.add_argument("--reset-seconds", type=float, default=30.0, help="서킷 브레이커 재시도 간격 (초)")
+    args = parser.parse_args()
+
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+시작 예열 벤치마크 스크립트
+서버를 새 프로세스로 띄워 예열 비활성/활성 시 준비 시간과 첫 요청 지연 시간 비교
+
+사용법:
+    python scripts/benchmark_warmup.py --runs 3
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+# 프로젝트 루트 경로
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(PROJECT_ROOT / "scripts"))
+
+os.environ.setdefault("OPENAI_API_KEY", "sk-benchmark")
+
+import httpx  # noqa: E402
+
+QUERIES = ["김치찌개 2인분 레시피 알려줘", "불고기 레시피", "비빔밥 칼로리"]
+
+
+def serve(port: int, chat_delay: float, token_delay: float):
+    """스텁 OpenAI 클라이언트로 서버 실행 (--serve 하위 프로세스)"""
+    import uvicorn
+
+    from stub_llm import StubOpenAI
+    from benchmark_single_flight import install_stub
+    from app.main import app
+
+    install_stub(StubOpenAI(chat_delay=chat_delay, token_delay=token_delay))
+    uvicorn.run(app, host="127.0.0.1", port=port, log_level="error")
+
+
+def measure_boot(port: int, warmup: bool, chat_delay: float, token_delay: float) -> Dict[str, float]:
+    """서버 기동 → /api/ready 200 → 요청 순차 실행 지연 시간"""
+    env = {
+        **os.environ,
+        "WARMUP_ENABLED": str(warmup).lower(),
+        "WARMUP_QUERIES_PATH": "",
+        "PIPELINE_CACHE_ENABLED": "false",
+        "QUERY_CACHE_PATH": "",
+    }
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, __file__, "--serve", "--port", str(port), "--chat-delay", str(chat_delay),
+         "--token-delay", str(token_delay)],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
+    )
+    try:
+        base_url = f"http://127.0.0.1:{port}"
+        with httpx.Client(base_url=base_url, timeout=60) as client:
+            while True:
+                try:
+                    if client.get("/api/ready").status_code == 200:
+                        break
+                except httpx.TransportError:
+                    pass
+                if process.poll() is not None:
+                    raise RuntimeError("서버 프로세스가 종료되었습니다")
+                time.sleep(0.02)
+            ready = time.perf_counter() - start
+
+            latencies: List[float] = []
+            for query in QUERIES:
+                request_start = time.perf_counter()
+                client.post("/api/search", json={"query": query}).raise_for_status()
+                latencies.append((time.perf_counter() - request_start) * 1000)
+    finally:
+        process.terminate()
+        process.wait()
+
+    return {"ready": ready, "first": latencies[0], "next": statistics.mean(latencies[1:])}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="시작 예열 벤치마크")
+    parser.add_argument("--runs", type=int, default=3, help="설정별 반복 횟수")
+    parser.add_argument("--port", type=int, default=8765, help="서버 포트")
+    # LLM 지연을 0으로 두어 초기화 비용만 비교
+    parser.add_argument("--chat-delay", type=float, default=0.0, help="chat completion 지연 (초)")
+    parser.add_argument("--token-delay", type=float, default=0.0, help="토큰당 생성 지연 (초)")
+    parser.add_argument("--serve", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve:
+        serve(args.port, args.chat_delay, args.token_delay)
+        return
+
+    print(f"서버 기동 {args.runs}회씩, 쿼리 {len(QUERIES)}개 순차 실행 (chat 지연 {args.chat_delay}s)")
+    print("-" * 100)
+    for warmup in (False, True):
+        results = [measure_boot(args.port, warmup, args.chat_delay, args.token_delay) for _ in range(args.runs)]
+        label = "예열 on " if warmup else "예열 off"
+        print(
+            f"[{label}] 준비까지 {statistics.mean(r['ready'] for r in results):5.2f}s  "
+            f"첫 요청 {statistics.mean(r['first'] for r in results):7.1f}ms  "
+            f"이후 요청 {statistics.mean(r['next'] for r in results):7.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
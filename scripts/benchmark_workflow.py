@@ -0,0 +1,128 @@
+"""
+워크플로우 End-to-End 지연 벤치마크 스크립트
+고정 지연 스텁 LLM으로 같은 노드를 세 가지 그래프로 연결해 쿼리 유형별 지연을 비교
+    - linear:   모든 노드를 순차 실행
+    - parallel: 레시피/영양 분기 병렬 실행, 모든 노드 실행
+    - routed:   현재 워크플로우 (query_type/response_mode 조건부 라우팅)
+
+사용법:
+    python scripts/benchmark_workflow.py --runs 3 --chat-delay 0.5
+"""
+
+import argparse
+import logging
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+from langgraph.graph import StateGraph, END
+
+# 프로젝트 루트 경로
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+os.environ.setdefault("OPENAI_API_KEY", "sk-benchmark")
+
+from stub_llm import StubOpenAI  # noqa: E402
+from benchmark_single_flight import install_stub  # noqa: E402
+
+from app.core.workflow.graph import get_compiled_workflow, get_workflow_nodes  # noqa: E402
+from app.core.workflow.state import ChatState, create_initial_state  # noqa: E402
+
+logging.basicConfig(level=logging.ERROR)
+
+# 기본 쿼리: 쿼리 유형별 (모두 DB 미스 → LLM fallback)
+DEFAULT_QUERIES = ["스텁국 2인분 레시피", "스텁떡 칼로리", "스텁밥 먹고 운동"]
+
+NODE_ORDER = [
+    "query_analyzer", "recipe_fetcher", "nutrition_lookup", "llm_fallback",
+    "nutrition_calculator", "exercise_recommender", "response_formatter"
+]
+
+
+def compile_linear_workflow():
+    """비교용: 같은 노드를 한 줄로 연결한 순차 그래프"""
+    workflow = _add_nodes(StateGraph(ChatState))
+    workflow.set_entry_point(NODE_ORDER[0])
+    for src, dst in zip(NODE_ORDER, NODE_ORDER[1:]):
+        workflow.add_edge(src, dst)
+    workflow.add_edge(NODE_ORDER[-1], END)
+    return workflow.compile()
+
+
+def compile_unrouted_workflow():
+    """비교용: 조건부 라우팅 없이 모든 노드를 실행하는 병렬 그래프"""
+    workflow = _add_nodes(StateGraph(ChatState))
+    workflow.set_entry_point("query_analyzer")
+    for src, dst in [
+        ("query_analyzer", "recipe_fetcher"),
+        ("query_analyzer", "nutrition_lookup"),
+        ("recipe_fetcher", "llm_fallback"),
+        ("nutrition_lookup", "nutrition_calculator"),
+        ("llm_fallback", "exercise_recommender"),
+        ("nutrition_calculator", "exercise_recommender"),
+        ("exercise_recommender", "response_formatter"),
+        ("response_formatter", END),
+    ]:
+        workflow.add_edge(src, dst)
+    return workflow.compile()
+
+
+def _add_nodes(workflow: StateGraph) -> StateGraph:
+    nodes = get_workflow_nodes()
+    for name in NODE_ORDER:
+        workflow.add_node(name, nodes[name])
+    return workflow
+
+
+def measure(workflow, query: str, runs: int, response_mode: str = "natural") -> float:
+    """중앙값 지연 (ms)"""
+    latencies = []
+    for i in range(runs):
+        # 매 회 다른 쿼리로 single-flight/캐시 효과 배제
+        state = create_initial_state(f"{query} #{time.time_ns()}{i}", response_mode=response_mode)
+        start = time.perf_counter()
+        workflow.invoke(state)
+        latencies.append((time.perf_counter() - start) * 1000)
+    return statistics.median(latencies)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="워크플로우 지연 벤치마크")
+    parser.add_argument("--runs", type=int, default=3, help="쿼리별 반복 횟수")
+    parser.add_argument("--chat-delay", type=float, default=0.5, help="chat completion 1회 지연 (초)")
+    parser.add_argument("--queries", nargs="*", default=DEFAULT_QUERIES, help="측정할 쿼리")
+    args = parser.parse_args()
+
+    stub = StubOpenAI(chat_delay=args.chat_delay, token_delay=0)
+    install_stub(stub)
+
+    routed = get_compiled_workflow()
+    variants = [
+        ("linear", compile_linear_workflow(), "natural"),
+        ("parallel", compile_unrouted_workflow(), "natural"),
+        ("routed", routed, "natural"),
+        ("structured", routed, "structured"),
+    ]
+
+    print("=" * 70)
+    print(f"chat completion 지연 {args.chat_delay}s, 반복 {args.runs}회 (중앙값)")
+    for query in args.queries:
+        print("-" * 70)
+        results = {}
+        for name, workflow, response_mode in variants:
+            stub.reset()
+            results[name] = measure(workflow, query, args.runs, response_mode)
+            calls = stub.calls["chat"] / args.runs
+            speedup = results["linear"] / results[name] if results[name] else 0
+            print(
+                f"{query:20s} {name:10s}: {results[name]:8.0f}ms "
+                f"({speedup:5.2f}x, LLM 호출 {calls:.1f}회/요청)"
+            )
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
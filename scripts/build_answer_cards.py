@@ -0,0 +1,265 @@
+"""
+답변 카드 빌드 스크립트
+DB 레시피마다 1인분 기준 응답을 GPT로 미리 생성해 JSONL로 저장
+(인분 수/영양 수치/운동 추천은 자리표시자로 남기고 런타임에 요청 값으로 채움)
+
+중단 후 다시 실행하면 이미 생성된 카드(레시피 내용이 같은 것)는 건너뛰고 이어서 생성한다.
+
+사용법:
+    python scripts/build_answer_cards.py --workers 8
+    python scripts/build_answer_cards.py --limit 20 --stub   (API 키 없이 스텁 응답으로 생성)
+    python scripts/build_answer_cards.py --compact           (중복/오래된 줄 정리)
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from dotenv import load_dotenv
+
+# 프로젝트 루트 경로
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(PROJECT_ROOT / "scripts"))
+
+# 환경변수 로드
+load_dotenv(PROJECT_ROOT / ".env")
+
+from app.config import get_settings  # noqa: E402
+from app.core.agents.response_formatter import (  # noqa: E402
+    EXERCISE_PLACEHOLDER,
+    SYSTEM_PROMPT,
+    ResponseFormatter,
+)
+from app.core.services.answer_cards import CARD_PLACEHOLDERS, recipe_fingerprint  # noqa: E402
+
+# 로깅 설정
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+# 파일 경로
+RECIPES_FILE = PROJECT_ROOT / "data" / "processed" / "recipes.json"
+
+CARD_INSTRUCTION = """
+답변 카드 작성 규칙:
+- 인분 수와 영양 수치는 컨텍스트의 자리표시자([[...]])를 숫자 대신 그대로 출력 (단위는 자리표시자 뒤에 표기)
+- 자리표시자를 계산하거나 바꾸지 말 것
+"""
+
+# 카드에 반드시 있어야 하는 자리표시자 (나머지 영양 수치는 선택)
+REQUIRED_PLACEHOLDERS = ("[[SERVINGS]]", "[[CALORIES]]", EXERCISE_PLACEHOLDER)
+
+
+def load_recipes() -> List[Dict]:
+    """정제된 레시피 데이터 로드"""
+    if not RECIPES_FILE.exists():
+        logger.error(f"레시피 파일이 없습니다: {RECIPES_FILE}")
+        return []
+
+    with open(RECIPES_FILE, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def to_recipe_info(recipe: Dict) -> Dict:
+    """RecipeFetcher와 같은 형식의 RecipeInfo (지문 계산 기준)"""
+    return {
+        "recipe_id": recipe.get("recipe_id", ""),
+        "name": recipe.get("name", ""),
+        "category": recipe.get("category", ""),
+        "cooking_method": recipe.get("cooking_method", ""),
+        "ingredients": recipe.get("ingredients", []),
+        "instructions": recipe.get("instructions", []),
+        "tips": recipe.get("tip", ""),
+        "image_url": recipe.get("image_url", ""),
+    }
+
+
+def per_serving_nutrition(recipe: Dict) -> Dict[str, float]:
+    """레시피 DB의 1인분 영양정보 (요청에 영양정보가 없을 때 사용)"""
+    nutrition = recipe.get("nutrition") or {}
+    return {
+        field: float(nutrition.get(field) or 0)
+        for field, _ in CARD_PLACEHOLDERS.values()
+        if field != "servings"
+    }
+
+
+def build_messages(formatter: ResponseFormatter, recipe_info: Dict) -> List[Dict]:
+    """응답 포맷터 컨텍스트에 영양 수치 대신 자리표시자를 넣은 메시지"""
+    state = {
+        "user_query": f"{recipe_info['name']} 레시피 알려줘",
+        "recipe": recipe_info,
+        "recipe_source": "database",
+        "nutrition": {},
+        "analyzed_query": {"food_name": recipe_info["name"], "servings": "[[SERVINGS]]"},
+    }
+    context = [
+        formatter._build_context(state),
+        "\n영양 정보 ([[SERVINGS]]인분):",
+        "- 칼로리: [[CALORIES]]kcal",
+        "- 단백질: [[PROTEIN]]g",
+        "- 지방: [[FAT]]g",
+        "- 탄수화물: [[CARBOHYDRATE]]g",
+        "- 나트륨: [[SODIUM]]mg",
+        f"\n운동 추천 자리표시자: 운동 추천 섹션 위치에 제목 없이 {EXERCISE_PLACEHOLDER} 한 줄만 출력",
+    ]
+    return [
+        {"role": "system", "content": SYSTEM_PROMPT + CARD_INSTRUCTION},
+        {"role": "user", "content": "\n".join(context)},
+    ]
+
+
+def generate_card(client, model: str, formatter: ResponseFormatter, recipe: Dict, retries: int) -> Optional[Dict]:
+    """레시피 하나의 카드 생성 (필수 자리표시자가 빠지면 재시도)"""
+    recipe_info = to_recipe_info(recipe)
+    messages = build_messages(formatter, recipe_info)
+
+    for attempt in range(retries + 1):
+        try:
+            response = client.chat.completions.create(
+                model=model, messages=messages, temperature=0.7, max_tokens=2000
+            )
+            markdown = response.choices[0].message.content or ""
+        except Exception as e:
+            logger.warning(f"카드 생성 오류 ({recipe_info['name']}, {attempt + 1}회): {e}")
+            time.sleep(min(2 ** attempt, 10))
+            continue
+
+        missing = [p for p in REQUIRED_PLACEHOLDERS if p not in markdown]
+        if not missing:
+            return {
+                "recipe_id": recipe_info["recipe_id"],
+                "name": recipe_info["name"],
+                "fingerprint": recipe_fingerprint(recipe_info),
+                "model": model,
+                "markdown": markdown,
+                "nutrition": per_serving_nutrition(recipe),
+                "created_at": datetime.now(timezone.utc).isoformat(),
+            }
+        logger.warning(f"자리표시자 누락 ({recipe_info['name']}, {attempt + 1}회): {', '.join(missing)}")
+
+    return None
+
+
+def load_cards(path: Path) -> Dict[str, Dict]:
+    """기존 카드 (recipe_id별 마지막 줄, 잘린 줄은 무시)"""
+    cards: Dict[str, Dict] = {}
+    if not path.exists():
+        return cards
+
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                card = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if card.get("recipe_id"):
+                cards[card["recipe_id"]] = card
+    return cards
+
+
+def compact(path: Path, recipes: List[Dict]):
+    """레시피별 최신 카드만 남기고 레시피 내용이 바뀐 카드는 제거"""
+    cards = load_cards(path)
+    fingerprints = {r.get("recipe_id"): recipe_fingerprint(to_recipe_info(r)) for r in recipes}
+    kept = [c for rid, c in cards.items() if fingerprints.get(rid) == c.get("fingerprint")]
+
+    tmp_path = path.with_suffix(".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        for card in kept:
+            f.write(json.dumps(card, ensure_ascii=False) + "\n")
+    tmp_path.replace(path)
+    logger.info(f"카드 정리 완료: {len(kept)}개 유지 ({len(cards) - len(kept)}개 제거)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="DB 레시피 답변 카드 빌드")
+    parser.add_argument("--output", type=Path, default=None, help="카드 파일 (JSONL, 기본값 ANSWER_CARDS_PATH)")
+    parser.add_argument("--workers", type=int, default=8, help="동시 GPT 호출 수")
+    parser.add_argument("--limit", type=int, default=0, help="생성할 최대 카드 수 (0이면 전체)")
+    parser.add_argument("--retries", type=int, default=2, help="카드별 재시도 횟수")
+    parser.add_argument("--stub", action="store_true", help="벤치마크 스텁 응답으로 생성 (API 키 불필요)")
+    parser.add_argument("--compact", action="store_true", help="중복/오래된 카드 정리 후 종료")
+    args = parser.parse_args()
+
+    if args.stub:
+        # 응답 포맷터 초기화용 (실제 호출은 스텁 클라이언트)
+        os.environ.setdefault("OPENAI_API_KEY", "sk-benchmark")
+    settings = get_settings()
+    if args.output is None:
+        args.output = Path(settings.answer_cards_path)
+        if not args.output.is_absolute():
+            args.output = PROJECT_ROOT / args.output
+
+    recipes = [r for r in load_recipes() if r.get("recipe_id") and r.get("name")]
+    if not recipes:
+        sys.exit(1)
+
+    if args.compact:
+        compact(args.output, recipes)
+        return
+
+    if args.stub:
+        from stub_llm import StubOpenAI
+        client = StubOpenAI(chat_delay=0.05, embedding_delay=0.0, token_delay=0.0)
+    elif not settings.openai_api_key:
+        logger.error("OpenAI API 키가 없습니다. .env의 OPENAI_API_KEY를 설정하거나 --stub을 사용하세요.")
+        sys.exit(1)
+    else:
+        from app.core.services.openai_client import get_openai_client
+        client = get_openai_client()
+
+    formatter = ResponseFormatter()
+    model = settings.openai_model
+
+    # 이어서 실행: 레시피 내용이 같은 카드가 이미 있으면 건너뜀
+    existing = load_cards(args.output)
+    pending = [
+        r for r in recipes
+        if existing.get(r["recipe_id"], {}).get("fingerprint") != recipe_fingerprint(to_recipe_info(r))
+    ]
+    if args.limit:
+        pending = pending[:args.limit]
+    logger.info(f"레시피 {len(recipes)}개 중 기존 카드 {len(recipes) - len(pending)}개, 생성 대상 {len(pending)}개")
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    created, failed = 0, 0
+    start = time.perf_counter()
+
+    with open(args.output, "a", encoding="utf-8") as out, ThreadPoolExecutor(max_workers=args.workers) as pool:
+        futures = {
+            pool.submit(generate_card, client, model, formatter, recipe, args.retries): recipe
+            for recipe in pending
+        }
+        for future in as_completed(futures):
+            card = future.result()
+            if card is None:
+                failed += 1
+                logger.error(f"카드 생성 실패: {futures[future].get('name')}")
+                continue
+
+            # 줄 단위로 바로 기록 (중단되어도 완료된 카드는 유지)
+            out.write(json.dumps(card, ensure_ascii=False) + "\n")
+            out.flush()
+            created += 1
+            if created % 50 == 0:
+                logger.info(f"진행: {created}/{len(pending)}")
+
+    logger.info(
+        f"✅ 카드 생성 완료: {created}개 생성, {failed}개 실패, "
+        f"{time.perf_counter() - start:.1f}s → {args.output}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+"""
+LLM Fallback 통합 생성 비교 스크립트
+레시피/영양정보를 따로 생성하는 경로(GPT 2회)와 JSON 스키마 통합 생성 경로(GPT 1회)의
+토큰 사용량, 지연 시간, 파싱 실패율을 기록된 응답(fixture)으로 비교
+
+1) 기록: 음식 목록마다 두 경로의 GPT 응답/usage/지연 시간을 JSONL로 저장
+    python scripts/evaluate_combined_generation.py --record --dishes 김치찌개,된장찌개,잡채
+    (OPENAI_API_KEY 필요, --stub이면 벤치마크 스텁 응답으로 기록)
+2) 비교: 기록된 응답을 서비스의 파서로 다시 파싱해 경로별로 집계
+    python scripts/evaluate_combined_generation.py
+
+사용법:
+    python scripts/evaluate_combined_generation.py --fixtures data/fixtures/llm_generation.jsonl
+"""
+
+import argparse
+import json
+import logging
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+from dotenv import load_dotenv
+
+# 프로젝트 루트 경로
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(PROJECT_ROOT / "scripts"))
+
+# 환경변수 로드
+load_dotenv(PROJECT_ROOT / ".env")
+
+from app.core.services.llm_service import LLMService, get_llm_service  # noqa: E402
+
+logging.basicConfig(
+    level=logging.WARNING,
+    format="%(asctime)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+DEFAULT_FIXTURES = PROJECT_ROOT / "data" / "fixtures" / "llm_generation.jsonl"
+DEFAULT_DISHES = "용과샐러드,두리안찜,퀴노아전,아보카도국,망고김치,타코비빔,라자냐찜,후무스전"
+
+
+def call(service: LLMService, operation: str, request: Dict) -> Dict:
+    """GPT 호출 한 번 기록 (응답 내용, usage, 지연 시간)"""
+    start = time.perf_counter()
+    response = service.client.chat.completions.create(**request)
+    latency_ms = (time.perf_counter() - start) * 1000
+    usage = getattr(response, "usage", None)
+    return {
+        "operation": operation,
+        "content": response.choices[0].message.content,
+        "prompt_tokens": getattr(usage, "prompt_tokens", 0) or 0,
+        "completion_tokens": getattr(usage, "completion_tokens", 0) or 0,
+        "latency_ms": round(latency_ms, 1),
+    }
+
+
+def record(service: LLMService, dishes: List[str], servings: int, path: Path):
+    """두 경로의 응답을 fixture로 기록"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        for food_name in dishes:
+            separate = [
+                call(service, "recipe", service._recipe_request(food_name, servings)),
+                call(service, "nutrition", service._nutrition_request(food_name, servings)),
+            ]
+            combined = [call(service, "combined", service._combined_request(food_name, servings))]
+            for mode, calls in (("separate", separate), ("combined", combined)):
+                record = {"food_name": food_name, "servings": servings, "mode": mode, "calls": calls}
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+            print(f"기록: {food_name}")
+    print(f"fixture 저장: {path}")
+
+
+def is_complete(recipe: Dict, nutrition: Dict) -> bool:
+    """워크플로우에서 그대로 사용할 수 있는 결과인지 (레시피 내용과 칼로리가 모두 있음)"""
+    return bool(
+        recipe and recipe.get("ingredients") and recipe.get("instructions")
+        and nutrition and nutrition.get("calories", 0) > 0
+    )
+
+
+def evaluate(service: LLMService, path: Path):
+    """기록된 응답을 서비스 파서로 파싱해 경로별 토큰/지연/파싱 실패 집계"""
+    stats: Dict[str, Dict[str, List[float]]] = {}
+    with open(path, encoding="utf-8") as f:
+        records = [json.loads(line) for line in f if line.strip()]
+
+    for record in records:
+        food_name, servings, calls = record["food_name"], record["servings"], record["calls"]
+        if record["mode"] == "combined":
+            generated = service._to_combined(calls[0]["content"], food_name, servings) or {}
+            recipe, nutrition = generated.get("recipe"), generated.get("nutrition")
+            # 워크플로우에서 단일 호출
+            latency = calls[0]["latency_ms"]
+            sequential = latency
+        else:
+            by_operation = {c["operation"]: c for c in calls}
+            recipe = service._to_recipe(by_operation["recipe"]["content"], food_name)
+            nutrition = service._to_nutrition(by_operation["nutrition"]["content"], food_name, servings)
+            # 워크플로우에서는 레시피/영양 노드가 병렬 실행, process()는 순차 실행
+            latency = max(c["latency_ms"] for c in calls)
+            sequential = sum(c["latency_ms"] for c in calls)
+
+        mode_stats = stats.setdefault(record["mode"], {
+            "calls": [], "prompt": [], "completion": [], "latency": [], "sequential": [], "failed": []
+        })
+        mode_stats["calls"].append(len(calls))
+        mode_stats["prompt"].append(sum(c["prompt_tokens"] for c in calls))
+        mode_stats["completion"].append(sum(c["completion_tokens"] for c in calls))
+        mode_stats["latency"].append(latency)
+        mode_stats["sequential"].append(sequential)
+        mode_stats["failed"].append(0 if is_complete(recipe, nutrition) else 1)
+
+    print(f"fixture: {path} ({len(records)}개 기록)")
+    print("-" * 100)
+    for mode in ("separate", "combined"):
+        if mode not in stats:
+            continue
+        s = stats[mode]
+        label = "분리 생성 (2회)" if mode == "separate" else "통합 생성 (1회)"
+        print(
+            f"[{label}] 음식 {len(s['calls'])}개  GPT 호출 {sum(s['calls']):.0f}  "
+            f"prompt 토큰 평균 {statistics.mean(s['prompt']):7.1f}  completion 토큰 평균 {statistics.mean(s['completion']):7.1f}  "
+            f"| 지연 p50 {statistics.median(s['latency']):7.1f}ms (순차 {statistics.median(s['sequential']):7.1f}ms)  "
+            f"| 파싱 실패 {sum(s['failed']):.0f}/{len(s['failed'])}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="LLM Fallback 통합 생성 비교")
+    parser.add_argument("--fixtures", type=Path, default=DEFAULT_FIXTURES, help="fixture 파일 (JSONL)")
+    parser.add_argument("--record", action="store_true", help="GPT 응답을 새로 기록")
+    parser.add_argument("--stub", action="store_true", help="벤치마크 스텁 응답으로 기록 (API 키 불필요)")
+    parser.add_argument("--dishes", type=str, default=DEFAULT_DISHES, help="기록할 음식 목록 (쉼표 구분)")
+    parser.add_argument("--servings", type=int, default=1, help="인분 수")
+    args = parser.parse_args()
+
+    if args.stub:
+        from stub_llm import StubOpenAI
+        service = LLMService()
+        service.client = StubOpenAI(chat_delay=0.3, embedding_delay=0.0, token_delay=0.0)
+        service._is_ready = True
+    else:
+        service = get_llm_service()
+
+    if args.record:
+        if not service.is_ready:
+            print("OpenAI API 키가 없습니다. .env의 OPENAI_API_KEY를 설정하거나 --stub을 사용하세요.")
+            sys.exit(1)
+        record(service, [d.strip() for d in args.dishes.split(",") if d.strip()], args.servings, args.fixtures)
+
+    if not args.fixtures.exists():
+        print(f"fixture가 없습니다: {args.fixtures} (--record로 먼저 기록하세요)")
+        sys.exit(1)
+    evaluate(service, args.fixtures)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""
+QueryAnalyzer 규칙 분석 커버리지 리포트 스크립트
+쿼리 로그 중 사전 기반 규칙 분석만으로 처리되는 비율과 절감된 GPT 지연을 집계
+
+사용법:
+    python scripts/evaluate_query_analyzer.py --log data/query_log.txt
+    python scripts/evaluate_query_analyzer.py --log data/query_log.txt --compare-gpt
+"""
+
+import argparse
+import json
+import logging
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+from dotenv import load_dotenv
+
+# 프로젝트 루트 경로
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+# 환경변수 로드
+load_dotenv(PROJECT_ROOT / ".env")
+
+from app.config import get_settings  # noqa: E402
+from app.core.agents.query_analyzer import QueryAnalyzer  # noqa: E402
+from app.core.services.dish_matcher import get_dish_matcher  # noqa: E402
+
+logging.basicConfig(
+    level=logging.WARNING,
+    format="%(asctime)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+
+def load_queries(path: Path) -> List[str]:
+    """쿼리 로그 로드 (한 줄에 쿼리 하나, 또는 {"query": ...} JSONL)"""
+    queries = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            if line.startswith("{"):
+                try:
+                    line = json.loads(line).get("query", "")
+                except json.JSONDecodeError:
+                    pass
+            if line:
+                queries.append(line)
+    return queries
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """단순 백분위수"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    idx = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[idx]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="QueryAnalyzer 규칙 분석 커버리지 리포트")
+    parser.add_argument("--log", type=Path, required=True, help="쿼리 로그 파일")
+    parser.add_argument("--threshold", type=float, default=None, help="신뢰도 임계값 (기본: 설정값)")
+    parser.add_argument("--gpt-latency-ms", type=float, default=800.0,
+                        help="GPT 분석 1회 추정 지연 (--compare-gpt 미사용 시)")
+    parser.add_argument("--compare-gpt", action="store_true",
+                        help="규칙으로 처리된 쿼리도 GPT로 분석하여 실제 지연/일치율 측정")
+    args = parser.parse_args()
+
+    threshold = args.threshold if args.threshold is not None else get_settings().query_rule_threshold
+    queries = load_queries(args.log)
+    if not queries:
+        logger.error("쿼리가 없습니다.")
+        sys.exit(1)
+
+    build_start = time.perf_counter()
+    matcher = get_dish_matcher()
+    build_ms = (time.perf_counter() - build_start) * 1000
+
+    analyzer = QueryAnalyzer() if args.compare_gpt else None
+
+    rule_latencies = []
+    gpt_latencies = []
+    resolved = 0
+    agreed = 0
+    unresolved_samples = []
+
+    for query in queries:
+        start = time.perf_counter()
+        match = matcher.match(query)
+        rule_latencies.append((time.perf_counter() - start) * 1000)
+
+        if match.food_name and match.confidence >= threshold:
+            resolved += 1
+            if analyzer:
+                start = time.perf_counter()
+                gpt_result = analyzer._analyze_with_gpt(query)
+                gpt_latencies.append((time.perf_counter() - start) * 1000)
+                if gpt_result and gpt_result.get("food_name") == match.food_name \
+                        and gpt_result.get("query_type") == match.query_type:
+                    agreed += 1
+        elif len(unresolved_samples) < 10:
+            unresolved_samples.append(f"{query} (신뢰도 {match.confidence:.2f})")
+
+    total = len(queries)
+    gpt_ms = statistics.mean(gpt_latencies) if gpt_latencies else args.gpt_latency_ms
+
+    print("=" * 60)
+    print(f"쿼리 수: {total:,}  |  사전 음식명: {matcher.dish_count:,}개  |  빌드 {build_ms:.0f}ms")
+    print(f"신뢰도 임계값: {threshold}")
+    print("-" * 60)
+    print(f"GPT 없이 처리: {resolved:,}/{total:,} ({resolved / total * 100:.1f}%)")
+    print(f"규칙 분석 지연: p50 {percentile(rule_latencies, 50):.3f}ms, "
+          f"p99 {percentile(rule_latencies, 99):.3f}ms")
+    print(f"GPT 분석 지연 ({'측정' if gpt_latencies else '추정'}): {gpt_ms:.0f}ms")
+    print(f"절감된 GPT 호출: {resolved:,}회, 총 {resolved * gpt_ms / 1000:.1f}s "
+          f"(쿼리당 평균 {resolved * gpt_ms / total:.0f}ms)")
+    if gpt_latencies:
+        print(f"GPT 결과 일치율: {agreed}/{len(gpt_latencies)} ({agreed / len(gpt_latencies) * 100:.1f}%)")
+    if unresolved_samples:
+        print("-" * 60)
+        print("GPT로 넘어가는 쿼리 예시:")
+        for sample in unresolved_samples:
+            print(f"  - {sample}")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
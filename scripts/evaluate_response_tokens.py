@@ -0,0 +1,232 @@
+"""
+응답 포맷터 토큰 예산 비교 스크립트
+전체 컨텍스트 + max_tokens=2000 (이전) 과 토큰 예산 컨텍스트 + 쿼리 유형별 max_tokens (이후)의
+prompt/completion 토큰 분포 비교
+
+쿼리 집합: --queries 파일(기본 예열 쿼리) + DB 레시피에서 뽑은 레시피/칼로리/운동 쿼리(--samples개 레시피)
+prompt 토큰은 tiktoken으로 로컬 계산하고, completion 토큰은 기록된 GPT 응답(fixture)으로 집계한다.
+
+1) 기록: 쿼리마다 두 방식의 GPT 응답 usage/지연 시간/finish_reason을 JSONL로 저장
+    python scripts/evaluate_response_tokens.py --record
+    (OPENAI_API_KEY 필요, --stub이면 벤치마크 스텁 응답으로 기록)
+2) 비교: prompt 토큰(로컬 계산)과 기록된 completion 토큰 분포 출력
+    python scripts/evaluate_response_tokens.py
+
+사용법:
+    python scripts/evaluate_response_tokens.py --samples 50 --fixtures data/fixtures/response_tokens.jsonl
+"""
+
+import argparse
+import json
+import logging
+import os
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from dotenv import load_dotenv
+
+# 프로젝트 루트 경로
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(PROJECT_ROOT / "scripts"))
+
+# 환경변수 로드
+load_dotenv(PROJECT_ROOT / ".env")
+HAS_API_KEY = bool(os.environ.get("OPENAI_API_KEY"))
+# 응답 포맷터 초기화용 (로컬 계산/스텁 기록은 OpenAI를 호출하지 않음)
+os.environ.setdefault("OPENAI_API_KEY", "sk-benchmark")
+
+from app.config import get_settings  # noqa: E402
+from app.core.workflow.warmup import load_warm_queries  # noqa: E402
+
+logging.basicConfig(
+    level=logging.WARNING,
+    format="%(asctime)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+RECIPES_FILE = PROJECT_ROOT / "data" / "processed" / "recipes.json"
+DEFAULT_FIXTURES = PROJECT_ROOT / "data" / "fixtures" / "response_tokens.jsonl"
+NUTRITION_FIELDS = ("calories", "protein", "fat", "carbohydrate", "sodium")
+MODES = ("before", "after")
+
+
+def build_queries(queries_path: str, samples: int, recipes: List[Dict]) -> List[str]:
+    """쿼리 파일 + DB 레시피에서 뽑은 쿼리 (seed 고정)"""
+    queries = load_warm_queries(queries_path)
+    rng = random.Random(0)
+    for recipe in rng.sample(recipes, min(samples, len(recipes))):
+        template = rng.choice(["{} 레시피 알려줘", "{} 칼로리", "{} 2인분 만드는 법", "{} 먹고 운동 뭐 해야 돼?"])
+        queries.append(template.format(recipe["name"]))
+    return queries
+
+
+def build_state(query: str, recipes_by_name: Dict[str, Dict]) -> Optional[Dict]:
+    """워크플로우의 응답 포맷터 입력과 같은 State (규칙 분석 + DB 레시피/영양정보)"""
+    from app.core.agents.recipe_fetcher import get_recipe_fetcher
+    from app.core.services.dish_matcher import get_dish_matcher
+
+    match = get_dish_matcher().match(query)
+    recipe = recipes_by_name.get(match.food_name or "")
+    if recipe is None:
+        return None
+
+    servings = match.servings or 1
+    nutrition = {field: (recipe.get("nutrition", {}).get(field) or 0) * servings for field in NUTRITION_FIELDS}
+    nutrition.update(food_name=recipe["name"], servings=servings)
+    state = {
+        "user_query": query,
+        "analyzed_query": {"food_name": match.food_name, "servings": servings, "query_type": match.query_type},
+        "recipe_source": "database",
+        "nutrition": nutrition,
+    }
+    # 영양/운동 질의는 워크플로우에서 레시피 분기를 생략한다
+    if match.query_type in ("recipe", "general"):
+        state["recipe"] = get_recipe_fetcher()._get_full_recipe(
+            {"id": recipe["recipe_id"], "name": recipe["name"]}
+        )
+    return state
+
+
+def make_formatters() -> Dict[str, object]:
+    """이전(예산 없음)/이후(토큰 예산) 설정의 응답 포맷터"""
+    from app.core.agents.response_formatter import ResponseFormatter
+
+    formatters = {}
+    for mode in MODES:
+        formatter = ResponseFormatter()
+        formatter.settings = get_settings().model_copy(
+            update={"response_token_budget_enabled": mode == "after"}
+        )
+        formatters[mode] = formatter
+    return formatters
+
+
+def prompt_tokens(formatter, state: Dict) -> int:
+    """요청 메시지 토큰 수 (메시지당 형식 토큰 4개 + 응답 시작 3개, OpenAI 기준)"""
+    from app.core.services.token_budget import get_token_counter
+
+    counter = get_token_counter()
+    messages = formatter._build_messages(state)
+    return sum(counter.count(m["content"]) + 4 for m in messages) + 3
+
+
+def record(formatters: Dict, states: List[Dict], client, path: Path):
+    """두 방식의 GPT 응답 usage를 fixture로 기록"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        for state in states:
+            for mode, formatter in formatters.items():
+                request = formatter._build_request(state)
+                start = time.perf_counter()
+                response = client.chat.completions.create(**request)
+                latency_ms = (time.perf_counter() - start) * 1000
+                usage = getattr(response, "usage", None)
+                f.write(json.dumps({
+                    "query": state["user_query"],
+                    "query_type": state["analyzed_query"]["query_type"],
+                    "mode": mode,
+                    "max_tokens": request["max_tokens"],
+                    "prompt_tokens": getattr(usage, "prompt_tokens", 0) or 0,
+                    "completion_tokens": getattr(usage, "completion_tokens", 0) or 0,
+                    "finish_reason": getattr(response.choices[0], "finish_reason", None),
+                    "latency_ms": round(latency_ms, 1),
+                }, ensure_ascii=False) + "\n")
+            print(f"기록: {state['user_query']}")
+    print(f"fixture 저장: {path}")
+
+
+def distribution(values: List[float]) -> str:
+    ordered = sorted(values)
+
+    def pct(q: float) -> float:
+        return ordered[min(len(ordered) - 1, int(len(ordered) * q))]
+
+    return (
+        f"평균 {statistics.mean(ordered):7.1f}  p50 {pct(0.5):6.0f}  p90 {pct(0.9):6.0f}  p95 {pct(0.95):6.0f}  "
+        f"p99 {pct(0.99):6.0f}  최대 {ordered[-1]:6.0f}"
+    )
+
+
+def report(formatters: Dict, states: List[Dict], fixtures: Path):
+    """컨텍스트/prompt 토큰(로컬 계산) + 기록된 completion 토큰 분포"""
+    from app.core.services.token_budget import get_token_counter
+
+    counter = get_token_counter()
+    print(f"쿼리 {len(states)}개")
+    print("-" * 100)
+    # RESPONSE_CONTEXT_MAX_TOKENS 기준 (이보다 긴 컨텍스트만 줄어듦)
+    context = [counter.count(formatters["before"]._build_full_context(s)) for s in states]
+    budget = get_settings().response_context_max_tokens
+    abridged = sum(1 for tokens in context if tokens > budget)
+    print("[전체 컨텍스트 토큰 (로컬 계산)]")
+    print(f"  {distribution(context)}")
+    print(f"  예산 {budget} 초과(줄임) {abridged}/{len(context)}")
+    print("[prompt 토큰 (로컬 계산)]")
+    for mode, formatter in formatters.items():
+        print(f"  {mode:6s} {distribution([prompt_tokens(formatter, s) for s in states])}")
+
+    if not fixtures.exists():
+        print(f"\ncompletion 토큰: fixture가 없습니다 ({fixtures}, --record로 기록)")
+        return
+
+    with open(fixtures, encoding="utf-8") as f:
+        records = [json.loads(line) for line in f if line.strip()]
+
+    print(f"\n[기록된 GPT 응답 ({fixtures.name}, {len(records)}개)]")
+    for mode in MODES:
+        rows = [r for r in records if r["mode"] == mode]
+        if not rows:
+            continue
+        truncated = sum(1 for r in rows if r.get("finish_reason") == "length")
+        print(f"  {mode:6s} prompt     {distribution([r['prompt_tokens'] for r in rows])}")
+        print(f"  {mode:6s} completion {distribution([r['completion_tokens'] for r in rows])}")
+        print(
+            f"  {mode:6s} 지연 p50 {statistics.median(r['latency_ms'] for r in rows):7.1f}ms  "
+            f"max_tokens로 잘림 {truncated}/{len(rows)}"
+        )
+        for query_type in sorted({r["query_type"] for r in rows}):
+            typed = [r["completion_tokens"] for r in rows if r["query_type"] == query_type]
+            print(f"           {query_type:9s} completion p50 {statistics.median(typed):6.0f} ({len(typed)}개)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="응답 포맷터 토큰 예산 비교")
+    parser.add_argument("--queries", type=str, default="data/warmup_queries.txt", help="쿼리 파일 (한 줄에 하나)")
+    parser.add_argument("--samples", type=int, default=50, help="DB 레시피에서 추가로 뽑을 쿼리 수")
+    parser.add_argument("--fixtures", type=Path, default=DEFAULT_FIXTURES, help="fixture 파일 (JSONL)")
+    parser.add_argument("--record", action="store_true", help="GPT 응답을 새로 기록")
+    parser.add_argument("--stub", action="store_true", help="벤치마크 스텁 응답으로 기록 (API 키 불필요)")
+    args = parser.parse_args()
+
+    with open(RECIPES_FILE, encoding="utf-8") as f:
+        recipes = [r for r in json.load(f) if r.get("recipe_id") and r.get("name")]
+    recipes_by_name = {r["name"]: r for r in recipes}
+
+    queries = build_queries(args.queries, args.samples, recipes)
+    states = [s for s in (build_state(q, recipes_by_name) for q in queries) if s]
+    if len(states) < len(queries):
+        print(f"DB 레시피와 매칭되지 않은 쿼리 {len(queries) - len(states)}개 제외")
+
+    formatters = make_formatters()
+    if args.record:
+        if args.stub:
+            from stub_llm import StubOpenAI
+            client = StubOpenAI(chat_delay=0.0, embedding_delay=0.0, token_delay=0.0)
+        elif not HAS_API_KEY:
+            print("OpenAI API 키가 없습니다. .env의 OPENAI_API_KEY를 설정하거나 --stub을 사용하세요.")
+            sys.exit(1)
+        else:
+            from app.core.services.openai_client import get_openai_client
+            client = get_openai_client()
+        record(formatters, states, client, args.fixtures)
+
+    report(formatters, states, args.fixtures)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,529 @@
+"""
+엔드투엔드 부하 테스트 스크립트
+app.main:app에 실제 트래픽과 비슷한 요청을 목표 요청률(open-loop) 또는 동시성(closed-loop)으로 보내고
+경로별 지연 분위수(p50/p90/p99/최대), 처리량, 오류율, 노드/외부 호출별 처리 시간을 집계
+
+요청 목록:
+    --log 파일 재생 (한 줄에 쿼리 하나, 또는 {"route": ..., "query": ...} JSON)
+    없으면 레시피/영양정보 DB 음식명에서 Zipf 분포로 생성 (--save-log로 저장해 재사용)
+
+대상 서버:
+    --base-url 지정 시 실행 중인 서버
+    없으면 OpenAI 대체 서버(scripts/stub_openai_server.py)와 앱 서버를 새 프로세스로 띄워 오프라인 실행
+
+결과는 --output JSON으로 저장하고 --compare로 이전 결과(예: 다른 커밋)와 비교한다.
+
+사용법:
+    python scripts/load_test.py --rate 20 --duration 60 --output results/load_test.json
+    python scripts/load_test.py --concurrency 16 --requests 2000 --compare results/load_test.json
+    python scripts/load_test.py --base-url http://127.0.0.1:8000 --log queries.txt --rate 50
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+# 프로젝트 루트 경로
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+import httpx  # noqa: E402
+
+RECIPES_FILE = PROJECT_ROOT / "data" / "processed" / "recipes.json"
+NUTRITION_DB_FILE = PROJECT_ROOT / "data" / "database" / "nutrition.db"
+
+ROUTES = ("search", "stream", "recipe", "recipes", "nutrition")
+DEFAULT_MIX = "search=0.8,stream=0.1,recipe=0.04,recipes=0.03,nutrition=0.03"
+
+# DB에 없는 음식 (LLM fallback 경로)
+MISS_DISHES = ["용과샐러드", "두리안찜", "퀴노아전", "아보카도국", "망고김치", "타코비빔", "라자냐찜", "후무스전"]
+QUERY_TEMPLATES = [
+    ("{} 레시피 알려줘", 0.45),
+    ("{} 2인분 레시피", 0.15),
+    ("{} 칼로리", 0.25),
+    ("{} 먹고 운동 뭐 해야 돼?", 0.15),
+]
+
+
+@dataclass
+class Request:
+    """요청 하나 (route별로 query / recipe_id / food_name 사용)"""
+    route: str
+    query: str = ""
+    recipe_id: str = ""
+
+    def to_dict(self) -> Dict[str, str]:
+        return {k: v for k, v in {"route": self.route, "query": self.query, "recipe_id": self.recipe_id}.items() if v}
+
+
+@dataclass
+class Result:
+    route: str
+    latency_ms: float
+    status: str                     # HTTP 상태 코드 또는 예외 이름
+    ok: bool
+    first_token_ms: Optional[float] = None
+    timings: Dict[str, Any] = field(default_factory=dict)
+
+
+# ============================================================
+# 요청 목록
+# ============================================================
+
+def parse_mix(mix: str) -> Dict[str, float]:
+    weights = {}
+    for part in mix.split(","):
+        route, _, weight = part.partition("=")
+        route = route.strip()
+        if route not in ROUTES:
+            raise ValueError(f"알 수 없는 경로: {route} ({', '.join(ROUTES)})")
+        weights[route] = float(weight)
+    return weights
+
+
+def load_names() -> Tuple[List[Tuple[str, str]], List[str]]:
+    """(레시피 id, 이름) 목록과 영양정보 DB 음식명 목록"""
+    with open(RECIPES_FILE, encoding="utf-8") as f:
+        recipes = [(r["recipe_id"], r["name"]) for r in json.load(f) if r.get("recipe_id") and r.get("name")]
+
+    food_names: List[str] = []
+    if NUTRITION_DB_FILE.exists():
+        import sqlite3
+        with sqlite3.connect(str(NUTRITION_DB_FILE)) as conn:
+            try:
+                food_names = [row[0] for row in conn.execute("SELECT DISTINCT food_name FROM nutrition") if row[0]]
+            except sqlite3.Error:
+                pass
+    return recipes, food_names
+
+
+def zipf_sampler(items: List, s: float, rng: random.Random):
+    """순위 k의 확률이 1/k^s에 비례하는 샘플러 (순위는 seed로 섞은 순서)"""
+    ranked = list(items)
+    rng.shuffle(ranked)
+    weights = [1 / (k ** s) for k in range(1, len(ranked) + 1)]
+    cumulative = []
+    total = 0.0
+    for w in weights:
+        total += w
+        cumulative.append(total)
+    return lambda: rng.choices(ranked, cum_weights=cumulative)[0]
+
+
+def generate_requests(count: int, mix: Dict[str, float], zipf_s: float, miss_ratio: float, seed: int) -> List[Request]:
+    """음식명 Zipf 분포 요청 목록 생성"""
+    rng = random.Random(seed)
+    recipes, food_names = load_names()
+    pick_recipe = zipf_sampler(recipes, zipf_s, rng)
+    pick_dish = zipf_sampler([name for _, name in recipes] + food_names, zipf_s, rng)
+    templates, template_weights = zip(*QUERY_TEMPLATES)
+    routes, route_weights = zip(*mix.items())
+
+    requests = []
+    for _ in range(count):
+        route = rng.choices(routes, weights=route_weights)[0]
+        if route in ("search", "stream"):
+            dish = rng.choice(MISS_DISHES) if rng.random() < miss_ratio else pick_dish()
+            template = rng.choices(templates, weights=template_weights)[0]
+            requests.append(Request(route, query=template.format(dish)))
+        elif route == "recipe":
+            requests.append(Request(route, recipe_id=pick_recipe()[0]))
+        elif route == "nutrition":
+            requests.append(Request(route, query=pick_dish()))
+        else:
+            requests.append(Request(route))
+    return requests
+
+
+def load_log(path: Path) -> List[Request]:
+    """쿼리 로그 로드 (일반 텍스트 줄은 /api/search 쿼리)"""
+    requests = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            if line.startswith("{"):
+                entry = json.loads(line)
+                requests.append(Request(entry.get("route", "search"), entry.get("query", ""), entry.get("recipe_id", "")))
+            else:
+                requests.append(Request("search", query=line))
+    return requests
+
+
+# ============================================================
+# 요청 실행
+# ============================================================
+
+async def send(client: httpx.AsyncClient, request: Request, scheduled: float) -> Result:
+    """요청 하나 실행 (지연 시간은 예정 시각 기준, 밀린 대기 시간 포함)"""
+    first_token_ms = None
+    timings: Dict[str, Any] = {}
+    try:
+        if request.route == "search":
+            response = await client.post("/api/search", params={"timings": "true"}, json={"query": request.query})
+            if response.status_code == 200:
+                timings = response.json().get("timings") or {}
+        elif request.route == "stream":
+            async with client.stream(
+                "POST", "/api/search/stream", params={"timings": "true"}, json={"query": request.query}
+            ) as response:
+                event = None
+                async for line in response.aiter_lines():
+                    if line.startswith("event:"):
+                        event = line[len("event:"):].strip()
+                    elif line.startswith("data:") and event == "token" and first_token_ms is None:
+                        first_token_ms = (time.perf_counter() - scheduled) * 1000
+                    elif line.startswith("data:") and event == "done":
+                        timings = json.loads(line[len("data:"):]).get("timings") or {}
+                    elif line.startswith("data:") and event == "error":
+                        return Result(request.route, (time.perf_counter() - scheduled) * 1000, "stream_error", False)
+        elif request.route == "recipe":
+            response = await client.get(f"/api/recipes/{request.recipe_id}")
+        elif request.route == "recipes":
+            response = await client.get("/api/recipes", params={"limit": 20})
+        else:
+            response = await client.get(f"/api/nutrition/{request.query}")
+
+        # 단건 조회의 404(DB에 없는 음식)는 정상 응답으로 본다
+        ok = response.status_code < 400 or (response.status_code == 404 and request.route in ("recipe", "nutrition"))
+        status = str(response.status_code)
+    except Exception as e:
+        ok, status = False, type(e).__name__
+
+    return Result(request.route, (time.perf_counter() - scheduled) * 1000, status, ok, first_token_ms, timings)
+
+
+async def run_open_loop(client: httpx.AsyncClient, requests: List[Request], rate: float, seed: int) -> List[Result]:
+    """목표 요청률(Poisson 도착)로 전송 (응답을 기다리지 않음)"""
+    rng = random.Random(seed)
+    tasks = []
+    start = time.perf_counter()
+    next_at = start
+    for request in requests:
+        next_at += rng.expovariate(rate)
+        delay = next_at - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        tasks.append(asyncio.create_task(send(client, request, next_at)))
+    return await asyncio.gather(*tasks)
+
+
+async def run_closed_loop(client: httpx.AsyncClient, requests: List[Request], concurrency: int) -> List[Result]:
+    """동시성 고정 (응답을 받으면 다음 요청)"""
+    queue = list(reversed(requests))
+    results: List[Result] = []
+
+    async def worker():
+        while queue:
+            request = queue.pop()
+            results.append(await send(client, request, time.perf_counter()))
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return results
+
+
+# ============================================================
+# 집계
+# ============================================================
+
+def percentile(values: List[float], q: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * q))]
+
+
+def latency_summary(values: List[float]) -> Dict[str, float]:
+    if not values:
+        return {}
+    return {
+        "mean": round(statistics.mean(values), 1),
+        "p50": round(percentile(values, 0.5), 1),
+        "p90": round(percentile(values, 0.9), 1),
+        "p99": round(percentile(values, 0.99), 1),
+        "max": round(max(values), 1),
+    }
+
+
+def summarize(results: List[Result], elapsed: float) -> Dict[str, Any]:
+    """경로별/전체 지연 분위수, 처리량, 오류율, 단계별 처리 시간"""
+    by_route: Dict[str, List[Result]] = defaultdict(list)
+    for result in results:
+        by_route[result.route].append(result)
+
+    routes = {}
+    for route, rows in sorted(by_route.items()):
+        ok_latencies = [r.latency_ms for r in rows if r.ok]
+        entry = {
+            "requests": len(rows),
+            "errors": sum(1 for r in rows if not r.ok),
+            "error_rate": round(sum(1 for r in rows if not r.ok) / len(rows), 4),
+            "status": dict(Counter(r.status for r in rows)),
+            "throughput_rps": round(len(rows) / elapsed, 2),
+            "latency_ms": latency_summary(ok_latencies),
+        }
+        first_tokens = [r.first_token_ms for r in rows if r.first_token_ms is not None]
+        if first_tokens:
+            entry["first_token_ms"] = latency_summary(first_tokens)
+        routes[route] = entry
+
+    # 단계별 처리 시간 (요청당 노드/외부 호출 누적 시간)
+    stages: Dict[str, List[float]] = defaultdict(list)
+    for result in results:
+        for group in ("nodes", "external"):
+            for name, span in (result.timings.get(group) or {}).items():
+                stages[f"{group}.{name}"].append(span.get("total_ms", 0.0))
+
+    return {
+        "elapsed_seconds": round(elapsed, 2),
+        "requests": len(results),
+        "throughput_rps": round(len(results) / elapsed, 2),
+        "error_rate": round(sum(1 for r in results if not r.ok) / max(len(results), 1), 4),
+        "latency_ms": latency_summary([r.latency_ms for r in results if r.ok]),
+        "routes": routes,
+        "stages_ms": {name: {"count": len(v), **latency_summary(v)} for name, v in sorted(stages.items())},
+    }
+
+
+def print_summary(summary: Dict[str, Any]):
+    def fmt(latency: Dict[str, float]) -> str:
+        if not latency:
+            return "-"
+        return "  ".join(f"{k} {latency[k]:8.1f}" for k in ("p50", "p90", "p99", "max"))
+
+    print(
+        f"요청 {summary['requests']}개, {summary['elapsed_seconds']:.1f}s, "
+        f"처리량 {summary['throughput_rps']:.1f} req/s, 오류율 {summary['error_rate']:.2%}"
+    )
+    print("-" * 110)
+    print(f"[{'전체':9s}] {fmt(summary['latency_ms'])}")
+    for route, entry in summary["routes"].items():
+        line = (
+            f"[{route:9s}] {fmt(entry['latency_ms'])}  | {entry['requests']:5d}건 "
+            f"{entry['throughput_rps']:6.1f} req/s  오류 {entry['error_rate']:6.2%}  상태 {entry['status']}"
+        )
+        print(line)
+        if "first_token_ms" in entry:
+            print(f"[{'└ 첫 토큰':9s}] {fmt(entry['first_token_ms'])}")
+
+    if summary["stages_ms"]:
+        print("\n단계별 처리 시간 (ms, 요청당 누적)")
+        for name, stage in summary["stages_ms"].items():
+            print(f"  {name:32s} {stage['count']:5d}건  mean {stage['mean']:8.1f}  {fmt(stage)}")
+
+
+def print_comparison(summary: Dict[str, Any], baseline_path: Path):
+    """이전 결과 대비 변화 (p50/p99/처리량/오류율)"""
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = json.load(f)
+    base_summary = baseline["summary"]
+    print(f"\n비교 기준: {baseline_path} (commit {baseline['meta'].get('commit', '?')})")
+    print("-" * 110)
+
+    def delta(new: float, old: float) -> str:
+        if not old:
+            return f"{new:8.1f}"
+        return f"{old:8.1f} → {new:8.1f} ({(new - old) / old:+6.1%})"
+
+    rows = [("전체", summary, base_summary)] + [
+        (route, entry, base_summary["routes"][route])
+        for route, entry in summary["routes"].items() if route in base_summary["routes"]
+    ]
+    for name, new, old in rows:
+        print(
+            f"[{name:9s}] p50 {delta(new['latency_ms'].get('p50', 0), old['latency_ms'].get('p50', 0))}  "
+            f"p99 {delta(new['latency_ms'].get('p99', 0), old['latency_ms'].get('p99', 0))}  "
+            f"처리량 {delta(new['throughput_rps'], old['throughput_rps'])}  "
+            f"오류율 {old['error_rate']:.2%} → {new['error_rate']:.2%}"
+        )
+
+
+# ============================================================
+# 오프라인 서버
+# ============================================================
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _wait_ready(url: str, process: subprocess.Popen, timeout: float):
+    deadline = time.perf_counter() + timeout
+    with httpx.Client(timeout=5) as client:
+        while time.perf_counter() < deadline:
+            if process.poll() is not None:
+                raise RuntimeError(f"서버 프로세스가 종료되었습니다: {url}")
+            try:
+                if client.get(url).status_code == 200:
+                    return
+            except httpx.TransportError:
+                pass
+            time.sleep(0.1)
+    raise RuntimeError(f"서버 준비 시간 초과: {url}")
+
+
+def start_offline_stack(args) -> Tuple[str, List[subprocess.Popen]]:
+    """OpenAI 대체 서버 + 앱 서버 실행 (앱은 OPENAI_BASE_URL로 대체 서버 사용)"""
+    stub_port, app_port = _free_port(), _free_port()
+    stub = subprocess.Popen(
+        [
+            sys.executable, str(PROJECT_ROOT / "scripts" / "stub_openai_server.py"),
+            "--port", str(stub_port), "--seed", str(args.seed),
+            "--chat-latency-ms", str(args.llm_latency_ms), "--embedding-latency-ms", str(args.embedding_latency_ms),
+            "--token-delay-ms", str(args.token_delay_ms), "--error-rate", str(args.llm_error_rate),
+        ],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
+    )
+    processes = [stub]
+    try:
+        _wait_ready(f"http://127.0.0.1:{stub_port}/config", stub, 30)
+
+        env = {
+            **os.environ,
+            "OPENAI_BASE_URL": f"http://127.0.0.1:{stub_port}/v1",
+            "OPENAI_API_KEY": "sk-loadtest",
+        }
+        app = subprocess.Popen(
+            [
+                sys.executable, "-m", "uvicorn", "app.main:app", "--host", "127.0.0.1", "--port", str(app_port),
+                "--workers", str(args.workers), "--log-level", "error",
+            ],
+            cwd=str(PROJECT_ROOT),
+            env=env,
+            stdout=subprocess.DEVNULL,
+            stderr=None if args.verbose else subprocess.DEVNULL
+        )
+        processes.append(app)
+        base_url = f"http://127.0.0.1:{app_port}"
+        _wait_ready(f"{base_url}/api/ready", app, 120)
+    except Exception:
+        stop_processes(processes)
+        raise
+    return base_url, processes
+
+
+def stop_processes(processes: List[subprocess.Popen]):
+    for process in reversed(processes):
+        process.terminate()
+        try:
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+
+def git_revision() -> Dict[str, Any]:
+    """결과 비교용 커밋 정보"""
+    try:
+        commit = subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], cwd=PROJECT_ROOT, text=True).strip()
+        dirty = bool(subprocess.check_output(["git", "status", "--porcelain", "-uno"], cwd=PROJECT_ROOT, text=True).strip())
+    except (OSError, subprocess.CalledProcessError):
+        return {"commit": None, "dirty": None}
+    return {"commit": commit, "dirty": dirty}
+
+
+async def main_async(args, requests: List[Request], base_url: str) -> Tuple[List[Result], float]:
+    limits = httpx.Limits(max_connections=args.max_connections, max_keepalive_connections=args.max_connections)
+    async with httpx.AsyncClient(base_url=base_url, timeout=args.timeout, limits=limits) as client:
+        if args.warmup:
+            await run_closed_loop(client, requests[:args.warmup], min(args.concurrency, args.warmup))
+
+        start = time.perf_counter()
+        if args.rate:
+            results = await run_open_loop(client, requests[args.warmup:], args.rate, args.seed)
+        else:
+            results = await run_closed_loop(client, requests[args.warmup:], args.concurrency)
+        return results, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="엔드투엔드 부하 테스트")
+    parser.add_argument("--base-url", type=str, default="", help="대상 서버 (없으면 오프라인 스택 실행)")
+    parser.add_argument("--log", type=Path, default=None, help="재생할 쿼리 로그")
+    parser.add_argument("--save-log", type=Path, default=None, help="생성한 요청 목록 저장 (JSONL)")
+    parser.add_argument("--requests", type=int, default=500, help="요청 수 (--duration이 있으면 무시)")
+    parser.add_argument("--duration", type=float, default=0, help="실행 시간 (초, --rate 필요)")
+    parser.add_argument("--rate", type=float, default=0, help="목표 요청률 (req/s, open-loop)")
+    parser.add_argument("--concurrency", type=int, default=16, help="동시 요청 수 (closed-loop, --rate 없을 때)")
+    parser.add_argument("--warmup", type=int, default=20, help="집계에서 제외할 예열 요청 수")
+    parser.add_argument("--mix", type=str, default=DEFAULT_MIX, help="경로 비율 (search/stream/recipe/recipes/nutrition)")
+    parser.add_argument("--zipf-s", type=float, default=1.1, help="음식명 인기도 Zipf 지수")
+    parser.add_argument("--miss-ratio", type=float, default=0.05, help="DB에 없는 음식 쿼리 비율")
+    parser.add_argument("--seed", type=int, default=0, help="요청 생성/도착 간격/대체 서버 난수 seed")
+    parser.add_argument("--timeout", type=float, default=60.0, help="요청 타임아웃 (초)")
+    parser.add_argument("--max-connections", type=int, default=200, help="클라이언트 최대 연결 수")
+    parser.add_argument("--output", type=Path, default=None, help="결과 JSON 저장 경로")
+    parser.add_argument("--compare", type=Path, default=None, help="비교할 이전 결과 JSON")
+    # 오프라인 스택 설정
+    parser.add_argument("--workers", type=int, default=1, help="앱 서버 워커 수")
+    parser.add_argument("--llm-latency-ms", type=float, default=400, help="대체 서버 chat 첫 토큰 평균 지연")
+    parser.add_argument("--embedding-latency-ms", type=float, default=50, help="대체 서버 embedding 평균 지연")
+    parser.add_argument("--token-delay-ms", type=float, default=5, help="대체 서버 스트리밍 청크 간 지연")
+    parser.add_argument("--llm-error-rate", type=float, default=0.0, help="대체 서버 5xx 비율")
+    parser.add_argument("--verbose", action="store_true", help="앱 서버 오류 로그 출력")
+    args = parser.parse_args()
+
+    if args.duration and not args.rate:
+        parser.error("--duration은 --rate와 함께 사용")
+    count = int(args.duration * args.rate) if args.duration else args.requests
+    count += args.warmup
+
+    if args.log:
+        logged = load_log(args.log)
+        requests = [logged[i % len(logged)] for i in range(count)]
+    else:
+        requests = generate_requests(count, parse_mix(args.mix), args.zipf_s, args.miss_ratio, args.seed)
+    if args.save_log:
+        args.save_log.parent.mkdir(parents=True, exist_ok=True)
+        with open(args.save_log, "w", encoding="utf-8") as f:
+            for request in requests:
+                f.write(json.dumps(request.to_dict(), ensure_ascii=False) + "\n")
+
+    processes: List[subprocess.Popen] = []
+    base_url = args.base_url
+    if not base_url:
+        print("오프라인 스택 실행 (OpenAI 대체 서버 + 앱 서버)...")
+        base_url, processes = start_offline_stack(args)
+
+    try:
+        load = f"{args.rate} req/s (open-loop)" if args.rate else f"동시 {args.concurrency} (closed-loop)"
+        print(f"대상 {base_url}, {load}, 요청 {count - args.warmup}개 (+예열 {args.warmup})")
+        results, elapsed = asyncio.run(main_async(args, requests, base_url))
+    finally:
+        stop_processes(processes)
+
+    summary = summarize(results, elapsed)
+    print_summary(summary)
+
+    if args.output:
+        meta = {
+            **git_revision(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "target": args.base_url or "offline",
+            "args": {k: (str(v) if isinstance(v, Path) else v) for k, v in vars(args).items()},
+        }
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"meta": meta, "summary": summary}, f, ensure_ascii=False, indent=2)
+        print(f"\n결과 저장: {args.output}")
+
+    if args.compare:
+        print_comparison(summary, args.compare)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,229 @@
+"""
+벤치마크용 OpenAI 스텁 클라이언트
+실제 API 호출 없이 고정 지연과 미리 정의된 응답을 반환하고 호출 횟수를 기록
+"""
+
+import asyncio
+import hashlib
+import json
+import re
+import threading
+import time
+from types import SimpleNamespace
+from typing import Dict, List
+
+
+def canned_chat_content(messages: List[Dict]) -> str:
+    """프롬프트 유형별 미리 정의된 응답"""
+    system = messages[0].get("content", "") if messages else ""
+    user = messages[-1].get("content", "") if messages else ""
+
+    if "쿼리를 분석" in system:
+        food_name = user.split()[0] if user.split() else "김치찌개"
+        query_type = "recipe"
+        if "칼로리" in user or "영양" in user:
+            query_type = "nutrition"
+        elif "운동" in user:
+            query_type = "exercise"
+        return json.dumps(
+            {"food_name": food_name, "servings": 1, "query_type": query_type},
+            ensure_ascii=False
+        )
+
+    if "Korean cuisine and nutrition expert" in system:
+        return json.dumps({
+            "recipe": json.loads(canned_chat_content([{"content": "Korean cuisine expert"}])),
+            "nutrition": json.loads(canned_chat_content([{"content": "nutrition expert"}]))
+        }, ensure_ascii=False)
+
+    if "Korean cuisine expert" in system:
+        return json.dumps({
+            "name": "스텁 요리",
+            "category": "국/찌개",
+            "cooking_method": "끓이기",
+            "ingredients": ["재료A 100g", "재료B 50g"],
+            "instructions": ["1. 재료를 손질한다", "2. 끓인다"],
+            "tips": "스텁 팁",
+            "estimated_time": 30
+        }, ensure_ascii=False)
+
+    if "nutrition expert" in system:
+        return json.dumps({
+            "food_name": "스텁 요리",
+            "serving_size": 300,
+            "servings": 1,
+            "calories": 450,
+            "protein": 20,
+            "fat": 15,
+            "carbohydrate": 55,
+            "sodium": 900,
+            "sugar": 5,
+            "fiber": 3
+        }, ensure_ascii=False)
+
+    # 응답 포맷팅: 컨텍스트의 자리표시자(운동 추천, 답변 카드의 인분/영양 수치)를 그대로 출력
+    placeholders = list(dict.fromkeys(re.findall(r"\[\[\w+\]\]", user)))
+    exercises = "".join(f"{p}\n\n" for p in placeholders)
+    return (
+        "## 🍳 스텁 응답\n\n"
+        "### 📝 레시피\n- 재료A 100g\n- 재료B 50g\n\n"
+        "### 🥗 영양 정보\n- 🔥 칼로리: **450kcal**\n\n"
+        f"{exercises}"
+        "맛있게 드시고, 건강한 하루 보내세요! 😊"
+    )
+
+
+def deterministic_embedding(text: str, dimension: int = 1536) -> List[float]:
+    """텍스트 해시 기반 결정적 임베딩"""
+    values = []
+    counter = 0
+    while len(values) < dimension:
+        digest = hashlib.sha256(f"{text}:{counter}".encode("utf-8")).digest()
+        values.extend((b - 128) / 128.0 for b in digest)
+        counter += 1
+    return values[:dimension]
+
+
+def _sleep_or_timeout(delay: float, timeout=None):
+    """지연 시뮬레이션 (요청 timeout보다 길면 timeout만큼 대기 후 TimeoutError)"""
+    if timeout is not None and delay > timeout:
+        time.sleep(timeout)
+        raise TimeoutError(f"stub request timed out after {timeout:.2f}s")
+    time.sleep(delay)
+
+
+async def _asleep_or_timeout(delay: float, timeout=None):
+    """_sleep_or_timeout()의 비동기 버전"""
+    if timeout is not None and delay > timeout:
+        await asyncio.sleep(timeout)
+        raise TimeoutError(f"stub request timed out after {timeout:.2f}s")
+    await asyncio.sleep(delay)
+
+
+class _StubCompletions:
+    def __init__(self, owner: "StubOpenAI"):
+        self._owner = owner
+
+    def create(self, model: str, messages: List[Dict], stream: bool = False, timeout=None, **kwargs):
+        self._owner._record("chat")
+        content = canned_chat_content(messages)
+        if stream:
+            _sleep_or_timeout(self._owner.chat_delay, timeout)
+            return self._stream(content)
+
+        # 스트리밍과 동일한 총 생성 시간
+        chunk_count = (len(content) + 3) // 4
+        _sleep_or_timeout(self._owner.chat_delay + chunk_count * self._owner.token_delay, timeout)
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=content))],
+            usage=SimpleNamespace(prompt_tokens=100, completion_tokens=len(content) // 2)
+        )
+
+    def _stream(self, content: str):
+        """첫 토큰까지 chat_delay (create에서 대기), 이후 토큰마다 token_delay"""
+        for i in range(0, len(content), 4):
+            yield SimpleNamespace(
+                choices=[SimpleNamespace(delta=SimpleNamespace(content=content[i:i + 4]))]
+            )
+            time.sleep(self._owner.token_delay)
+
+
+class _StubEmbeddings:
+    def __init__(self, owner: "StubOpenAI"):
+        self._owner = owner
+
+    def create(self, input, model: str, timeout=None, **kwargs):
+        self._owner._record("embedding")
+        _sleep_or_timeout(self._owner.embedding_delay, timeout)
+        texts = [input] if isinstance(input, str) else list(input)
+        data = [
+            SimpleNamespace(index=i, embedding=deterministic_embedding(t))
+            for i, t in enumerate(texts)
+        ]
+        return SimpleNamespace(data=data)
+
+
+class _AsyncStubCompletions:
+    def __init__(self, owner: "StubOpenAI"):
+        self._owner = owner
+
+    async def create(self, model: str, messages: List[Dict], stream: bool = False, timeout=None, **kwargs):
+        self._owner._record("chat")
+        content = canned_chat_content(messages)
+        if stream:
+            await _asleep_or_timeout(self._owner.chat_delay, timeout)
+            return self._stream(content)
+
+        chunk_count = (len(content) + 3) // 4
+        await _asleep_or_timeout(self._owner.chat_delay + chunk_count * self._owner.token_delay, timeout)
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=content))],
+            usage=SimpleNamespace(prompt_tokens=100, completion_tokens=len(content) // 2)
+        )
+
+    async def _stream(self, content: str):
+        for i in range(0, len(content), 4):
+            yield SimpleNamespace(
+                choices=[SimpleNamespace(delta=SimpleNamespace(content=content[i:i + 4]))]
+            )
+            await asyncio.sleep(self._owner.token_delay)
+
+
+class _AsyncStubEmbeddings:
+    def __init__(self, owner: "StubOpenAI"):
+        self._owner = owner
+
+    async def create(self, input, model: str, timeout=None, **kwargs):
+        self._owner._record("embedding")
+        await _asleep_or_timeout(self._owner.embedding_delay, timeout)
+        texts = [input] if isinstance(input, str) else list(input)
+        data = [
+            SimpleNamespace(index=i, embedding=deterministic_embedding(t))
+            for i, t in enumerate(texts)
+        ]
+        return SimpleNamespace(data=data)
+
+
+class StubAsyncOpenAI:
+    """AsyncOpenAI 클라이언트 대체 (지연/호출 횟수는 StubOpenAI와 공유)"""
+
+    def __init__(self, owner: "StubOpenAI"):
+        self.chat = SimpleNamespace(completions=_AsyncStubCompletions(owner))
+        self.embeddings = _AsyncStubEmbeddings(owner)
+
+    async def close(self):
+        pass
+
+
+class StubOpenAI:
+    """OpenAI 클라이언트 대체 (chat.completions / embeddings)"""
+
+    def __init__(
+        self,
+        chat_delay: float = 0.5,
+        embedding_delay: float = 0.1,
+        token_delay: float = 0.02
+    ):
+        """
+        Args:
+            chat_delay: chat completion 1회 지연 (스트리밍 시 첫 토큰까지 지연, 초)
+            embedding_delay: embedding 1회 지연 (초)
+            token_delay: 스트리밍 토큰 간 지연 (초)
+        """
+        self.chat_delay = chat_delay
+        self.embedding_delay = embedding_delay
+        self.token_delay = token_delay
+        self.calls: Dict[str, int] = {"chat": 0, "embedding": 0}
+        self._lock = threading.Lock()
+        self.chat = SimpleNamespace(completions=_StubCompletions(self))
+        self.embeddings = _StubEmbeddings(self)
+        self.async_client = StubAsyncOpenAI(self)
+
+    def _record(self, kind: str):
+        with self._lock:
+            self.calls[kind] += 1
+
+    def reset(self):
+        """호출 횟수 초기화"""
+        with self._lock:
+            self.calls = {"chat": 0, "embedding": 0}
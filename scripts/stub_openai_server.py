@@ -0,0 +1,300 @@
+"""
+로컬 OpenAI 대체 서버 (부하/지연 테스트용)
+chat/completions(스트리밍 포함), embeddings, models 엔드포인트를 OpenAI와 같은 형식으로 제공
+
+- 응답: QueryAnalyzer / LLMService / ResponseFormatter 프롬프트별 미리 정의된 응답 (stub_llm과 동일)
+- 임베딩: 텍스트 해시 기반 결정적 벡터
+- 지연: 분포(fixed / uniform / exponential / lognormal) + 느린 요청 비율로 첫 토큰 지연을 샘플링,
+  이후 토큰 청크마다 --token-delay-ms (비스트리밍 응답은 전체 생성 시간 후 한 번에 반환)
+- 오류: --error-rate 비율로 5xx, --rate-limit-rate 비율로 429 (Retry-After), --stream-abort-rate 비율로 스트리밍 중단
+- max_tokens보다 긴 응답은 잘라서 finish_reason="length"로 반환
+
+GET /stats로 엔드포인트/상태별 호출 수, GET/POST /config로 실행 중 설정 조회/변경 (POST /stats/reset으로 초기화)
+
+사용법:
+    python scripts/stub_openai_server.py --port 8100 --chat-latency-ms 400 --latency-dist lognormal --error-rate 0.02
+    OPENAI_BASE_URL=http://127.0.0.1:8100/v1 OPENAI_API_KEY=sk-stub uvicorn app.main:app
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import random
+import sys
+import time
+import uuid
+from collections import Counter
+from dataclasses import asdict, dataclass, fields
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# 프로젝트 루트 경로
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(PROJECT_ROOT / "scripts"))
+
+import uvicorn  # noqa: E402
+from fastapi import FastAPI, Request  # noqa: E402
+from fastapi.responses import JSONResponse, StreamingResponse  # noqa: E402
+
+from stub_llm import canned_chat_content, deterministic_embedding  # noqa: E402
+
+LATENCY_DISTRIBUTIONS = ("fixed", "uniform", "exponential", "lognormal")
+
+# GET /v1/models 목록 (요청의 model 값은 이 목록과 무관하게 그대로 응답에 사용)
+STUB_MODELS = ("gpt-4o-mini", "gpt-4o", "text-embedding-3-small", "text-embedding-3-large")
+
+
+@dataclass
+class StubServerConfig:
+    """대체 서버 동작 설정 (POST /config로 실행 중 변경 가능)"""
+    chat_latency_ms: float = 400.0          # chat 첫 토큰까지 평균 지연
+    embedding_latency_ms: float = 50.0      # embedding 평균 지연
+    latency_dist: str = "lognormal"         # fixed / uniform / exponential / lognormal
+    latency_spread: float = 0.5             # uniform: 평균 대비 ±비율, lognormal: sigma
+    slow_ratio: float = 0.0                 # 느린 요청 비율 (꼬리 지연)
+    slow_latency_ms: float = 3000.0         # 느린 요청 지연
+    token_delay_ms: float = 10.0            # 스트리밍 청크 간 지연
+    chunk_chars: int = 4                    # 스트리밍 청크 크기 (문자)
+    error_rate: float = 0.0                 # 5xx 비율
+    error_status: int = 503
+    rate_limit_rate: float = 0.0            # 429 비율
+    retry_after_seconds: float = 1.0        # 429 응답의 Retry-After
+    stream_abort_rate: float = 0.0          # 스트리밍 중간에 연결을 끊는 비율
+    seed: Optional[int] = None
+
+    def update(self, values: Dict[str, Any]):
+        """알려진 필드만 타입에 맞춰 갱신"""
+        for f in fields(self):
+            if f.name in values:
+                current = getattr(self, f.name)
+                value = values[f.name]
+                setattr(self, f.name, type(current)(value) if current is not None and value is not None else value)
+        if self.latency_dist not in LATENCY_DISTRIBUTIONS:
+            raise ValueError(f"latency_dist는 {', '.join(LATENCY_DISTRIBUTIONS)} 중 하나")
+
+
+def sample_latency(config: StubServerConfig, mean_ms: float, rng: random.Random) -> float:
+    """설정된 분포로 지연 시간 샘플링 (초)"""
+    if config.slow_ratio and rng.random() < config.slow_ratio:
+        return config.slow_latency_ms / 1000
+
+    if mean_ms <= 0:
+        return 0.0
+    if config.latency_dist == "uniform":
+        spread = mean_ms * config.latency_spread
+        value = rng.uniform(mean_ms - spread, mean_ms + spread)
+    elif config.latency_dist == "exponential":
+        value = rng.expovariate(1 / mean_ms)
+    elif config.latency_dist == "lognormal":
+        # 평균이 mean_ms가 되도록 mu 보정
+        sigma = config.latency_spread
+        value = rng.lognormvariate(math.log(mean_ms) - sigma ** 2 / 2, sigma)
+    else:
+        value = mean_ms
+    return max(value, 0.0) / 1000
+
+
+def estimate_tokens(text: str) -> int:
+    """응답 토큰 수 추정 (stub_llm과 같은 기준)"""
+    return max(len(text) // 2, 1)
+
+
+def _error_body(message: str, error_type: str) -> Dict[str, Any]:
+    return {"error": {"message": message, "type": error_type, "param": None, "code": None}}
+
+
+def create_app(config: Optional[StubServerConfig] = None) -> FastAPI:
+    """
+    대체 서버 ASGI 앱 생성 (httpx.ASGITransport로 프로세스 안에서도 사용 가능)
+
+    Args:
+        config: 동작 설정 (None이면 기본값)
+    """
+    config = config or StubServerConfig()
+    rng = random.Random(config.seed)
+    stats: Counter = Counter()
+    app = FastAPI(title="OpenAI stand-in")
+
+    def inject_error(endpoint: str) -> Optional[JSONResponse]:
+        """설정된 비율로 429/5xx 응답"""
+        roll = rng.random()
+        if roll < config.rate_limit_rate:
+            stats[f"{endpoint}:429"] += 1
+            return JSONResponse(
+                _error_body("Rate limit reached (stub)", "rate_limit_error"),
+                status_code=429,
+                headers={"retry-after": f"{config.retry_after_seconds:g}"}
+            )
+        if roll < config.rate_limit_rate + config.error_rate:
+            stats[f"{endpoint}:{config.error_status}"] += 1
+            return JSONResponse(
+                _error_body("The server is overloaded (stub)", "server_error"),
+                status_code=config.error_status
+            )
+        return None
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request):
+        body = await request.json()
+        error = inject_error("chat")
+        if error is not None:
+            await asyncio.sleep(sample_latency(config, config.chat_latency_ms, rng) / 4)
+            return error
+
+        messages: List[Dict] = body.get("messages", [])
+        content = canned_chat_content(messages)
+        finish_reason = "stop"
+        max_tokens = body.get("max_tokens") or body.get("max_completion_tokens")
+        if max_tokens and estimate_tokens(content) > max_tokens:
+            content = content[:max_tokens * 2]
+            finish_reason = "length"
+
+        model = body.get("model", "gpt-4o-mini")
+        completion_id = f"chatcmpl-stub-{uuid.uuid4().hex[:12]}"
+        usage = {
+            "prompt_tokens": sum(estimate_tokens(m.get("content") or "") for m in messages),
+            "completion_tokens": estimate_tokens(content),
+        }
+        usage["total_tokens"] = usage["prompt_tokens"] + usage["completion_tokens"]
+        first_token = sample_latency(config, config.chat_latency_ms, rng)
+        chunks = [content[i:i + config.chunk_chars] for i in range(0, len(content), config.chunk_chars)]
+
+        if not body.get("stream"):
+            await asyncio.sleep(first_token + len(chunks) * config.token_delay_ms / 1000)
+            stats["chat:200"] += 1
+            return {
+                "id": completion_id,
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": model,
+                "choices": [{
+                    "index": 0,
+                    "message": {"role": "assistant", "content": content},
+                    "finish_reason": finish_reason,
+                }],
+                "usage": usage,
+            }
+
+        include_usage = (body.get("stream_options") or {}).get("include_usage", False)
+        abort_at = rng.randrange(len(chunks)) if chunks and rng.random() < config.stream_abort_rate else None
+
+        def event(delta: Dict[str, Any], finish: Optional[str] = None, **extra) -> str:
+            payload = {
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "created": int(time.time()),
+                "model": model,
+                "choices": [{"index": 0, "delta": delta, "finish_reason": finish}],
+                **extra,
+            }
+            return f"data: {json.dumps(payload, ensure_ascii=False)}\n\n"
+
+        async def stream():
+            await asyncio.sleep(first_token)
+            yield event({"role": "assistant", "content": ""})
+            for i, chunk in enumerate(chunks):
+                if i == abort_at:
+                    stats["chat:stream_aborted"] += 1
+                    raise ConnectionResetError("stream aborted (stub)")
+                yield event({"content": chunk})
+                await asyncio.sleep(config.token_delay_ms / 1000)
+            yield event({}, finish_reason)
+            if include_usage:
+                payload = {"id": completion_id, "object": "chat.completion.chunk", "created": int(time.time()),
+                           "model": model, "choices": [], "usage": usage}
+                yield f"data: {json.dumps(payload)}\n\n"
+            yield "data: [DONE]\n\n"
+            stats["chat:200"] += 1
+
+        return StreamingResponse(stream(), media_type="text/event-stream")
+
+    @app.post("/v1/embeddings")
+    async def embeddings(request: Request):
+        body = await request.json()
+        error = inject_error("embedding")
+        if error is not None:
+            return error
+
+        raw = body.get("input", "")
+        texts = [raw] if isinstance(raw, str) else list(raw)
+        dimension = body.get("dimensions") or 1536
+        await asyncio.sleep(sample_latency(config, config.embedding_latency_ms, rng))
+        stats["embedding:200"] += 1
+        tokens = sum(estimate_tokens(str(t)) for t in texts)
+        return {
+            "object": "list",
+            "data": [
+                {"object": "embedding", "index": i, "embedding": deterministic_embedding(str(t), dimension)}
+                for i, t in enumerate(texts)
+            ],
+            "model": body.get("model", "text-embedding-3-small"),
+            "usage": {"prompt_tokens": tokens, "total_tokens": tokens},
+        }
+
+    @app.get("/v1/models")
+    async def list_models():
+        # /api/health?deep=1의 OpenAI 연결 확인용
+        stats["models:200"] += 1
+        created = int(time.time())
+        return {
+            "object": "list",
+            "data": [
+                {"id": model_id, "object": "model", "created": created, "owned_by": "stub"}
+                for model_id in STUB_MODELS
+            ],
+        }
+
+    @app.get("/stats")
+    async def get_stats():
+        return dict(stats)
+
+    @app.post("/stats/reset")
+    async def reset_stats():
+        stats.clear()
+        return {}
+
+    @app.get("/config")
+    async def get_config():
+        return asdict(config)
+
+    @app.post("/config")
+    async def update_config(request: Request):
+        try:
+            config.update(await request.json())
+        except (TypeError, ValueError) as e:
+            return JSONResponse({"error": str(e)}, status_code=400)
+        return asdict(config)
+
+    return app
+
+
+def main():
+    defaults = StubServerConfig()
+    parser = argparse.ArgumentParser(description="로컬 OpenAI 대체 서버")
+    parser.add_argument("--host", type=str, default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8100)
+    parser.add_argument("--chat-latency-ms", type=float, default=defaults.chat_latency_ms, help="chat 첫 토큰 평균 지연")
+    parser.add_argument("--embedding-latency-ms", type=float, default=defaults.embedding_latency_ms, help="embedding 평균 지연")
+    parser.add_argument("--latency-dist", choices=LATENCY_DISTRIBUTIONS, default=defaults.latency_dist, help="지연 분포")
+    parser.add_argument("--latency-spread", type=float, default=defaults.latency_spread, help="uniform ±비율 / lognormal sigma")
+    parser.add_argument("--slow-ratio", type=float, default=defaults.slow_ratio, help="느린 요청 비율")
+    parser.add_argument("--slow-latency-ms", type=float, default=defaults.slow_latency_ms, help="느린 요청 지연")
+    parser.add_argument("--token-delay-ms", type=float, default=defaults.token_delay_ms, help="스트리밍 청크 간 지연")
+    parser.add_argument("--chunk-chars", type=int, default=defaults.chunk_chars, help="스트리밍 청크 크기 (문자)")
+    parser.add_argument("--error-rate", type=float, default=defaults.error_rate, help="5xx 응답 비율")
+    parser.add_argument("--error-status", type=int, default=defaults.error_status, help="오류 응답 상태 코드")
+    parser.add_argument("--rate-limit-rate", type=float, default=defaults.rate_limit_rate, help="429 응답 비율")
+    parser.add_argument("--retry-after-seconds", type=float, default=defaults.retry_after_seconds, help="429 Retry-After")
+    parser.add_argument("--stream-abort-rate", type=float, default=defaults.stream_abort_rate, help="스트리밍 중단 비율")
+    parser.add_argument("--seed", type=int, default=None, help="난수 seed (지연/오류 샘플링 재현)")
+    args = parser.parse_args()
+
+    config = StubServerConfig(**{f.name: getattr(args, f.name) for f in fields(StubServerConfig)})
+    print(f"OpenAI 대체 서버: http://{args.host}:{args.port}/v1  (OPENAI_BASE_URL로 지정)")
+    uvicorn.run(create_app(config), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
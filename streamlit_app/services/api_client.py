@@ -3,7 +3,7 @@
 import logging
 import time
 import asyncio
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Iterator, Tuple
 import json
 from pathlib import Path
 
@@ -14,6 +14,11 @@ logger = logging.getLogger(__name__)
 # API 서버 URL (환경변수 또는 기본값)
 API_BASE_URL = "http://localhost:8000"
 
+# 검색 요청 예산 (초) - 서버는 예산 안에서 LLM 단계를 대체 경로로 처리하고 응답
+SEARCH_TIMEOUT_SECONDS = 20.0
+# 서버 예산 소진 후 응답 전송까지의 여유 시간 (초)
+SEARCH_TIMEOUT_MARGIN_SECONDS = 5.0
+
 
 def search_recipes_multiple(query: str, limit: int = 9) -> Dict:
     """
@@ -280,10 +285,11 @@ def _search_via_api(query: str, user_profile: Optional[Dict] = None) -> Dict:
         if user_profile:
             request_data["user_profile"] = user_profile
 
-        with httpx.Client(timeout=60.0) as client:
+        with httpx.Client(timeout=SEARCH_TIMEOUT_SECONDS + SEARCH_TIMEOUT_MARGIN_SECONDS) as client:
             response = client.post(
                 f"{API_BASE_URL}/api/search",
-                json=request_data
+                json=request_data,
+                headers={"X-Request-Timeout": str(SEARCH_TIMEOUT_SECONDS)}
             )
             response.raise_for_status()
             return response.json()
@@ -299,27 +305,134 @@ def _search_via_api(query: str, user_profile: Optional[Dict] = None) -> Dict:
         }
 
 
+def stream_search_via_api(
+    query: str,
+    user_profile: Optional[Dict] = None
+) -> Iterator[Tuple[str, Dict]]:
+    """
+    SSE 스트리밍 검색 (/api/search/stream)
+
+    Args:
+        query: 검색 쿼리
+        user_profile: 사용자 프로필
+
+    Yields:
+        (이벤트명, 데이터) 튜플
+        - analyzed_query, recipe, nutrition, exercises: 단계별 결과
+        - token: {"text": 응답 텍스트 조각}
+        - done: 최종 SearchResponse / error: 에러 정보
+    """
+    import httpx
+
+    request_data = {"query": query}
+    if user_profile:
+        request_data["user_profile"] = user_profile
+
+    with httpx.Client(timeout=SEARCH_TIMEOUT_SECONDS + SEARCH_TIMEOUT_MARGIN_SECONDS) as client:
+        with client.stream(
+            "POST",
+            f"{API_BASE_URL}/api/search/stream",
+            json=request_data,
+            headers={"X-Request-Timeout": str(SEARCH_TIMEOUT_SECONDS)}
+        ) as response:
+            response.raise_for_status()
+
+            event = "message"
+            data_lines: List[str] = []
+            for line in response.iter_lines():
+                if line.startswith("event:"):
+                    event = line[len("event:"):].strip()
+                elif line.startswith("data:"):
+                    data_lines.append(line[len("data:"):].strip())
+                elif not line and data_lines:
+                    yield event, json.loads("\n".join(data_lines))
+                    event, data_lines = "message", []
+
+
+def render_search_stream(query: str, user_profile: Optional[Dict] = None) -> Dict:
+    """
+    스트리밍 검색 결과를 단계별로 렌더링
+
+    각 단계 결과가 도착하는 즉시 화면에 표시하고, 응답 텍스트는 토큰 단위로 갱신한다.
+    API 서버에 연결할 수 없으면 직접 호출 결과를 한 번에 표시한다.
+
+    Returns:
+        최종 검색 결과 딕셔너리 (search_recipe와 동일 형식)
+    """
+    import httpx
+
+    summary_slot = st.empty()
+    recipe_slot = st.empty()
+    nutrition_slot = st.empty()
+    exercise_slot = st.empty()
+    response_slot = st.empty()
+
+    text = ""
+    result: Dict = {"success": False, "error": "응답이 없습니다"}
+
+    try:
+        for event, data in stream_search_via_api(query, user_profile):
+            if event == "analyzed_query":
+                summary_slot.caption(f"🔍 {data.get('food_name', '')} · {data.get('servings', 1)}인분")
+            elif event == "recipe" and data.get("name"):
+                with recipe_slot.container():
+                    st.markdown(f"### 📝 {data['name']}")
+                    for ingredient in data.get("ingredients", [])[:10]:
+                        st.markdown(f"- {ingredient}")
+            elif event == "nutrition" and data.get("calories", 0) > 0:
+                nutrition_slot.markdown(
+                    f"🔥 **{data['calories']:.0f}kcal** · 단백질 {data.get('protein', 0):.1f}g · "
+                    f"지방 {data.get('fat', 0):.1f}g · 탄수화물 {data.get('carbohydrate', 0):.1f}g"
+                )
+            elif event == "exercises" and data:
+                exercise_slot.markdown("\n".join(
+                    f"- {ex.get('name_kr', '')}: 약 {ex.get('duration_minutes', 0):.0f}분" for ex in data
+                ))
+            elif event == "token":
+                text += data.get("text", "")
+                response_slot.markdown(text + "▌")
+            elif event == "done":
+                result = data
+            elif event == "error":
+                result = {"success": False, "error": data.get("error", ""), "detail": data.get("detail")}
+
+        response_slot.markdown(result.get("response", text) if result.get("success") else text)
+        return result
+
+    except httpx.ConnectError:
+        logger.warning("API 서버 연결 실패, 직접 호출로 전환")
+        result = _search_directly(query, user_profile)
+        if result.get("success"):
+            response_slot.markdown(result.get("response", ""))
+        return result
+    except Exception as e:
+        logger.error(f"스트리밍 검색 실패: {e}")
+        return {"success": False, "error": f"스트리밍 검색 실패: {str(e)}"}
+
+
 def _search_directly(query: str, user_profile: Optional[Dict] = None) -> Dict:
     """워크플로우 직접 호출"""
     try:
         from app.core.workflow.graph import run_workflow_sync
         from app.core.workflow.state import UserProfile
+        from app.core.workflow.deadline import create_deadline
 
         start_time = time.time()
+        deadline = create_deadline(SEARCH_TIMEOUT_SECONDS)
 
         # UserProfile 변환
         profile = None
         if user_profile:
             profile = UserProfile(
-                weight_kg=user_profile.get("weight", 70),
-                height_cm=user_profile.get("height", 170),
+                weight=user_profile.get("weight", 70),
+                height=user_profile.get("height", 170),
                 age=user_profile.get("age", 30),
                 gender=user_profile.get("gender", "male"),
                 activity_level=user_profile.get("activity_level", "moderate")
             )
 
         # 워크플로우 실행
-        final_state = run_workflow_sync(query, profile)
+        final_state = run_workflow_sync(query, profile, deadline=deadline)
 
         # 처리 시간 계산
         processing_time_ms = (time.time() - start_time) * 1000
@@ -396,6 +509,8 @@ def _search_directly(query: str, user_profile: Optional[Dict] = None) -> Dict:
 
         # 최종 응답 텍스트
         result["response"] = final_state.get("response", "")
+        result["degraded_stages"] = list(final_state.get("degraded_stages") or [])
+        result["cache_status"] = final_state.get("cache_status", "bypass")
 
         return result
 
@@ -0,0 +1,35 @@
+"""공용 테스트 fixture (OpenAI 스텁 클라이언트)"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트 경로 (scripts/stub_llm.py 재사용)
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(PROJECT_ROOT / "scripts"))
+
+# 서비스 초기화용 (실제 호출은 스텁 클라이언트)
+os.environ.setdefault("OPENAI_API_KEY", "sk-test")
+
+from stub_llm import StubOpenAI  # noqa: E402
+
+
+@pytest.fixture
+def stub_openai(monkeypatch):
+    """서비스 싱글톤의 OpenAI 클라이언트(동기/비동기)를 호출 횟수를 세는 스텁으로 교체"""
+    from app.core.agents.query_analyzer import get_query_analyzer
+    from app.core.agents.response_formatter import get_response_formatter
+    from app.core.services import openai_client
+    from app.core.services.embedding_service import get_embedding_service
+    from app.core.services.llm_service import get_llm_service
+
+    stub = StubOpenAI(chat_delay=0.2, embedding_delay=0.2, token_delay=0.0)
+    for service in (get_query_analyzer(), get_response_formatter(), get_llm_service(), get_embedding_service()):
+        monkeypatch.setattr(service, "client", stub)
+
+    monkeypatch.setattr(openai_client, "_async_clients", type(openai_client._async_clients)())
+    monkeypatch.setattr(openai_client, "_create_async_client", lambda api_key: stub.async_client)
+    return stub
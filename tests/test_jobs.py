@@ -0,0 +1,79 @@
+"""백그라운드 작업 저장소의 임대 기반 복구와 롱 폴링 알림 확인"""
+
+import asyncio
+import time
+
+from app.core.workflow import jobs
+from app.core.workflow.jobs import (
+    JOB_PENDING,
+    JOB_RUNNING,
+    JOB_SUCCEEDED,
+    JobManager,
+    JobStore,
+)
+
+
+def test_recover_does_not_steal_running_job_with_valid_lease(tmp_path):
+    store = JobStore(tmp_path / "jobs.db", lease_seconds=30)
+    job_id = store.create({"query": "임대 테스트"})
+    assert store.mark_running(job_id, "worker-a") is not None
+
+    # 다른 워커 프로세스가 시작하면서 복구
+    assert job_id not in store.recover()
+    assert store.mark_running(job_id, "worker-b") is None
+    assert store.get(job_id)["status"] == JOB_RUNNING
+
+
+def test_expired_lease_is_reclaimed(tmp_path):
+    store = JobStore(tmp_path / "jobs.db", lease_seconds=0.05)
+    job_id = store.create({"query": "임대 만료 테스트"})
+    store.mark_running(job_id, "worker-a")
+    time.sleep(0.1)
+
+    assert store.expire() == [job_id]
+    assert store.mark_running(job_id, "worker-b")["attempts"] == 2
+    # 임대를 잃은 이전 실행자의 결과는 기록되지 않음
+    assert not store.finish(job_id, "worker-a", JOB_SUCCEEDED, result={"response": "a"})
+    assert store.finish(job_id, "worker-b", JOB_SUCCEEDED, result={"response": "b"})
+    assert store.get(job_id)["result"] == {"response": "b"}
+
+
+def test_release_returns_owned_jobs_to_pending(tmp_path):
+    store = JobStore(tmp_path / "jobs.db")
+    job_id = store.create({"query": "반환 테스트"})
+    store.mark_running(job_id, "worker-a")
+
+    assert store.release("worker-b") == 0
+    assert store.release("worker-a") == 1
+    assert store.get(job_id)["status"] == JOB_PENDING
+
+
+def test_duplicate_dequeue_does_not_wake_long_poller(tmp_path, monkeypatch):
+    finish = asyncio.Event()
+
+    async def complete_workflow(state):
+        await finish.wait()
+        return {**state, "response": "완료"}
+
+    monkeypatch.setattr(jobs, "complete_workflow", complete_workflow)
+    manager = JobManager(JobStore(tmp_path / "jobs.db"), workers=2)
+
+    async def scenario():
+        job_id = await manager.submit({"query": "롱 폴링 테스트"})
+        waiter = asyncio.create_task(manager.wait(job_id, timeout=5))
+        await asyncio.sleep(0.1)
+
+        # 복구가 같은 작업을 한 번 더 넣어도 (mark_running → None) 대기자는 깨어나지 않음
+        manager._queue.put_nowait(job_id)
+        await asyncio.sleep(0.1)
+        assert not waiter.done()
+
+        finish.set()
+        job = await waiter
+        await manager.stop()
+        return job
+
+    job = asyncio.run(scenario())
+
+    assert job["status"] == JOB_SUCCEEDED
+    assert job["result"]["response"] == "완료"
@@ -0,0 +1,43 @@
+"""비동기 쿼리 분석이 음식명 사전 생성 중에도 이벤트 루프를 막지 않는지 확인"""
+
+import asyncio
+import time
+
+from app.core.agents.query_analyzer import get_query_analyzer
+from app.core.services import dish_matcher
+from app.core.services.dish_matcher import DishMatcher
+
+BUILD_DELAY = 0.3
+
+
+def test_aanalyze_builds_dish_matcher_off_event_loop(stub_openai, monkeypatch):
+    class SlowDishMatcher(DishMatcher):
+        def __init__(self):
+            # 레시피/영양정보 DB 로드 + 오토마톤 구성 시간
+            time.sleep(BUILD_DELAY)
+            super().__init__(["된장찌개"])
+
+    monkeypatch.setattr(dish_matcher, "_dish_matcher", None)
+    monkeypatch.setattr(dish_matcher, "DishMatcher", SlowDishMatcher)
+
+    async def scenario():
+        ticks = []
+
+        async def ticker():
+            while True:
+                ticks.append(time.perf_counter())
+                await asyncio.sleep(0.01)
+
+        ticking = asyncio.create_task(ticker())
+        await asyncio.sleep(0)
+        state = await get_query_analyzer().aanalyze({"user_query": "된장찌개 2인분 레시피"})
+        ticking.cancel()
+        gaps = [later - earlier for earlier, later in zip(ticks, ticks[1:])]
+        return state, gaps
+
+    state, gaps = asyncio.run(scenario())
+
+    assert state["analyzed_query"]["food_name"] == "된장찌개"
+    assert stub_openai.calls["chat"] == 0
+    # 사전 생성 동안에도 다른 태스크가 계속 실행됨
+    assert max(gaps) < BUILD_DELAY / 2
@@ -0,0 +1,65 @@
+"""쿼리 캐시 디스크 저장이 set() 호출을 막지 않는지 확인"""
+
+import json
+import threading
+import time
+
+from app.core.services import query_cache
+from app.core.services.query_cache import QueryCache
+
+DUMP_DELAY = 0.3
+
+
+def _wait_for_flush(cache: QueryCache, timeout: float = 5.0):
+    deadline = time.time() + timeout
+    while cache._flushing and time.time() < deadline:
+        time.sleep(0.01)
+
+
+def test_set_does_not_wait_for_disk_flush(tmp_path, monkeypatch):
+    original_dump = json.dump
+
+    def slow_dump(*args, **kwargs):
+        time.sleep(DUMP_DELAY)
+        return original_dump(*args, **kwargs)
+
+    monkeypatch.setattr(query_cache.json, "dump", slow_dump)
+    path = tmp_path / "query_cache.json"
+    cache = QueryCache(persist_path=path, persist_every=2)
+
+    start = time.perf_counter()
+    for i in range(10):
+        cache.set(f"key{i}", {"value": i})
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < DUMP_DELAY
+    _wait_for_flush(cache)
+    cache.flush()
+
+    entries = json.loads(path.read_text(encoding="utf-8"))
+    assert {key for key, _, _ in entries} == {f"key{i}" for i in range(10)}
+    assert list(tmp_path.glob("*.tmp")) == []
+
+
+def test_concurrent_flushes_use_separate_temp_files(tmp_path):
+    path = tmp_path / "query_cache.json"
+    caches = [QueryCache(persist_path=path, persist_every=1000) for _ in range(4)]
+    for i, cache in enumerate(caches):
+        cache.set("key", {"value": i})
+
+    barrier = threading.Barrier(len(caches))
+
+    def flush(cache):
+        barrier.wait()
+        cache.flush()
+
+    threads = [threading.Thread(target=flush, args=(cache,)) for cache in caches]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # 마지막으로 교체한 저장 결과가 온전한 JSON으로 남음
+    entries = json.loads(path.read_text(encoding="utf-8"))
+    assert len(entries) == 1
+    assert list(tmp_path.glob("*.tmp")) == []
@@ -0,0 +1,77 @@
+"""/api/ready가 필수 구성 요소 예열 실패를 503으로 알리는지 확인"""
+
+import asyncio
+
+from fastapi import Response
+
+from app.api import routes
+from app.core.workflow import warmup
+from app.core.workflow.warmup import WarmupManager
+
+
+def _fail():
+    raise RuntimeError("index missing")
+
+
+def _run_warmup(monkeypatch, phase) -> WarmupManager:
+    monkeypatch.setattr(warmup, "WARMUP_PHASES", [phase])
+    manager = WarmupManager()
+    asyncio.run(manager.run())
+    monkeypatch.setattr(routes, "get_warmup_manager", lambda: manager)
+    return manager
+
+
+def _ready(manager: WarmupManager):
+    response = Response()
+    body = asyncio.run(routes.readiness_check(response))
+    return response.status_code, body
+
+
+def test_ready_when_critical_components_warm(monkeypatch):
+    manager = _run_warmup(monkeypatch, {
+        "vector_db": lambda: {"total_vectors": 10},
+        "nutrition_db": _fail,
+        "workflow": lambda: {},
+    })
+
+    status_code, body = _ready(manager)
+
+    # 영양정보 DB는 GPT 대체 경로가 있으므로 준비 상태에 영향 없음
+    assert status_code == 200
+    assert body.ready and body.failed_components == []
+
+
+def test_not_ready_when_vector_db_fails(monkeypatch):
+    manager = _run_warmup(monkeypatch, {
+        "vector_db": _fail,
+        "workflow": lambda: {},
+    })
+
+    status_code, body = _ready(manager)
+
+    assert status_code == 503
+    assert body.status == "ready"
+    assert body.failed_components == ["vector_db"]
+
+
+def test_not_ready_when_vector_db_reports_not_ready(monkeypatch):
+    manager = _run_warmup(monkeypatch, {
+        "vector_db": lambda: {"ready": False, "total_vectors": 0},
+        "workflow": _fail,
+    })
+
+    status_code, body = _ready(manager)
+
+    assert status_code == 503
+    assert body.failed_components == ["vector_db", "workflow"]
+
+
+def test_not_ready_while_running(monkeypatch):
+    manager = WarmupManager()
+    manager.status = "running"
+    monkeypatch.setattr(routes, "get_warmup_manager", lambda: manager)
+
+    status_code, body = _ready(manager)
+
+    assert status_code == 503
+    assert not body.ready
@@ -0,0 +1,55 @@
+"""응답 골격의 운동 추천 자리표시자 렌더링 확인"""
+
+import pytest
+
+from app.core.agents.response_formatter import (
+    EXERCISE_PLACEHOLDER,
+    _StreamRenderer,
+    exercise_section,
+    render_response,
+)
+
+STATE = {
+    "nutrition": {"calories": 450},
+    "exercise_recommendations": [
+        {"intensity": "medium", "name_kr": "빠르게 걷기", "duration_minutes": 90},
+    ],
+}
+
+HEADING = "### 🏃 운동 추천"
+
+SKELETONS = [
+    # 지시대로 자리표시자만 출력
+    f"## 🍳 김치찌개\n\n### 🥗 영양 정보\n- 칼로리: 450kcal\n\n{EXERCISE_PLACEHOLDER}\n\n맛있게 드세요!",
+    # 자리표시자 앞에 운동 추천 제목을 직접 씀
+    f"## 🍳 김치찌개\n\n### 🥗 영양 정보\n- 칼로리: 450kcal\n\n{HEADING}\n\n{EXERCISE_PLACEHOLDER}\n\n맛있게 드세요!",
+    f"## 🍳 김치찌개\n\n## 운동 추천\n{EXERCISE_PLACEHOLDER}\n맛있게 드세요!",
+]
+
+
+@pytest.mark.parametrize("skeleton", SKELETONS)
+def test_render_response_has_single_exercise_heading(skeleton):
+    response = render_response(skeleton, STATE)
+
+    assert response.count("운동 추천") == 1
+    assert exercise_section(STATE) in response
+    assert response.startswith("## 🍳 김치찌개")
+
+
+@pytest.mark.parametrize("skeleton", SKELETONS)
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 1000])
+def test_stream_renderer_matches_render_response(skeleton, chunk_size):
+    renderer = _StreamRenderer(dict(STATE))
+    streamed = "".join(
+        renderer.feed(skeleton[i:i + chunk_size]) for i in range(0, len(skeleton), chunk_size)
+    )
+    streamed += renderer.finish()
+
+    assert streamed == render_response(skeleton, STATE)
+    assert streamed.count("운동 추천") == 1
+
+
+def test_other_headings_are_kept():
+    skeleton = f"### 🏃 운동 팁\n가볍게 걸어요\n\n{EXERCISE_PLACEHOLDER}"
+
+    assert render_response(skeleton, STATE).startswith("### 🏃 운동 팁\n가볍게 걸어요")
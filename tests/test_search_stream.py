@@ -0,0 +1,59 @@
+"""SSE 검색 스트림이 응답 생성 완료 전에 단계별 이벤트를 보내는지 확인"""
+
+import asyncio
+import json
+import time
+
+from app.api.routes import search_stream
+from app.core.agents.response_formatter import get_response_formatter
+from app.schemas.request import SearchRequest
+
+
+def _parse_sse(chunk: str):
+    """SSE 청크 → (이벤트명, 데이터) 리스트"""
+    events = []
+    for block in chunk.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.split("\n") if ": " in line)
+        if "event" in lines:
+            events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+def test_analyzed_query_event_arrives_before_formatter_finishes(stub_openai, monkeypatch):
+    # 응답 텍스트 스트리밍이 눈에 띄게 오래 걸리도록 토큰 간 지연
+    stub_openai.token_delay = 0.01
+
+    formatter = get_response_formatter()
+    original_astream = formatter.astream
+    formatter_finished = {}
+
+    async def astream(state):
+        async for chunk in original_astream(state):
+            yield chunk
+        formatter_finished["at"] = time.perf_counter()
+
+    monkeypatch.setattr(formatter, "astream", astream)
+
+    async def collect():
+        response = await search_stream(
+            SearchRequest(query="스트리밍테스트찌개 레시피 알려줘"), timings=False, x_request_timeout=30
+        )
+        received = []
+        async for chunk in response.body_iterator:
+            for event in _parse_sse(chunk):
+                received.append((time.perf_counter(), *event))
+        return received
+
+    received = asyncio.run(collect())
+    names = [name for _, name, _ in received]
+
+    assert "error" not in names
+    assert names[0] == "analyzed_query"
+    assert names[-1] == "done"
+    assert "token" in names
+
+    analyzed_at = received[0][0]
+    assert analyzed_at < formatter_finished["at"]
+    # 첫 토큰도 응답 생성이 끝나기 전에 도착
+    first_token_at = next(at for at, name, _ in received if name == "token")
+    assert analyzed_at < first_token_at < formatter_finished["at"]
@@ -0,0 +1,108 @@
+"""동일 키 동시 호출이 upstream 호출 하나로 병합되는지 확인 (동기/비동기 경로)"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from app.core.services.embedding_service import get_embedding_service
+from app.core.services.llm_service import get_llm_service
+
+CONCURRENCY = 20
+
+
+def _burst(fn, *args):
+    """CONCURRENCY개 스레드가 동시에 같은 호출 실행"""
+    barrier = threading.Barrier(CONCURRENCY)
+
+    def call(_):
+        barrier.wait()
+        return fn(*args)
+
+    with ThreadPoolExecutor(max_workers=CONCURRENCY) as pool:
+        return list(pool.map(call, range(CONCURRENCY)))
+
+
+def test_generate_recipe_sync_single_upstream_call(stub_openai):
+    results = _burst(get_llm_service().generate_recipe, "싱글플라이트 동기 레시피", 1)
+
+    assert stub_openai.calls["chat"] == 1
+    assert all(r == results[0] for r in results)
+    # follower는 leader 결과의 사본을 받음
+    assert len({id(r) for r in results}) == CONCURRENCY
+
+
+def test_generate_recipe_async_single_upstream_call(stub_openai):
+    service = get_llm_service()
+
+    async def burst():
+        return await asyncio.gather(
+            *(service.agenerate_recipe("싱글플라이트 비동기 레시피", 1) for _ in range(CONCURRENCY))
+        )
+
+    results = asyncio.run(burst())
+
+    assert stub_openai.calls["chat"] == 1
+    assert all(r == results[0] for r in results)
+
+
+def test_get_embedding_sync_single_upstream_call(stub_openai):
+    results = _burst(get_embedding_service().get_embedding, "싱글플라이트 동기 임베딩")
+
+    assert stub_openai.calls["embedding"] == 1
+    assert all(r == results[0] for r in results)
+
+
+def test_get_embedding_async_single_upstream_call(stub_openai):
+    service = get_embedding_service()
+
+    async def burst():
+        return await asyncio.gather(
+            *(service.aget_embedding("싱글플라이트 비동기 임베딩") for _ in range(CONCURRENCY))
+        )
+
+    results = asyncio.run(burst())
+
+    assert stub_openai.calls["embedding"] == 1
+    assert all(r == results[0] for r in results)
+
+
+def test_get_embedding_batch_missing_key_falls_back_to_single_call(stub_openai, monkeypatch):
+    from app.core.services.micro_batcher import micro_batching
+
+    service = get_embedding_service()
+    # 배치 응답에 요청한 텍스트가 빠진 경우
+    monkeypatch.setattr(service._batcher, "batch_fn", lambda texts: {})
+
+    with micro_batching():
+        embedding = service.get_embedding("배치 누락 임베딩")
+
+    assert len(embedding) == service.dimension
+    assert stub_openai.calls["embedding"] == 1
+
+
+def test_cancelled_leader_does_not_fail_followers():
+    from app.core.services.single_flight import SingleFlight
+
+    flight = SingleFlight("test_cancel")
+    calls = []
+
+    async def work():
+        calls.append(1)
+        await asyncio.sleep(0.1)
+        return "result"
+
+    async def scenario():
+        leader = asyncio.create_task(flight.do_async("key", work))
+        await asyncio.sleep(0.01)
+        followers = [asyncio.create_task(flight.do_async("key", work)) for _ in range(3)]
+        await asyncio.sleep(0.01)
+
+        # SSE 연결 끊김 등으로 leader 요청만 취소
+        leader.cancel()
+        results = await asyncio.gather(*followers)
+        assert leader.cancelled()
+        return results
+
+    assert asyncio.run(scenario()) == ["result"] * 3
+    assert len(calls) == 1
+    assert flight.in_flight == 0
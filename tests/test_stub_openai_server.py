@@ -0,0 +1,42 @@
+"""로컬 OpenAI 대체 서버가 SDK 호출에 OpenAI와 같은 형식으로 응답하는지 확인"""
+
+import asyncio
+
+import httpx
+from openai import AsyncOpenAI
+
+from stub_openai_server import StubServerConfig, create_app
+
+
+def _client(app) -> AsyncOpenAI:
+    http_client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app))
+    return AsyncOpenAI(api_key="sk-stub", base_url="http://stub/v1", http_client=http_client, max_retries=0)
+
+
+def test_models_list_for_deep_health_check():
+    app = create_app(StubServerConfig())
+
+    async def run():
+        async with _client(app) as client:
+            return await client.models.list()
+
+    models = asyncio.run(run())
+
+    assert "gpt-4o-mini" in [model.id for model in models.data]
+
+
+def test_chat_and_embeddings_round_trip():
+    app = create_app(StubServerConfig(chat_latency_ms=0, embedding_latency_ms=0, token_delay_ms=0))
+
+    async def run():
+        async with _client(app) as client:
+            chat = await client.chat.completions.create(
+                model="gpt-4o-mini", messages=[{"role": "user", "content": "안녕"}]
+            )
+            embedding = await client.embeddings.create(model="text-embedding-3-small", input=["a", "b"])
+            return chat, embedding
+
+    chat, embedding = asyncio.run(run())
+
+    assert chat.choices[0].message.content
+    assert [item.index for item in embedding.data] == [0, 1]
@@ -0,0 +1,140 @@
+"""OpenAI 전송 계층의 재시도/서킷 브레이커 실패 분류 확인"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from app.core.services.upstream_transport import (
+    CIRCUIT_CLOSED,
+    CIRCUIT_OPEN,
+    PROBE_HEADER,
+    AsyncResilientTransport,
+    CircuitBreaker,
+    ResilientTransport,
+    RetryPolicy,
+)
+
+URL = "https://api.openai.test/v1/chat/completions"
+
+
+class _Upstream:
+    """미리 정한 결과(상태 코드 또는 예외)를 차례로 돌려주는 업스트림"""
+
+    def __init__(self, *outcomes):
+        self.outcomes = list(outcomes)
+        self.requests = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        outcome = self.outcomes.pop(0) if len(self.outcomes) > 1 else self.outcomes[0]
+        if isinstance(outcome, Exception):
+            raise outcome
+        return httpx.Response(outcome)
+
+
+def _sync_client(upstream: _Upstream, breaker: CircuitBreaker, max_retries: int = 2) -> httpx.Client:
+    transport = ResilientTransport(httpx.MockTransport(upstream), breaker, RetryPolicy(max_retries, 0, 0))
+    return httpx.Client(transport=transport, timeout=5.0)
+
+
+def _send(client: httpx.Client, **kwargs) -> httpx.Response:
+    return client.post(URL, json={"model": "test"}, **kwargs)
+
+
+def test_429_is_retried_but_not_counted():
+    breaker = CircuitBreaker(failure_threshold=1)
+    upstream = _Upstream(429, 429, 200)
+
+    response = _send(_sync_client(upstream, breaker))
+
+    assert response.status_code == 200
+    assert len(upstream.requests) == 3
+    assert breaker.state == CIRCUIT_CLOSED
+
+
+def test_429_exhausting_retries_does_not_open_circuit():
+    breaker = CircuitBreaker(failure_threshold=1)
+
+    response = _send(_sync_client(_Upstream(429), breaker))
+
+    assert response.status_code == 429
+    assert breaker.state == CIRCUIT_CLOSED
+
+
+def test_5xx_is_counted():
+    breaker = CircuitBreaker(failure_threshold=3)
+
+    response = _send(_sync_client(_Upstream(503), breaker))
+
+    assert response.status_code == 503
+    assert breaker.state == CIRCUIT_OPEN
+
+
+def test_connect_error_is_counted():
+    breaker = CircuitBreaker(failure_threshold=3)
+
+    with pytest.raises(httpx.ConnectError):
+        _send(_sync_client(_Upstream(httpx.ConnectError("refused")), breaker))
+
+    assert breaker.state == CIRCUIT_OPEN
+
+
+def test_read_timeout_from_client_budget_is_not_counted():
+    breaker = CircuitBreaker(failure_threshold=1)
+
+    with pytest.raises(httpx.ReadTimeout):
+        _send(_sync_client(_Upstream(httpx.ReadTimeout("budget")), breaker))
+
+    assert breaker.state == CIRCUIT_CLOSED
+
+
+def test_connect_timeout_shortened_by_budget_is_not_counted():
+    breaker = CircuitBreaker(failure_threshold=1)
+    # 첫 시도는 읽기 타임아웃(예산)으로 실패, 재시도는 남은 예산으로 줄어든 연결 타임아웃으로 실패
+    upstream = _Upstream(httpx.ReadTimeout("budget"), httpx.ConnectTimeout("budget"))
+
+    with pytest.raises(httpx.ConnectTimeout):
+        _send(_sync_client(upstream, breaker, max_retries=1), timeout=httpx.Timeout(1.0, connect=10.0))
+
+    assert len(upstream.requests) == 2
+    assert breaker.state == CIRCUIT_CLOSED
+
+
+def test_probe_request_is_sent_once_and_bypasses_breaker():
+    breaker = CircuitBreaker(failure_threshold=1)
+    upstream = _Upstream(503)
+
+    response = _send(_sync_client(upstream, breaker), headers={PROBE_HEADER: "1"})
+
+    assert response.status_code == 503
+    assert len(upstream.requests) == 1
+    assert PROBE_HEADER not in upstream.requests[0].headers
+    assert breaker.state == CIRCUIT_CLOSED
+
+
+def test_probe_request_is_sent_while_circuit_open():
+    breaker = CircuitBreaker(failure_threshold=1, reset_seconds=60)
+    breaker.record_failure()
+    upstream = _Upstream(200)
+
+    response = _send(_sync_client(upstream, breaker), headers={PROBE_HEADER: "1"})
+
+    assert response.status_code == 200
+    assert breaker.state == CIRCUIT_OPEN
+
+
+def test_async_429_is_retried_but_not_counted():
+    breaker = CircuitBreaker(failure_threshold=1)
+    upstream = _Upstream(429, 200)
+    transport = AsyncResilientTransport(httpx.MockTransport(upstream), breaker, RetryPolicy(2, 0, 0))
+
+    async def send():
+        async with httpx.AsyncClient(transport=transport, timeout=5.0) as client:
+            return await client.post(URL, json={"model": "test"})
+
+    response = asyncio.run(send())
+
+    assert response.status_code == 200
+    assert len(upstream.requests) == 2
+    assert breaker.state == CIRCUIT_CLOSED
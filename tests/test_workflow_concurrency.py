@@ -0,0 +1,33 @@
+"""비동기 워크플로우 동시 실행이 이벤트 루프를 막지 않는지 확인"""
+
+import asyncio
+import time
+
+from app.core.workflow.graph import run_workflow
+
+CONCURRENCY = 10
+CHAT_DELAY = 0.3
+
+
+def test_concurrent_run_workflow_wall_time_close_to_single_latency(stub_openai):
+    stub_openai.chat_delay = CHAT_DELAY
+
+    async def run(queries):
+        start = time.perf_counter()
+        states = await asyncio.gather(*(run_workflow(q) for q in queries))
+        return time.perf_counter() - start, states
+
+    # 같은 경로의 단일 실행 지연 (음식명이 달라 single-flight로 병합되지 않음)
+    single, _ = asyncio.run(run(["동시성기준찌개 레시피 알려줘"]))
+    single_calls = stub_openai.calls["chat"]
+    stub_openai.reset()
+
+    queries = [f"동시성테스트{i}찌개 레시피 알려줘" for i in range(CONCURRENCY)]
+    wall, states = asyncio.run(run(queries))
+
+    assert all(state.get("response") for state in states)
+    # 쿼리마다 upstream을 따로 호출했는데도
+    assert stub_openai.calls["chat"] == single_calls * CONCURRENCY
+    # 순차 실행(single * CONCURRENCY)이 아니라 단일 실행 지연에 가까움
+    assert single >= CHAT_DELAY
+    assert wall < single * 1.5 + 0.2